@@ -4,12 +4,17 @@ from app.core.logger import configure_logging, get_logger
 from app.process_edge.asgi import build_process_asgi_app, run_process_app
 from app.ui.app import build_app
 from infrastructure.config.settings import settings
-from services.corpus_persistence.corpus_loader import ensure_corpus
+from services.coding_engine.sandbox_worker_pool import warm_default_worker_pool
+from services.corpus_persistence.corpus_loader import ensure_corpus, warm_corpus_backend
 
 configure_logging()
 logger = get_logger(__name__)
 
 ensure_corpus(hf_token=settings.hf_token)
+if settings.retrieval_warmup_enabled:
+    warm_corpus_backend()
+if settings.coding_sandbox_worker_pool_enabled:
+    warm_default_worker_pool()
 
 logger.info("Building Gradio app for HF Spaces...")
 
@@ -39,6 +39,15 @@ class AITestGenerator:
         self._diversity_filter = TestDiversityFilter()
         self._oracle_validator = OracleValidator()
 
+    def cache_key(
+        self,
+        question: Question,
+        num_tests: int = 3,
+    ) -> str:
+        """Key identifying the tests generate_tests would produce (and cache) for question."""
+
+        return self._cache.cache_key(question, num_tests)
+
     def generate_tests(
         self,
         question: Question,
@@ -0,0 +1,133 @@
+# app/ai/test_generation/hidden_test_generation_stage.py
+
+# HiddenTestGenerationStage
+#
+# Responsibility:
+# Fans AITestGenerator.generate_tests out across coding questions on the
+# process-wide LLM executor, so a batch of questions costs one generation
+# round-trip instead of one per question. Requests for a question whose
+# tests are already being generated (same cache key and domain profile)
+# share that work across every stage in the process, so interviews that
+# start together do not generate the same tests twice.
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from domain.contracts.execution.coding_test_case import CodingTestCase
+from domain.contracts.question.question import Question
+
+from app.ai.test_generation.ai_test_generator import AITestGenerator
+from infrastructure.llm.llm_concurrency import submit_llm_call
+
+# Generations still running, shared by every stage in the process and keyed
+# by (test cache key, domain profile). Entries are dropped once finished;
+# finished tests are reused through the generator's own cache.
+_IN_FLIGHT: Dict[Tuple[str, object], "Future[List[CodingTestCase]]"] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+class HiddenTestGenerationStage:
+
+    def __init__(
+        self,
+        test_generator: AITestGenerator,
+        num_tests: int = 3,
+        domain_profile=None,
+    ) -> None:
+
+        self._test_generator = test_generator
+        self._num_tests = num_tests
+        self._domain_profile = domain_profile
+
+    # =========================================================
+    # PUBLIC API
+    # =========================================================
+
+    def submit(
+        self,
+        question: Question,
+    ) -> "Future[Question]":
+        """
+        Future of question with hidden_tests filled in. Non-coding questions
+        resolve immediately to themselves.
+        """
+
+        result: "Future[Question]" = Future()
+
+        if question.type.name != "CODING":
+            result.set_result(question)
+            return result
+
+        def _attach(tests_future: "Future[List[CodingTestCase]]") -> None:
+            try:
+                hidden_tests = tests_future.result()
+            except BaseException as exc:
+                result.set_exception(exc)
+                return
+            result.set_result(question.model_copy(update={"hidden_tests": hidden_tests}))
+
+        self._submit_tests(question).add_done_callback(_attach)
+
+        return result
+
+    def submit_all(
+        self,
+        questions: List[Question],
+    ) -> List["Future[Question]"]:
+        """One future per question, in order; all coding questions start at once."""
+
+        return [self.submit(question) for question in questions]
+
+    def enrich(
+        self,
+        question: Question,
+    ) -> Question:
+        """Blocking form of submit, usable as a question enricher."""
+
+        return self.submit(question).result()
+
+    # =========================================================
+    # INTERNALS
+    # =========================================================
+
+    def _submit_tests(
+        self,
+        question: Question,
+    ) -> "Future[List[CodingTestCase]]":
+
+        key = (
+            self._test_generator.cache_key(question, self._num_tests),
+            self._domain_profile,
+        )
+
+        with _IN_FLIGHT_LOCK:
+
+            future = _IN_FLIGHT.get(key)
+
+            if future is not None:
+                return future
+
+            future = submit_llm_call(
+                self._test_generator.generate_tests,
+                question,
+                num_tests=self._num_tests,
+                domain_profile=self._domain_profile,
+            )
+            _IN_FLIGHT[key] = future
+
+        # Registered outside the lock: the callback runs inline when the
+        # future has already finished.
+        future.add_done_callback(lambda done: _forget(key, done))
+
+        return future
+
+
+def _forget(
+    key: Tuple[str, object],
+    future: "Future[List[CodingTestCase]]",
+) -> None:
+
+    with _IN_FLIGHT_LOCK:
+        if _IN_FLIGHT.get(key) is future:
+            del _IN_FLIGHT[key]
@@ -2,8 +2,9 @@
 #
 # OracleValidator
 #
-# Executes a reference solution against a test case in an isolated subprocess
-# and compares the output to the LLM-generated expected value.
+# Executes a reference solution against a question's test cases in one
+# isolated subprocess and compares each output to the LLM-generated expected
+# value.
 #
 # Used for:
 #   TASK 2: trust check — reference solution vs visible tests
@@ -12,7 +13,7 @@
 
 import json
 import textwrap
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, NamedTuple, Optional
 
 from domain.contracts.execution.coding_test_case import CodingTestCase
 from services.coding_engine.execution_sandbox import ExecutionSandbox
@@ -24,47 +25,118 @@ _SANDBOX_TIMEOUT = 5
 _REPR_MAX = 500
 
 
-def _build_runner(reference_solution: str, entrypoint: str, test: CodingTestCase) -> str:
-    args_repr = repr(test.args)
-    kwargs_repr = repr(dict(test.kwargs)) if test.kwargs else "{}"
+_CASE_MARKER = "__ORACLE_CASE__"
+
+
+class ReferenceResult(NamedTuple):
+    """Outcome of one test case under the reference solution."""
+
+    success: bool
+    output: Any = None
+    error: Optional[str] = None
+
+
+_FAILED_TO_REPORT = ReferenceResult(False, error="no result reported")
+
+
+def _build_batch_runner(
+    reference_solution: str,
+    entrypoint: str,
+    tests: List[CodingTestCase],
+) -> str:
+    cases_repr = repr(
+        [(t.args, dict(t.kwargs) if t.kwargs else {}) for t in tests]
+    )
     return textwrap.dedent(f"""\
-import json, sys
+import json, signal, sys
 
 {reference_solution}
 
-try:
-    result = {entrypoint}(*{args_repr}, **{kwargs_repr})
-    print(json.dumps(result))
-except Exception as exc:
-    print("__ERROR__:" + str(exc), file=sys.stderr)
-    sys.exit(1)
+class __OracleTimeout(BaseException):
+    pass
+
+def __on_timeout(signum, frame):
+    raise __OracleTimeout()
+
+__has_timer = hasattr(signal, "setitimer")
+if __has_timer:
+    signal.signal(signal.SIGALRM, __on_timeout)
+
+for __index, (__args, __kwargs) in enumerate({cases_repr}):
+    try:
+        if __has_timer:
+            signal.setitimer(signal.ITIMER_REAL, {_SANDBOX_TIMEOUT})
+        try:
+            __report = {{"ok": True, "output": {entrypoint}(*__args, **__kwargs)}}
+        finally:
+            if __has_timer:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        __line = json.dumps(__report)
+    except __OracleTimeout:
+        __line = json.dumps({{"ok": False, "error": "timeout"}})
+    except Exception as exc:
+        __line = json.dumps({{"ok": False, "error": type(exc).__name__ + ": " + str(exc)}})
+    print("{_CASE_MARKER}:" + str(__index) + ":" + __line, flush=True)
 """)
 
 
-def _run_reference(
+def _parse_case_line(line: str, total: int) -> Optional[tuple[int, ReferenceResult]]:
+    index, _, payload = line[len(_CASE_MARKER) + 1:].partition(":")
+
+    try:
+        index = int(index)
+        report = json.loads(payload)
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+    if not 0 <= index < total:
+        return None
+
+    if not report.get("ok"):
+        return index, ReferenceResult(False, error=report.get("error"))
+
+    return index, ReferenceResult(True, report.get("output"))
+
+
+def _run_reference_batch(
     reference_solution: str,
     entrypoint: str,
-    test: CodingTestCase,
-) -> Tuple[bool, Any]:
+    tests: List[CodingTestCase],
+) -> List[ReferenceResult]:
     """
-    Returns (success, output).
-    success=False when execution errors, timeouts, or produces no parseable output.
+    Run the reference solution against every test in one sandbox process.
+
+    The solution is loaded once; each case runs under its own
+    _SANDBOX_TIMEOUT and its exceptions are isolated from the others.
+    Results are streamed per case, so a case is only reported as failed
+    (success=False) when it errored, timed out, returned a value that is
+    not JSON-serializable, or never reported because the process died.
     """
-    sandbox = ExecutionSandbox(timeout_seconds=_SANDBOX_TIMEOUT)
-    code = _build_runner(reference_solution, entrypoint, test)
-    result = sandbox.execute(code)
+    if not tests:
+        return []
 
-    if result.returncode != 0 or result.timeout:
-        return False, None
+    sandbox = ExecutionSandbox(timeout_seconds=_SANDBOX_TIMEOUT * (len(tests) + 1))
+    result = sandbox.execute(_build_batch_runner(reference_solution, entrypoint, tests))
 
-    stdout = result.stdout.strip()
-    if not stdout:
-        return False, None
+    results = [_FAILED_TO_REPORT] * len(tests)
 
-    try:
-        return True, json.loads(stdout)
-    except (json.JSONDecodeError, ValueError):
-        return True, stdout
+    for line in (result.stdout or "").splitlines():
+        if not line.startswith(_CASE_MARKER + ":"):
+            continue
+        parsed = _parse_case_line(line, len(tests))
+        if parsed is not None:
+            index, case_result = parsed
+            results[index] = case_result
+
+    if result.returncode != 0 or result.timeout:
+        logger.debug(
+            "[OracleValidator] Reference runner exited early (returncode=%s timeout=%s): %s",
+            result.returncode,
+            result.timeout,
+            (result.stderr or "")[:_REPR_MAX],
+        )
+
+    return results
 
 
 def _outputs_equal(reference_output: Any, expected: Any) -> bool:
@@ -109,16 +181,6 @@ class OracleValidator:
             logger.warning("[OracleValidator] No reference solution — skipping validation")
             return None
 
-        # ----------------------------------------------------------
-        # TASK 2: trust check — reference solution vs visible tests
-        # ----------------------------------------------------------
-        if not self._reference_passes_visible(reference_solution, entrypoint, visible_tests):
-            logger.warning(
-                "[OracleValidator] Reference solution failed visible tests — "
-                "validation disabled, using visible-only scoring"
-            )
-            return None
-
         # ----------------------------------------------------------
         # TASK 3: build visible args index for overlap check
         # ----------------------------------------------------------
@@ -126,12 +188,8 @@ class OracleValidator:
             repr(t.args): t.expected for t in visible_tests
         }
 
-        # ----------------------------------------------------------
-        # TASK 1: filter hidden tests
-        # ----------------------------------------------------------
-        validated: List[CodingTestCase] = []
+        candidates: List[CodingTestCase] = []
         for test in hidden_tests:
-            # TASK 3: overlap check
             args_key = repr(test.args)
             if args_key in visible_index:
                 if not _outputs_equal(visible_index[args_key], test.expected):
@@ -143,13 +201,40 @@ class OracleValidator:
                         test.expected,
                     )
                     continue
+            candidates.append(test)
+
+        # Visible and hidden cases share one reference run.
+        results = _run_reference_batch(
+            reference_solution,
+            entrypoint,
+            list(visible_tests) + candidates,
+        )
+        visible_results = results[:len(visible_tests)]
+        hidden_results = results[len(visible_tests):]
+
+        # ----------------------------------------------------------
+        # TASK 2: trust check — reference solution vs visible tests
+        # ----------------------------------------------------------
+        if not self._reference_passes_visible(visible_tests, visible_results):
+            logger.warning(
+                "[OracleValidator] Reference solution failed visible tests — "
+                "validation disabled, using visible-only scoring"
+            )
+            return None
+
+        # ----------------------------------------------------------
+        # TASK 1: filter hidden tests
+        # ----------------------------------------------------------
+        validated: List[CodingTestCase] = []
+        for test, (success, ref_output, error) in zip(candidates, hidden_results):
+            args_key = repr(test.args)
 
-            # TASK 1: reference execution check
-            success, ref_output = _run_reference(reference_solution, entrypoint, test)
             if not success:
                 logger.debug(
-                    "[OracleValidator] Hidden test discarded (reference execution error): args=%s",
+                    "[OracleValidator] Hidden test discarded (reference execution error): "
+                    "args=%s error=%s",
                     args_key[:_REPR_MAX],
+                    error,
                 )
                 continue
 
@@ -171,18 +256,16 @@ class OracleValidator:
 
     def _reference_passes_visible(
         self,
-        reference_solution: str,
-        entrypoint: str,
         visible_tests: List[CodingTestCase],
+        visible_results: List[ReferenceResult],
     ) -> bool:
-        if not visible_tests:
-            return True
-        for test in visible_tests:
-            success, ref_output = _run_reference(reference_solution, entrypoint, test)
+        for test, (success, ref_output, error) in zip(visible_tests, visible_results):
             if not success:
                 logger.debug(
-                    "[OracleValidator] Reference solution execution error on visible test: args=%s",
+                    "[OracleValidator] Reference solution execution error on visible test: "
+                    "args=%s error=%s",
                     repr(test.args)[:_REPR_MAX],
+                    error,
                 )
                 return False
             if not _outputs_equal(ref_output, test.expected):
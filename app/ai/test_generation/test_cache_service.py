@@ -2,27 +2,67 @@
 
 import json
 import hashlib
+import itertools
+import sqlite3
+import threading
+import time
+from contextlib import closing
 from pathlib import Path
 from typing import List, Optional
 
 from domain.contracts.question.question import Question
 from domain.contracts.execution.coding_test_case import CodingTestCase
+from infrastructure.config.settings import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Databases whose schema, version sweep and legacy migration already ran
+# in this process.
+_PREPARED_DATABASES: set[str] = set()
+_PREPARE_LOCK = threading.Lock()
+
+# Stores across all instances; eviction runs every _EVICT_EVERY of them.
+_STORE_COUNTER = itertools.count(1)
 
 
 class TestCacheService:
     # Persistent cache for AI-generated tests.
     # Supports backward compatibility with legacy TestCase format.
     #
+    # Entries live in a SQLite database (WAL mode) shared by every instance,
+    # thread and process: one row per cache key, written with a single
+    # upsert, and evicted least-recently-used first beyond
+    # settings.test_cache_max_entries. The legacy JSON cache (CACHE_FILE)
+    # is imported once, the first time the database is opened.
+    #
     # CACHE_VERSION: increment to invalidate all previously stored entries.
+    # Rows stored under another version are deleted when the database is
+    # first opened by a process.
     # v2: rejects null-expected test cases cached in v1.
     # v3: invalidates all pre-oracle-validated entries (R5.2).
     # v4: cache key includes reference_solution hash (R5.3.4).
 
     CACHE_FILE = Path("data/ai_test_cache.json")
+    DB_FILE = Path("data/ai_test_cache.db")
     CACHE_VERSION = 4
 
-    def __init__(self):
-        self._cache = self._load_cache()
+    _BUSY_TIMEOUT_SECONDS = 5.0
+    _EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        legacy_json_path: Path | None = None,
+        max_entries: int | None = None,
+    ):
+        self._db_path = Path(db_path) if db_path is not None else self.DB_FILE
+        self._legacy_json_path = (
+            Path(legacy_json_path) if legacy_json_path is not None else self.CACHE_FILE
+        )
+        self._max_entries = (
+            max_entries if max_entries is not None else settings.test_cache_max_entries
+        )
 
     # =========================================================
     # PUBLIC API
@@ -36,10 +76,22 @@ class TestCacheService:
 
         key = self._build_cache_key(question, num_tests)
 
-        if key not in self._cache:
-            return None
+        with closing(self._connect()) as conn:
+
+            row = conn.execute(
+                "SELECT tests FROM test_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE test_cache SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
 
-        cached = self._cache[key]
+        cached = json.loads(row[0])
 
         results: List[CodingTestCase] = []
 
@@ -94,16 +146,41 @@ class TestCacheService:
         # STORE ONLY NEW FORMAT
         # ---------------------------------------------------------
 
-        self._cache[key] = [
-            {
-                "args": t.args,
-                "kwargs": t.kwargs,
-                "expected": t.expected,
-            }
-            for t in tests
-        ]
+        payload = json.dumps(
+            [
+                {
+                    "args": t.args,
+                    "kwargs": t.kwargs,
+                    "expected": t.expected,
+                }
+                for t in tests
+            ]
+        )
+
+        with closing(self._connect()) as conn:
+
+            conn.execute(
+                """
+                INSERT INTO test_cache (key, version, tests, last_used)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    version = excluded.version,
+                    tests = excluded.tests,
+                    last_used = excluded.last_used
+                """,
+                (key, self.CACHE_VERSION, payload, time.time()),
+            )
+
+            if next(_STORE_COUNTER) % self._EVICT_EVERY == 0:
+                self._evict(conn)
+
+    def cache_key(
+        self,
+        question: Question,
+        num_tests: int,
+    ) -> str:
 
-        self._save_cache()
+        return self._build_cache_key(question, num_tests)
 
     # =========================================================
     # CACHE MANAGEMENT
@@ -121,20 +198,140 @@ class TestCacheService:
 
         return hashlib.sha256(payload.encode()).hexdigest()
 
-    def _load_cache(self) -> dict:
+    def _connect(self) -> sqlite3.Connection:
+
+        self._prepare()
+
+        # Autocommit: every statement is its own transaction, so a store
+        # is one atomic upsert.
+        return sqlite3.connect(
+            self._db_path,
+            timeout=self._BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+        )
+
+    def _prepare(self) -> None:
+
+        db_key = str(self._db_path.resolve())
+
+        if db_key in _PREPARED_DATABASES:
+            return
 
-        if not self.CACHE_FILE.exists():
+        with _PREPARE_LOCK:
+
+            if db_key in _PREPARED_DATABASES:
+                return
+
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with closing(
+                sqlite3.connect(
+                    self._db_path,
+                    timeout=self._BUSY_TIMEOUT_SECONDS,
+                    isolation_level=None,
+                )
+            ) as conn:
+
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS test_cache (
+                        key TEXT PRIMARY KEY,
+                        version INTEGER NOT NULL,
+                        tests TEXT NOT NULL,
+                        last_used REAL NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS test_cache_last_used ON test_cache (last_used)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS test_cache_meta (name TEXT PRIMARY KEY, value TEXT)"
+                )
+
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._migrate_legacy_json(conn)
+                    conn.execute(
+                        "DELETE FROM test_cache WHERE version != ?",
+                        (self.CACHE_VERSION,),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+
+                self._evict(conn)
+
+            _PREPARED_DATABASES.add(db_key)
+
+    def _migrate_legacy_json(
+        self,
+        conn: sqlite3.Connection,
+    ) -> None:
+
+        migrated = conn.execute(
+            "SELECT value FROM test_cache_meta WHERE name = 'legacy_json_migrated'"
+        ).fetchone()
+
+        if migrated is not None:
+            return
+
+        legacy = self._load_legacy_json()
+
+        # Legacy keys already embed the version they were stored under;
+        # entries from older versions are simply never looked up again and
+        # are the first to be evicted (last_used = 0).
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO test_cache (key, version, tests, last_used)
+            VALUES (?, ?, ?, 0)
+            """,
+            [
+                (key, self.CACHE_VERSION, json.dumps(items))
+                for key, items in legacy.items()
+                if isinstance(items, list)
+            ],
+        )
+
+        conn.execute(
+            "INSERT INTO test_cache_meta (name, value) VALUES ('legacy_json_migrated', ?)",
+            (str(len(legacy)),),
+        )
+
+        if legacy:
+            logger.info(
+                "[TestCacheService] Migrated %d entries from %s",
+                len(legacy),
+                self._legacy_json_path,
+            )
+
+    def _load_legacy_json(self) -> dict:
+
+        if not self._legacy_json_path.exists():
             return {}
 
         try:
-            with open(self.CACHE_FILE, "r") as f:
-                return json.load(f)
+            with open(self._legacy_json_path, "r") as f:
+                data = json.load(f)
         except Exception:
             return {}
 
-    def _save_cache(self) -> None:
+        return data if isinstance(data, dict) else {}
 
-        self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    def _evict(
+        self,
+        conn: sqlite3.Connection,
+    ) -> None:
 
-        with open(self.CACHE_FILE, "w") as f:
-            json.dump(self._cache, f, indent=2)
+        conn.execute(
+            """
+            DELETE FROM test_cache WHERE key IN (
+                SELECT key FROM test_cache
+                ORDER BY last_used DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
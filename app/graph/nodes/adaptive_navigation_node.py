@@ -81,6 +81,34 @@ def _update_retrieval_memory(
     return variety_memory.record_question(memory=updated, question=question)
 
 
+def _project_answered_memory(
+    memory: InterviewRetrievalMemory,
+    question: Question,
+    memory_updater: InterviewMemoryUpdater,
+) -> InterviewRetrievalMemory:
+    """Memory as the NEXT transition will see it once question is evaluated.
+
+    Asked ids, covered domains, difficulty history and variety memory follow
+    update_from_question_evaluation; the score-driven fields (weak/strong
+    domains, average score, count) are unknown until then and keep their
+    current values.
+    """
+
+    answered = memory_updater.update_from_question_evaluation(
+        memory=memory,
+        question=question,
+        evaluation_score=memory.average_score,
+    )
+    return answered.model_copy(
+        update={
+            "weak_domains": list(memory.weak_domains),
+            "strong_domains": list(memory.strong_domains),
+            "average_score": memory.average_score,
+            "question_count": memory.question_count,
+        }
+    )
+
+
 class AdaptiveNavigationNode:
 
     def __init__(
@@ -173,6 +201,8 @@ class AdaptiveNavigationNode:
                     else BusinessContext.GENERIC
                 )
                 try:
+                    # Served from the background prefetch when its snapshot
+                    # still matches the updated memory; enriched either way.
                     new_question, retrieval_memory = self._lazy_service.generate_next_question(
                         role=state.role.type,
                         level=level,
@@ -183,6 +213,8 @@ class AdaptiveNavigationNode:
                         job_description=job_description,
                         company_description=company_description,
                         business_context=business_context,
+                        session_id=state.interview_id,
+                        question_enricher=self._question_enricher,
                     )
                 except Exception as exc:
                     logger.error(
@@ -216,12 +248,9 @@ class AdaptiveNavigationNode:
                         }
                     )
 
-                if self._question_enricher is not None:
-                    new_question = self._question_enricher(new_question)
-
                 updated_questions = [*questions, new_question]
 
-                return state.model_copy(
+                new_state = state.model_copy(
                     update={
                         "questions": updated_questions,
                         "current_question_index": current_index + 1,
@@ -236,6 +265,10 @@ class AdaptiveNavigationNode:
                     }
                 )
 
+                self.prefetch_next(new_state)
+
+                return new_state
+
             if current_index < last_index:
                 return state.model_copy(
                     update={
@@ -262,6 +295,9 @@ class AdaptiveNavigationNode:
 
         if action == ActionType.GENERATE_REPORT:
 
+            if self._lazy_service is not None:
+                self._lazy_service.cancel_prefetch(state.interview_id)
+
             return state.model_copy(
                 update={
                     "awaiting_user_input": False,
@@ -271,3 +307,61 @@ class AdaptiveNavigationNode:
             )
 
         return state
+
+    def prefetch_next(self, state: InterviewState) -> None:
+        """Start building the next planned question while the current one is answered.
+
+        The build starts from the memory the NEXT transition will produce
+        once the current question is evaluated, minus the score-driven
+        fields; the lazy service drops it only if the real update changes
+        the adaptive signals enough. Best effort: failures are logged and
+        never affect the interview.
+        """
+
+        questions = state.questions or []
+        current_question = state.current_question
+
+        if (
+            not state.adaptive_interview_enabled
+            or not state.planned_areas
+            or self._lazy_service is None
+            or current_question is None
+            or len(questions) >= len(state.planned_areas)
+        ):
+            return
+
+        context_profile = state.context_profile
+
+        try:
+            projected_memory = _project_answered_memory(
+                memory=state.retrieval_memory,
+                question=current_question,
+                memory_updater=self._memory_updater,
+            )
+            self._lazy_service.prefetch_next_question(
+                session_id=state.interview_id,
+                role=state.role.type,
+                level=(
+                    self._seniority_level
+                    if self._seniority_level is not None
+                    else SeniorityLevel(state.seniority_level)
+                ),
+                interview_type=state.interview_type,
+                planned_areas=state.planned_areas,
+                generated_count=len(questions),
+                memory=projected_memory,
+                job_description=(
+                    context_profile.job_description if context_profile is not None else None
+                ),
+                company_description=(
+                    context_profile.company_description if context_profile is not None else None
+                ),
+                business_context=(
+                    context_profile.business_context
+                    if context_profile is not None
+                    else BusinessContext.GENERIC
+                ),
+                question_enricher=self._question_enricher,
+            )
+        except Exception as exc:
+            logger.warning("Next-question prefetch not started: %s", exc)
@@ -48,6 +48,15 @@ def navigation_node(state: InterviewState) -> InterviewState:
     return _default_navigation_node(state)
 
 
+def prefetch_next_question(state: InterviewState) -> None:
+    """Start the configured node's background build of the next planned question.
+
+    No-op until configure_navigation_node() has been called.
+    """
+    if _default_navigation_node is not None:
+        _default_navigation_node.prefetch_next(state)
+
+
 def _build_last_question_context(state: InterviewState) -> LastQuestionContext | None:
     question = state.current_question
     if question is None:
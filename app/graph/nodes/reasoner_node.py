@@ -41,8 +41,8 @@ from domain.contracts.observation.extraction.observation_extraction_context impo
 )
 from domain.observation.runtime.in_memory_observation_store import InMemoryObservationStore
 from domain.observation.runtime.default_observation_registry import build_default_observation_registry
-from services.knowledge_pipeline.default_knowledge_pipeline_factory import (
-    build_default_knowledge_pipeline,
+from services.knowledge_pipeline.knowledge_pipeline_registry import (
+    get_knowledge_pipeline_registry,
 )
 from services.knowledge_pipeline.knowledge_pipeline_context import KnowledgePipelineContext
 
@@ -193,6 +193,9 @@ def _run_knowledge_pipeline(
 
     Uses the session-scoped ObservationStore (already populated by ObservationExtractor).
     Extraction is skipped (skip_extraction_if_store_populated=True).
+    The session's pipeline comes from KnowledgePipelineRegistry, so its
+    IncrementalFeatureEngine only processes observations added since the
+    previous cycle.
     Returns the new CandidateProfile, or the prior candidate_profile_v2
     (unchanged) if the pipeline fails.  Never raises.
     """
@@ -204,8 +207,6 @@ def _run_knowledge_pipeline(
             )
             return state.candidate_profile_v2
 
-        pipeline = build_default_knowledge_pipeline(store=updated_observation_store)
-
         ctx = KnowledgePipelineContext(
             session_id=state.interview_id,
             candidate_identity_id=_resolve_candidate_identity_id(state),
@@ -214,7 +215,11 @@ def _run_knowledge_pipeline(
             prior_profile=state.candidate_profile_v2,
         )
 
-        result = pipeline.run(ctx)
+        result = get_knowledge_pipeline_registry().run(
+            session_id=state.interview_id,
+            store=updated_observation_store,
+            context=ctx,
+        )
 
         if result.is_successful and result.profile is not None:
             logger.debug(
@@ -346,18 +351,7 @@ def _append_reasoning_entry(
 
     # Propagate new_evidence into evidence_store (immutable append).
     # Use memory_with_metrics as base so session_metrics are already updated.
-    store = memory_with_metrics.evidence_store
-    for sig in decision.new_evidence:
-        try:
-            store = store.append(sig)
-        except ValueError:
-            logger.warning(
-                "evidence_store_capacity_exceeded in reasoner_node | "
-                "q_idx=%d store_size=%d",
-                state.current_question_index,
-                len(store.signals),
-            )
-            break
+    store = memory_with_metrics.evidence_store.extend(decision.new_evidence)
 
     return InterviewMemory(
         evidence_store=store,
@@ -12,7 +12,8 @@ Responsibilities (orchestration only):
 8. Write state.session_history on success.
 
 KnowledgePipeline is NOT executed here. Features come from
-state.candidate_profile_v2.features (ADR-018, ADR-020).
+state.candidate_profile_v2.features (ADR-018, ADR-020). The session's entry
+in KnowledgePipelineRegistry is released, since no reasoning cycle follows.
 
 NarrativeGenerator failure falls back to structural stub.
 CoachingEngine failure falls back to CoachingBuilder.empty().
@@ -55,6 +56,9 @@ from services.narrative_generator.narrative_generation_context import NarrativeG
 from services.narrative_generator.narrative_generator import NarrativeGenerator
 from services.session_close.session_close_context import SessionCloseContext
 from services.session_close.session_close_pipeline import SessionClosePipeline
+from services.knowledge_pipeline.knowledge_pipeline_registry import (
+    get_knowledge_pipeline_registry,
+)
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -105,6 +109,8 @@ def session_close_node(state: InterviewState) -> InterviewState:
         logger.debug("session_close_node: session_history already set — skipping (idempotency)")
         return state
 
+    get_knowledge_pipeline_registry().evict(state.interview_id)
+
     try:
         candidate_identity_id = state.candidate_identity_id or state.interview_id
         session_id = state.interview_id
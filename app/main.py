@@ -3,7 +3,8 @@
 from app.core.logger import configure_logging, get_logger
 from app.process_edge.asgi import build_process_asgi_app, run_process_app
 from app.ui.app import build_app
-from services.corpus_persistence.corpus_loader import ensure_corpus
+from services.coding_engine.sandbox_worker_pool import warm_default_worker_pool
+from services.corpus_persistence.corpus_loader import ensure_corpus, warm_corpus_backend
 
 configure_logging()
 logger = get_logger(__name__)
@@ -14,6 +15,10 @@ def main() -> None:
 
     hf_token = settings.hf_token
     ensure_corpus(hf_token=hf_token)
+    if settings.retrieval_warmup_enabled:
+        warm_corpus_backend()
+    if settings.coding_sandbox_worker_pool_enabled:
+        warm_default_worker_pool()
 
     logger.info("Creating Gradio app...")
     demo = build_app()
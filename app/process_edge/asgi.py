@@ -25,7 +25,7 @@ from infrastructure.health.http import (
     readiness_response_body,
     readiness_status_code,
 )
-from infrastructure.health.probes import LLMConnectivityCheck
+from infrastructure.health.probes import LLMConnectivityCheck, RetrievalWarmStateSource
 from infrastructure.health.readiness import evaluate_readiness
 
 
@@ -34,6 +34,7 @@ def register_readiness_route(
     *,
     settings: Settings | None = None,
     llm_connectivity_check: LLMConnectivityCheck | None = None,
+    retrieval_warm_state: RetrievalWarmStateSource | None = None,
 ) -> None:
     """Attach GET /health/ready; thin HTTP adapter over evaluate_readiness."""
 
@@ -42,6 +43,7 @@ def register_readiness_route(
         report = evaluate_readiness(
             settings,
             llm_connectivity_check=llm_connectivity_check,
+            retrieval_warm_state=retrieval_warm_state,
         )
         return JSONResponse(
             content=readiness_response_body(report),
@@ -54,6 +56,7 @@ def build_process_asgi_app(
     *,
     settings: Settings | None = None,
     llm_connectivity_check: LLMConnectivityCheck | None = None,
+    retrieval_warm_state: RetrievalWarmStateSource | None = None,
     drain_controller: ShutdownDrainController | None = None,
 ) -> Any:
     """Compose process-edge FastAPI with readiness, Gradio, and drain middleware."""
@@ -67,6 +70,7 @@ def build_process_asgi_app(
         api,
         settings=settings,
         llm_connectivity_check=llm_connectivity_check,
+        retrieval_warm_state=retrieval_warm_state,
     )
     mounted = mount_gradio_app(api, gradio_blocks, path="/")
     return DrainMiddleware(mounted, controller)
@@ -1,5 +1,6 @@
 # app/ui/state_handlers/start.py
 
+from concurrent.futures import as_completed
 from typing import Generator
 import time
 
@@ -17,6 +18,7 @@ from services.interview_length.interview_length_planner import (
 )
 
 from app.ai.test_generation.ai_test_generator import AITestGenerator
+from app.ai.test_generation.hidden_test_generation_stage import HiddenTestGenerationStage
 from app.settings.constants import (
     QUESTIONS_PER_AREA,
     USE_BATCH_QUESTION_GENERATION,
@@ -28,7 +30,10 @@ from app.runtime.interview_runtime import (
     get_runtime_llm,
     get_runtime_metrics_collector,
 )
-from app.graph.nodes.navigation_node import configure_navigation_node
+from app.graph.nodes.navigation_node import (
+    configure_navigation_node,
+    prefetch_next_question,
+)
 
 from domain.contracts.interview_state import InterviewState
 from domain.contracts.interview.interview_context_profile import InterviewContextProfile
@@ -113,6 +118,12 @@ def start_interview(
         resolved_business_context = BusinessContext.from_company_description(raw_cd)
         resolved_domain_profile = CodingDomainProfileRegistry.get(resolved_business_context)
 
+        test_stage = HiddenTestGenerationStage(
+            test_generator,
+            num_tests=3,
+            domain_profile=resolved_domain_profile,
+        )
+
         areas = interview_type_enum.get_areas()
         area_question_counts = _compute_questions_per_area(
             interview_length=resolved_length,
@@ -130,17 +141,9 @@ def start_interview(
             )
         else:
 
-            def _enrich_question(question):
-                if question.type.name == "CODING":
-                    hidden_tests = test_generator.generate_tests(
-                        question, num_tests=3, domain_profile=resolved_domain_profile
-                    )
-                    return question.model_copy(update={"hidden_tests": hidden_tests})
-                return question
-
             configure_navigation_node(
                 lazy_service=question_intelligence.lazy_adaptive_service,
-                question_enricher=_enrich_question,
+                question_enricher=test_stage.enrich,
                 seniority_level=level_enum,
             )
 
@@ -176,16 +179,20 @@ def start_interview(
         state.current_progress = _smooth_progress(state.current_progress, map_loader_progress(LoaderStep.FINALIZING))
         time.sleep(0.2)
 
-        enriched_questions = []
+        # Tests for every coding question are generated concurrently;
+        # progress advances towards FINALIZING as each one completes.
+        test_futures = test_stage.submit_all(questions)
+        pending_tests = [f for f in test_futures if not f.done()]
 
-        for q in questions:
-            if q.type.name == "CODING":
-                hidden_tests = test_generator.generate_tests(
-                    q, num_tests=3, domain_profile=resolved_domain_profile
-                )
-                q = q.model_copy(update={"hidden_tests": hidden_tests})
+        # Continue from the smoothed value so the loader never moves backwards.
+        tests_progress = state.current_progress
+        tests_progress_span = map_loader_progress(LoaderStep.FINALIZING) - tests_progress
+
+        for completed, _ in enumerate(as_completed(pending_tests), start=1):
+            state.current_progress = tests_progress + tests_progress_span * completed // len(pending_tests)
+            yield UIOutputAdapter.to_gradio(build_ui_response_from_state(state))
 
-            enriched_questions.append(q)
+        enriched_questions = [f.result() for f in test_futures]
 
         # -----------------------------------------------------
         # STEP 4 — BUILD STATE
@@ -227,6 +234,9 @@ def start_interview(
                 }
             )
 
+            # Build the second planned question while the first is answered.
+            prefetch_next_question(state)
+
         # -----------------------------------------------------
         # FOLLOW-UP SELECTOR — populate eligible indices once
         # -----------------------------------------------------
@@ -19,7 +19,7 @@ from domain.contracts.feature.feature_provenance import FeatureProvenance
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.profile_feature import ProfileFeature
 from domain.contracts.feature.feature_composer import FeatureComposer
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FeatureUpdater, FoldingFeatureUpdater
 from domain.contracts.feature.feature_merge_policy import FeatureMergePolicy
 from domain.contracts.feature.feature_replacement_policy import FeatureReplacementPolicy
 # E01-M4 runtime support layer
@@ -49,6 +49,7 @@ __all__ = [
     "ProfileFeature",
     "FeatureComposer",
     "FeatureUpdater",
+    "FoldingFeatureUpdater",
     "FeatureMergePolicy",
     "FeatureReplacementPolicy",
     # E01-M4
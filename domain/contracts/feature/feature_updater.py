@@ -57,3 +57,34 @@ class FeatureUpdater(ABC):
         Returns:
             FeatureCandidate list — may be empty if no relevant Observations were found.
         """
+
+
+class FoldingFeatureUpdater(FeatureUpdater):
+    """FeatureUpdater whose candidates can be maintained by folding deltas.
+
+    Declares that produce(observations) is equivalent to folding the
+    observations, in order, into an accumulator state and reading candidates
+    off that state. IncrementalFeatureEngine keeps one state per session and
+    folds only observations that arrived since the prior cycle (ADR-020 §H).
+
+    Contract:
+    - fold(fold(s, a), b) must yield the same candidates as fold(s, a + b).
+    - An observation's contribution must not depend on later observations or
+      on lifecycle status changes made after it was appended.
+    - fold may update state in place; it must return the state to keep.
+    """
+
+    @abstractmethod
+    def initial_state(self) -> Any:
+        """Return an empty accumulator state."""
+
+    @abstractmethod
+    def fold(self, state: Any, observations: list[Any]) -> Any:
+        """Fold observations (question_index-ordered) into state and return it."""
+
+    @abstractmethod
+    def candidates_from_state(self, state: Any) -> list[FeatureCandidate]:
+        """Produce FeatureCandidates from an accumulator state."""
+
+    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
+        return self.candidates_from_state(self.fold(self.initial_state(), observations))
@@ -5,6 +5,7 @@
 from abc import ABC, abstractmethod
 
 from domain.contracts.observation.observation import Observation
+from domain.contracts.observation.observation_filter import ObservationFilter
 from domain.contracts.observation.observation_id import ObservationId
 from domain.contracts.observation.observation_query import ObservationQuery
 from domain.contracts.observation.observation_snapshot import ObservationSnapshot
@@ -65,6 +66,23 @@ class ObservationStore(ABC):
     def count(self) -> int:
         """Return the total number of stored Observations (all statuses)."""
 
+    def count_matching(self, observation_filter: ObservationFilter) -> int:
+        """Return the number of Observations matching the filter (no pagination).
+
+        The default pages through query(); indexed stores should override it.
+        """
+        page_size = 1000
+        total = 0
+        offset = 0
+        while True:
+            page = self.query(
+                ObservationQuery(filter=observation_filter, limit=page_size, offset=offset)
+            )
+            total += len(page)
+            if len(page) < page_size:
+                return total
+            offset += page_size
+
     @abstractmethod
     def session_id(self) -> str:
         """Return the session identifier this store is scoped to."""
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import bisect
+import threading
+from typing import Iterable
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 from domain.contracts.reasoning.evidence_polarity import EvidencePolarity
 from domain.contracts.reasoning.evidence_signal import EvidenceSignal
@@ -10,7 +14,114 @@ from domain.contracts.reasoning.evidence_source import EvidenceSource
 from domain.contracts.reasoning.evidence_type import EvidenceType
 from domain.contracts.reasoning.profile_dimension import ProfileDimension
 
-_MAX_SIGNALS = 200
+SignalIdentityKey = tuple[EvidenceType, ProfileDimension, int, EvidenceSource]
+
+
+def signal_identity_key(signal: EvidenceSignal) -> SignalIdentityKey:
+    """Structural identity of a signal: (signal_type, dimension, question_index, source)."""
+    return (signal.signal_type, signal.dimension, signal.question_index, signal.source)
+
+
+class _EvidenceIndex:
+    """Signal positions by question, dimension, type, timestamp and identity key.
+
+    Shared by a lineage of stores, each extending the previous one, so a
+    store built by append() reuses its parent's index and only indexes the
+    signals it added, on first query. Every store in the lineage is a prefix
+    of the longest one (`_claimed` signals); a store sees the positions
+    below its own length.
+    """
+
+    def __init__(self, claimed: int) -> None:
+        self._lock = threading.Lock()
+        self._claimed = claimed
+        self._size = 0
+        self._buckets: dict[str, dict[object, list[int]]] = {
+            "question": {},
+            "dimension": {},
+            "type": {},
+            "timestamp": {},
+        }
+        self._timestamps: list[int] = []
+        self._first_by_identity: dict[SignalIdentityKey, int] = {}
+
+    def claim(self, parent_size: int, child_size: int) -> bool:
+        """Let a store extending the lineage tip by the child's signals join it.
+
+        Fails when another store already extended the same parent: the
+        lineages diverge and the child must build its own index.
+        """
+        with self._lock:
+            if self._claimed != parent_size:
+                return False
+            self._claimed = child_size
+            return True
+
+    def positions(self, signals: list[EvidenceSignal], bucket: str, key: object) -> list[int]:
+        with self._lock:
+            self._sync(signals)
+            found = self._buckets[bucket].get(key, [])
+            return found[:bisect.bisect_left(found, len(signals))]
+
+    def contains_identity(self, signals: list[EvidenceSignal], key: SignalIdentityKey) -> bool:
+        with self._lock:
+            self._sync(signals)
+            first = self._first_by_identity.get(key)
+            return first is not None and first < len(signals)
+
+    def recent(self, signals: list[EvidenceSignal], n: int) -> list[int]:
+        """Positions of the `n` latest signals: timestamp desc, then insertion order."""
+        with self._lock:
+            self._sync(signals)
+            size = len(signals)
+            selected: list[int] = []
+            for timestamp in reversed(self._timestamps):
+                found = self._buckets["timestamp"][timestamp]
+                selected.extend(found[:bisect.bisect_left(found, size)])
+                if len(selected) >= n:
+                    break
+            return selected[:n]
+
+    def _sync(self, signals: list[EvidenceSignal]) -> None:
+        for position in range(self._size, len(signals)):
+            signal = signals[position]
+            self._add("question", signal.question_index, position)
+            self._add("dimension", signal.dimension, position)
+            self._add("type", signal.signal_type, position)
+            if signal.timestamp_question_index not in self._buckets["timestamp"]:
+                bisect.insort(self._timestamps, signal.timestamp_question_index)
+            self._add("timestamp", signal.timestamp_question_index, position)
+            self._first_by_identity.setdefault(signal_identity_key(signal), position)
+        self._size = max(self._size, len(signals))
+
+    def _add(self, bucket: str, key: object, position: int) -> None:
+        self._buckets[bucket].setdefault(key, []).append(position)
+
+
+class _IndexSlot:
+    """A store's handle on its lineage index.
+
+    A cache rather than state: slots always compare equal, so stores compare
+    by their signals alone, and copies start empty and re-index lazily.
+    """
+
+    __slots__ = ("entry",)
+
+    def __init__(self) -> None:
+        # (signals list the index was built for, index) — one attribute so
+        # that concurrent readers never see a mismatched pair.
+        self.entry: tuple[list[EvidenceSignal], _EvidenceIndex] | None = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IndexSlot)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __deepcopy__(self, memo: dict) -> _IndexSlot:
+        return _IndexSlot()
+
+    def __reduce__(self):
+        return (_IndexSlot, ())
 
 
 class EvidenceStoreStatistics(BaseModel):
@@ -31,18 +142,19 @@ class EvidenceStoreStatistics(BaseModel):
 class EvidenceStore(BaseModel):
     """Single point of access for all EvidenceSignal queries (ADR-046).
 
-    Append-only; capped at _MAX_SIGNALS (200).
-    All methods are O(n), deterministic, side-effect-free.
+    Append-only and uncapped. Stores derived by append()/extend() share one
+    lazily maintained index with the store they extend, so lookups by
+    question, dimension, type and identity key, and recent(), cost the size
+    of their result rather than of the store. Deterministic, side-effect-free.
     Single-writer: InterviewReasoner (ADR-032, ADR-038).
     """
 
-    signals: list[EvidenceSignal] = Field(
-        default_factory=list,
-        max_length=_MAX_SIGNALS,
-    )
+    signals: list[EvidenceSignal] = Field(default_factory=list)
 
     model_config = {"frozen": True, "extra": "forbid"}
 
+    _index_slot: _IndexSlot = PrivateAttr(default_factory=_IndexSlot)
+
     # ------------------------------------------------------------------
     # Factory (immutable-friendly mutation)
     # ------------------------------------------------------------------
@@ -51,17 +163,29 @@ class EvidenceStore(BaseModel):
         """Return a new EvidenceStore with `signal` appended.
 
         Preserves immutability: does not mutate self.
-        Raises ValueError if capacity (_MAX_SIGNALS) would be exceeded.
         """
-        if len(self.signals) >= _MAX_SIGNALS:
-            raise ValueError(
-                f"EvidenceStore capacity {_MAX_SIGNALS} exceeded; "
-                "cannot append further signals."
-            )
-        return EvidenceStore(signals=[*self.signals, signal])
+        return self.extend([signal])
+
+    def extend(self, signals: Iterable[EvidenceSignal]) -> EvidenceStore:
+        """Return a new EvidenceStore with `signals` appended, in order.
+
+        Only the new signals are validated; the existing ones are shared
+        with self, as is self's index. Returns self when `signals` is empty.
+        """
+        added = [EvidenceSignal.model_validate(s) for s in signals]
+        if not added:
+            return self
+
+        combined = [*self.signals, *added]
+        store = EvidenceStore.model_construct(signals=combined)
+
+        index = self._index()
+        if index.claim(len(self.signals), len(combined)):
+            store._index_slot.entry = (combined, index)
+        return store
 
     # ------------------------------------------------------------------
-    # Filters (all O(n), return new list)
+    # Filters (return new list)
     # ------------------------------------------------------------------
 
     def positive(self) -> list[EvidenceSignal]:
@@ -71,13 +195,13 @@ class EvidenceStore(BaseModel):
         return [s for s in self.signals if s.polarity == EvidencePolarity.NEGATIVE]
 
     def by_dimension(self, dim: ProfileDimension) -> list[EvidenceSignal]:
-        return [s for s in self.signals if s.dimension == dim]
+        return self._lookup("dimension", dim)
 
     def by_question(self, question_index: int) -> list[EvidenceSignal]:
-        return [s for s in self.signals if s.question_index == question_index]
+        return self._lookup("question", question_index)
 
     def by_type(self, evidence_type: EvidenceType) -> list[EvidenceSignal]:
-        return [s for s in self.signals if s.signal_type == evidence_type]
+        return self._lookup("type", evidence_type)
 
     def by_source(self, source: EvidenceSource) -> list[EvidenceSignal]:
         return [s for s in self.signals if s.source == source]
@@ -89,12 +213,11 @@ class EvidenceStore(BaseModel):
         """Return up to `n` most recent signals ordered by timestamp_question_index desc."""
         if n <= 0:
             return []
-        sorted_signals = sorted(
-            self.signals,
-            key=lambda s: s.timestamp_question_index,
-            reverse=True,
-        )
-        return sorted_signals[:n]
+        return [self.signals[p] for p in self._index().recent(self.signals, n)]
+
+    def contains_identity(self, signal: EvidenceSignal) -> bool:
+        """True if a signal with the same identity key as `signal` is stored."""
+        return self._index().contains_identity(self.signals, signal_identity_key(signal))
 
     # ------------------------------------------------------------------
     # Aggregates
@@ -136,3 +259,18 @@ class EvidenceStore(BaseModel):
             mean_strength_positive=round(pos_strength_sum / pos_count, 4) if pos_count else 0.0,
             mean_strength_negative=round(neg_strength_sum / neg_count, 4) if neg_count else 0.0,
         )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _index(self) -> _EvidenceIndex:
+        entry = self._index_slot.entry
+        # A model_copy() with new signals shares the slot but not the list.
+        if entry is None or entry[0] is not self.signals:
+            entry = (self.signals, _EvidenceIndex(claimed=len(self.signals)))
+            self._index_slot.entry = entry
+        return entry[1]
+
+    def _lookup(self, bucket: str, key: object) -> list[EvidenceSignal]:
+        return [self.signals[p] for p in self._index().positions(self.signals, bucket, key)]
@@ -11,14 +11,34 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Hashable
 
 from domain.contracts.observation.observation import Observation
+from domain.contracts.observation.observation_filter import ObservationFilter
 from domain.contracts.observation.observation_id import ObservationId
-from domain.contracts.observation.observation_query import ObservationQuery
+from domain.contracts.observation.observation_origin import ObservationOrigin
+from domain.contracts.observation.observation_query import (
+    ObservationQuery,
+    ObservationSortField,
+    ObservationSortOrder,
+)
 from domain.contracts.observation.observation_snapshot import ObservationSnapshot
 from domain.contracts.observation.observation_status import ObservationStatus
 from domain.contracts.observation.observation_store import ObservationStore
+from domain.contracts.observation.observation_type import ObservationType
+from domain.observation.runtime.observation_collection import matches_filter
+
+_DedupKey = tuple[ObservationType, ObservationOrigin, int, str]
+
+# Ordered id sets: dict keys keep insertion order and give O(1) add/remove.
+_IdSet = dict[str, None]
+
+_SORT_KEYS = {
+    ObservationSortField.QUESTION_INDEX: lambda o: o.metadata.question_index,
+    ObservationSortField.OBSERVED_AT: lambda o: o.metadata.observed_at,
+    ObservationSortField.CONFIDENCE: lambda o: o.confidence,
+    ObservationSortField.WEIGHT: lambda o: o.weight,
+}
 
 
 class InMemoryObservationStore(ObservationStore):
@@ -29,6 +49,10 @@ class InMemoryObservationStore(ObservationStore):
     session_id) tuple is transitioned to SUPERSEDED before the new one is
     inserted (ADR-017 §4).
 
+    Secondary indexes (dedup key → ACTIVE id, type, status, question_index)
+    keep append() O(1) and let query() start from the narrowest candidate set
+    instead of scanning the whole session.
+
     Thread-safety: NOT thread-safe. Designed for single-session, single-thread
     use within a LangGraph node cycle.
     """
@@ -38,6 +62,12 @@ class InMemoryObservationStore(ObservationStore):
             raise ValueError("session_id must be non-empty")
         self._session_id: str = session_id
         self._store: dict[str, Observation] = {}
+        self._sequence: dict[str, int] = {}
+        self._next_sequence: int = 0
+        self._active_by_key: dict[_DedupKey, str] = {}
+        self._ids_by_type: dict[ObservationType, _IdSet] = {}
+        self._ids_by_status: dict[ObservationStatus, _IdSet] = {}
+        self._ids_by_question_index: dict[int, _IdSet] = {}
 
     # ------------------------------------------------------------------
     # ObservationStore ABC
@@ -51,31 +81,114 @@ class InMemoryObservationStore(ObservationStore):
 
     def append(self, observation: Observation) -> None:
         """Append an Observation, superseding any active duplicate."""
-        key = (
-            observation.observation_type,
-            observation.metadata.origin,
-            observation.metadata.question_index,
-            observation.metadata.session_id,
-        )
-        for oid, existing in list(self._store.items()):
-            ek = (
-                existing.observation_type,
-                existing.metadata.origin,
-                existing.metadata.question_index,
-                existing.metadata.session_id,
-            )
-            if ek == key and existing.status == ObservationStatus.ACTIVE:
-                self._store[oid] = existing.with_status(ObservationStatus.SUPERSEDED)
-        self._store[observation.id.value] = observation
+        key = _dedup_key(observation)
+        active_id = self._active_by_key.get(key)
+        if active_id is not None:
+            existing = self._store[active_id]
+            self._put(existing.with_status(ObservationStatus.SUPERSEDED))
+        self._put(observation)
 
     def get(self, observation_id: Any) -> Observation | None:
         key = observation_id.value if isinstance(observation_id, ObservationId) else observation_id
         return self._store.get(key)
 
     def query(self, observation_query: ObservationQuery) -> list[Observation]:
-        return list(self._store.values())
+        """Filter, sort and paginate using the narrowest secondary index."""
+        results = self._select(observation_query.filter)
+        results.sort(
+            key=_SORT_KEYS[observation_query.sort_by],
+            reverse=observation_query.sort_order == ObservationSortOrder.DESC,
+        )
+        start = observation_query.offset
+        return results[start:start + observation_query.limit]
+
+    def count_matching(self, observation_filter: ObservationFilter) -> int:
+        return len(self._select(observation_filter))
 
     def snapshot(self) -> ObservationSnapshot:
         return ObservationSnapshot.from_observations(
             self._session_id, list(self._store.values())
         )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _put(self, observation: Observation) -> None:
+        """Insert or replace an Observation and keep every index in step."""
+        oid = observation.id.value
+        previous = self._store.get(oid)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._sequence[oid] = self._next_sequence
+            self._next_sequence += 1
+
+        self._store[oid] = observation
+        _index_add(self._ids_by_type, observation.observation_type, oid)
+        _index_add(self._ids_by_status, observation.status, oid)
+        _index_add(self._ids_by_question_index, observation.metadata.question_index, oid)
+        if observation.status == ObservationStatus.ACTIVE:
+            self._active_by_key[_dedup_key(observation)] = oid
+
+    def _unindex(self, observation: Observation) -> None:
+        oid = observation.id.value
+        _index_discard(self._ids_by_type, observation.observation_type, oid)
+        _index_discard(self._ids_by_status, observation.status, oid)
+        _index_discard(self._ids_by_question_index, observation.metadata.question_index, oid)
+        key = _dedup_key(observation)
+        if self._active_by_key.get(key) == oid:
+            del self._active_by_key[key]
+
+    def _select(self, f: ObservationFilter) -> list[Observation]:
+        """Observations matching f, in insertion order."""
+        candidate_sets: list[list[_IdSet]] = []
+        if f.observation_types is not None:
+            candidate_sets.append(_buckets(self._ids_by_type, f.observation_types))
+        if f.statuses is not None:
+            candidate_sets.append(_buckets(self._ids_by_status, f.statuses))
+        if f.question_index_min is not None or f.question_index_max is not None:
+            low = f.question_index_min if f.question_index_min is not None else 0
+            high = f.question_index_max
+            candidate_sets.append([
+                ids
+                for index, ids in self._ids_by_question_index.items()
+                if index >= low and (high is None or index <= high)
+            ])
+
+        if not candidate_sets:
+            return [o for o in self._store.values() if matches_filter(o, f)]
+
+        # Buckets are re-ordered by status transitions, so restore append order.
+        narrowest = min(candidate_sets, key=lambda sets: sum(len(ids) for ids in sets))
+        ids = sorted(
+            (oid for ids in narrowest for oid in ids),
+            key=self._sequence.__getitem__,
+        )
+        return [o for o in map(self._store.__getitem__, ids) if matches_filter(o, f)]
+
+
+def _dedup_key(observation: Observation) -> _DedupKey:
+    return (
+        observation.observation_type,
+        observation.metadata.origin,
+        observation.metadata.question_index,
+        observation.metadata.session_id,
+    )
+
+
+def _index_add(index: dict[Hashable, _IdSet], value: Hashable, oid: str) -> None:
+    index.setdefault(value, {})[oid] = None
+
+
+def _index_discard(index: dict[Hashable, _IdSet], value: Hashable, oid: str) -> None:
+    ids = index.get(value)
+    if ids is None:
+        return
+    ids.pop(oid, None)
+    if not ids:
+        del index[value]
+
+
+def _buckets(index: dict[Hashable, _IdSet], values: frozenset) -> list[_IdSet]:
+    return [index[value] for value in values if value in index]
@@ -17,7 +17,7 @@ from domain.observation.runtime.observation_ordering import (
 )
 
 
-def _matches(obs: Observation, f: ObservationFilter) -> bool:
+def matches_filter(obs: Observation, f: ObservationFilter) -> bool:
     """Return True iff obs satisfies all predicates in filter f (AND semantics)."""
     if f.observation_types is not None and obs.observation_type not in f.observation_types:
         return False
@@ -79,7 +79,7 @@ class ObservationCollection:
     def filter(self, observation_filter: ObservationFilter) -> "ObservationCollection":
         """Return a new collection containing only matching observations."""
         return ObservationCollection(
-            tuple(o for o in self._observations if _matches(o, observation_filter))
+            tuple(o for o in self._observations if matches_filter(o, observation_filter))
         )
 
     def where(self, predicate: Callable[[Observation], bool]) -> "ObservationCollection":
@@ -16,6 +16,9 @@ from domain.contracts.observation.observation_type import ObservationType
 from domain.observation.runtime.observation_collection import ObservationCollection
 from domain.observation.runtime.observation_statistics import ObservationStatistics
 
+# ObservationQuery caps limit at 1000; unbounded reads page through the store.
+_PAGE_SIZE = 1000
+
 
 class ObservationStoreQueryEngine:
     """Runtime facade over ObservationStore for rich query and collection operations.
@@ -25,6 +28,9 @@ class ObservationStoreQueryEngine:
     - Convenience accessors (active_only, by_type, by_question_index, etc.)
     - Inline statistics without building a full snapshot.
 
+    Accessors without an explicit limit return every match, paging through
+    the store, since ObservationQuery caps a single page at 1000.
+
     The engine is read-only; it never calls store.append().
     """
 
@@ -35,10 +41,9 @@ class ObservationStoreQueryEngine:
     # Full collection retrieval
     # ------------------------------------------------------------------
 
-    def all(self, limit: int = 1000) -> ObservationCollection:
-        """Return all observations (up to limit) as an ObservationCollection."""
-        results = self._store.query(ObservationQuery(limit=limit))
-        return ObservationCollection.from_list(results)
+    def all(self, limit: int | None = None) -> ObservationCollection:
+        """Return all observations (up to limit, when given) as an ObservationCollection."""
+        return self.query_filter(ObservationFilter(), limit=limit)
 
     # ------------------------------------------------------------------
     # Structured queries
@@ -55,10 +60,17 @@ class ObservationStoreQueryEngine:
         observation_filter: ObservationFilter,
         sort_by: ObservationSortField = ObservationSortField.QUESTION_INDEX,
         sort_order: ObservationSortOrder = ObservationSortOrder.ASC,
-        limit: int = 1000,
+        limit: int | None = None,
         offset: int = 0,
     ) -> ObservationCollection:
-        """Convenience method: build a query from filter + sort params."""
+        """Convenience method: build a query from filter + sort params.
+
+        limit=None returns every match from offset on.
+        """
+        if limit is None:
+            return ObservationCollection.from_list(
+                self._query_all(observation_filter, sort_by, sort_order, offset)
+            )
         q = ObservationQuery(
             filter=observation_filter,
             sort_by=sort_by,
@@ -119,7 +131,34 @@ class ObservationStoreQueryEngine:
 
     def count_active(self) -> int:
         f = ObservationFilter(statuses=frozenset({ObservationStatus.ACTIVE}))
-        return len(self.query_filter(f).all)
+        return self._store.count_matching(f)
 
     def session_id(self) -> str:
         return self._store.session_id()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _query_all(
+        self,
+        observation_filter: ObservationFilter,
+        sort_by: ObservationSortField,
+        sort_order: ObservationSortOrder,
+        offset: int,
+    ) -> list[Observation]:
+        results: list[Observation] = []
+        while True:
+            page = self._store.query(
+                ObservationQuery(
+                    filter=observation_filter,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    limit=_PAGE_SIZE,
+                    offset=offset,
+                )
+            )
+            results.extend(page)
+            if len(page) < _PAGE_SIZE:
+                return results
+            offset += _PAGE_SIZE
@@ -5,9 +5,10 @@ from typing import Any
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_identity import FeatureIdentity
 from domain.contracts.feature.feature_type import FeatureType
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FoldingFeatureUpdater
 from domain.contracts.observation.observation import Observation
 from domain.contracts.observation.observation_type import ObservationType
+from domain.plugins.feature.updaters.observation_tally import ObservationTally
 
 _CALIBRATED = frozenset({ObservationType.CONFIDENCE_WELL_CALIBRATED})
 _OVER = frozenset({ObservationType.CONFIDENCE_OVERCONFIDENT})
@@ -20,7 +21,19 @@ _UNSTABLE = frozenset({
 _IDENTITY = FeatureIdentity.for_type(FeatureType.CONFIDENCE)
 
 
-class ConfidenceFeatureUpdater(FeatureUpdater):
+def _category(o: Observation) -> str | None:
+    if o.observation_type in _CALIBRATED:
+        return "CALIBRATED"
+    if o.observation_type in _OVER:
+        return "OVERCONFIDENT"
+    if o.observation_type in _UNDER:
+        return "UNDERCONFIDENT"
+    if o.observation_type in _UNSTABLE:
+        return "UNSTABLE"
+    return None
+
+
+class ConfidenceFeatureUpdater(FoldingFeatureUpdater):
 
     @property
     def updater_id(self) -> str:
@@ -45,27 +58,17 @@ class ConfidenceFeatureUpdater(FeatureUpdater):
     def invocation_order(self) -> int:
         return 30
 
-    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
-        typed: list[Observation] = [o for o in observations if isinstance(o, Observation)]
-        if not typed:
+    def initial_state(self) -> ObservationTally:
+        return ObservationTally.empty(("CALIBRATED", "OVERCONFIDENT", "UNDERCONFIDENT", "UNSTABLE"))
+
+    def fold(self, state: ObservationTally, observations: list[Any]) -> ObservationTally:
+        return state.fold(observations, _category)
+
+    def candidates_from_state(self, state: ObservationTally) -> list[FeatureCandidate]:
+        if not state.count:
             return []
 
-        scores: dict[str, float] = {
-            "CALIBRATED": 0.0,
-            "OVERCONFIDENT": 0.0,
-            "UNDERCONFIDENT": 0.0,
-            "UNSTABLE": 0.0,
-        }
-        for o in typed:
-            w = o.confidence * o.weight
-            if o.observation_type in _CALIBRATED:
-                scores["CALIBRATED"] += w
-            elif o.observation_type in _OVER:
-                scores["OVERCONFIDENT"] += w
-            elif o.observation_type in _UNDER:
-                scores["UNDERCONFIDENT"] += w
-            elif o.observation_type in _UNSTABLE:
-                scores["UNSTABLE"] += w
+        scores: dict[str, float] = dict(state.scores)
 
         total = sum(scores.values())
         if total == 0.0:
@@ -78,12 +81,12 @@ class ConfidenceFeatureUpdater(FeatureUpdater):
                 value = best
             else:
                 value = "DEVELOPING"
-            count = len(typed)
+            count = state.count
             confidence = min(0.95, 0.35 + 0.1 * count) * best_ratio
             confidence = max(0.05, min(1.0, confidence))
 
-        source_ids = tuple(str(o.id) for o in typed)
-        question_index = max(o.metadata.question_index for o in typed)
+        source_ids = tuple(state.source_ids)
+        question_index = state.max_question_index
 
         return [
             FeatureCandidate(
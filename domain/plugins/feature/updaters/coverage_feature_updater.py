@@ -5,9 +5,10 @@ from typing import Any
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_identity import FeatureIdentity
 from domain.contracts.feature.feature_type import FeatureType
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FoldingFeatureUpdater
 from domain.contracts.observation.observation import Observation
 from domain.contracts.observation.observation_type import ObservationType
+from domain.plugins.feature.updaters.observation_tally import ObservationTally
 
 _BROAD = frozenset({
     ObservationType.KNOWLEDGE_DEMONSTRATED,
@@ -19,7 +20,17 @@ _IDENTITY = FeatureIdentity.for_type(FeatureType.COVERAGE)
 _MIN_OBS = 2
 
 
-class CoverageFeatureUpdater(FeatureUpdater):
+def _category(o: Observation) -> str | None:
+    if o.observation_type in _BROAD:
+        return "BROAD"
+    if o.observation_type in _NARROW:
+        return "NARROW"
+    if o.observation_type in _CONTRADICTORY:
+        return "CONTRADICTORY"
+    return None
+
+
+class CoverageFeatureUpdater(FoldingFeatureUpdater):
 
     @property
     def updater_id(self) -> str:
@@ -42,14 +53,19 @@ class CoverageFeatureUpdater(FeatureUpdater):
     def invocation_order(self) -> int:
         return 40
 
-    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
-        typed: list[Observation] = [o for o in observations if isinstance(o, Observation)]
-        if len(typed) < _MIN_OBS:
+    def initial_state(self) -> ObservationTally:
+        return ObservationTally.empty(("BROAD", "NARROW", "CONTRADICTORY"))
+
+    def fold(self, state: ObservationTally, observations: list[Any]) -> ObservationTally:
+        return state.fold(observations, _category)
+
+    def candidates_from_state(self, state: ObservationTally) -> list[FeatureCandidate]:
+        if state.count < _MIN_OBS:
             return []
 
-        broad_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _BROAD)
-        narrow_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _NARROW)
-        contra_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _CONTRADICTORY)
+        broad_score = state.scores["BROAD"]
+        narrow_score = state.scores["NARROW"]
+        contra_score = state.scores["CONTRADICTORY"]
         total = broad_score + narrow_score + contra_score
 
         if total == 0.0:
@@ -57,7 +73,7 @@ class CoverageFeatureUpdater(FeatureUpdater):
             confidence = 0.15
         elif contra_score / total >= 0.4:
             value = "MIXED"
-            confidence = min(0.95, 0.3 + 0.08 * len(typed)) * (contra_score / total)
+            confidence = min(0.95, 0.3 + 0.08 * state.count) * (contra_score / total)
             confidence = max(0.05, min(1.0, confidence))
         else:
             remaining = broad_score + narrow_score
@@ -70,11 +86,11 @@ class CoverageFeatureUpdater(FeatureUpdater):
                     value = "BROAD"
                 else:
                     value = "NARROW"
-            confidence = min(0.95, 0.35 + 0.08 * len(typed)) * (0.5 + 0.5 * abs(ratio - 0.5) * 2)
+            confidence = min(0.95, 0.35 + 0.08 * state.count) * (0.5 + 0.5 * abs(ratio - 0.5) * 2)
             confidence = max(0.05, min(1.0, confidence))
 
-        source_ids = tuple(str(o.id) for o in typed)
-        question_index = max(o.metadata.question_index for o in typed)
+        source_ids = tuple(state.source_ids)
+        question_index = state.max_question_index
 
         return [
             FeatureCandidate(
@@ -0,0 +1,41 @@
+# domain/plugins/feature/updaters/observation_tally.py
+# ObservationTally — fold state shared by the weighted-score feature updaters
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from domain.contracts.observation.observation import Observation
+
+
+@dataclass
+class ObservationTally:
+    """Running confidence×weight scores per category plus lineage.
+
+    Scores accumulate in observation order, so folding a session in one pass
+    or in per-cycle deltas yields bit-identical floats.
+    """
+
+    scores: dict[str, float]
+    count: int = 0
+    source_ids: list[str] = field(default_factory=list)
+    max_question_index: int = -1
+
+    @classmethod
+    def empty(cls, categories: tuple[str, ...]) -> "ObservationTally":
+        return cls(scores={category: 0.0 for category in categories})
+
+    def fold(
+        self,
+        observations: list[Any],
+        categorize: Callable[[Observation], str | None],
+    ) -> "ObservationTally":
+        for o in observations:
+            if not isinstance(o, Observation):
+                continue
+            category = categorize(o)
+            if category is not None:
+                self.scores[category] += o.confidence * o.weight
+            self.count += 1
+            self.source_ids.append(str(o.id))
+            self.max_question_index = max(self.max_question_index, o.metadata.question_index)
+        return self
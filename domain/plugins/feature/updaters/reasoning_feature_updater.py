@@ -5,9 +5,10 @@ from typing import Any
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_identity import FeatureIdentity
 from domain.contracts.feature.feature_type import FeatureType
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FoldingFeatureUpdater
 from domain.contracts.observation.observation import Observation
 from domain.contracts.observation.observation_type import ObservationType
+from domain.plugins.feature.updaters.observation_tally import ObservationTally
 
 _DEEP_TYPES = frozenset({
     ObservationType.REASONING_DEPTH_HIGH,
@@ -20,7 +21,15 @@ _SHALLOW_TYPES = frozenset({
 _IDENTITY = FeatureIdentity.for_type(FeatureType.REASONING)
 
 
-class ReasoningFeatureUpdater(FeatureUpdater):
+def _category(o: Observation) -> str | None:
+    if o.observation_type in _DEEP_TYPES:
+        return "DEEP"
+    if o.observation_type in _SHALLOW_TYPES:
+        return "SHALLOW"
+    return None
+
+
+class ReasoningFeatureUpdater(FoldingFeatureUpdater):
 
     @property
     def updater_id(self) -> str:
@@ -44,13 +53,18 @@ class ReasoningFeatureUpdater(FeatureUpdater):
     def invocation_order(self) -> int:
         return 20
 
-    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
-        typed: list[Observation] = [o for o in observations if isinstance(o, Observation)]
-        if not typed:
+    def initial_state(self) -> ObservationTally:
+        return ObservationTally.empty(("DEEP", "SHALLOW"))
+
+    def fold(self, state: ObservationTally, observations: list[Any]) -> ObservationTally:
+        return state.fold(observations, _category)
+
+    def candidates_from_state(self, state: ObservationTally) -> list[FeatureCandidate]:
+        if not state.count:
             return []
 
-        deep_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _DEEP_TYPES)
-        shallow_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _SHALLOW_TYPES)
+        deep_score = state.scores["DEEP"]
+        shallow_score = state.scores["SHALLOW"]
         total = deep_score + shallow_score
 
         if total == 0.0:
@@ -65,12 +79,12 @@ class ReasoningFeatureUpdater(FeatureUpdater):
             else:
                 value = "DEVELOPING"
 
-        count = len(typed)
+        count = state.count
         confidence = min(0.95, 0.4 + 0.08 * count) * (0.5 + 0.5 * abs(ratio - 0.5) * 2)
         confidence = max(0.05, min(1.0, confidence))
 
-        source_ids = tuple(str(o.id) for o in typed)
-        question_index = max(o.metadata.question_index for o in typed)
+        source_ids = tuple(state.source_ids)
+        question_index = state.max_question_index
 
         return [
             FeatureCandidate(
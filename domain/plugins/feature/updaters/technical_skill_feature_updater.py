@@ -5,9 +5,10 @@ from typing import Any
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_identity import FeatureIdentity
 from domain.contracts.feature.feature_type import FeatureType
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FoldingFeatureUpdater
 from domain.contracts.observation.observation import Observation
 from domain.contracts.observation.observation_type import ObservationType
+from domain.plugins.feature.updaters.observation_tally import ObservationTally
 
 _POSITIVE = frozenset({
     ObservationType.TECHNICAL_CORRECTNESS,
@@ -22,7 +23,15 @@ _NEGATIVE = frozenset({
 _IDENTITY = FeatureIdentity.for_type(FeatureType.TECHNICAL_SKILL)
 
 
-class TechnicalSkillFeatureUpdater(FeatureUpdater):
+def _category(o: Observation) -> str | None:
+    if o.observation_type in _POSITIVE:
+        return "POSITIVE"
+    if o.observation_type in _NEGATIVE:
+        return "NEGATIVE"
+    return None
+
+
+class TechnicalSkillFeatureUpdater(FoldingFeatureUpdater):
 
     @property
     def updater_id(self) -> str:
@@ -47,13 +56,18 @@ class TechnicalSkillFeatureUpdater(FeatureUpdater):
     def invocation_order(self) -> int:
         return 10
 
-    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
-        typed: list[Observation] = [o for o in observations if isinstance(o, Observation)]
-        if not typed:
+    def initial_state(self) -> ObservationTally:
+        return ObservationTally.empty(("POSITIVE", "NEGATIVE"))
+
+    def fold(self, state: ObservationTally, observations: list[Any]) -> ObservationTally:
+        return state.fold(observations, _category)
+
+    def candidates_from_state(self, state: ObservationTally) -> list[FeatureCandidate]:
+        if not state.count:
             return []
 
-        positive_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _POSITIVE)
-        negative_score = sum(o.confidence * o.weight for o in typed if o.observation_type in _NEGATIVE)
+        positive_score = state.scores["POSITIVE"]
+        negative_score = state.scores["NEGATIVE"]
         total = positive_score + negative_score
 
         if total == 0.0:
@@ -67,12 +81,12 @@ class TechnicalSkillFeatureUpdater(FeatureUpdater):
         else:
             value = "LOW"
 
-        count = len(typed)
+        count = state.count
         confidence = min(0.95, 0.4 + 0.1 * count) * (0.5 + 0.5 * abs(ratio - 0.5) * 2)
         confidence = max(0.05, min(1.0, confidence))
 
-        source_ids = tuple(str(o.id) for o in typed)
-        question_index = max(o.metadata.question_index for o in typed)
+        source_ids = tuple(state.source_ids)
+        question_index = state.max_question_index
 
         return [
             FeatureCandidate(
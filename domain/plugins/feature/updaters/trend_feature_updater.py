@@ -5,9 +5,10 @@ from typing import Any
 from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_identity import FeatureIdentity
 from domain.contracts.feature.feature_type import FeatureType
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import FoldingFeatureUpdater
 from domain.contracts.observation.observation import Observation
 from domain.contracts.observation.observation_type import ObservationType
+from domain.plugins.feature.updaters.observation_tally import ObservationTally
 
 _IMPROVING = frozenset({
     ObservationType.PERFORMANCE_IMPROVING,
@@ -20,7 +21,19 @@ _IDENTITY = FeatureIdentity.for_type(FeatureType.TREND)
 _MIN_OBS = 2
 
 
-class TrendFeatureUpdater(FeatureUpdater):
+def _category(o: Observation) -> str | None:
+    if o.observation_type in _IMPROVING:
+        return "IMPROVING"
+    if o.observation_type in _DECLINING:
+        return "DECLINING"
+    if o.observation_type in _STABLE:
+        return "STABLE"
+    if o.observation_type in _PLATEAU:
+        return "PLATEAU"
+    return None
+
+
+class TrendFeatureUpdater(FoldingFeatureUpdater):
 
     @property
     def updater_id(self) -> str:
@@ -44,17 +57,17 @@ class TrendFeatureUpdater(FeatureUpdater):
     def invocation_order(self) -> int:
         return 50
 
-    def produce(self, observations: list[Any]) -> list[FeatureCandidate]:
-        typed: list[Observation] = [o for o in observations if isinstance(o, Observation)]
-        if len(typed) < _MIN_OBS:
+    def initial_state(self) -> ObservationTally:
+        return ObservationTally.empty(("IMPROVING", "DECLINING", "STABLE", "PLATEAU"))
+
+    def fold(self, state: ObservationTally, observations: list[Any]) -> ObservationTally:
+        return state.fold(observations, _category)
+
+    def candidates_from_state(self, state: ObservationTally) -> list[FeatureCandidate]:
+        if state.count < _MIN_OBS:
             return []
 
-        scores: dict[str, float] = {
-            "IMPROVING": sum(o.confidence * o.weight for o in typed if o.observation_type in _IMPROVING),
-            "DECLINING": sum(o.confidence * o.weight for o in typed if o.observation_type in _DECLINING),
-            "STABLE": sum(o.confidence * o.weight for o in typed if o.observation_type in _STABLE),
-            "PLATEAU": sum(o.confidence * o.weight for o in typed if o.observation_type in _PLATEAU),
-        }
+        scores: dict[str, float] = dict(state.scores)
 
         total = sum(scores.values())
         if total == 0.0:
@@ -64,12 +77,12 @@ class TrendFeatureUpdater(FeatureUpdater):
         best_ratio = scores[best] / total
         value = best
 
-        count = len(typed)
+        count = state.count
         confidence = min(0.95, 0.35 + 0.1 * count) * best_ratio
         confidence = max(0.05, min(1.0, confidence))
 
-        source_ids = tuple(str(o.id) for o in typed)
-        question_index = max(o.metadata.question_index for o in typed)
+        source_ids = tuple(state.source_ids)
+        question_index = state.max_question_index
 
         return [
             FeatureCandidate(
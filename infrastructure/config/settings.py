@@ -41,6 +41,41 @@ class Settings(BaseSettings):
     # Local SentenceTransformer model used for semantic dedup and planning.
     local_embedding_model: str = "all-MiniLM-L6-v2"
 
+    # Backend behind get_embedding_model() (Chroma corpus build and
+    # retrieval): "openai" or "local" (local_embedding_model, no network).
+    # Collections record their model; switching requires a corpus rebuild.
+    embedding_backend: str = "openai"
+
+    # Local inference: device, "torch" or "onnx" runtime, int8 quantization
+    # (dynamic Linear quantization on torch, this export file on onnx) and
+    # texts per encode() batch.
+    local_embedding_device: str = "cpu"
+    local_embedding_runtime: str = "torch"
+    local_embedding_int8: bool = False
+    local_embedding_onnx_int8_file: str = "onnx/model_qint8_avx512.onnx"
+    local_embedding_batch_size: int = 64
+
+    # Content-addressed embedding cache shared by every embedding consumer.
+    embedding_cache_enabled: bool = True
+
+    # On-disk tier (memory-mapped float32 store per model); empty disables it.
+    embedding_cache_dir: str = "storage/embedding_cache"
+
+    # Vectors kept in the in-process LRU tier.
+    embedding_cache_memory_entries: int = 20_000
+
+    # Texts sent to the embedding backend per call on cache misses.
+    embedding_cache_batch_size: int = 256
+
+    # ── Retrieval result cache ────────────────────────────────────────────────
+    # Scored vector-search results keyed by (query, filters, k, corpus version).
+    retrieval_result_cache_enabled: bool = True
+    retrieval_result_cache_max_entries: int = 512
+    retrieval_result_cache_ttl_s: float = 3600.0
+
+    # Seconds between checks of the collection's corpus version.
+    retrieval_corpus_version_check_s: float = 30.0
+
     # ── Application-level LLM retry counts ───────────────────────────────────
     # JSON parse/validation retries inside DefaultLLMAdapter.invoke_json.
     llm_json_retry_attempts: int = 2
@@ -57,6 +92,22 @@ class Settings(BaseSettings):
     # Generation retries inside AITestGenerator.
     test_generation_retry_attempts: int = 2
 
+    # ── LLM concurrency ───────────────────────────────────────────────────────
+    # Worker count of the process-wide executor that fanned-out LLM calls
+    # (question enrichment, gap-filling generation and hidden-test
+    # generation) run on.
+    llm_max_concurrency: int = 8
+
+    # ── Hidden test cache ─────────────────────────────────────────────────────
+    # Entries kept in the SQLite test cache before least-recently-used ones
+    # are evicted.
+    test_cache_max_entries: int = 5000
+
+    # ── Knowledge pipeline ────────────────────────────────────────────────────
+    # Seconds a session's KnowledgePipeline (and its incremental feature
+    # cache) is kept without a reasoning cycle before it is evicted.
+    knowledge_pipeline_session_ttl_s: float = 3600.0
+
     # ── Context profile prompt limits ────────────────────────────────────────
     # Maximum characters of job_description injected into generation prompts.
     job_description_max_chars: int = 500
@@ -132,6 +183,20 @@ class Settings(BaseSettings):
     # no longer generate new derived patterns.
     reasoner_bridge_window: int = 3
 
+    # ── Coding sandbox ────────────────────────────────────────────────────────
+    # Run harnesses in pre-started worker processes instead of spawning a new
+    # interpreter per submission.
+    coding_sandbox_worker_pool_enabled: bool = False
+
+    # Number of warm workers; 0 means one per CPU core.
+    coding_sandbox_worker_pool_size: int = 0
+
+    # Runs served by a worker before it is replaced.
+    coding_sandbox_worker_max_runs: int = 100
+
+    # Address-space limit (RLIMIT_AS) for each pooled run, in MB; 0 disables it.
+    coding_sandbox_worker_memory_limit_mb: int = 512
+
     # ── Process edge / server (EPIC-08 P1/P5) ─────────────────────────────────
     server_host: str = "0.0.0.0"
     server_port: int = Field(
@@ -151,6 +216,24 @@ class Settings(BaseSettings):
     health_llm_probe_enabled: bool = True
     health_db_probe_enabled: bool = True
     health_sandbox_probe_enabled: bool = True
+    # Reports the shared Chroma registry's warm-up state; not ready until warm.
+    health_retrieval_probe_enabled: bool = True
+
+    # ── Retrieval backend warm-up ─────────────────────────────────────────────
+    # Load the retrieval collection and run a probe query at process start.
+    retrieval_warmup_enabled: bool = True
+
+    # ── Adaptive question prefetch ────────────────────────────────────────────
+    # Build the next planned area's question in the background while the
+    # candidate answers the current one.
+    adaptive_prefetch_enabled: bool = True
+    adaptive_prefetch_workers: int = 2
+    # Covered/weak/strong domains that may differ between the prefetch
+    # snapshot and the answered memory before the prefetch is discarded.
+    adaptive_prefetch_domain_tolerance: int = 1
+    # Seconds an untaken prefetch is kept before it is evicted, so abandoned
+    # sessions do not hold their prebuilt questions for the process lifetime.
+    adaptive_prefetch_ttl_s: float = 1800.0
 
     # ── CI / deploy readiness gate (EPIC-08 P4/C11) ───────────────────────────
     # Base URL of the running process edge; gate GETs READINESS_PATH on this host.
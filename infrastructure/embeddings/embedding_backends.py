@@ -0,0 +1,152 @@
+# infrastructure/embeddings/embedding_backends.py
+
+# EmbeddingBackend
+#
+# Responsibility:
+# Uniform batch interface over the embedding providers used in the codebase
+# (LangChain/OpenAI embeddings and local SentenceTransformer models) so that
+# CachedEmbeddings can sit in front of either one.
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class EmbeddingBackend(ABC):
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """Identifies the vector space; part of every cache key."""
+
+    @abstractmethod
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+    ) -> np.ndarray:
+        """Embed texts in one provider call; returns a (len(texts), d) array."""
+
+
+def embedding_model_name(
+    embeddings: Embeddings,
+) -> str:
+    """Name of the vector space an Embeddings instance produces."""
+
+    return str(
+        getattr(embeddings, "model", type(embeddings).__name__)
+    )
+
+
+class LangChainEmbeddingBackend(EmbeddingBackend):
+    """Backend for any LangChain Embeddings (OpenAIEmbeddings in production)."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model_name: str | None = None,
+    ) -> None:
+
+        self._embeddings = embeddings
+
+        self._model_name = model_name or embedding_model_name(embeddings)
+
+    @property
+    def model_name(self) -> str:
+
+        return self._model_name
+
+    @property
+    def embeddings(self) -> Embeddings:
+
+        return self._embeddings
+
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+    ) -> np.ndarray:
+
+        return np.asarray(
+            self._embeddings.embed_documents(list(texts)),
+            dtype=np.float32,
+        )
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Backend for a loaded sentence_transformers.SentenceTransformer."""
+
+    def __init__(
+        self,
+        model: Any,
+        model_name: str,
+        batch_size: int = 32,
+    ) -> None:
+
+        self._model = model
+
+        self._model_name = model_name
+
+        self._batch_size = batch_size
+
+    @property
+    def model_name(self) -> str:
+
+        return self._model_name
+
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+    ) -> np.ndarray:
+
+        return np.asarray(
+            self._model.encode(
+                list(texts),
+                batch_size=self._batch_size,
+                convert_to_numpy=True,
+            ),
+            dtype=np.float32,
+        )
+
+
+class BackendEmbeddings(Embeddings):
+    """LangChain Embeddings over an EmbeddingBackend, without caching."""
+
+    def __init__(
+        self,
+        backend: EmbeddingBackend,
+    ) -> None:
+
+        self._backend = backend
+
+    @property
+    def model(self) -> str:
+
+        return self._backend.model_name
+
+    def embed_many(
+        self,
+        texts: Sequence[str],
+    ) -> np.ndarray:
+        """Embed texts as a (len(texts), d) float32 array, like CachedEmbeddings.embed_many."""
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        return self._backend.embed_batch(texts)
+
+    def embed_documents(
+        self,
+        texts: list[str],
+    ) -> list[list[float]]:
+
+        return self._backend.embed_batch(texts).tolist()
+
+    def embed_query(
+        self,
+        text: str,
+    ) -> list[float]:
+
+        return self._backend.embed_batch([text])[0].tolist()
@@ -0,0 +1,536 @@
+# infrastructure/embeddings/embedding_cache.py
+
+# EmbeddingCache
+#
+# Responsibility:
+# Content-addressed cache of embedding vectors keyed by (model name,
+# sha256(text)). Two tiers:
+# - an in-process LRU of float32 vectors shared by every consumer, and
+# - an optional on-disk store per model: an append-only float32 data file
+#   read through np.memmap plus an offset index, so vectors survive across
+#   runs and processes without loading the whole file.
+#
+# CachedEmbeddings puts the cache in front of an EmbeddingBackend and
+# exposes a batching embed_many API alongside the LangChain Embeddings
+# interface, so it drops in wherever get_embedding_model() was used.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from infrastructure.config.settings import settings
+from infrastructure.embeddings.embedding_backends import EmbeddingBackend
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+_FLOAT_BYTES = np.dtype(np.float32).itemsize
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheMetrics:
+
+    memory_hits: int
+
+    disk_hits: int
+
+    misses: int
+
+    bytes_saved: int
+
+    @property
+    def hits(self) -> int:
+
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class MmapEmbeddingStore:
+    """Append-only on-disk vectors for one embedding model.
+
+    vectors.f32 holds raw float32 rows back to back; index.tsv maps each
+    text hash to "<hash>\\t<offset>\\t<dim>" with offset counted in floats.
+    Rows are written before their index lines, so a crash can leave unused
+    bytes but never an index entry pointing at missing data; a torn index
+    line is ignored by readers and truncated by the next writer. Appends take an
+    exclusive flock on the index, and new index lines written by other
+    processes are picked up on the next lookup miss.
+    """
+
+    DATA_FILE = "vectors.f32"
+
+    INDEX_FILE = "index.tsv"
+
+    def __init__(
+        self,
+        directory: str | Path,
+    ) -> None:
+
+        self._directory = Path(directory)
+
+        self._directory.mkdir(
+            parents=True,
+            exist_ok=True,
+        )
+
+        self._data_path = self._directory / self.DATA_FILE
+
+        self._index_path = self._directory / self.INDEX_FILE
+
+        self._data_path.touch(exist_ok=True)
+
+        self._index_path.touch(exist_ok=True)
+
+        self._lock = threading.Lock()
+
+        self._index: dict[str, tuple[int, int]] = {}
+
+        self._index_position = 0
+
+        self._mmap: np.memmap | None = None
+
+        with self._lock:
+            self._refresh()
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    def get(
+        self,
+        key: str,
+    ) -> np.ndarray | None:
+
+        with self._lock:
+
+            entry = self._index.get(key)
+
+            if entry is None:
+                self._refresh()
+                entry = self._index.get(key)
+
+            if entry is None:
+                return None
+
+            return self._read(*entry)
+
+    def put_many(
+        self,
+        items: Iterable[tuple[str, np.ndarray]],
+    ) -> None:
+
+        with self._lock:
+
+            with self._index_path.open("ab") as index_file:
+
+                if fcntl is not None:
+                    fcntl.flock(index_file, fcntl.LOCK_EX)
+
+                try:
+
+                    # Another process may have stored some of these already.
+                    self._refresh()
+
+                    # Anything past the last complete line is a torn write.
+                    index_file.truncate(self._index_position)
+
+                    pending = [
+                        (key, np.ascontiguousarray(vector, dtype=np.float32).ravel())
+                        for key, vector in items
+                        if key not in self._index
+                    ]
+
+                    if not pending:
+                        return
+
+                    lines = []
+
+                    with self._data_path.open("ab") as data_file:
+
+                        size = os.fstat(data_file.fileno()).st_size
+
+                        # Pad away a torn row left by an interrupted writer.
+                        remainder = size % _FLOAT_BYTES
+
+                        if remainder:
+                            data_file.write(b"\x00" * (_FLOAT_BYTES - remainder))
+                            size += _FLOAT_BYTES - remainder
+
+                        offset = size // _FLOAT_BYTES
+
+                        for key, vector in pending:
+
+                            data_file.write(vector.tobytes())
+
+                            lines.append(f"{key}\t{offset}\t{vector.size}\n")
+
+                            self._index[key] = (offset, int(vector.size))
+
+                            offset += vector.size
+
+                    index_file.write("".join(lines).encode("utf-8"))
+
+                    index_file.flush()
+
+                    self._index_position = index_file.tell()
+
+                finally:
+
+                    if fcntl is not None:
+                        fcntl.flock(index_file, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            return len(self._index)
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _refresh(self) -> None:
+        """Load index lines appended since the last read."""
+
+        with self._index_path.open("rb") as index_file:
+
+            index_file.seek(self._index_position)
+
+            chunk = index_file.read()
+
+        if not chunk:
+            return
+
+        complete = chunk.rfind(b"\n") + 1
+
+        for line in chunk[:complete].decode("utf-8").splitlines():
+
+            parts = line.split("\t")
+
+            if len(parts) != 3:
+                continue
+
+            key, offset, dim = parts
+
+            try:
+                self._index[key] = (int(offset), int(dim))
+            except ValueError:
+                continue
+
+        self._index_position += complete
+
+    def _read(
+        self,
+        offset: int,
+        dim: int,
+    ) -> np.ndarray | None:
+
+        end = offset + dim
+
+        if self._mmap is None or end > self._mmap.shape[0]:
+
+            floats = self._data_path.stat().st_size // _FLOAT_BYTES
+
+            if end > floats:
+                return None
+
+            self._mmap = np.memmap(
+                self._data_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(floats,),
+            )
+
+        return np.array(self._mmap[offset:end])
+
+
+class EmbeddingCache:
+    """Process-wide two-tier vector cache with hit/miss accounting."""
+
+    def __init__(
+        self,
+        max_memory_entries: int = 20_000,
+        directory: str | Path | None = None,
+    ) -> None:
+
+        if max_memory_entries < 1:
+            raise ValueError("max_memory_entries must be >= 1")
+
+        self._max_memory_entries = max_memory_entries
+
+        self._directory = Path(directory) if directory else None
+
+        self._memory: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+
+        self._stores: dict[str, MmapEmbeddingStore] = {}
+
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+
+        self._disk_hits = 0
+
+        self._misses = 0
+
+        self._bytes_saved = 0
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    def get(
+        self,
+        model_name: str,
+        key: str,
+    ) -> np.ndarray | None:
+
+        with self._lock:
+
+            vector = self._memory.get((model_name, key))
+
+            if vector is not None:
+                self._memory.move_to_end((model_name, key))
+                self._memory_hits += 1
+                self._bytes_saved += vector.nbytes
+                return vector
+
+        store = self._store(model_name)
+
+        vector = store.get(key) if store is not None else None
+
+        with self._lock:
+
+            if vector is None:
+                self._misses += 1
+                return None
+
+            self._disk_hits += 1
+            self._bytes_saved += vector.nbytes
+            self._remember((model_name, key), vector)
+
+        return vector
+
+    def put_many(
+        self,
+        model_name: str,
+        items: Sequence[tuple[str, np.ndarray]],
+    ) -> None:
+
+        with self._lock:
+
+            for key, vector in items:
+                self._remember((model_name, key), vector)
+
+        store = self._store(model_name)
+
+        if store is not None:
+            store.put_many(items)
+
+    @property
+    def metrics(self) -> EmbeddingCacheMetrics:
+
+        with self._lock:
+
+            return EmbeddingCacheMetrics(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                bytes_saved=self._bytes_saved,
+            )
+
+    @property
+    def memory_size(self) -> int:
+
+        with self._lock:
+            return len(self._memory)
+
+    def clear_memory(self) -> None:
+
+        with self._lock:
+            self._memory.clear()
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _remember(
+        self,
+        key: tuple[str, str],
+        vector: np.ndarray,
+    ) -> None:
+
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _store(
+        self,
+        model_name: str,
+    ) -> MmapEmbeddingStore | None:
+
+        if self._directory is None:
+            return None
+
+        with self._lock:
+
+            store = self._stores.get(model_name)
+
+            if store is None:
+                store = MmapEmbeddingStore(self._directory / _slug(model_name))
+                self._stores[model_name] = store
+
+            return store
+
+
+class CachedEmbeddings(Embeddings):
+    """LangChain Embeddings that consult an EmbeddingCache before the backend."""
+
+    DEFAULT_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        backend: EmbeddingBackend,
+        cache: EmbeddingCache,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self._backend = backend
+
+        self._cache = cache
+
+        self._batch_size = batch_size
+
+    @property
+    def model(self) -> str:
+
+        return self._backend.model_name
+
+    @property
+    def cache(self) -> EmbeddingCache:
+
+        return self._cache
+
+    def embed_many(
+        self,
+        texts: Sequence[str],
+    ) -> np.ndarray:
+        """
+        Embed texts as a (len(texts), d) float32 array.
+
+        Duplicates within the call are looked up once; texts missing from
+        both tiers go to the backend in batches of batch_size and are written
+        back to the cache.
+        """
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        model_name = self._backend.model_name
+
+        keys = [text_hash(text) for text in texts]
+
+        vectors: dict[str, np.ndarray] = {}
+
+        missing: dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+
+            if key in vectors or key in missing:
+                continue
+
+            vector = self._cache.get(model_name, key)
+
+            if vector is None:
+                missing[key] = text
+            else:
+                vectors[key] = vector
+
+        pending = list(missing.items())
+
+        for start in range(0, len(pending), self._batch_size):
+
+            batch = pending[start:start + self._batch_size]
+
+            embedded = self._backend.embed_batch(
+                [text for _, text in batch],
+            )
+
+            items = [
+                (key, np.array(row, dtype=np.float32))
+                for (key, _), row in zip(batch, embedded)
+            ]
+
+            self._cache.put_many(
+                model_name,
+                items,
+            )
+
+            vectors.update(items)
+
+        return np.stack([vectors[key] for key in keys])
+
+    def embed_documents(
+        self,
+        texts: list[str],
+    ) -> list[list[float]]:
+
+        return self.embed_many(texts).tolist()
+
+    def embed_query(
+        self,
+        text: str,
+    ) -> list[float]:
+
+        return self.embed_many([text])[0].tolist()
+
+
+def _slug(model_name: str) -> str:
+
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model_name) or "default"
+
+
+@lru_cache(maxsize=1)
+def get_default_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache shared by every embedding consumer."""
+
+    return EmbeddingCache(
+        max_memory_entries=settings.embedding_cache_memory_entries,
+        directory=settings.embedding_cache_dir or None,
+    )
+
+
+def cached_embeddings(backend: EmbeddingBackend) -> CachedEmbeddings:
+    """Wrap backend with the process-wide cache."""
+
+    return CachedEmbeddings(
+        backend,
+        cache=get_default_embedding_cache(),
+        batch_size=settings.embedding_cache_batch_size,
+    )
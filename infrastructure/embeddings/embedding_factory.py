@@ -6,19 +6,79 @@
 # Creates and configures embedding model instances.
 # Centralizes provider selection and configuration.
 
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
 from infrastructure.config.settings import settings
+from infrastructure.embeddings.embedding_backends import (
+    BackendEmbeddings,
+    EmbeddingBackend,
+    LangChainEmbeddingBackend,
+    SentenceTransformerBackend,
+)
+from infrastructure.embeddings.embedding_cache import cached_embeddings
+from infrastructure.embeddings.local_embedding_model import (
+    get_local_sentence_transformer,
+    local_embedding_model_name,
+)
 
+EMBEDDING_BACKENDS = ("openai", "local")
 
-def get_embedding_model() -> OpenAIEmbeddings:
+
+def get_embedding_model() -> Embeddings:
     """
     Factory function to create an embedding model instance.
-    
+
+    settings.embedding_backend selects the provider: "openai" for the
+    OpenAI API, "local" for the process-wide local SentenceTransformer
+    (no network calls at query time).
+
+    When settings.embedding_cache_enabled is set (the default) the model is
+    wrapped in CachedEmbeddings backed by the process-wide EmbeddingCache,
+    so texts already embedded by any consumer are served from memory or
+    disk.
+
     Returns:
-        OpenAIEmbeddings: Configured embedding model
+        Embeddings: Configured embedding model
     """
-    return OpenAIEmbeddings(
-        model=settings.openai_embedding_model,
-        openai_api_key=settings.openai_api_key,
+    backend = get_embedding_backend()
+
+    if not settings.embedding_cache_enabled:
+        return _uncached(backend)
+
+    return cached_embeddings(backend)
+
+
+def get_embedding_backend() -> EmbeddingBackend:
+    """Batch backend for settings.embedding_backend."""
+
+    if settings.embedding_backend == "openai":
+        return LangChainEmbeddingBackend(
+            OpenAIEmbeddings(
+                model=settings.openai_embedding_model,
+                openai_api_key=settings.openai_api_key,
+            ),
+            model_name=settings.openai_embedding_model,
+        )
+
+    if settings.embedding_backend == "local":
+        return SentenceTransformerBackend(
+            get_local_sentence_transformer(),
+            model_name=local_embedding_model_name(),
+            batch_size=settings.local_embedding_batch_size,
+        )
+
+    raise ValueError(
+        f"Unknown embedding backend '{settings.embedding_backend}'; "
+        f"expected one of {EMBEDDING_BACKENDS}"
     )
+
+
+def _uncached(backend: EmbeddingBackend) -> Embeddings:
+
+    # The OpenAI client is returned as is so LangChain keeps its own
+    # request batching.
+    if isinstance(backend, LangChainEmbeddingBackend):
+        return backend.embeddings
+
+    return BackendEmbeddings(backend)
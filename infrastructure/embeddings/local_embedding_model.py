@@ -0,0 +1,98 @@
+# infrastructure/embeddings/local_embedding_model.py
+
+# LocalEmbeddingModel
+#
+# Responsibility:
+# Loads the process-wide local SentenceTransformer used when
+# settings.embedding_backend is "local" (and by EmbeddingModelProvider),
+# on CPU by default, with either the PyTorch or the ONNX Runtime backend
+# and optional int8 quantization.
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from infrastructure.config.settings import settings
+
+LOCAL_EMBEDDING_RUNTIMES = ("torch", "onnx")
+
+
+def load_local_sentence_transformer(
+    model_name: str,
+    device: str = "cpu",
+    runtime: str = "torch",
+    quantize_int8: bool = False,
+    onnx_int8_file: str = "onnx/model_qint8_avx512.onnx",
+) -> Any:
+    """
+    Load a SentenceTransformer for local inference.
+
+    runtime="torch" quantizes with dynamic int8 Linear layers;
+    runtime="onnx" loads the model's pre-quantized ONNX export
+    (onnx_int8_file) instead of the float one.
+    """
+
+    if runtime not in LOCAL_EMBEDDING_RUNTIMES:
+        raise ValueError(
+            f"Unknown local embedding runtime '{runtime}'; "
+            f"expected one of {LOCAL_EMBEDDING_RUNTIMES}"
+        )
+
+    from sentence_transformers import SentenceTransformer
+
+    if runtime == "onnx":
+
+        return SentenceTransformer(
+            model_name,
+            device=device,
+            backend="onnx",
+            model_kwargs={"file_name": onnx_int8_file} if quantize_int8 else None,
+        )
+
+    model = SentenceTransformer(
+        model_name,
+        device=device,
+    )
+
+    if not quantize_int8:
+        return model
+
+    import torch
+
+    return torch.quantization.quantize_dynamic(
+        model,
+        {torch.nn.Linear},
+        dtype=torch.qint8,
+    )
+
+
+def local_embedding_model_name() -> str:
+    """
+    Identity of the vector space the configured local model produces, used
+    for embedding cache keys and the collection's embedding model stamp:
+    settings.local_embedding_model, suffixed with runtime and precision
+    unless those are the defaults (torch, fp32), e.g.
+    "all-MiniLM-L6-v2@onnx-int8".
+    """
+
+    runtime = settings.local_embedding_runtime
+    precision = "int8" if settings.local_embedding_int8 else "fp32"
+
+    if (runtime, precision) == ("torch", "fp32"):
+        return settings.local_embedding_model
+
+    return f"{settings.local_embedding_model}@{runtime}-{precision}"
+
+
+@lru_cache(maxsize=1)
+def get_local_sentence_transformer() -> Any:
+    """settings.local_embedding_model, loaded once per process."""
+
+    return load_local_sentence_transformer(
+        settings.local_embedding_model,
+        device=settings.local_embedding_device,
+        runtime=settings.local_embedding_runtime,
+        quantize_int8=settings.local_embedding_int8,
+        onnx_int8_file=settings.local_embedding_onnx_int8_file,
+    )
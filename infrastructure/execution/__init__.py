@@ -8,6 +8,7 @@ from infrastructure.execution.execution_factory import ExecutionFactory
 from infrastructure.execution.execution_pipeline import ExecutionPipeline
 from infrastructure.execution.execution_validator import ExecutionValidator
 from infrastructure.execution.execution_routing_result import ExecutionRoutingResult
+from infrastructure.execution.python_language_executor import PythonLanguageExecutor
 
 __all__ = [
     "LanguageExecutorRegistry",
@@ -19,4 +20,5 @@ __all__ = [
     "ExecutionPipeline",
     "ExecutionValidator",
     "ExecutionRoutingResult",
+    "PythonLanguageExecutor",
 ]
@@ -0,0 +1,248 @@
+# infrastructure/execution/python_language_executor.py
+
+# PythonLanguageExecutor
+#
+# Responsibility:
+# Concrete LanguageExecutor for CPython. Writes candidate code followed by
+# the visible and hidden test suites to a private temp directory, runs it
+# through run_sandboxed_python under request.limits, and maps the raw
+# outcome to the normalised ExecutionResult contract (status, metrics,
+# stdout/stderr artifacts, diagnostics).
+
+from __future__ import annotations
+
+import errno
+import os
+import platform
+import re
+import shutil
+import signal
+import sys
+import tempfile
+
+from infrastructure.execution import sandboxed_process
+from infrastructure.execution.contracts.execution_artifact import (
+    ArtifactKind,
+    ExecutionArtifact,
+)
+from infrastructure.execution.contracts.execution_diagnostics import (
+    DiagnosticSeverity,
+    ExecutionDiagnostics,
+    RuntimeDiagnostic,
+)
+from infrastructure.execution.contracts.execution_environment import ExecutionEnvironment
+from infrastructure.execution.contracts.execution_limits import ExecutionLimits
+from infrastructure.execution.contracts.execution_metrics import ExecutionMetrics
+from infrastructure.execution.contracts.execution_request import ExecutionRequest
+from infrastructure.execution.contracts.execution_result import ExecutionResult
+from infrastructure.execution.contracts.execution_runtime import ExecutionRuntime
+from infrastructure.execution.contracts.execution_status import ExecutionStatus
+from infrastructure.execution.contracts.language_executor import LanguageExecutor
+
+SCRIPT_FILENAME = "solution.py"
+
+_TRACEBACK_FRAME = re.compile(r'File "(?P<file>[^"]+)", line (?P<line>\d+)')
+_EXCEPTION_LINE = re.compile(r"^(?P<type>[A-Za-z_][\w.]*)(?::\s*(?P<message>.*))?$")
+
+_FILE_TOO_LARGE = os.strerror(errno.EFBIG)
+
+_SYNTAX_ERRORS = {"SyntaxError", "IndentationError", "TabError"}
+
+
+class PythonLanguageExecutor(LanguageExecutor):
+    """Runs Python candidate code in a resource-limited subprocess."""
+
+    def __init__(self, python_executable: str | None = None) -> None:
+        self._python = python_executable or sys.executable
+        major, minor = sys.version_info[:2]
+        self._runtime = ExecutionRuntime(
+            environment=ExecutionEnvironment(
+                language_id="python",
+                runtime_id=f"cpython-{major}.{minor}",
+                runtime_version=platform.python_version(),
+                sandbox_type="subprocess",
+            ),
+            limits=ExecutionLimits(),
+            runtime_label=f"python-{major}.{minor}-subprocess",
+        )
+
+    # =====================================================
+    # LanguageExecutor
+    # =====================================================
+
+    @property
+    def language_id(self) -> str:
+        return "python"
+
+    @property
+    def runtime(self) -> ExecutionRuntime:
+        return self._runtime
+
+    def is_available(self) -> bool:
+        try:
+            return sandboxed_process.is_supported() and os.access(self._python, os.X_OK)
+        except Exception:
+            return False
+
+    def execute(self, request: ExecutionRequest) -> ExecutionResult:
+        self.validate_request(request)
+
+        workdir = tempfile.mkdtemp(prefix="exec-")
+
+        try:
+            script_path = os.path.join(workdir, SCRIPT_FILENAME)
+
+            with open(script_path, "w", encoding="utf-8") as handle:
+                handle.write(_compose_script(request))
+
+            outcome = sandboxed_process.run_sandboxed_python(
+                self._python,
+                script_path,
+                request.limits,
+                env=dict(request.environment.env_vars),
+            )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        return _to_result(request, outcome)
+
+
+# =========================================================
+# INTERNALS
+# =========================================================
+
+
+def _compose_script(request: ExecutionRequest) -> str:
+    # Candidate code comes first so diagnostic line numbers match what the
+    # candidate wrote.
+    parts = [request.candidate_code, request.visible_test_suite, request.hidden_test_suite]
+    return "\n\n".join(part for part in parts if part.strip()) + "\n"
+
+
+def _to_result(
+    request: ExecutionRequest,
+    outcome: sandboxed_process.SandboxedProcessOutcome,
+) -> ExecutionResult:
+
+    stdout = outcome.stdout.decode("utf-8", errors="replace")
+    stderr = outcome.stderr.decode("utf-8", errors="replace")
+
+    diagnostic = _parse_traceback(stderr)
+    status, runtime_errors = _classify(request, outcome, diagnostic)
+
+    return ExecutionResult(
+        execution_id=request.execution_id,
+        language_id=request.language_id,
+        question_id=request.question_id,
+        status=status,
+        exit_code=outcome.returncode,
+        timed_out=status == ExecutionStatus.TIMEOUT,
+        stdout=stdout,
+        stderr=stderr,
+        runtime_errors=runtime_errors,
+        metrics=ExecutionMetrics(
+            duration_ms=outcome.duration_ms,
+            cpu_time_ms=outcome.cpu_time_ms,
+            peak_memory_kb=outcome.peak_memory_kb,
+            stdout_bytes=len(outcome.stdout),
+            stderr_bytes=len(outcome.stderr),
+        ),
+        diagnostics=ExecutionDiagnostics(
+            entries=[diagnostic] if diagnostic is not None else []
+        ),
+        artifacts=[
+            ExecutionArtifact(
+                kind=ArtifactKind.STDOUT,
+                name="stdout",
+                content=stdout,
+                size_bytes=len(outcome.stdout),
+                truncated=outcome.stdout_truncated,
+            ),
+            ExecutionArtifact(
+                kind=ArtifactKind.STDERR,
+                name="stderr",
+                content=stderr,
+                size_bytes=len(outcome.stderr),
+                truncated=outcome.stderr_truncated,
+            ),
+        ],
+    )
+
+
+def _classify(
+    request: ExecutionRequest,
+    outcome: sandboxed_process.SandboxedProcessOutcome,
+    diagnostic: RuntimeDiagnostic | None,
+) -> tuple[ExecutionStatus, list[str]]:
+
+    limits = request.limits
+    error_type = diagnostic.error_type if diagnostic is not None else None
+
+    if outcome.timed_out or outcome.term_signal == signal.SIGXCPU:
+        return ExecutionStatus.TIMEOUT, [
+            f"Execution exceeded the {limits.timeout_ms} ms time limit"
+        ]
+
+    if outcome.output_limit_exceeded:
+        return ExecutionStatus.SANDBOX_VIOLATION, [
+            f"Output exceeded the {limits.max_output_bytes} byte limit"
+        ]
+
+    # MemoryError is raised when RLIMIT_AS refuses an allocation; an external
+    # SIGKILL (we only send one on timeout/output overflow) is the OOM killer.
+    if error_type == "MemoryError" or outcome.term_signal == signal.SIGKILL:
+        return ExecutionStatus.MEMORY_EXCEEDED, [
+            f"Execution exceeded the {limits.memory_limit_mb} MB memory limit"
+        ]
+
+    # RLIMIT_FSIZE is 0; CPython ignores SIGXFSZ, so writes fail with EFBIG.
+    if error_type == "OSError" and _FILE_TOO_LARGE in diagnostic.message:
+        return ExecutionStatus.SANDBOX_VIOLATION, ["Filesystem writes are not permitted"]
+
+    if outcome.returncode == 0:
+        return ExecutionStatus.SUCCESS, []
+
+    if error_type in _SYNTAX_ERRORS:
+        return ExecutionStatus.SYNTAX_ERROR, [diagnostic.message]
+
+    has_tests = bool(request.visible_test_suite.strip() or request.hidden_test_suite.strip())
+
+    if error_type == "AssertionError" and has_tests:
+        return ExecutionStatus.FAILED_TESTS, [diagnostic.message]
+
+    if outcome.term_signal is not None:
+        return ExecutionStatus.RUNTIME_ERROR, [
+            f"Process terminated by {signal.Signals(outcome.term_signal).name}"
+        ]
+
+    message = diagnostic.message if diagnostic is not None else f"Exit code {outcome.returncode}"
+    return ExecutionStatus.RUNTIME_ERROR, [message]
+
+
+def _parse_traceback(stderr: str) -> RuntimeDiagnostic | None:
+    """Map the final Python traceback in stderr to a RuntimeDiagnostic."""
+
+    if "Traceback (most recent call last)" not in stderr:
+        return None
+
+    lines = [line for line in stderr.strip().splitlines() if line.strip()]
+
+    match = _EXCEPTION_LINE.match(lines[-1].strip())
+
+    if match is None:
+        return None
+
+    error_type = match.group("type").rsplit(".", 1)[-1]
+    message = (match.group("message") or "").strip() or error_type
+
+    line_number = None
+    for frame in _TRACEBACK_FRAME.finditer(stderr):
+        if os.path.basename(frame.group("file")) == SCRIPT_FILENAME:
+            line_number = int(frame.group("line"))
+
+    return RuntimeDiagnostic(
+        severity=DiagnosticSeverity.ERROR,
+        error_type=error_type,
+        message=message,
+        line=line_number,
+    )
@@ -0,0 +1,213 @@
+# infrastructure/execution/sandboxed_process.py
+
+# SandboxedProcess
+#
+# Responsibility:
+# Runs one interpreter process under the hard limits of ExecutionLimits and
+# measures it. Limits are applied with resource.setrlimit inside the child
+# (address space, open files, processes, file size, CPU backstop); stdout and
+# stderr are read incrementally and the process is killed as soon as their
+# combined size passes max_output_bytes or the wall-clock deadline expires.
+# CPU time and peak RSS come from the rusage returned by os.wait4.
+#
+# Limits are applied by a small bootstrap executed with `-c` rather than a
+# preexec_fn, which is not safe to use from a multi-threaded parent.
+
+from __future__ import annotations
+
+import os
+import selectors
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from infrastructure.execution.contracts.execution_limits import ExecutionLimits
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None
+
+_READ_CHUNK_BYTES = 65_536
+_REAP_POLL_SECONDS = 0.005
+
+# argv: <script> <as_bytes> <nofile> <nproc> <cpu_seconds>
+_BOOTSTRAP = """\
+import resource, sys
+_path = sys.argv[1]
+_limits = [int(v) for v in sys.argv[2:6]]
+with open(_path, encoding="utf-8") as _f:
+    _code = compile(_f.read(), _path, "exec")
+for _name, _value in zip(("RLIMIT_AS", "RLIMIT_NOFILE", "RLIMIT_NPROC", "RLIMIT_CPU"), _limits):
+    resource.setrlimit(getattr(resource, _name), (_value, _value))
+resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+sys.argv = [_path]
+_globals = {"__name__": "__main__", "__file__": _path, "__builtins__": __builtins__}
+del resource, _path, _limits, _f, _name, _value
+exec(_code, _globals)
+"""
+
+
+@dataclass(frozen=True)
+class SandboxedProcessOutcome:
+    """Raw, language-agnostic outcome of one sandboxed process run."""
+
+    stdout: bytes
+    stderr: bytes
+    returncode: int
+    timed_out: bool
+    output_limit_exceeded: bool
+    stdout_truncated: bool
+    stderr_truncated: bool
+    duration_ms: int
+    cpu_time_ms: int
+    peak_memory_kb: int
+
+    @property
+    def term_signal(self) -> int | None:
+        return -self.returncode if self.returncode < 0 else None
+
+
+def is_supported() -> bool:
+    """Return True when rlimits and wait4 are available on this platform."""
+
+    return resource is not None and hasattr(os, "wait4")
+
+
+def run_sandboxed_python(
+    python_executable: str,
+    script_path: str,
+    limits: ExecutionLimits,
+    env: dict[str, str] | None = None,
+) -> SandboxedProcessOutcome:
+    """Execute script_path with python_executable under limits."""
+
+    cpu_seconds = max(1, -(-limits.timeout_ms // 1000)) + 1
+
+    argv = [
+        python_executable,
+        "-I",
+        "-B",
+        "-c",
+        _BOOTSTRAP,
+        script_path,
+        str(limits.memory_limit_mb * 1024 * 1024),
+        str(limits.max_file_descriptors),
+        str(limits.max_processes),
+        # CPU rlimit is a backstop; the wall-clock deadline normally fires first.
+        str(cpu_seconds),
+    ]
+
+    start = time.perf_counter()
+    deadline = time.monotonic() + limits.timeout_ms / 1000
+
+    process = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=os.path.dirname(script_path) or None,
+        env=env if env is not None else {},
+        start_new_session=True,
+    )
+
+    buffers: dict[str, list[bytes]] = {"stdout": [], "stderr": []}
+    truncated = {"stdout": False, "stderr": False}
+    timed_out = False
+    output_limit_exceeded = False
+    remaining_budget = limits.max_output_bytes
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+
+        while selector.get_map() and not (timed_out or output_limit_exceeded):
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                timed_out = True
+                break
+
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, _READ_CHUNK_BYTES)
+
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+
+                kept = chunk[:remaining_budget]
+                buffers[key.data].append(kept)
+                remaining_budget -= len(kept)
+
+                if len(kept) < len(chunk):
+                    truncated[key.data] = True
+                    output_limit_exceeded = True
+                    break
+
+    if timed_out or output_limit_exceeded:
+        _kill_group(process.pid)
+
+    status, rusage, reaped_after_deadline = _reap(process.pid, deadline)
+    timed_out = timed_out or reaped_after_deadline
+
+    # wait4 already reaped the child; keep Popen from waiting on it again.
+    process.returncode = os.waitstatus_to_exitcode(status)
+    process.stdout.close()
+    process.stderr.close()
+
+    duration_ms = int((time.perf_counter() - start) * 1000)
+
+    return SandboxedProcessOutcome(
+        stdout=b"".join(buffers["stdout"]),
+        stderr=b"".join(buffers["stderr"]),
+        returncode=process.returncode,
+        timed_out=timed_out,
+        output_limit_exceeded=output_limit_exceeded,
+        stdout_truncated=truncated["stdout"],
+        stderr_truncated=truncated["stderr"],
+        duration_ms=duration_ms,
+        cpu_time_ms=int((rusage.ru_utime + rusage.ru_stime) * 1000),
+        peak_memory_kb=_max_rss_kb(rusage.ru_maxrss),
+    )
+
+
+# =========================================================
+# INTERNALS
+# =========================================================
+
+
+def _kill_group(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _reap(pid: int, deadline: float) -> tuple[int, "resource.struct_rusage", bool]:
+    """
+    Wait for pid with wait4, killing it if it outlives the deadline after
+    closing its pipes. Returns (status, rusage, killed_for_deadline).
+    """
+
+    while True:
+        reaped, status, rusage = os.wait4(pid, os.WNOHANG)
+
+        if reaped:
+            return status, rusage, False
+
+        if time.monotonic() >= deadline:
+            _kill_group(pid)
+            _, status, rusage = os.wait4(pid, 0)
+            return status, rusage, True
+
+        time.sleep(_REAP_POLL_SECONDS)
+
+
+def _max_rss_kb(max_rss: int) -> int:
+    # Linux reports ru_maxrss in kilobytes, macOS in bytes.
+    if sys.platform == "darwin":
+        return max_rss // 1024
+    return max_rss
@@ -8,6 +8,7 @@ from infrastructure.health.http import (
 from infrastructure.health.probes import (
     probe_database,
     probe_llm,
+    probe_retrieval,
     probe_sandbox,
 )
 from infrastructure.health.readiness import evaluate_readiness
@@ -26,6 +27,7 @@ __all__ = [
     "evaluate_readiness",
     "probe_database",
     "probe_llm",
+    "probe_retrieval",
     "probe_sandbox",
     "readiness_response_body",
     "readiness_status_code",
@@ -10,11 +10,16 @@ import sys
 import time
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from infrastructure.config.settings import Settings
 from infrastructure.health.types import ProbeResult
 
+if TYPE_CHECKING:
+    from infrastructure.vector_store.chroma_registry import ChromaWarmState
+
 LLMConnectivityCheck = Callable[[Settings], None]
+RetrievalWarmStateSource = Callable[[], "ChromaWarmState"]
 
 
 def probe_llm(
@@ -118,6 +123,50 @@ def probe_sandbox(settings: Settings) -> ProbeResult:
         )
 
 
+def probe_retrieval(
+    settings: Settings,
+    *,
+    warm_state: RetrievalWarmStateSource | None = None,
+) -> ProbeResult:
+    """
+    Shared retrieval index warm-up state — reads the registry, never opens
+    or queries the index itself.
+    """
+    name = "retrieval"
+    if not settings.health_retrieval_probe_enabled:
+        return ProbeResult(name=name, status="skipped", detail="probe disabled")
+
+    source = warm_state or _default_retrieval_warm_state
+    try:
+        state = source()
+    except Exception as exc:
+        return ProbeResult(
+            name=name,
+            status="failure",
+            detail=str(exc) or type(exc).__name__,
+            error_type=type(exc).__name__,
+        )
+
+    if state.is_warm:
+        return ProbeResult(
+            name=name,
+            status="success",
+            detail=state.detail or "retrieval index warm",
+            duration_ms=state.duration_ms,
+        )
+
+    if state.status == "cold" and not settings.retrieval_warmup_enabled:
+        return ProbeResult(name=name, status="skipped", detail="warm-up disabled")
+
+    return ProbeResult(
+        name=name,
+        status="failure",
+        detail=state.detail or f"retrieval index {state.status}",
+        error_type=state.error_type,
+        duration_ms=state.duration_ms,
+    )
+
+
 def _default_llm_connectivity_check(settings: Settings) -> None:
     """
     OpenAI models.list is connectivity-only (no chat, no business prompts).
@@ -138,6 +187,12 @@ def _default_llm_connectivity_check(settings: Settings) -> None:
     next(iter(client.models.list()), None)
 
 
+def _default_retrieval_warm_state() -> ChromaWarmState:
+    from infrastructure.vector_store.chroma_registry import get_chroma_registry
+
+    return get_chroma_registry().warm_state()
+
+
 def _timeout_seconds(settings: Settings) -> float:
     return max(settings.health_probe_timeout_ms, 1) / 1000.0
 
@@ -7,8 +7,10 @@ from __future__ import annotations
 from infrastructure.config.settings import Settings, settings as default_settings
 from infrastructure.health.probes import (
     LLMConnectivityCheck,
+    RetrievalWarmStateSource,
     probe_database,
     probe_llm,
+    probe_retrieval,
     probe_sandbox,
 )
 from infrastructure.health.types import ReadinessReport
@@ -18,6 +20,7 @@ def evaluate_readiness(
     settings: Settings | None = None,
     *,
     llm_connectivity_check: LLMConnectivityCheck | None = None,
+    retrieval_warm_state: RetrievalWarmStateSource | None = None,
 ) -> ReadinessReport:
     """
     Run HLT-01 probes and return aggregate readiness.
@@ -29,6 +32,7 @@ def evaluate_readiness(
         probe_llm(resolved, connectivity_check=llm_connectivity_check),
         probe_database(resolved),
         probe_sandbox(resolved),
+        probe_retrieval(resolved, warm_state=retrieval_warm_state),
     )
     ready = all(probe.status != "failure" for probe in probes)
     return ReadinessReport(ready=ready, probes=probes)
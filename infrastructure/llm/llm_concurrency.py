@@ -0,0 +1,43 @@
+# infrastructure/llm/llm_concurrency.py
+
+# LLMConcurrency
+#
+# Responsibility:
+# Process-wide executor for LLM calls that callers fan out. Its worker
+# count (settings.llm_max_concurrency) bounds how many such requests are
+# in flight at once across every session. Tasks run in the submitting
+# thread's context so LLM metrics and operation attribution still reach
+# the caller. Tasks must not wait on other tasks of this executor.
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from infrastructure.config.settings import settings
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_llm_executor() -> ThreadPoolExecutor:
+
+    return ThreadPoolExecutor(
+        max_workers=settings.llm_max_concurrency,
+        thread_name_prefix="llm",
+    )
+
+
+def submit_llm_call(
+    fn: Callable[..., T],
+    *args,
+    **kwargs,
+) -> "Future[T]":
+    """Run fn(*args, **kwargs) on the LLM executor in the caller's context."""
+
+    return get_llm_executor().submit(
+        contextvars.copy_context().run,
+        fn,
+        *args,
+        **kwargs,
+    )
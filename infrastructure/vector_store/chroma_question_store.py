@@ -6,13 +6,13 @@
 # Creates and manages the Chroma collection dedicated
 # to QuestionBankItem embeddings.
 # Ensures persistence and embedding consistency.
+# The collection is opened through the process-wide ChromaRegistry.
 
 from pathlib import Path
 
-from langchain_chroma import Chroma
 from langchain_core.documents import Document
 
-from infrastructure.embeddings.embedding_factory import get_embedding_model
+from infrastructure.vector_store.chroma_registry import get_chroma_registry
 
 
 class ChromaQuestionStore:
@@ -22,11 +22,8 @@ class ChromaQuestionStore:
     def __init__(self) -> None:
         self.PERSIST_DIR.mkdir(parents=True, exist_ok=True)
 
-        self._embedding_model = get_embedding_model()
-
-        self._store = Chroma(
+        self._store = get_chroma_registry().vectorstore(
             collection_name=self.COLLECTION_NAME,
-            embedding_function=self._embedding_model,
             persist_directory=str(self.PERSIST_DIR),
         )
 
@@ -37,13 +34,8 @@ class ChromaQuestionStore:
     
     def reset_collection(self) -> None:
 
-        self._store.delete_collection()
-
-        self._store = Chroma(
-            collection_name=self.COLLECTION_NAME,
-            embedding_function=self._embedding_model,
-            persist_directory=str(self.PERSIST_DIR),
-        )
+        # Recreated in place: other holders of the shared store stay valid.
+        self._store.reset_collection()
 
     
     def similarity_search(
@@ -0,0 +1,345 @@
+# infrastructure/vector_store/chroma_registry.py
+
+# ChromaRegistry
+#
+# Responsibility:
+# Owns the process-wide Chroma clients and LangChain vector stores.
+# Every consumer of a persisted collection (retrieval, question bank,
+# corpus validation) goes through one registry, so the SQLite/HNSW files
+# under a persist directory are opened and loaded once per process.
+# Also warms the retrieval collection at startup and records the warm
+# state read by the readiness probe.
+#
+# Collections record the embedding model that filled them; opening one
+# with a different model raises instead of returning meaningless
+# neighbours.
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import chromadb
+from chromadb.api.client import SharedSystemClient
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+
+from app.core.logger import get_logger
+from infrastructure.embeddings.embedding_backends import embedding_model_name
+from infrastructure.embeddings.embedding_factory import get_embedding_model
+
+logger = get_logger(__name__)
+
+EmbeddingsFactory = Callable[[], Embeddings]
+
+# Collection metadata key naming the embedding model of its vectors.
+EMBEDDING_MODEL_KEY = "embedding_model"
+
+
+class EmbeddingModelMismatchError(RuntimeError):
+    """The collection was built with a different embedding model."""
+
+
+@dataclass(frozen=True)
+class ChromaWarmState:
+    """Warm-up progress of the retrieval collection: cold, warming, warm or failed."""
+
+    status: str
+
+    detail: str | None = None
+
+    record_count: int | None = None
+
+    error_type: str | None = None
+
+    duration_ms: float | None = None
+
+    @property
+    def is_warm(self) -> bool:
+
+        return self.status == "warm"
+
+
+class ChromaRegistry:
+    """
+    Thread-safe owner of one PersistentClient per persist directory and one
+    Chroma vector store per (persist directory, collection).
+
+    chromadb clients are safe to share across threads; the registry only
+    serialises their creation.
+    """
+
+    def __init__(
+        self,
+        embeddings_factory: EmbeddingsFactory | None = None,
+    ) -> None:
+
+        self._embeddings_factory = embeddings_factory or get_embedding_model
+
+        self._embeddings: Embeddings | None = None
+
+        self._clients: dict[str, chromadb.ClientAPI] = {}
+
+        self._vectorstores: dict[tuple[str, str], Chroma] = {}
+
+        self._lock = threading.RLock()
+
+        self._warm_state = ChromaWarmState(status="cold")
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    def client(
+        self,
+        persist_directory: str,
+    ) -> chromadb.ClientAPI:
+
+        key = _directory_key(persist_directory)
+
+        with self._lock:
+
+            client = self._clients.get(key)
+
+            if client is None:
+
+                client = chromadb.PersistentClient(
+                    path=persist_directory,
+                )
+
+                self._clients[key] = client
+
+            return client
+
+    def vectorstore(
+        self,
+        collection_name: str,
+        persist_directory: str,
+    ) -> Chroma:
+
+        key = (
+            _directory_key(persist_directory),
+            collection_name,
+        )
+
+        with self._lock:
+
+            vectorstore = self._vectorstores.get(key)
+
+            if vectorstore is None:
+
+                vectorstore = Chroma(
+                    client=self.client(persist_directory),
+                    collection_name=collection_name,
+                    embedding_function=self.embeddings(),
+                )
+
+                _check_embedding_model(
+                    vectorstore,
+                    embedding_model_name(self.embeddings()),
+                )
+
+                self._vectorstores[key] = vectorstore
+
+            return vectorstore
+
+    def embeddings(
+        self,
+    ) -> Embeddings:
+
+        with self._lock:
+
+            if self._embeddings is None:
+                self._embeddings = self._embeddings_factory()
+
+            return self._embeddings
+
+    def warm_up(
+        self,
+        collection_name: str,
+        persist_directory: str,
+    ) -> ChromaWarmState:
+        """
+        Open the collection, load its index and run one nearest-neighbour
+        probe with a stored vector, so the first real query does not pay
+        the cold load. The probe needs no embedding call.
+        """
+
+        self._set_warm_state(
+            ChromaWarmState(status="warming"),
+        )
+
+        started = time.perf_counter()
+
+        try:
+
+            collection = self.vectorstore(
+                collection_name,
+                persist_directory,
+            )._collection
+
+            count = collection.count()
+
+            if count:
+
+                sample = collection.get(
+                    limit=1,
+                    include=["embeddings"],
+                )
+
+                collection.query(
+                    query_embeddings=[sample["embeddings"][0]],
+                    n_results=1,
+                )
+
+            state = ChromaWarmState(
+                status="warm",
+                detail=f"{collection_name}: {count} records",
+                record_count=count,
+                duration_ms=_elapsed_ms(started),
+            )
+
+        except Exception as exc:
+
+            state = ChromaWarmState(
+                status="failed",
+                detail=str(exc) or type(exc).__name__,
+                error_type=type(exc).__name__,
+                duration_ms=_elapsed_ms(started),
+            )
+
+        self._set_warm_state(
+            state,
+        )
+
+        logger.info(
+            "chroma_warm_up: collection=%s status=%s records=%s duration_ms=%s",
+            collection_name,
+            state.status,
+            state.record_count,
+            state.duration_ms,
+        )
+
+        return state
+
+    def warm_up_in_background(
+        self,
+        collection_name: str,
+        persist_directory: str,
+    ) -> threading.Thread:
+
+        self._set_warm_state(
+            ChromaWarmState(status="warming"),
+        )
+
+        thread = threading.Thread(
+            target=self.warm_up,
+            args=(collection_name, persist_directory),
+            name="chroma-warm-up",
+            daemon=True,
+        )
+
+        thread.start()
+
+        return thread
+
+    def warm_state(
+        self,
+    ) -> ChromaWarmState:
+
+        with self._lock:
+            return self._warm_state
+
+    def reset(
+        self,
+    ) -> None:
+        """
+        Drop every client and vector store, e.g. after the persist
+        directory was replaced on disk. chromadb keeps its own per-path
+        system cache, which is cleared as well.
+        """
+
+        with self._lock:
+
+            self._vectorstores.clear()
+
+            self._clients.clear()
+
+            self._warm_state = ChromaWarmState(status="cold")
+
+            SharedSystemClient.clear_system_cache()
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _set_warm_state(
+        self,
+        state: ChromaWarmState,
+    ) -> None:
+
+        with self._lock:
+            self._warm_state = state
+
+
+def _check_embedding_model(
+    vectorstore: Chroma,
+    model_name: str,
+) -> None:
+    """
+    Raise if the collection records another embedding model. A new, empty
+    collection is stamped with model_name; older non-empty collections
+    without a record are accepted as they are.
+    """
+
+    collection = vectorstore._collection
+
+    metadata = {
+        key: value
+        for key, value in (collection.metadata or {}).items()
+        if not key.startswith("hnsw:")
+    }
+
+    recorded = metadata.get(EMBEDDING_MODEL_KEY)
+
+    if recorded is None:
+
+        if collection.count() == 0:
+
+            metadata[EMBEDDING_MODEL_KEY] = model_name
+
+            collection.modify(
+                metadata=metadata,
+            )
+
+        return
+
+    if recorded != model_name:
+        raise EmbeddingModelMismatchError(
+            f"Collection '{collection.name}' was built with embedding model "
+            f"'{recorded}' but the configured model is '{model_name}'; "
+            "rebuild the corpus or switch settings.embedding_backend back."
+        )
+
+
+def _directory_key(
+    persist_directory: str,
+) -> str:
+
+    return str(Path(persist_directory).resolve())
+
+
+def _elapsed_ms(started: float) -> float:
+
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+@lru_cache(maxsize=1)
+def get_chroma_registry() -> ChromaRegistry:
+    """Process-wide registry shared by every Chroma consumer."""
+
+    return ChromaRegistry()
@@ -53,6 +53,7 @@ def main() -> int:
         health_llm_probe_enabled=False,
         health_db_probe_enabled=False,
         health_sandbox_probe_enabled=True,
+        health_retrieval_probe_enabled=False,
         readiness_gate_base_url="http://127.0.0.1:8765",
         readiness_gate_timeout_s=5.0,
     )
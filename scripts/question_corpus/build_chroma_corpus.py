@@ -1,5 +1,6 @@
 # scripts/question_corpus/build_chroma_corpus.py
 
+import argparse
 from collections import Counter
 
 from dotenv import load_dotenv
@@ -172,6 +173,14 @@ def print_sample_retrieval(
 
 def main() -> None:
 
+    parser = argparse.ArgumentParser(description="Build or sync the Chroma question corpus")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="drop the collection and re-embed every document instead of syncing changes",
+    )
+    args = parser.parse_args()
+
     load_dotenv()
 
     print("\nCHROMA CORPUS BUILD")
@@ -224,6 +233,7 @@ def main() -> None:
 
     ChromaCorpusBuilder().build(
         langchain_documents,
+        incremental=not args.full,
     )
 
     chroma = Chroma(
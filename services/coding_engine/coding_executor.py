@@ -54,6 +54,7 @@ class CodingExecutor:
             hidden_tests=hidden_tests,
             function_name=question.function_name or "solution",
             coding_spec=question.coding_spec,  # ✅ NEW
+            question_id=question.id,
         )
 
         # -----------------------------------------------------
@@ -5,12 +5,26 @@
 # Responsibility:
 # Executes arbitrary Python code in an isolated subprocess.
 # Provides timeout control and captures raw execution output.
+# Optionally delegates to a warm SandboxWorkerPool, falling back to a fresh
+# interpreter if the pool fails.
 # Does not contain domain logic.
 
+from __future__ import annotations
+
 import subprocess
 import tempfile
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from infrastructure.config.settings import settings
+
+from app.core.logger import get_logger
+
+if TYPE_CHECKING:
+    from services.coding_engine.sandbox_worker_pool import SandboxWorkerPool
+
+logger = get_logger(__name__)
 
 
 class SandboxExecutionOutput:
@@ -30,10 +44,33 @@ class SandboxExecutionOutput:
 
 
 class ExecutionSandbox:
-    def __init__(self, timeout_seconds: int = 5) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int = 5,
+        worker_pool: SandboxWorkerPool | None = None,
+    ) -> None:
         self._timeout_seconds = timeout_seconds
 
+        if worker_pool is None and settings.coding_sandbox_worker_pool_enabled:
+            # Lazy import: the pool module imports SandboxExecutionOutput from here.
+            from services.coding_engine.sandbox_worker_pool import get_default_worker_pool
+
+            worker_pool = get_default_worker_pool()
+
+        self._worker_pool = worker_pool
+
     def execute(self, code: str) -> SandboxExecutionOutput:
+        if self._worker_pool is not None:
+            from services.coding_engine.sandbox_worker_pool import SandboxWorkerError
+
+            try:
+                return self._worker_pool.run(code, self._timeout_seconds)
+            except SandboxWorkerError as e:
+                logger.warning("Sandbox worker failed, falling back to subprocess: %s", e)
+
+        return self._execute_in_subprocess(code)
+
+    def _execute_in_subprocess(self, code: str) -> SandboxExecutionOutput:
         with tempfile.TemporaryDirectory() as tmpdir:
             file_path = Path(tmpdir) / "user_code.py"
             file_path.write_text(code)
@@ -1,6 +1,5 @@
 # services/coding_engine/harness/blocks/callable_resolver_block.py
 
-import os
 from typing import List, Optional
 
 from domain.contracts.execution.coding_spec import CodingSpec
@@ -12,9 +11,6 @@ from services.coding_engine.harness.strategies.resolver_strategy_factory import
     ResolverStrategyFactory,
 )
 
-BASE_DIR = os.path.dirname(__file__)
-TEMPLATES_DIR = os.path.join(BASE_DIR, "../templates")
-
 class CallableResolverBlock(BaseBlock):
 
     def __init__(
@@ -25,7 +21,7 @@ class CallableResolverBlock(BaseBlock):
         self.function_name = function_name
         self.coding_spec = coding_spec
 
-        self._renderer = TemplateRenderer(TEMPLATES_DIR)
+        self._renderer = TemplateRenderer()
 
     def render(self) -> List[str]:
 
@@ -17,7 +17,7 @@ class SignatureValidationBlock(BaseBlock):
     def __init__(self, coding_spec: Optional[CodingSpec]):
         self.coding_spec = coding_spec
 
-        self._renderer = TemplateRenderer("services/coding_engine/harness/templates")
+        self._renderer = TemplateRenderer()
 
     def render(self) -> List[str]:
 
@@ -1,22 +1,18 @@
 # services/coding_engine/harness/blocks/test_runner_block.py
 
-import os
 from typing import List
 from .base_block import BaseBlock
 
 from services.coding_engine.harness.markers import TestMarkers
 from services.coding_engine.harness.template_renderer import TemplateRenderer
 
-BASE_DIR = os.path.dirname(__file__)
-TEMPLATES_DIR = os.path.join(BASE_DIR, "../templates")
-
 class TestRunnerBlock(BaseBlock):
 
     def __init__(self, visible_tests, hidden_tests):
         self.visible_tests = visible_tests
         self.hidden_tests = hidden_tests
 
-        self._renderer = TemplateRenderer(TEMPLATES_DIR)
+        self._renderer = TemplateRenderer()
 
     def render(self) -> List[str]:
 
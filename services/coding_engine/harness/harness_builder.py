@@ -16,10 +16,17 @@ from services.coding_engine.harness.blocks.signature_validation_block import (
 from services.coding_engine.harness.blocks.entry_point_block import EntryPointBlock
 from services.coding_engine.harness.blocks.comparator_block import ComparatorBlock
 from services.coding_engine.harness.blocks.test_runner_block import TestRunnerBlock
+from services.coding_engine.harness.harness_cache import (
+    HarnessCache,
+    get_default_harness_cache,
+)
 
 
 class HarnessBuilder:
 
+    def __init__(self, cache: HarnessCache | None = None):
+        self._cache = cache if cache is not None else get_default_harness_cache()
+
     def build(
         self,
         user_code: str,
@@ -27,10 +34,44 @@ class HarnessBuilder:
         hidden_tests: List[CodingTestCase],
         function_name: str,
         coding_spec: Optional[CodingSpec],
+        question_id: Optional[str] = None,
+    ) -> str:
+
+        # Everything after the user code depends only on the question, so it
+        # is rendered once and reused for every submission.
+        key = self._cache.build_key(
+            question_id,
+            visible_tests,
+            hidden_tests,
+            function_name,
+            coding_spec,
+        )
+
+        body = self._cache.get_or_render(
+            key,
+            lambda: self._render_body(
+                visible_tests,
+                hidden_tests,
+                function_name,
+                coding_spec,
+            ),
+        )
+
+        return "\n".join(UserCodeBlock(user_code).render() + [body])
+
+    # =========================================================
+    # INTERNALS
+    # =========================================================
+
+    def _render_body(
+        self,
+        visible_tests: List[CodingTestCase],
+        hidden_tests: List[CodingTestCase],
+        function_name: str,
+        coding_spec: Optional[CodingSpec],
     ) -> str:
 
         blocks = [
-            UserCodeBlock(user_code),
             ImportsBlock(),
             CallableResolverBlock(function_name, coding_spec),
             SignatureValidationBlock(coding_spec),
@@ -0,0 +1,123 @@
+# services/coding_engine/harness/harness_cache.py
+
+# HarnessCache
+#
+# Responsibility:
+# Memoizes the rendered, question-dependent part of a harness (imports,
+# callable resolver, signature validation, entry point, comparator and test
+# runner). Only the user code changes between submissions for the same
+# question, so HarnessBuilder splices it in front of the cached body.
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+from domain.contracts.execution.coding_spec import CodingSpec
+from domain.contracts.execution.coding_test_case import CodingTestCase
+
+
+class HarnessCache:
+    """Thread-safe LRU cache of rendered harness bodies."""
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    @staticmethod
+    def build_key(
+        question_id: Optional[str],
+        visible_tests: List[CodingTestCase],
+        hidden_tests: List[CodingTestCase],
+        function_name: str,
+        coding_spec: Optional[CodingSpec],
+    ) -> str:
+        """
+        Tests are hashed through repr(), the same representation the test
+        runner template embeds, so equal keys always render equal harnesses.
+        """
+
+        digest = hashlib.sha256()
+
+        for part in (
+            question_id or "",
+            function_name,
+            coding_spec.model_dump_json() if coding_spec is not None else "",
+            _tests_repr(visible_tests),
+            _tests_repr(hidden_tests),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return body
+
+    def put(self, key: str, body: str) -> str:
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, render())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+
+def _tests_repr(tests: List[CodingTestCase]) -> str:
+    return repr([(t.args, t.kwargs, t.expected) for t in tests])
+
+
+@lru_cache(maxsize=1)
+def get_default_harness_cache() -> HarnessCache:
+    """Process-wide cache shared by every HarnessBuilder."""
+
+    return HarnessCache()
@@ -1,17 +1,29 @@
 # services/coding_engine/harness/template_renderer.py
 
+import os
+from functools import lru_cache
+
 from jinja2 import Environment, FileSystemLoader
 
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+
+@lru_cache(maxsize=None)
+def _shared_environment(template_dir: str) -> Environment:
+    # One Environment per template directory for the whole process, so
+    # compiled templates are reused by every renderer instance.
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
 
 class TemplateRenderer:
 
-    def __init__(self, template_dir: str):
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=False,  
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+    def __init__(self, template_dir: str = TEMPLATES_DIR):
+        self.env = _shared_environment(os.path.abspath(template_dir))
 
     def render(self, template_name: str, context: dict) -> str:
         template = self.env.get_template(template_name)
@@ -0,0 +1,218 @@
+# services/coding_engine/sandbox_worker.py
+
+# SandboxWorker
+#
+# Responsibility:
+# Long-lived child process used by SandboxWorkerPool.
+# Preloads the modules every harness imports, then serves run requests
+# received over stdin. Each run executes in a forked grandchild so user code
+# never mutates the warm worker, under an optional CPU/memory rlimit.
+# The grandchild leads its own process group and keeps only stdin (devnull),
+# stdout and stderr: it cannot reach the worker's protocol pipes, and
+# anything it spawns is killed with the group when the run ends, or when
+# the worker receives SIGTERM (the pool's timeout path).
+#
+# Standalone by design: started as a script and imports only the stdlib.
+#
+# Protocol (both directions): 4-byte big-endian length + UTF-8 JSON payload.
+#   request:  {"code": str, "cpu_limit_seconds": int | null,
+#              "memory_limit_mb": int | null, "stdout_path": str | null}
+#   response: {"returncode": int, "stdout": str, "stderr": str}
+#   stdout_path, when given, is where the run's stdout is written, so the
+#   pool can still read partial output after killing a timed-out worker.
+
+import builtins
+import json
+import os
+import signal
+import struct
+import sys
+import tempfile
+import traceback
+
+# Harness imports (ImportsBlock) plus modules commonly used by solutions.
+import collections  # noqa: F401
+import functools  # noqa: F401
+import heapq  # noqa: F401
+import inspect  # noqa: F401
+import itertools  # noqa: F401
+import math  # noqa: F401
+import re  # noqa: F401
+import typing  # noqa: F401
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None
+
+_HEADER = struct.Struct(">I")
+
+HARNESS_FILENAME = "user_code.py"
+
+# Process group of the run in progress, if any.
+_current_run: int | None = None
+
+
+# =========================================================
+# PROTOCOL
+# =========================================================
+
+
+def _read_exact(fd: int, size: int) -> bytes | None:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_message(fd: int) -> dict | None:
+    header = _read_exact(fd, _HEADER.size)
+    if header is None:
+        return None
+    payload = _read_exact(fd, _HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+    return json.loads(payload.decode("utf-8"))
+
+
+def write_message(fd: int, message: dict) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    data = _HEADER.pack(len(payload)) + payload
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+# =========================================================
+# EXECUTION
+# =========================================================
+
+
+def _apply_limits(cpu_limit_seconds: int | None, memory_limit_mb: int | None) -> None:
+    if resource is None:
+        return
+    if cpu_limit_seconds:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit_seconds, cpu_limit_seconds))
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _exec_harness(code: str) -> int:
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    try:
+        exec(compile(code, HARNESS_FILENAME, "exec"), namespace)
+        return 0
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(exc.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+def _kill_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _terminate(signum, frame) -> None:
+    if _current_run is not None:
+        _kill_group(_current_run)
+    os._exit(128 + signum)
+
+
+def run_isolated(request: dict) -> dict:
+    stdout_path = request.get("stdout_path")
+    stdout_file = open(stdout_path, "w+b") if stdout_path else tempfile.TemporaryFile()
+
+    with stdout_file as out, tempfile.TemporaryFile() as err:
+
+        pid = os.fork()
+
+        if pid == 0:
+            returncode = 1
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                os.setpgid(0, 0)
+                os.dup2(out.fileno(), 1)
+                os.dup2(err.fileno(), 2)
+                # Drop every inherited fd, above all the request/response
+                # pipes duplicated in main().
+                os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+                sys.stdin = open(os.devnull)
+                _apply_limits(
+                    request.get("cpu_limit_seconds"),
+                    request.get("memory_limit_mb"),
+                )
+                returncode = _exec_harness(request["code"])
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(returncode & 0xFF)
+
+        global _current_run
+        _current_run = pid
+
+        # Set from both sides so the group exists before either proceeds.
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            pass
+
+        # Wait without reaping: the zombie keeps pid (and so the group id)
+        # from being reused until the group has been killed.
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        _kill_group(pid)
+        _, status = os.waitpid(pid, 0)
+
+        _current_run = None
+
+        out.seek(0)
+        err.seek(0)
+
+        return {
+            "returncode": os.waitstatus_to_exitcode(status),
+            "stdout": out.read().decode("utf-8", errors="replace"),
+            "stderr": err.read().decode("utf-8", errors="replace"),
+        }
+
+
+# =========================================================
+# ENTRY POINT
+# =========================================================
+
+
+def main() -> None:
+    request_fd = os.dup(0)
+    response_fd = os.dup(1)
+
+    # Stray prints must never corrupt the response stream.
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+
+    signal.signal(signal.SIGTERM, _terminate)
+
+    while True:
+        request = read_message(request_fd)
+        if request is None:
+            return
+        write_message(response_fd, run_isolated(request))
+
+
+if __name__ == "__main__":
+    main()
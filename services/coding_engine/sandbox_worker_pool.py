@@ -0,0 +1,265 @@
+# services/coding_engine/sandbox_worker_pool.py
+
+# SandboxWorkerPool
+#
+# Responsibility:
+# Keeps a bounded set of warm sandbox_worker.py processes so that harness
+# execution skips interpreter startup and harness imports.
+# Enforces the wall-clock timeout from the parent side (the worker is asked
+# to kill its forked run's process group and exit, then killed outright)
+# and recycles workers after a fixed number of runs. Returns the same SandboxExecutionOutput contract as
+# ExecutionSandbox, including the partial stdout of a timed-out run.
+
+from __future__ import annotations
+
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from infrastructure.config.settings import settings
+from services.coding_engine import sandbox_worker
+from services.coding_engine.execution_sandbox import SandboxExecutionOutput
+
+_WORKER_SCRIPT = Path(sandbox_worker.__file__).resolve()
+
+
+class SandboxWorkerError(RuntimeError):
+    """The worker died or broke protocol; the run should be retried elsewhere."""
+
+
+class _SandboxWorker:
+
+    _TERMINATE_GRACE_SECONDS = 1.0
+
+    def __init__(self) -> None:
+        self._process = subprocess.Popen(
+            [sys.executable, str(_WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.runs = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def send(self, request: dict) -> None:
+        try:
+            sandbox_worker.write_message(self._process.stdin.fileno(), request)
+        except OSError as exc:
+            raise SandboxWorkerError(f"worker rejected request: {exc}") from exc
+
+    def receive(self, deadline: float) -> dict | None:
+        """Return the response, or None when the deadline passes first."""
+
+        fd = self._process.stdout.fileno()
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            return None
+
+        ready, _, _ = select.select([fd], [], [], remaining)
+
+        if not ready:
+            return None
+
+        response = sandbox_worker.read_message(fd)
+
+        if response is None:
+            raise SandboxWorkerError("worker exited unexpectedly")
+
+        return response
+
+    def kill(self) -> None:
+        # SIGTERM lets the worker kill the run's own process group first.
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(self._process.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+            try:
+                self._process.wait(timeout=self._TERMINATE_GRACE_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+        self._process.wait()
+        self._close_pipes()
+
+    def close(self) -> None:
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+            return
+        self._close_pipes()
+
+    def _close_pipes(self) -> None:
+        for pipe in (self._process.stdin, self._process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+class SandboxWorkerPool:
+    """Thread-safe pool of pre-started sandbox workers."""
+
+    DEFAULT_MAX_RUNS_PER_WORKER = 100
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_runs_per_worker: int = DEFAULT_MAX_RUNS_PER_WORKER,
+        memory_limit_mb: int | None = None,
+    ) -> None:
+        self._size = size if size and size > 0 else (os.cpu_count() or 1)
+
+        if max_runs_per_worker < 1:
+            raise ValueError("max_runs_per_worker must be >= 1")
+
+        self._max_runs = max_runs_per_worker
+        self._memory_limit_mb = memory_limit_mb
+        self._idle: list[_SandboxWorker] = []
+        self._slots = threading.BoundedSemaphore(self._size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def warm(self) -> None:
+        """Start every worker now instead of on first use."""
+        with self._lock:
+            while len(self._idle) < self._size and not self._closed:
+                self._idle.append(_SandboxWorker())
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def run(self, code: str, timeout_seconds: float) -> SandboxExecutionOutput:
+        with self._slots:
+            worker = self._checkout()
+
+            # The run writes stdout here so a timeout can still report what
+            # was printed before the worker was killed.
+            stdout_fd, stdout_path = tempfile.mkstemp(prefix="sandbox-stdout-")
+            os.close(stdout_fd)
+
+            try:
+                return self._run_on(worker, code, timeout_seconds, stdout_path)
+            finally:
+                try:
+                    os.unlink(stdout_path)
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+    # =====================================================
+    # INTERNAL
+    # =====================================================
+
+    def _run_on(
+        self,
+        worker: _SandboxWorker,
+        code: str,
+        timeout_seconds: float,
+        stdout_path: str,
+    ) -> SandboxExecutionOutput:
+        start = time.perf_counter()
+
+        try:
+            worker.send(
+                {
+                    "code": code,
+                    # CPU rlimit is a backstop; the wall-clock deadline
+                    # below is what normally stops a run.
+                    "cpu_limit_seconds": int(timeout_seconds) + 1,
+                    "memory_limit_mb": self._memory_limit_mb,
+                    "stdout_path": stdout_path,
+                }
+            )
+            response = worker.receive(time.monotonic() + timeout_seconds)
+        except SandboxWorkerError:
+            worker.kill()
+            raise
+
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+
+        if response is None:
+            worker.kill()
+            return SandboxExecutionOutput(
+                returncode=-1,
+                stdout=Path(stdout_path).read_bytes().decode("utf-8", errors="replace"),
+                stderr="Execution timed out",
+                execution_time_ms=elapsed_ms,
+                timeout=True,
+            )
+
+        worker.runs += 1
+        self._checkin(worker)
+
+        return SandboxExecutionOutput(
+            returncode=int(response["returncode"]),
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+            execution_time_ms=elapsed_ms,
+        )
+
+    def _checkout(self) -> _SandboxWorker:
+        with self._lock:
+            if self._closed:
+                raise SandboxWorkerError("worker pool is closed")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.kill()
+        return _SandboxWorker()
+
+    def _checkin(self, worker: _SandboxWorker) -> None:
+        with self._lock:
+            if not self._closed and worker.alive and worker.runs < self._max_runs:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+
+@lru_cache(maxsize=1)
+def get_default_worker_pool() -> SandboxWorkerPool:
+    """Process-wide pool used when the worker pool setting is enabled."""
+
+    return SandboxWorkerPool(
+        size=settings.coding_sandbox_worker_pool_size,
+        max_runs_per_worker=settings.coding_sandbox_worker_max_runs,
+        memory_limit_mb=settings.coding_sandbox_worker_memory_limit_mb or None,
+    )
+
+
+def warm_default_worker_pool() -> SandboxWorkerPool:
+    """Start the default pool's workers so the first submissions skip interpreter startup."""
+
+    pool = get_default_worker_pool()
+    pool.warm()
+    return pool
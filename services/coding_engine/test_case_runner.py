@@ -9,6 +9,9 @@ from services.coding_engine.harness.harness_builder import HarnessBuilder
 
 class TestCaseRunner:
 
+    def __init__(self, builder: HarnessBuilder | None = None) -> None:
+        self._builder = builder or HarnessBuilder()
+
     def build_harness(
         self,
         user_code: str,
@@ -16,14 +19,14 @@ class TestCaseRunner:
         hidden_tests: List[CodingTestCase],
         function_name: str,
         coding_spec: Optional[CodingSpec],
+        question_id: Optional[str] = None,
     ) -> str:
 
-        builder = HarnessBuilder()
-
-        return builder.build(
+        return self._builder.build(
             user_code=user_code,
             visible_tests=visible_tests,
             hidden_tests=hidden_tests,
             function_name=function_name,
             coding_spec=coding_spec,
+            question_id=question_id,
         )
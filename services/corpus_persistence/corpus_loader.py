@@ -7,6 +7,7 @@ from pathlib import Path
 
 from app.core.logger import get_logger
 from infrastructure.config.settings import settings
+from infrastructure.vector_store.chroma_registry import ChromaWarmState, get_chroma_registry
 from services.question_corpus.constants.vector_store_constants import (
     CHROMA_COLLECTION_NAME,
     CHROMA_PERSIST_DIRECTORY,
@@ -33,9 +34,7 @@ def validate_corpus() -> int:
     Raises RuntimeError if the collection is absent or below minimum.
     """
     try:
-        import chromadb
-
-        client = chromadb.PersistentClient(path=CHROMA_PERSIST_DIRECTORY)
+        client = get_chroma_registry().client(CHROMA_PERSIST_DIRECTORY)
         collection = client.get_collection(CHROMA_COLLECTION_NAME)
         count = collection.count()
     except Exception as exc:
@@ -68,6 +67,8 @@ def restore_corpus_from_hf(*, hf_repo: str, hf_token: str | None = None) -> int:
         )
 
         dest = Path(CHROMA_PERSIST_DIRECTORY)
+        # Clients opened on the old files must not outlive them.
+        get_chroma_registry().reset()
         if dest.exists():
             shutil.rmtree(dest)
         dest.mkdir(parents=True, exist_ok=True)
@@ -113,3 +114,16 @@ def ensure_corpus(*, hf_token: str | None = None) -> None:
     except Exception as exc:
         logger.error("CORPUS_LOAD_FAILED: %s", exc)
         raise SystemExit(1)
+
+
+def warm_corpus_backend(*, background: bool = True) -> ChromaWarmState:
+    """
+    Load the retrieval collection into the shared Chroma registry and run a
+    probe query, so the first interview does not pay the cold index load.
+    Progress is reported by the readiness probe while it runs.
+    """
+    registry = get_chroma_registry()
+    if background:
+        registry.warm_up_in_background(CHROMA_COLLECTION_NAME, CHROMA_PERSIST_DIRECTORY)
+        return registry.warm_state()
+    return registry.warm_up(CHROMA_COLLECTION_NAME, CHROMA_PERSIST_DIRECTORY)
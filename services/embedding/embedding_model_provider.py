@@ -2,6 +2,16 @@
 
 from sentence_transformers import SentenceTransformer
 
+from infrastructure.config.settings import settings
+from infrastructure.embeddings.embedding_backends import (
+    BackendEmbeddings,
+    SentenceTransformerBackend,
+)
+from infrastructure.embeddings.embedding_cache import CachedEmbeddings, cached_embeddings
+from infrastructure.embeddings.local_embedding_model import (
+    get_local_sentence_transformer,
+    local_embedding_model_name,
+)
 from services.embedding.embedding_config import DEFAULT_EMBEDDING_MODEL
 
 
@@ -38,9 +48,8 @@ class EmbeddingModelProvider:
 
         try:
 
-            cls._model = SentenceTransformer(
-                cls._model_name,
-            )
+            # Same instance the "local" retrieval embedding backend uses.
+            cls._model = get_local_sentence_transformer()
 
             return cls._model
 
@@ -59,6 +68,27 @@ class EmbeddingModelProvider:
                 )
             ) from exc
 
+    @classmethod
+    def get_embedder(
+        cls,
+    ) -> CachedEmbeddings | BackendEmbeddings:
+        """
+        Local model behind the shared embedding cache (see embed_many), or
+        uncached when settings.embedding_cache_enabled is off, matching
+        get_embedding_model().
+        """
+
+        backend = SentenceTransformerBackend(
+            cls.get_model(),
+            model_name=local_embedding_model_name(),
+            batch_size=settings.local_embedding_batch_size,
+        )
+
+        if not settings.embedding_cache_enabled:
+            return BackendEmbeddings(backend)
+
+        return cached_embeddings(backend)
+
     @classmethod
     def get_model_name(
         cls,
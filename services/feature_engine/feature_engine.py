@@ -125,10 +125,44 @@ class FeatureEngine:
                 )
             )
 
+        return self._assemble_result(
+            context,
+            plan,
+            all_candidates,
+            updater_records,
+            updater_timings,
+            observation_count=len(observations),
+            cycle_start=cycle_start,
+        )
+
+    @property
+    def registered_updater_ids(self) -> tuple[str, ...]:
+        return tuple(u.updater_id for u in self._updaters)
+
+    @property
+    def engine_version(self) -> str:
+        return self._engine_version
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _assemble_result(
+        self,
+        context: FeatureEngineContext,
+        plan: FeatureUpdatePlan,
+        all_candidates: list[FeatureCandidate],
+        updater_records: list[UpdaterInvocationRecord],
+        updater_timings: list[UpdaterTimingRecord],
+        observation_count: int,
+        cycle_start: float,
+        retained_feature_type_ids: frozenset[str] = frozenset(),
+    ) -> FeatureEngineResult:
+        """Steps 4–5: compose collected candidates and build the cycle result."""
         # Step 4: Compose
         t_compose = time.monotonic()
         features, resolution_report = self._compose(
-            all_candidates, context, plan
+            all_candidates, context, plan, retained_feature_type_ids
         )
         compose_ms = (time.monotonic() - t_compose) * 1000.0
 
@@ -147,7 +181,7 @@ class FeatureEngine:
             commit_duration_ms=commit_ms,
             features_computed=len(features),
             candidates_collected=len(all_candidates),
-            observation_count=len(observations),
+            observation_count=observation_count,
             is_incremental=plan.is_incremental,
             is_replay=plan.is_replay,
         )
@@ -170,18 +204,6 @@ class FeatureEngine:
             is_successful=True,
         )
 
-    @property
-    def registered_updater_ids(self) -> tuple[str, ...]:
-        return tuple(u.updater_id for u in self._updaters)
-
-    @property
-    def engine_version(self) -> str:
-        return self._engine_version
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     def _validate_updater_registry(self) -> None:
         seen_ids: set[str] = set()
         for updater in self._updaters:
@@ -241,8 +263,14 @@ class FeatureEngine:
         candidates: list[FeatureCandidate],
         context: FeatureEngineContext,
         plan: FeatureUpdatePlan,
+        retained_feature_type_ids: frozenset[str] = frozenset(),
     ) -> tuple[list[ProfileFeature], FeatureResolutionReport]:
-        """Step 4: Compose — invoke FeatureComposer and build resolution report."""
+        """Step 4: Compose — invoke FeatureComposer and build resolution report.
+
+        Feature types listed in retained_feature_type_ids were composed only
+        from candidates carried over from a prior cycle (incremental mode) and
+        are reported with ResolutionStrategy.RETAINED.
+        """
         features = self._composer.compose(
             candidates,
             context.candidate_identity_id,
@@ -262,11 +290,12 @@ class FeatureEngine:
             pf = feature_by_type.get(type_id)
             if pf is None:
                 continue
-            strategy = (
-                ResolutionStrategy.SINGLE_CANDIDATE
-                if len(type_candidates) == 1
-                else ResolutionStrategy.MERGED
-            )
+            if type_id in retained_feature_type_ids:
+                strategy = ResolutionStrategy.RETAINED
+            elif len(type_candidates) == 1:
+                strategy = ResolutionStrategy.SINGLE_CANDIDATE
+            else:
+                strategy = ResolutionStrategy.MERGED
             candidate_records = tuple(
                 CandidateResolutionRecord(
                     updater_id=c.updater_id,
@@ -291,6 +320,7 @@ class FeatureEngine:
         merge_count = sum(1 for r in resolution_records if r.strategy == ResolutionStrategy.MERGED)
         replace_count = sum(1 for r in resolution_records if r.strategy == ResolutionStrategy.REPLACED)
         single_count = sum(1 for r in resolution_records if r.strategy == ResolutionStrategy.SINGLE_CANDIDATE)
+        retained_count = sum(1 for r in resolution_records if r.strategy == ResolutionStrategy.RETAINED)
 
         report = FeatureResolutionReport(
             session_id=context.session_id,
@@ -301,6 +331,7 @@ class FeatureEngine:
             merge_resolutions=merge_count,
             replace_resolutions=replace_count,
             single_candidate_resolutions=single_count,
+            retained_resolutions=retained_count,
             resolution_records=tuple(resolution_records),
         )
         return features, report
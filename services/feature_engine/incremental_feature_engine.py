@@ -1,11 +1,21 @@
 # services/feature_engine/incremental_feature_engine.py
 # IncrementalFeatureEngine — delta-aware engine for live session path (ADR-020 §H)
 
+import time
+from typing import Any
+
+from domain.contracts.feature.feature_candidate import FeatureCandidate
 from domain.contracts.feature.feature_composer import FeatureComposer
-from domain.contracts.feature.feature_updater import FeatureUpdater
+from domain.contracts.feature.feature_updater import (
+    FeatureUpdater,
+    FoldingFeatureUpdater,
+)
 from domain.contracts.feature.profile_feature import ProfileFeature
+from domain.contracts.observation.observation import Observation
 from services.feature_engine.feature_engine import FeatureEngine, FeatureEngineError
 from services.feature_engine.feature_engine_context import FeatureEngineContext
+from services.feature_engine.feature_engine_diagnostics import UpdaterInvocationRecord
+from services.feature_engine.feature_engine_metrics import UpdaterTimingRecord
 from services.feature_engine.feature_engine_result import FeatureEngineResult
 from services.feature_engine.feature_update_plan import (
     FeatureUpdatePlan,
@@ -17,16 +27,23 @@ class IncrementalFeatureEngine(FeatureEngine):
     """Delta-aware engine for live session path (ADR-020 §H — Incremental Recomputation).
 
     Extends FeatureEngine with:
-    - Prior-cycle feature cache (retained features)
-    - Delta detection: identifies which feature types are affected by new observations
-    - Incremental plan: only affected Updaters/features are recomputed
-    - Retained features: unaffected features from the prior cycle are carried forward
+    - Observation watermark: how many snapshot observations earlier cycles consumed
+    - Per-updater candidate cache: updaters with no new relevant observations
+      are skipped and their prior candidates re-enter composition unchanged
+    - Delta folding: FoldingFeatureUpdaters receive only the new observations
+      and fold them into a retained accumulator state
+    - Full dispatch over the snapshot for affected updaters that cannot fold
 
     Invariants (ADR-020 §H):
     - Incremental mode is safe only because ObservationStore is append-only.
+      If the snapshot prefix consumed by earlier cycles changed, the cycle
+      falls back to full recomputation.
     - Determinism: given the same ObservationStore state, incremental produces
-      the same output as full recomputation.
-    - Fall-back: when delta detection yields all features, full recomputation runs.
+      the same output as full recomputation. With verify_against_full=True
+      (differential test mode) every incremental cycle is checked against a
+      full recomputation and FeatureEngineError is raised on divergence.
+    - Fall-back: the first cycle and any cycle after reset_cache() or a failed
+      cycle run full recomputation.
     """
 
     def __init__(
@@ -34,42 +51,60 @@ class IncrementalFeatureEngine(FeatureEngine):
         updaters: list[FeatureUpdater],
         composer: FeatureComposer,
         engine_version: str = "1.0.0",
+        verify_against_full: bool = False,
     ) -> None:
         super().__init__(updaters, composer, engine_version)
+        self._verify_against_full = verify_against_full
         self._prior_features: dict[str, ProfileFeature] = {}
         self._prior_question_index: int = -1
+        self._observation_watermark: int = 0
+        self._watermark_observation_id: str | None = None
+        self._candidates_by_updater: dict[str, list[FeatureCandidate]] = {}
+        self._fold_states: dict[str, Any] = {}
 
     def run(self, context: FeatureEngineContext) -> FeatureEngineResult:
         """Execute an incremental computation cycle.
 
-        If prior features exist and only a subset of feature types are affected,
-        only those types are recomputed; the rest are retained from prior cycle.
-        If no prior features exist, delegates to full recomputation.
+        Only observations past the watermark are treated as new. Updaters with
+        no new relevant observations are skipped; affected FoldingFeatureUpdaters
+        fold just the new observations; other affected updaters re-run over
+        their full observation subset. If no prior cycle exists, delegates to
+        full recomputation.
         """
         if context.is_replay:
             raise FeatureEngineError(
                 "IncrementalFeatureEngine does not support replay path; use ReplayFeatureEngine"
             )
 
-        affected_ids = self._detect_affected_feature_types(context)
-        is_incremental = bool(self._prior_features) and bool(affected_ids) and affected_ids != self._all_feature_type_ids()
+        cycle_start = time.monotonic()
+        observations = context.snapshot.observations
+        new_observations = self._new_observations(observations)
 
-        if not is_incremental:
-            result = super().run(context)
-            self._update_cache(result)
-            return result
+        try:
+            if new_observations is None:
+                result = self._run_full(context, observations, cycle_start)
+            else:
+                result = self._run_delta(context, observations, new_observations, cycle_start)
+                if self._verify_against_full:
+                    self._verify(context, result)
+        except BaseException:
+            # Fold states may be half-updated; the next cycle starts over.
+            self.reset_cache()
+            raise
 
-        # Incremental: run only affected updaters, then merge with retained
-        incremental_context = self._make_incremental_context(context, affected_ids)
-        result = super().run(incremental_context)
-        merged_result = self._merge_with_prior(result, affected_ids, context)
-        self._update_cache(merged_result)
-        return merged_result
+        self._observation_watermark = len(observations)
+        self._watermark_observation_id = str(observations[-1].id) if observations else None
+        self._update_cache(result)
+        return result
 
     def reset_cache(self) -> None:
         """Clear the prior-cycle feature cache (e.g. after crash recovery)."""
         self._prior_features = {}
         self._prior_question_index = -1
+        self._observation_watermark = 0
+        self._watermark_observation_id = None
+        self._candidates_by_updater = {}
+        self._fold_states = {}
 
     @property
     def has_prior_cycle(self) -> bool:
@@ -79,131 +114,189 @@ class IncrementalFeatureEngine(FeatureEngine):
     def prior_question_index(self) -> int:
         return self._prior_question_index
 
+    @property
+    def observation_watermark(self) -> int:
+        """Number of snapshot observations consumed by prior cycles."""
+        return self._observation_watermark
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _detect_affected_feature_types(self, context: FeatureEngineContext) -> frozenset[str]:
-        """Map new observation types to the feature types they affect.
+    def _new_observations(
+        self,
+        observations: tuple[Observation, ...],
+    ) -> list[Observation] | None:
+        """Observations past the watermark, or None when a full cycle is required.
 
-        Uses each Updater's observation_type_set and feature_identity_set to
-        determine which feature types are touched by the new observations.
+        The snapshot is question_index-ordered and the store append-only, so
+        prior observations form an unchanged prefix; the last consumed id
+        guards against anything inserted before the watermark.
         """
-        new_obs_types: frozenset[str] = frozenset(
-            o.observation_type.value for o in context.snapshot.observations
-        )
-        affected: set[str] = set()
-        for updater in self._updaters:
-            if not updater.observation_type_set or updater.observation_type_set & new_obs_types:
-                affected |= updater.feature_identity_set
-        return frozenset(affected)
+        if not self._candidates_by_updater:
+            return None
 
-    def _all_feature_type_ids(self) -> frozenset[str]:
-        ids: set[str] = set()
-        for u in self._updaters:
-            ids |= u.feature_identity_set
-        return frozenset(ids)
+        watermark = self._observation_watermark
+        if len(observations) < watermark:
+            return None
+        if watermark and str(observations[watermark - 1].id) != self._watermark_observation_id:
+            return None
+        return list(observations[watermark:])
 
-    def _make_incremental_context(
+    def _run_full(
         self,
         context: FeatureEngineContext,
-        affected_ids: frozenset[str],
-    ) -> FeatureEngineContext:
-        """Return context unchanged — incremental filtering happens in run()."""
-        return context
+        observations: tuple[Observation, ...],
+        cycle_start: float,
+    ) -> FeatureEngineResult:
+        plan = self._build_plan(context)
+        observation_list = list(observations)
 
-    def _merge_with_prior(
+        self._candidates_by_updater = {}
+        self._fold_states = {}
+
+        updater_records: list[UpdaterInvocationRecord] = []
+        updater_timings: list[UpdaterTimingRecord] = []
+        all_candidates: list[FeatureCandidate] = []
+
+        for spec in plan.updater_specs:
+            updater = self._find_updater(spec.updater_id)
+            if updater is None:
+                continue
+            obs_subset = self._filter_observations(observation_list, updater, spec)
+            candidates = self._invoke(updater, spec, obs_subset, updater_records, updater_timings)
+            all_candidates.extend(candidates)
+
+        return self._assemble_result(
+            context,
+            plan,
+            all_candidates,
+            updater_records,
+            updater_timings,
+            observation_count=len(observation_list),
+            cycle_start=cycle_start,
+        )
+
+    def _run_delta(
         self,
-        incremental_result: FeatureEngineResult,
-        affected_ids: frozenset[str],
-        original_context: FeatureEngineContext,
+        context: FeatureEngineContext,
+        observations: tuple[Observation, ...],
+        new_observations: list[Observation],
+        cycle_start: float,
     ) -> FeatureEngineResult:
-        """Merge newly computed features with retained prior-cycle features."""
-        new_by_type = {f.feature_identity.feature_type_id: f for f in incremental_result.features}
-        merged: list[ProfileFeature] = list(incremental_result.features)
-
-        for type_id, prior_feature in self._prior_features.items():
-            if type_id not in affected_ids and type_id not in new_by_type:
-                merged.append(prior_feature)
-
-        retained_count = len(merged) - len(incremental_result.features)
-        prior_plan = incremental_result.diagnostics.plan
-        incremental_plan = FeatureUpdatePlan(
-            session_id=prior_plan.session_id,
-            candidate_identity_id=prior_plan.candidate_identity_id,
-            current_question_index=prior_plan.current_question_index,
-            updater_specs=prior_plan.updater_specs,
+        specs: list[UpdaterInvocationSpec] = []
+        updater_records: list[UpdaterInvocationRecord] = []
+        updater_timings: list[UpdaterTimingRecord] = []
+        all_candidates: list[FeatureCandidate] = []
+        affected_ids: set[str] = set()
+        recomputed_ids: set[str] = set()
+        carried_ids: set[str] = set()
+
+        for updater in self._updaters:
+            is_folding = isinstance(updater, FoldingFeatureUpdater)
+            spec = UpdaterInvocationSpec(
+                updater_id=updater.updater_id,
+                invocation_order=updater.invocation_order,
+                target_feature_type_ids=updater.feature_identity_set,
+                is_incremental=is_folding,
+            )
+            new_subset = self._filter_observations(new_observations, updater, spec)
+
+            if not new_subset:
+                carried = self._candidates_by_updater.get(updater.updater_id, [])
+                carried_ids.update(c.feature_identity.feature_type_id for c in carried)
+                all_candidates.extend(carried)
+                continue
+
+            obs_subset = (
+                new_subset
+                if is_folding
+                else self._filter_observations(list(observations), updater, spec)
+            )
+            candidates = self._invoke(updater, spec, obs_subset, updater_records, updater_timings)
+            all_candidates.extend(candidates)
+            specs.append(spec)
+            affected_ids |= updater.feature_identity_set
+            recomputed_ids.update(c.feature_identity.feature_type_id for c in candidates)
+
+        plan = FeatureUpdatePlan(
+            session_id=context.session_id,
+            candidate_identity_id=context.candidate_identity_id,
+            current_question_index=context.current_question_index,
+            updater_specs=tuple(specs),
             is_full_recomputation=False,
             is_incremental=True,
             is_replay=False,
-            affected_feature_type_ids=affected_ids,
+            affected_feature_type_ids=frozenset(affected_ids),
         )
-
-        prior_diag = incremental_result.diagnostics
-        from services.feature_engine.feature_engine_metrics import FeatureEngineMetrics
-        updated_metrics = FeatureEngineMetrics(
-            session_id=prior_diag.metrics.session_id,
-            candidate_identity_id=prior_diag.metrics.candidate_identity_id,
-            current_question_index=prior_diag.metrics.current_question_index,
-            total_cycle_duration_ms=prior_diag.metrics.total_cycle_duration_ms,
-            updater_timings=prior_diag.metrics.updater_timings,
-            composer_duration_ms=prior_diag.metrics.composer_duration_ms,
-            commit_duration_ms=prior_diag.metrics.commit_duration_ms,
-            features_computed=len(merged),
-            candidates_collected=prior_diag.metrics.candidates_collected,
-            observation_count=prior_diag.metrics.observation_count,
-            is_incremental=True,
-            is_replay=False,
+        return self._assemble_result(
+            context,
+            plan,
+            all_candidates,
+            updater_records,
+            updater_timings,
+            observation_count=len(observations),
+            cycle_start=cycle_start,
+            retained_feature_type_ids=frozenset(carried_ids - recomputed_ids),
         )
 
-        from services.feature_engine.feature_resolution_report import (
-            FeatureResolutionReport,
-            FeatureResolutionRecord,
-            ResolutionStrategy,
-        )
-        retained_records = tuple(
-            FeatureResolutionRecord(
-                feature_type_id=type_id,
-                strategy=ResolutionStrategy.RETAINED,
-                final_value=pf.value,
-                final_confidence=pf.quality.confidence.value,
+    def _invoke(
+        self,
+        updater: FeatureUpdater,
+        spec: UpdaterInvocationSpec,
+        obs_subset: list[Observation],
+        updater_records: list[UpdaterInvocationRecord],
+        updater_timings: list[UpdaterTimingRecord],
+    ) -> list[FeatureCandidate]:
+        """Dispatch one updater, caching its candidates (and fold state)."""
+        t0 = time.monotonic()
+        if isinstance(updater, FoldingFeatureUpdater):
+            state = self._fold_states.get(updater.updater_id)
+            if state is None:
+                state = updater.initial_state()
+            state = updater.fold(state, obs_subset)
+            self._fold_states[updater.updater_id] = state
+            candidates = updater.candidates_from_state(state)
+        else:
+            candidates = updater.produce(obs_subset)
+        duration_ms = (time.monotonic() - t0) * 1000.0
+
+        self._candidates_by_updater[updater.updater_id] = list(candidates)
+        updater_records.append(
+            UpdaterInvocationRecord(
+                updater_id=spec.updater_id,
+                invocation_order=spec.invocation_order,
+                observation_ids_received=tuple(str(o.id) for o in obs_subset),
+                candidate_feature_type_ids_produced=tuple(
+                    c.feature_identity.feature_type_id for c in candidates
+                ),
+                duration_ms=duration_ms,
             )
-            for type_id, pf in self._prior_features.items()
-            if type_id not in affected_ids
         )
-        prior_report = incremental_result.diagnostics.resolution_report
-        merged_report = FeatureResolutionReport(
-            session_id=prior_report.session_id,
-            candidate_identity_id=prior_report.candidate_identity_id,
-            current_question_index=prior_report.current_question_index,
-            total_candidates_received=prior_report.total_candidates_received,
-            total_features_resolved=len(merged),
-            merge_resolutions=prior_report.merge_resolutions,
-            replace_resolutions=prior_report.replace_resolutions,
-            single_candidate_resolutions=prior_report.single_candidate_resolutions,
-            retained_resolutions=retained_count,
-            resolution_records=prior_report.resolution_records + retained_records,
+        updater_timings.append(
+            UpdaterTimingRecord(
+                updater_id=spec.updater_id,
+                duration_ms=duration_ms,
+                candidates_produced=len(candidates),
+            )
         )
+        return candidates
 
-        from services.feature_engine.feature_engine_diagnostics import FeatureEngineDiagnostics
-        new_diagnostics = FeatureEngineDiagnostics(
-            session_id=prior_diag.session_id,
-            candidate_identity_id=prior_diag.candidate_identity_id,
-            current_question_index=prior_diag.current_question_index,
-            plan=incremental_plan,
-            updater_invocation_records=prior_diag.updater_invocation_records,
-            resolution_report=merged_report,
-            metrics=updated_metrics,
-            is_replay=False,
-        )
-        return FeatureEngineResult(
-            session_id=incremental_result.session_id,
-            candidate_identity_id=incremental_result.candidate_identity_id,
-            current_question_index=incremental_result.current_question_index,
-            features=tuple(merged),
-            diagnostics=new_diagnostics,
-            is_successful=incremental_result.is_successful,
+    def _verify(self, context: FeatureEngineContext, result: FeatureEngineResult) -> None:
+        """Differential check: incremental features must equal full recomputation."""
+        expected = FeatureEngine.run(self, context)
+        expected_by_type = {f.feature_identity.feature_type_id: f for f in expected.features}
+        actual_by_type = {f.feature_identity.feature_type_id: f for f in result.features}
+        diverged = sorted(
+            type_id
+            for type_id in expected_by_type.keys() | actual_by_type.keys()
+            if expected_by_type.get(type_id) != actual_by_type.get(type_id)
         )
+        if diverged:
+            raise FeatureEngineError(
+                "Incremental cycle diverged from full recomputation at "
+                f"question_index={context.current_question_index}: {diverged}"
+            )
 
     def _update_cache(self, result: FeatureEngineResult) -> None:
         self._prior_features = {
@@ -19,7 +19,7 @@ class PairwiseSemanticDistanceEngine:
         self,
     ) -> None:
 
-        self._model = EmbeddingModelProvider.get_model()
+        self._embedder = EmbeddingModelProvider.get_embedder()
 
     # =====================================================
     # PUBLIC
@@ -65,9 +65,8 @@ class PairwiseSemanticDistanceEngine:
         second: str,
     ) -> float:
 
-        embeddings = self._model.encode(
+        embeddings = self._embedder.embed_many(
             [first, second],
-            convert_to_tensor=True,
         )
 
         similarity = cos_sim(
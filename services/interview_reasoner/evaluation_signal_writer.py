@@ -52,19 +52,12 @@ def write_evaluation_signals(
     # Idempotency guard: skip if already written for this question.
     already_written = any(
         sig.source == EvidenceSource.EVALUATION and sig.question_index == question_index
-        for sig in store.signals
+        for sig in store.by_question(question_index)
     )
     if already_written:
         return store
 
-    signals = _build_signals(evaluation, question_index, question_area)
-    for sig in signals:
-        try:
-            store = store.append(sig)
-        except ValueError:
-            # EvidenceStore capacity reached — stop silently (ADR-046).
-            break
-    return store
+    return store.extend(_build_signals(evaluation, question_index, question_area))
 
 
 def _build_signals(
@@ -17,10 +17,6 @@ from __future__ import annotations
 import time
 import uuid
 
-from app.core.logger import get_logger
-
-_logger = get_logger(__name__)
-
 from domain.contracts.reasoning.data_sufficiency import DataSufficiency
 from domain.contracts.reasoning.detector_context import DetectorResult
 from domain.contracts.reasoning.evidence_polarity import EvidencePolarity
@@ -190,19 +186,7 @@ class ReasonerService:
         new_signals: list[EvidenceSignal],
         question_index: int,
     ) -> InterviewMemory:
-        store = memory.evidence_store
-        for sig in new_signals:
-            try:
-                store = store.append(sig)
-            except ValueError:
-                _logger.warning(
-                    "evidence_store_capacity_exceeded | "
-                    "q_idx=%d store_size=%d dropped_signals=%d",
-                    question_index,
-                    len(store.signals),
-                    len(new_signals) - (len(store.signals) - len(memory.evidence_store.signals)),
-                )
-                break
+        store = memory.evidence_store.extend(new_signals)
 
         # P0-2 fix: increment questions_answered so that _compute_confidence()
         # and CoverageDetector see the correct counter (single-writer: ADR-038).
@@ -5,11 +5,18 @@
 # Configuration: skip_extraction_if_store_populated=True because reasoner_node
 # already runs ObservationExtractor before this pipeline is invoked.
 # No double extraction.
+#
+# The stateless parts (updaters, composer, observation rule registry) are
+# built once per process and shared by every session's pipeline.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from domain.contracts.observation.extraction.observation_extractor import ObservationExtractor
+from domain.contracts.feature.feature_updater import FeatureUpdater
 from domain.contracts.observation.observation_store import ObservationStore
+from domain.contracts.observation.extraction.observation_rule_registry import ObservationRuleRegistry
 from domain.observation.runtime.default_observation_registry import build_default_observation_registry
 from domain.observation.runtime.observation_store_query_engine import ObservationStoreQueryEngine
 from domain.plugins.feature.default_feature_composer import DefaultFeatureComposer
@@ -23,8 +30,42 @@ from services.knowledge_pipeline.knowledge_pipeline import KnowledgePipeline
 from services.knowledge_pipeline.knowledge_pipeline_configuration import KnowledgePipelineConfiguration
 
 
+@lru_cache(maxsize=1)
+def _default_updaters() -> tuple[FeatureUpdater, ...]:
+    return (
+        TechnicalSkillFeatureUpdater(),
+        ReasoningFeatureUpdater(),
+        ConfidenceFeatureUpdater(),
+        CoverageFeatureUpdater(),
+        TrendFeatureUpdater(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_composer() -> DefaultFeatureComposer:
+    return DefaultFeatureComposer()
+
+
+@lru_cache(maxsize=1)
+def _default_observation_registry() -> ObservationRuleRegistry:
+    return build_default_observation_registry()
+
+
+def build_default_feature_engine() -> IncrementalFeatureEngine:
+    """Build a fresh IncrementalFeatureEngine over the shared updaters and composer.
+
+    The engine holds the per-session incremental cache, so each session
+    needs its own instance; see KnowledgePipelineRegistry.
+    """
+    return IncrementalFeatureEngine(
+        updaters=list(_default_updaters()),
+        composer=_default_composer(),
+    )
+
+
 def build_default_knowledge_pipeline(
     store: ObservationStore,
+    feature_engine: IncrementalFeatureEngine | None = None,
 ) -> KnowledgePipeline:
     """Build and return the production KnowledgePipeline for the live session path.
 
@@ -36,6 +77,9 @@ def build_default_knowledge_pipeline(
 
     Args:
         store: The session-scoped ObservationStore populated by reasoner_node.
+        feature_engine: The session's IncrementalFeatureEngine, reused across
+            cycles so only new observations are processed. A fresh engine is
+            built when omitted.
 
     Returns:
         A configured, ready-to-run KnowledgePipeline instance.
@@ -43,20 +87,12 @@ def build_default_knowledge_pipeline(
     query_engine = ObservationStoreQueryEngine(store=store)
 
     extractor = ObservationExtractor(
-        registry=build_default_observation_registry(),
+        registry=_default_observation_registry(),
         store=store,
     )
 
-    feature_engine = IncrementalFeatureEngine(
-        updaters=[
-            TechnicalSkillFeatureUpdater(),
-            ReasoningFeatureUpdater(),
-            ConfidenceFeatureUpdater(),
-            CoverageFeatureUpdater(),
-            TrendFeatureUpdater(),
-        ],
-        composer=DefaultFeatureComposer(),
-    )
+    if feature_engine is None:
+        feature_engine = build_default_feature_engine()
 
     configuration = KnowledgePipelineConfiguration(
         skip_extraction_if_store_populated=True,
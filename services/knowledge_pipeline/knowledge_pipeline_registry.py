@@ -0,0 +1,127 @@
+# services/knowledge_pipeline/knowledge_pipeline_registry.py
+# KnowledgePipelineRegistry — session-scoped KnowledgePipeline reuse for reasoner_node.
+#
+# Keeps one IncrementalFeatureEngine per interview session so its prior-cycle
+# cache (watermark, per-updater candidates, fold states) survives between
+# answers and each cycle only processes the new observations. The pipeline
+# wrapping it is rebuilt only when the session's ObservationStore instance
+# changes; the engine's watermark guard falls back to full recomputation if
+# the new store does not extend what it already consumed.
+#
+# Sessions are evicted explicitly on session close, or after
+# settings.knowledge_pipeline_session_ttl_s without a cycle.
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+from typing import Callable
+
+from domain.contracts.observation.observation_store import ObservationStore
+from infrastructure.config.settings import settings
+from services.feature_engine.incremental_feature_engine import IncrementalFeatureEngine
+from services.knowledge_pipeline.default_knowledge_pipeline_factory import (
+    build_default_feature_engine,
+    build_default_knowledge_pipeline,
+)
+from services.knowledge_pipeline.knowledge_pipeline import KnowledgePipeline
+from services.knowledge_pipeline.knowledge_pipeline_context import KnowledgePipelineContext
+from services.knowledge_pipeline.knowledge_pipeline_result import KnowledgePipelineResult
+
+
+class _SessionPipeline:
+    """One session's feature engine and the pipeline bound to its current store."""
+
+    def __init__(self, feature_engine: IncrementalFeatureEngine, last_used: float) -> None:
+        self.feature_engine = feature_engine
+        self.store: ObservationStore | None = None
+        self.pipeline: KnowledgePipeline | None = None
+        self.last_used = last_used
+        # Cycles of one session never run concurrently on its engine.
+        self.lock = threading.Lock()
+
+    def pipeline_for(self, store: ObservationStore) -> KnowledgePipeline:
+        if self.pipeline is None or self.store is not store:
+            self.store = store
+            self.pipeline = build_default_knowledge_pipeline(
+                store=store,
+                feature_engine=self.feature_engine,
+            )
+        return self.pipeline
+
+
+class KnowledgePipelineRegistry:
+    """Process-wide map of interview_id → session pipeline, with TTL eviction."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sessions: dict[str, _SessionPipeline] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        session_id: str,
+        store: ObservationStore,
+        context: KnowledgePipelineContext,
+    ) -> KnowledgePipelineResult:
+        """Run one pipeline cycle for session_id against store, reusing the session's engine."""
+        session = self._session(session_id)
+        with session.lock:
+            return session.pipeline_for(store).run(context)
+
+    def evict(self, session_id: str) -> None:
+        """Drop the session's pipeline (session close)."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __contains__(self, session_id: object) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _session(self, session_id: str) -> _SessionPipeline:
+        now = self._clock()
+        with self._lock:
+            expired = [
+                sid
+                for sid, session in self._sessions.items()
+                if now - session.last_used > self._ttl_seconds
+            ]
+            for sid in expired:
+                del self._sessions[sid]
+
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = _SessionPipeline(build_default_feature_engine(), now)
+                self._sessions[session_id] = session
+            session.last_used = now
+            return session
+
+
+@lru_cache(maxsize=1)
+def get_knowledge_pipeline_registry() -> KnowledgePipelineRegistry:
+    """Process-wide registry used by reasoner_node and session_close_node."""
+    return KnowledgePipelineRegistry(
+        ttl_seconds=settings.knowledge_pipeline_session_ttl_s,
+    )
@@ -23,7 +23,7 @@ class SemanticNoveltyBonusEngine:
 
         self._bonus = novelty_bonus
 
-        self._model = EmbeddingModelProvider.get_model()
+        self._embedder = EmbeddingModelProvider.get_embedder()
 
     # =====================================================
     # PUBLIC
@@ -64,19 +64,16 @@ class SemanticNoveltyBonusEngine:
         selected_questions: list[QuestionBankItem],
     ) -> float:
 
-        candidate_embedding = self._model.encode(
-            candidate.text,
-            convert_to_tensor=True,
+        # One batched, cache-backed call instead of an encode per question.
+        embeddings = self._embedder.embed_many(
+            [candidate.text] + [selected.text for selected in selected_questions],
         )
 
-        similarities: list[float] = []
+        candidate_embedding = embeddings[0]
 
-        for selected in selected_questions:
+        similarities: list[float] = []
 
-            selected_embedding = self._model.encode(
-                selected.text,
-                convert_to_tensor=True,
-            )
+        for selected_embedding in embeddings[1:]:
 
             similarity = cos_sim(
                 candidate_embedding,
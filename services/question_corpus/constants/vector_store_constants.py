@@ -3,3 +3,6 @@
 CHROMA_PERSIST_DIRECTORY = "storage/chroma/interview_corpus"
 
 CHROMA_COLLECTION_NAME = "interview_questions"
+
+# Collection metadata key holding a digest of the synced corpus content.
+CHROMA_CORPUS_VERSION_KEY = "corpus_version"
@@ -4,6 +4,7 @@
 # retrieval operations. External callers must not import AdaptiveRetrievalService
 # or ChromaRetrievalService directly.
 
+from infrastructure.config.settings import settings
 from services.question_corpus.contracts.adaptive_retrieval_context import (
     AdaptiveRetrievalContext,
 )
@@ -21,6 +22,10 @@ from services.question_corpus.retrieval.adaptive_retrieval_service import (
 from services.question_corpus.retrieval.chroma_retrieval_service import (
     ChromaRetrievalService,
 )
+from services.question_corpus.retrieval.retrieval_result_cache import (
+    RetrievalResultCache,
+    get_default_retrieval_result_cache,
+)
 
 
 class QuestionRetrievalRuntime:
@@ -34,18 +39,29 @@ class QuestionRetrievalRuntime:
         adaptive_retrieval_service: AdaptiveRetrievalService | None = None,
         chroma_retrieval_service: ChromaRetrievalService | None = None,
         context_builder: AdaptiveContextBuilder | None = None,
+        result_cache: RetrievalResultCache | None = None,
     ) -> None:
 
-        self._adaptive_retrieval_service = (
-            adaptive_retrieval_service
-            if adaptive_retrieval_service is not None
-            else AdaptiveRetrievalService()
-        )
+        # Query embeddings are cached (in memory and on disk) by the shared
+        # embedding model; scored search results are cached here, before
+        # any per-session repetition filtering, and shared across sessions.
+        if result_cache is None and settings.retrieval_result_cache_enabled:
+            result_cache = get_default_retrieval_result_cache()
 
         self._chroma_retrieval_service = (
             chroma_retrieval_service
             if chroma_retrieval_service is not None
-            else ChromaRetrievalService()
+            else ChromaRetrievalService(
+                result_cache=result_cache,
+            )
+        )
+
+        self._adaptive_retrieval_service = (
+            adaptive_retrieval_service
+            if adaptive_retrieval_service is not None
+            else AdaptiveRetrievalService(
+                retrieval=self._chroma_retrieval_service,
+            )
         )
 
         self._context_builder = (
@@ -28,7 +28,7 @@ class AdaptiveContextBuilder:
         retrieval_query: str | None = None,
     ) -> AdaptiveRetrievalContext:
 
-        target_difficulty = self._compute_target_difficulty(
+        target_difficulty = self.compute_target_difficulty(
             memory,
         )
 
@@ -45,11 +45,7 @@ class AdaptiveContextBuilder:
             memory=memory,
         )
 
-    # =====================================================
-    # INTERNALS
-    # =====================================================
-
-    def _compute_target_difficulty(
+    def compute_target_difficulty(
         self,
         memory: InterviewRetrievalMemory,
     ) -> int:
@@ -11,6 +11,7 @@ from services.question_corpus.contracts.interview_retrieval_memory import (
 )
 from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
 from services.question_corpus.contracts.retrieval_filters import RetrievalFilters
+from services.question_corpus.retrieval.candidate_batch import CandidateBatch
 from services.question_corpus.retrieval.chroma_retrieval_service import ChromaRetrievalService
 from services.question_corpus.retrieval.adaptive_retrieval_policy import AdaptiveRetrievalPolicy
 from services.question_corpus.retrieval.coverage_penalty_engine import CoveragePenaltyEngine
@@ -96,23 +97,24 @@ class AdaptiveRetrievalService:
         if not candidates:
             return []
 
-        adjusted = self._coverage_engine.apply(
-            candidates=candidates,
-            context=context,
+        # Both engines adjust one columnar batch in place; candidates are
+        # rebuilt and sorted once for the selector.
+        batch = CandidateBatch(
+            candidates,
         )
 
-        adjusted = self._weak_domain_engine.apply(
-            candidates=adjusted,
+        self._coverage_engine.apply_batch(
+            batch=batch,
             context=context,
         )
 
-        adjusted.sort(
-            key=lambda c: c.adaptive_score or c.final_score,
-            reverse=True,
+        self._weak_domain_engine.apply_batch(
+            batch=batch,
+            context=context,
         )
 
         return self._performance_selector.select(
-            pool=adjusted,
+            pool=batch.ranked(fallback_to_final=True),
             context=context,
         )
 
@@ -131,13 +133,15 @@ class AdaptiveRetrievalService:
 
         best_undersized: list[RetrievalCandidate] = []
 
-        for stage_filters in filter_stages:
+        # One query embedding and one widened search serve every stage;
+        # later stages are only evaluated if the earlier ones fall short.
+        staged_results = self._retrieval.search_staged(
+            query=query,
+            filter_stages=filter_stages,
+            k=fetch_k,
+        )
 
-            stage_candidates = self._retrieval.search_with_filters(
-                query=query,
-                filters=stage_filters,
-                k=fetch_k,
-            )
+        for stage_candidates in staged_results:
 
             filtered = self._repetition_filter.apply(
                 candidates=stage_candidates,
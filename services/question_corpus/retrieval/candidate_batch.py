@@ -0,0 +1,145 @@
+# services/question_corpus/retrieval/candidate_batch.py
+#
+# Internal implementation detail. External callers must use
+# QuestionRetrievalRuntime instead of importing this module directly.
+
+# CandidateBatch
+#
+# Responsibility:
+# Columnar view of a retrieval candidate pool: one float array per score
+# and one SqlDomain bitmask per candidate, parsed once. Re-scoring stages
+# (CoveragePenaltyEngine, WeakDomainBoostEngine) update the arrays in
+# place; RetrievalCandidate objects are only rebuilt by ranked(), once,
+# for the final selection.
+
+import numpy as np
+
+from domain.contracts.question.sql_domain import SqlDomain
+from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
+from services.question_corpus.utils.domain_parser import SQL_DOMAIN_BITS, sql_domain_mask
+
+_BITS = np.array(
+    list(SQL_DOMAIN_BITS.values()),
+    dtype=np.int64,
+)
+
+
+class CandidateBatch:
+
+    # =====================================================
+    # CONSTRUCTOR
+    # =====================================================
+
+    def __init__(
+        self,
+        candidates: list[RetrievalCandidate],
+    ) -> None:
+
+        self._candidates = list(candidates)
+
+        self.final_scores = np.array(
+            [c.final_score for c in self._candidates],
+            dtype=np.float64,
+        )
+
+        self._initial_adaptive = np.array(
+            [
+                c.adaptive_score if c.adaptive_score is not None else np.nan
+                for c in self._candidates
+            ],
+            dtype=np.float64,
+        )
+
+        self.adaptive_scores = np.where(
+            np.isnan(self._initial_adaptive),
+            self.final_scores,
+            self._initial_adaptive,
+        )
+
+        self.domain_masks = np.array(
+            [
+                sql_domain_mask(c.document.metadata.get("domains"))
+                for c in self._candidates
+            ],
+            dtype=np.int64,
+        )
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    def __len__(self) -> int:
+
+        return len(self._candidates)
+
+    @property
+    def candidates(self) -> list[RetrievalCandidate]:
+        """The candidates as given, with their original scores."""
+
+        return self._candidates
+
+    def domain_overlap(
+        self,
+        domains: list[SqlDomain],
+    ) -> np.ndarray:
+        """Per candidate, how many distinct domains it shares with domains."""
+
+        mask = sql_domain_mask(list(domains))
+
+        return np.count_nonzero(
+            (self.domain_masks & mask)[:, None] & _BITS,
+            axis=1,
+        )
+
+    def has_domain(
+        self,
+        domain: SqlDomain,
+    ) -> np.ndarray:
+
+        return (self.domain_masks & SQL_DOMAIN_BITS[domain]) != 0
+
+    def ranked(
+        self,
+        fallback_to_final: bool = False,
+    ) -> list[RetrievalCandidate]:
+        """
+        Candidates ordered by adaptive score, highest first and stable on
+        ties; with fallback_to_final a zero adaptive score ranks by the
+        final score instead. Only candidates whose adaptive score changed
+        are copied.
+        """
+
+        sort_key = self.adaptive_scores
+
+        if fallback_to_final:
+            sort_key = np.where(
+                sort_key != 0.0,
+                sort_key,
+                self.final_scores,
+            )
+
+        order = np.argsort(
+            -sort_key,
+            kind="stable",
+        )
+
+        changed = self.adaptive_scores != self._initial_adaptive
+
+        ranked: list[RetrievalCandidate] = []
+
+        for i in order.tolist():
+
+            candidate = self._candidates[i]
+
+            if changed[i]:
+                candidate = candidate.model_copy(
+                    update={
+                        "adaptive_score": float(self.adaptive_scores[i]),
+                    }
+                )
+
+            ranked.append(
+                candidate,
+            )
+
+        return ranked
@@ -34,7 +34,7 @@ class ChromaFilterBuilder:
 
         if filters.seniority:
 
-            seniority_values = [v.strip() for v in filters.seniority.split(",") if v.strip()]
+            seniority_values = _seniority_values(filters)
 
             if len(seniority_values) == 1:
                 conditions.append({"seniority": seniority_values[0]})
@@ -102,3 +102,95 @@ class ChromaFilterBuilder:
         return {
             "$and": conditions,
         }
+
+    def matches(
+        self,
+        filters: RetrievalFilters,
+        metadata: dict,
+    ) -> bool:
+        """
+        Evaluate filters against one record's metadata locally, with the
+        same semantics as the where clause build() produces.
+        """
+
+        if filters.role and metadata.get("role") != filters.role:
+            return False
+
+        if filters.seniority and metadata.get("seniority") not in _seniority_values(filters):
+            return False
+
+        if filters.area and metadata.get("area") != filters.area:
+            return False
+
+        if filters.min_difficulty is None and filters.max_difficulty is None:
+            return True
+
+        difficulty = metadata.get("difficulty")
+
+        if isinstance(difficulty, bool) or not isinstance(difficulty, (int, float)):
+            return False
+
+        if filters.min_difficulty is not None and difficulty < filters.min_difficulty:
+            return False
+
+        if filters.max_difficulty is not None and difficulty > filters.max_difficulty:
+            return False
+
+        return True
+
+    def covering(
+        self,
+        stages: list[RetrievalFilters],
+    ) -> RetrievalFilters:
+        """
+        Loosest filters every stage implies: a field is kept only when all
+        stages constrain it, so any record matching a stage matches the
+        result.
+        """
+
+        role = _shared(
+            [stage.role for stage in stages],
+        )
+
+        area = _shared(
+            [stage.area for stage in stages],
+        )
+
+        seniority = None
+
+        if all(stage.seniority for stage in stages):
+
+            values: list[str] = []
+
+            for stage in stages:
+                values.extend(v for v in _seniority_values(stage) if v not in values)
+
+            seniority = ",".join(values)
+
+        min_values = [stage.min_difficulty for stage in stages]
+
+        max_values = [stage.max_difficulty for stage in stages]
+
+        return RetrievalFilters(
+            role=role,
+            seniority=seniority,
+            area=area,
+            min_difficulty=min(min_values) if None not in min_values else None,
+            max_difficulty=max(max_values) if None not in max_values else None,
+        )
+
+
+def _seniority_values(
+    filters: RetrievalFilters,
+) -> list[str]:
+
+    return [v.strip() for v in (filters.seniority or "").split(",") if v.strip()]
+
+
+def _shared(
+    values: list[str | None],
+) -> str | None:
+
+    first = values[0] if values else None
+
+    return first if first and all(value == first for value in values) else None
@@ -3,13 +3,18 @@
 # Internal implementation detail. External callers must use
 # QuestionRetrievalRuntime instead of importing this module directly.
 
+import time
+from typing import Callable, Iterator
+
+import numpy as np
 from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 
 from infrastructure.config.settings import settings
+from infrastructure.vector_store.chroma_registry import get_chroma_registry
 from services.question_corpus.constants.vector_store_constants import (
     CHROMA_COLLECTION_NAME,
+    CHROMA_CORPUS_VERSION_KEY,
     CHROMA_PERSIST_DIRECTORY,
 )
 from services.question_corpus.contracts.retrieval_filters import RetrievalFilters
@@ -17,23 +22,40 @@ from services.question_corpus.contracts.retrieval_candidate import RetrievalCand
 from services.question_corpus.retrieval.chroma_filter_builder import ChromaFilterBuilder
 from services.question_corpus.retrieval.hybrid_retrieval_scorer import HybridRetrievalScorer
 from services.question_corpus.retrieval.diversity_reranker import DiversityReranker
+from services.question_corpus.retrieval.retrieval_result_cache import (
+    RetrievalResultCache,
+    normalize_query,
+    retrieval_cache_key,
+)
 
 
 class ChromaRetrievalService:
 
+    # =====================================================
+    # CONSTANTS
+    # =====================================================
+
+    # The widened staged query fetches this many times k so the relaxed
+    # stages usually find k matches in it without their own round trip.
+    STAGED_FETCH_MULTIPLIER = 4
+
     # =====================================================
     # CONSTRUCTOR
     # =====================================================
 
     def __init__(
         self,
+        vectorstore: Chroma | None = None,
+        result_cache: RetrievalResultCache | None = None,
     ) -> None:
 
-        self._vectorstore = Chroma(
-            collection_name=CHROMA_COLLECTION_NAME,
-            embedding_function=OpenAIEmbeddings(model=settings.openai_embedding_model),
-            persist_directory=CHROMA_PERSIST_DIRECTORY,
-        )
+        if vectorstore is None:
+            vectorstore = get_chroma_registry().vectorstore(
+                collection_name=CHROMA_COLLECTION_NAME,
+                persist_directory=CHROMA_PERSIST_DIRECTORY,
+            )
+
+        self._vectorstore = vectorstore
 
         self._filter_builder = ChromaFilterBuilder()
 
@@ -41,6 +63,12 @@ class ChromaRetrievalService:
 
         self._diversity_reranker = DiversityReranker()
 
+        self._result_cache = result_cache
+
+        self._corpus_version_value: str | None = None
+
+        self._corpus_version_checked_at = 0.0
+
     # =====================================================
     # PUBLIC
     # =====================================================
@@ -51,17 +79,18 @@ class ChromaRetrievalService:
         k: int = 5,
     ) -> list[RetrievalCandidate]:
 
-        results = self._vectorstore.similarity_search_with_score(
+        return self._cached(
             query=query,
+            filters=None,
             k=k,
+            compute=lambda: self._score_results(
+                self._query_with_embeddings(
+                    query=query,
+                    k=k,
+                )
+            ),
         )
 
-        
-        return self._score_results(
-            results,
-        )
-
-    
     def search_with_filters(
         self,
         query: str,
@@ -69,52 +98,356 @@ class ChromaRetrievalService:
         k: int = 5,
     ) -> list[RetrievalCandidate]:
 
-        where = self._filter_builder.build(
-            filters,
+        return self._cached(
+            query=query,
+            filters=filters,
+            k=k,
+            compute=lambda: self._score_results(
+                self._query_with_embeddings(
+                    query=query,
+                    k=k,
+                    where=self._filter_builder.build(filters),
+                )
+            ),
         )
 
-        results = self._vectorstore.similarity_search_with_score(
+    def search_staged(
+        self,
+        query: str,
+        filter_stages: list[RetrievalFilters],
+        k: int = 5,
+    ) -> Iterator[list[RetrievalCandidate]]:
+        """
+        Lazily yield search_with_filters(query, stage, k) for each stage.
+
+        The query is embedded once. The first (strictest) stage, which
+        usually succeeds, gets its own filtered query. If the caller moves
+        on, one widened query with the covering filter of the remaining
+        stages fetches k * STAGED_FETCH_MULTIPLIER rows and those stages are
+        evaluated locally over their metadata. A stage only gets its own
+        query when the widened rows were truncated and hold fewer than k
+        matches for it, so its local top k could be missing closer records.
+        Stages found in the result cache cost neither.
+        """
+
+        if not filter_stages:
+            return
+
+        staged = _StagedQuery(
+            service=self,
             query=query,
+            relaxed_stages=filter_stages[1:],
             k=k,
-            filter=where,
         )
 
-        
-        return self._score_results(
-            results,
+        first_stage, *relaxed_stages = filter_stages
+
+        yield self._cached(
+            query=query,
+            filters=first_stage,
+            k=k,
+            compute=lambda: self._score_results(
+                self._query_by_vector(
+                    query_embedding=staged.query_embedding(),
+                    k=k,
+                    where=self._filter_builder.build(first_stage),
+                )
+            ),
         )
 
+        for stage_filters in relaxed_stages:
+
+            yield self._cached(
+                query=query,
+                filters=stage_filters,
+                k=k,
+                compute=lambda: self._score_results(
+                    staged.relaxed_rows(stage_filters),
+                ),
+            )
+
     # =====================================================
     # INTERNALS
     # =====================================================
 
+    def _cached(
+        self,
+        query: str,
+        filters: RetrievalFilters | None,
+        k: int,
+        compute: Callable[[], list[RetrievalCandidate]],
+    ) -> list[RetrievalCandidate]:
+
+        if self._result_cache is None:
+            return compute()
+
+        key = retrieval_cache_key(
+            query=query,
+            filters=filters,
+            k=k,
+            corpus_version=self._corpus_version(),
+        )
+
+        cached = self._result_cache.get(
+            key,
+        )
+
+        if cached is not None:
+            return cached
+
+        candidates = compute()
+
+        self._result_cache.put(
+            key,
+            candidates,
+        )
+
+        return candidates
+
+    def _corpus_version(
+        self,
+    ) -> str:
+        """
+        Version stamped on the collection by ChromaCorpusBuilder, re-read
+        at most every retrieval_corpus_version_check_s seconds; collections
+        without one fall back to their record count.
+        """
+
+        now = time.monotonic()
+
+        if (
+            self._corpus_version_value is not None
+            and now - self._corpus_version_checked_at < settings.retrieval_corpus_version_check_s
+        ):
+            return self._corpus_version_value
+
+        collection = self._vectorstore._client.get_collection(
+            self._vectorstore._collection.name,
+        )
+
+        version = (collection.metadata or {}).get(
+            CHROMA_CORPUS_VERSION_KEY,
+        ) or f"count:{collection.count()}"
+
+        self._corpus_version_value = str(version)
+
+        self._corpus_version_checked_at = now
+
+        if self._result_cache is not None:
+            self._result_cache.observe_version(self._corpus_version_value)
+
+        return self._corpus_version_value
+
+    def _embed_query(
+        self,
+        query: str,
+    ) -> list[float]:
+
+        return self._vectorstore.embeddings.embed_query(
+            normalize_query(query),
+        )
+
+    def _query_with_embeddings(
+        self,
+        query: str,
+        k: int,
+        where: dict | None = None,
+    ) -> list[tuple[Document, float, np.ndarray | None]]:
+
+        return self._query_by_vector(
+            query_embedding=self._embed_query(query),
+            k=k,
+            where=where,
+        )
+
+    def _query_by_vector(
+        self,
+        query_embedding: list[float],
+        k: int,
+        where: dict | None = None,
+    ) -> list[tuple[Document, float, np.ndarray | None]]:
+        """
+        One collection round trip returning documents, distances and the
+        stored vectors the diversity reranker needs.
+        """
+
+        results = self._vectorstore._collection.query(
+            query_embeddings=[query_embedding],
+            n_results=k,
+            where=where or None,
+            include=["documents", "metadatas", "distances", "embeddings"],
+        )
+
+        embeddings = results.get("embeddings")
+
+        vectors = embeddings[0] if embeddings is not None else None
+
+        rows: list[tuple[Document, float, np.ndarray | None]] = []
+
+        for i, (document_id, content, metadata, distance) in enumerate(
+            zip(
+                results["ids"][0],
+                results["documents"][0],
+                results["metadatas"][0],
+                results["distances"][0],
+            )
+        ):
+
+            if content is None:
+                continue
+
+            rows.append(
+                (
+                    Document(
+                        page_content=content,
+                        metadata=metadata or {},
+                        id=document_id,
+                    ),
+                    distance,
+                    np.asarray(vectors[i]) if vectors is not None else None,
+                )
+            )
+
+        return rows
+
     def _score_results(
         self,
-        results: list[tuple[Document, float]],
+        results: list[tuple[Document, float, np.ndarray | None]],
     ) -> list[RetrievalCandidate]:
+        """
+        Score, order and diversity-rerank the rows as columns; each
+        RetrievalCandidate is built once, with its final scores.
+        """
 
-        candidates: list[RetrievalCandidate] = []
+        if not results:
+            return []
+
+        documents = [document for document, _, _ in results]
+
+        semantic_scores, quality_scores, final_scores = self._scorer.score_batch(
+            documents=documents,
+            semantic_distances=[distance for _, distance, _ in results],
+        )
 
-        for document, distance in results:
+        order = np.argsort(
+            -final_scores,
+            kind="stable",
+        ).tolist()
 
-            candidate = self._scorer.score(
+        embeddings = [
+            self._scorer.resolve_embedding(
                 document=document,
-                semantic_distance=distance,
+                embedding=vector.tolist() if vector is not None else None,
             )
+            for document, _, vector in results
+        ]
 
-            candidates.append(
-                candidate,
+        # Use the fetched matrix directly when every row carries its vector.
+        if all(vector is not None for _, _, vector in results):
+            has_embedding = np.ones(len(order), dtype=bool)
+            vectors = np.stack([results[i][2] for i in order]).astype(np.float64)
+        else:
+            has_embedding, vectors = self._diversity_reranker.stack_embeddings(
+                [embeddings[i] for i in order],
             )
 
-        candidates.sort(
-            key=lambda c: c.final_score,
-            reverse=True,
+        picks = self._diversity_reranker.select(
+            scores=final_scores[order],
+            top_k=len(order),
+            vectors=vectors,
+            has_embedding=has_embedding,
         )
 
-        reranked = self._diversity_reranker.rerank(
-            candidates=candidates,
-            top_k=len(candidates),
-        )
+        candidates: list[RetrievalCandidate] = []
+
+        for position, diversity_score in picks:
+
+            i = order[position]
+
+            candidates.append(
+                RetrievalCandidate(
+                    document=documents[i],
+                    semantic_score=float(semantic_scores[i]),
+                    quality_score=float(quality_scores[i]),
+                    final_score=float(final_scores[i]),
+                    diversity_score=diversity_score,
+                    adaptive_score=diversity_score,
+                    embedding=embeddings[i],
+                )
+            )
+
+        return candidates
+
 
+class _StagedQuery:
+    """Query embedding and widened rows of one search_staged call, both built on first use."""
+
+    def __init__(
+        self,
+        service: ChromaRetrievalService,
+        query: str,
+        relaxed_stages: list[RetrievalFilters],
+        k: int,
+    ) -> None:
+
+        self._service = service
+
+        self._query = query
+
+        self._relaxed_stages = relaxed_stages
+
+        self._k = k
+
+        self._query_embedding: list[float] | None = None
+
+        self._rows: list[tuple[Document, float, np.ndarray | None]] | None = None
+
+        self._exhaustive = False
+
+    def query_embedding(
+        self,
+    ) -> list[float]:
+
+        if self._query_embedding is None:
+            self._query_embedding = self._service._embed_query(self._query)
+
+        return self._query_embedding
+
+    def relaxed_rows(
+        self,
+        stage_filters: RetrievalFilters,
+    ) -> list[tuple[Document, float, np.ndarray | None]]:
+
+        filter_builder = self._service._filter_builder
+
+        wide_k = self._k * self._service.STAGED_FETCH_MULTIPLIER
+
+        if self._rows is None:
+
+            covering = filter_builder.covering(
+                self._relaxed_stages,
+            )
+
+            self._rows = self._service._query_by_vector(
+                query_embedding=self.query_embedding(),
+                k=wide_k,
+                where=filter_builder.build(covering),
+            )
+
+            self._exhaustive = len(self._rows) < wide_k
+
+        matching = [
+            row
+            for row in self._rows
+            if filter_builder.matches(stage_filters, row[0].metadata)
+        ]
+
+        if len(matching) < self._k and not self._exhaustive:
+
+            matching = self._service._query_by_vector(
+                query_embedding=self.query_embedding(),
+                k=self._k,
+                where=filter_builder.build(stage_filters),
+            )
 
-        return reranked
+        return matching[:self._k]
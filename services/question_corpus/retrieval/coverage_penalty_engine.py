@@ -1,9 +1,10 @@
 # services/question_corpus/retrieval/coverage_penalty_engine.py
 
-from domain.contracts.question.sql_domain import SqlDomain
+import numpy as np
+
 from services.question_corpus.contracts.adaptive_retrieval_context import AdaptiveRetrievalContext
 from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
-from services.question_corpus.utils.domain_parser import parse_sql_domains
+from services.question_corpus.retrieval.candidate_batch import CandidateBatch
 
 
 class CoveragePenaltyEngine:
@@ -24,58 +25,32 @@ class CoveragePenaltyEngine:
         context: AdaptiveRetrievalContext,
     ) -> list[RetrievalCandidate]:
 
-        adjusted: list[RetrievalCandidate] = []
-
-        used_domains = set(
-            context.already_used_domains,
+        batch = CandidateBatch(
+            candidates,
         )
 
-        for candidate in candidates:
-
-            candidate_domains = self._extract_domains(
-                candidate,
-            )
-
-            overlap = used_domains.intersection(
-                candidate_domains,
-            )
-
-            penalty = len(overlap) * self.DOMAIN_REPEAT_PENALTY
-
-            adjusted_score = max(
-                0.0,
-                candidate.adaptive_score - penalty,
-            )
-
-            adjusted_candidate = candidate.model_copy(
-                update={
-                    "adaptive_score": round(
-                        adjusted_score,
-                        3,
-                    )
-                }
-            )
-
-            adjusted.append(
-                adjusted_candidate,
-            )
-
-        adjusted.sort(
-            key=lambda c: c.adaptive_score,
-            reverse=True,
+        self.apply_batch(
+            batch=batch,
+            context=context,
         )
 
-        return adjusted
-
-    # =====================================================
-    # INTERNALS
-    # =====================================================
+        return batch.ranked()
 
-    def _extract_domains(
+    def apply_batch(
         self,
-        candidate: RetrievalCandidate,
-    ) -> list[SqlDomain]:
+        batch: CandidateBatch,
+        context: AdaptiveRetrievalContext,
+    ) -> None:
+        """Lower adaptive scores in place by DOMAIN_REPEAT_PENALTY per already used domain."""
+
+        penalty = batch.domain_overlap(
+            context.already_used_domains,
+        ) * self.DOMAIN_REPEAT_PENALTY
 
-        return parse_sql_domains(
-            candidate.document.metadata.get("domains"),
+        batch.adaptive_scores = np.round(
+            np.maximum(
+                0.0,
+                batch.adaptive_scores - penalty,
+            ),
+            3,
         )
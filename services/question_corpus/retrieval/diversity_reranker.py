@@ -1,7 +1,8 @@
 # services/question_corpus/retrieval/diversity_reranker.py
 
+import numpy as np
+
 from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
-from infrastructure.embeddings.embedding_similarity_engine import EmbeddingSimilarityEngine
 
 from app.core.logger import get_logger
 
@@ -14,108 +15,192 @@ class DiversityReranker:
 
     REDUNDANCY_CAP = 0.25
 
-    def __init__(
-        self,
-    ) -> None:
-
-        self._similarity_engine = EmbeddingSimilarityEngine()
-
     def rerank(
         self,
         candidates: list[RetrievalCandidate],
         top_k: int,
+        embeddings: np.ndarray | None = None,
     ) -> list[RetrievalCandidate]:
+        """
+        Greedy maximal-marginal-relevance selection.
+
+        Each pick scores every remaining candidate as
+        final_score - min(max_similarity * REDUNDANCY_WEIGHT, REDUNDANCY_CAP),
+        where max_similarity is the highest cosine similarity to anything
+        already selected. Candidates without an embedding are never penalised
+        and never penalise others.
+
+        embeddings, when given, is a (len(candidates), d) matrix aligned with
+        candidates and is used instead of converting candidate.embedding lists.
+        """
+
+        if not candidates or top_k <= 0:
+            return []
+
+        if embeddings is not None:
+            has_embedding = np.ones(
+                len(candidates),
+                dtype=bool,
+            )
+            vectors = np.asarray(
+                embeddings,
+                dtype=np.float64,
+            )
+        else:
+            has_embedding, vectors = self.stack_embeddings(
+                [c.embedding for c in candidates],
+            )
 
-        selected: list[RetrievalCandidate] = []
-
-        remaining = candidates.copy()
-
-        while remaining and len(selected) < top_k:
+        picks = self.select(
+            scores=np.array(
+                [c.final_score for c in candidates],
+                dtype=np.float64,
+            ),
+            top_k=top_k,
+            vectors=vectors,
+            has_embedding=has_embedding,
+        )
 
-            best_candidate = None
+        return [
+            candidates[index].model_copy(
+                update={
+                    "diversity_score": score,
+                    "adaptive_score": score,
+                }
+            )
+            for index, score in picks
+        ]
 
-            best_score = -999.0
+    def select(
+        self,
+        scores: np.ndarray,
+        top_k: int,
+        vectors: np.ndarray,
+        has_embedding: np.ndarray,
+    ) -> list[tuple[int, float]]:
+        """
+        rerank() over score and vector columns: (index, diversity score
+        rounded to 3 decimals) per pick, in selection order, so callers
+        holding columns can build their candidates once.
+        """
+
+        count = len(scores)
+
+        similarity = self._cosine_matrix(
+            vectors,
+        )
 
-            for candidate in remaining:
+        # Highest similarity to the selected set; -inf until a selected
+        # candidate with an embedding exists.
+        max_similarity = np.full(
+            count,
+            -np.inf,
+        )
 
-                redundancy_penalty = self._compute_redundancy_penalty(
-                    candidate,
-                    selected,
-                )
+        available = np.ones(
+            count,
+            dtype=bool,
+        )
 
-                diversity_score = candidate.final_score - redundancy_penalty
+        picks: list[tuple[int, float]] = []
 
-                logger.debug(
-                    "diversity_rerank: doc=%s penalty=%.3f",
-                    candidate.document.metadata.get("document_id", "unknown"),
-                    redundancy_penalty,
-                )
+        while len(picks) < min(top_k, count):
 
-                if diversity_score > best_score:
+            penalty = np.where(
+                np.isfinite(max_similarity),
+                np.minimum(
+                    max_similarity * self.REDUNDANCY_WEIGHT,
+                    self.REDUNDANCY_CAP,
+                ),
+                0.0,
+            )
 
-                    best_candidate = candidate
+            diversity = np.where(
+                available,
+                scores - penalty,
+                -np.inf,
+            )
 
-                    best_score = diversity_score
+            # argmax returns the first maximum, preserving input order on ties.
+            best = int(np.argmax(diversity))
 
-            if best_candidate is None:
-                break
+            logger.debug(
+                "diversity_rerank: index=%d penalty=%.3f",
+                best,
+                float(penalty[best]),
+            )
 
-            selected.append(
-                best_candidate.model_copy(
-                    update={
-                        "diversity_score": round(
-                            best_score,
-                            3,
-                        ),
-                        "adaptive_score": round(
-                            best_score,
-                            3,
-                        ),
-                    }
+            picks.append(
+                (
+                    best,
+                    round(float(diversity[best]), 3),
                 )
             )
 
-            remaining.remove(
-                best_candidate,
-            )
+            available[best] = False
 
-        return selected
+            if has_embedding[best]:
 
-    def _compute_redundancy_penalty(
-        self,
-        candidate: RetrievalCandidate,
-        selected: list[RetrievalCandidate],
-    ) -> float:
+                np.maximum(
+                    max_similarity,
+                    np.where(has_embedding, similarity[best], -np.inf),
+                    out=max_similarity,
+                )
 
-        if not selected:
-            return 0.0
+        return picks
 
-        similarities = []
+    @staticmethod
+    def stack_embeddings(
+        embeddings: list[list[float] | np.ndarray | None],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Mask of the entries that carry an embedding and a (k, d) matrix with
+        zero rows for the ones that do not.
+        """
 
-        for existing in selected:
+        has_embedding = np.array(
+            [e is not None for e in embeddings],
+            dtype=bool,
+        )
 
-            if candidate.embedding is None or existing.embedding is None:
-                continue
+        if not has_embedding.any():
+            return has_embedding, np.zeros((len(embeddings), 1))
 
-            similarity = self._similarity_engine.similarity(
-                candidate.embedding,
-                existing.embedding,
-            )
+        embedded = np.array(
+            [e for e in embeddings if e is not None],
+            dtype=np.float64,
+        )
 
-            similarities.append(
-                similarity,
-            )
+        vectors = np.zeros(
+            (len(embeddings), embedded.shape[1]),
+            dtype=np.float64,
+        )
+
+        vectors[has_embedding] = embedded
 
-            logger.debug("similarity: %.4f", similarity)
+        return has_embedding, vectors
 
-        if not similarities:
-            return 0.0
+    # =====================================================
+    # INTERNALS
+    # =====================================================
 
-        max_similarity = max(
-            similarities,
+    @staticmethod
+    def _cosine_matrix(
+        vectors: np.ndarray,
+    ) -> np.ndarray:
+        """Pairwise cosine similarities (k×k); zero-norm rows score 0."""
+
+        norms = np.linalg.norm(
+            vectors,
+            axis=1,
+            keepdims=True,
         )
 
-        return min(
-            max_similarity * self.REDUNDANCY_WEIGHT,
-            self.REDUNDANCY_CAP,
+        unit = np.divide(
+            vectors,
+            norms,
+            out=np.zeros_like(vectors),
+            where=norms > 0,
         )
+
+        return unit @ unit.T
@@ -1,5 +1,6 @@
 # services/question_corpus/retrieval/hybrid_retrieval_scorer.py
 
+import numpy as np
 from langchain_core.documents import Document
 
 from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
@@ -28,31 +29,72 @@ class HybridRetrievalScorer:
         self,
         document: Document,
         semantic_distance: float,
+        embedding: list[float] | None = None,
     ) -> RetrievalCandidate:
 
-        semantic_score = max(
+        semantic_scores, quality_scores, final_scores = self.score_batch(
+            documents=[document],
+            semantic_distances=[semantic_distance],
+        )
+
+        final_score = float(final_scores[0])
+
+        return RetrievalCandidate(
+            document=document,
+            semantic_score=float(semantic_scores[0]),
+            quality_score=float(quality_scores[0]),
+            final_score=final_score,
+            diversity_score=final_score,
+            adaptive_score=final_score,
+            embedding=self.resolve_embedding(
+                document=document,
+                embedding=embedding,
+            ),
+        )
+
+    def score_batch(
+        self,
+        documents: list[Document],
+        semantic_distances: list[float],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Semantic, quality and final score columns for a batch of
+        documents, rounded to 3 decimals like score().
+        """
+
+        semantic_scores = np.maximum(
             0.0,
-            1.0 - semantic_distance,
+            1.0 - np.asarray(semantic_distances, dtype=np.float64),
         )
 
-        quality_score = float(
-            document.metadata.get(
-                "quality_score",
-                0.5,
-            )
+        quality_scores = np.array(
+            [float(d.metadata.get("quality_score", 0.5)) for d in documents],
+            dtype=np.float64,
+        )
+
+        final_scores = (
+            semantic_scores * self.SEMANTIC_WEIGHT + quality_scores * self.QUALITY_WEIGHT
         )
 
-        final_score = (
-            semantic_score * self.SEMANTIC_WEIGHT + quality_score * self.QUALITY_WEIGHT
+        return (
+            np.round(semantic_scores, 3),
+            np.round(quality_scores, 3),
+            np.round(final_scores, 3),
         )
 
+    def resolve_embedding(
+        self,
+        document: Document,
+        embedding: list[float] | None = None,
+    ) -> list[float] | None:
+
         document_id = document.metadata.get(
             "document_id",
         )
 
-        embedding = None 
-
-        if document_id:
+        # Vectors fetched with the query win; the build-time repository is
+        # only populated in the process that built the corpus.
+        if embedding is None and document_id:
 
             embedding = RetrievalEmbeddingRepository.get(
                 document_id=document_id,
@@ -60,27 +102,4 @@ class HybridRetrievalScorer:
 
         logger.debug("embedding resolved: %s", embedding is not None)
 
-        return RetrievalCandidate(
-            document=document,
-            semantic_score=round(
-                semantic_score,
-                3,
-            ),
-            quality_score=round(
-                quality_score,
-                3,
-            ),
-            final_score=round(
-                final_score,
-                3,
-            ),
-            diversity_score=round(
-                final_score,
-                3,
-            ),
-            adaptive_score=round(
-                final_score,
-                3,
-            ),
-            embedding=embedding,
-        )
+        return embedding
@@ -0,0 +1,180 @@
+# services/question_corpus/retrieval/retrieval_result_cache.py
+#
+# Internal implementation detail. External callers must use
+# QuestionRetrievalRuntime instead of importing this module directly.
+
+# RetrievalResultCache
+#
+# Responsibility:
+# Process-wide TTL/LRU cache of scored vector-search results keyed by
+# (normalized query, filters, k, corpus version). Entries hold the raw
+# candidate list before any per-session filtering, so they can be shared
+# by every interview. A new corpus version drops every entry.
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable
+
+from infrastructure.config.settings import settings
+from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
+from services.question_corpus.contracts.retrieval_filters import RetrievalFilters
+
+RetrievalCacheKey = tuple[str, str, int, str]
+
+
+def normalize_query(
+    query: str,
+) -> str:
+    """Collapse whitespace so trivially different query strings share entries."""
+
+    return " ".join(query.split())
+
+
+def retrieval_cache_key(
+    query: str,
+    filters: RetrievalFilters | None,
+    k: int,
+    corpus_version: str,
+) -> RetrievalCacheKey:
+
+    query_hash = hashlib.sha256(
+        normalize_query(query).encode("utf-8"),
+    ).hexdigest()
+
+    return (
+        query_hash,
+        filters.model_dump_json() if filters is not None else "",
+        k,
+        corpus_version,
+    )
+
+
+class RetrievalResultCache:
+
+    # =====================================================
+    # CONSTRUCTOR
+    # =====================================================
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+
+        self._ttl_seconds = ttl_seconds
+
+        self._clock = clock
+
+        self._entries: OrderedDict[
+            RetrievalCacheKey,
+            tuple[float, tuple[RetrievalCandidate, ...]],
+        ] = OrderedDict()
+
+        self._corpus_version: str | None = None
+
+        self._lock = threading.Lock()
+
+        self._hits = 0
+
+        self._misses = 0
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    def get(
+        self,
+        key: RetrievalCacheKey,
+    ) -> list[RetrievalCandidate] | None:
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+
+            if entry is not None and self._clock() - entry[0] > self._ttl_seconds:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+
+            self._hits += 1
+
+            return list(entry[1])
+
+    def put(
+        self,
+        key: RetrievalCacheKey,
+        candidates: list[RetrievalCandidate],
+    ) -> None:
+
+        with self._lock:
+
+            self._entries[key] = (
+                self._clock(),
+                tuple(candidates),
+            )
+
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def observe_version(
+        self,
+        corpus_version: str,
+    ) -> None:
+        """Drop every entry when the collection reports a new corpus version."""
+
+        with self._lock:
+
+            if self._corpus_version is not None and corpus_version != self._corpus_version:
+                self._entries.clear()
+
+            self._corpus_version = corpus_version
+
+    def clear(
+        self,
+    ) -> None:
+
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+
+        with self._lock:
+            return self._misses
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_default_retrieval_result_cache() -> RetrievalResultCache:
+    """Process-wide cache shared by every QuestionRetrievalRuntime."""
+
+    return RetrievalResultCache(
+        max_entries=settings.retrieval_result_cache_max_entries,
+        ttl_seconds=settings.retrieval_result_cache_ttl_s,
+    )
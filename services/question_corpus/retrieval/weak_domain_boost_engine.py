@@ -1,9 +1,11 @@
 # services/question_corpus/retrieval/weak_domain_boost_engine.py
 
+import numpy as np
+
 from domain.contracts.question.sql_domain import SqlDomain
 from services.question_corpus.contracts.adaptive_retrieval_context import AdaptiveRetrievalContext
 from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
-from services.question_corpus.utils.domain_parser import parse_sql_domains
+from services.question_corpus.retrieval.candidate_batch import CandidateBatch
 from services.question_intelligence.interview_theme_memory import get_interview_theme_anchor
 
 
@@ -26,84 +28,85 @@ class WeakDomainBoostEngine:
         context: AdaptiveRetrievalContext,
     ) -> list[RetrievalCandidate]:
 
-        boosted: list[RetrievalCandidate] = []
-
-        weak_domains = set(
-            context.weak_domains,
+        batch = CandidateBatch(
+            candidates,
         )
 
-        theme_anchor = get_interview_theme_anchor(
-            context.memory,
+        self.apply_batch(
+            batch=batch,
+            context=context,
         )
 
-        for candidate in candidates:
+        return batch.ranked()
 
-            domains = self._extract_domains(
-                candidate,
-            )
+    def apply_batch(
+        self,
+        batch: CandidateBatch,
+        context: AdaptiveRetrievalContext,
+    ) -> None:
+        """Raise adaptive scores in place for weak domains and the interview theme."""
 
-            overlap = weak_domains.intersection(
-                domains,
-            )
+        boost = batch.domain_overlap(
+            context.weak_domains,
+        ) * self.DOMAIN_BOOST
 
-            boost = len(overlap) * self.DOMAIN_BOOST
-
-            if theme_anchor:
-                boost += self._theme_affinity_boost(
-                    candidate=candidate,
-                    domains=domains,
-                    theme_anchor=theme_anchor,
-                )
-
-            updated = candidate.model_copy(
-                update={
-                    "adaptive_score": round(
-                        candidate.adaptive_score + boost,
-                        3,
-                    )
-                }
-            )
+        theme_anchor = get_interview_theme_anchor(
+            context.memory,
+        )
 
-            boosted.append(
-                updated,
+        if theme_anchor:
+            boost = boost + self._theme_affinity_boost(
+                batch=batch,
+                theme_anchor=theme_anchor,
             )
 
-        boosted.sort(
-            key=lambda c: c.adaptive_score,
-            reverse=True,
+        batch.adaptive_scores = np.round(
+            batch.adaptive_scores + boost,
+            3,
         )
 
-        return boosted
-
     # =====================================================
     # INTERNALS
     # =====================================================
 
-    def _extract_domains(
+    def _theme_affinity_boost(
         self,
-        candidate: RetrievalCandidate,
-    ) -> list[SqlDomain]:
+        batch: CandidateBatch,
+        theme_anchor: str,
+    ) -> np.ndarray:
+        """
+        THEME_AFFINITY_BOOST where the theme is one of the candidate's
+        domains, half of it where it only appears in the question text.
+        """
+
+        try:
+            in_domains = batch.has_domain(SqlDomain(theme_anchor))
+        except ValueError:
+            in_domains = np.zeros(len(batch), dtype=bool)
+
+        # Only candidates without the domain need the text scan.
+        in_text = np.array(
+            [
+                not in_domain
+                and self._mentions_theme(candidate.document.page_content, theme_anchor)
+                for candidate, in_domain in zip(batch.candidates, in_domains.tolist())
+            ],
+            dtype=bool,
+        )
 
-        return parse_sql_domains(
-            candidate.document.metadata.get("domains"),
+        return np.where(
+            in_domains,
+            self.THEME_AFFINITY_BOOST,
+            np.where(in_text, self.THEME_AFFINITY_BOOST * 0.5, 0.0),
         )
 
-    def _theme_affinity_boost(
+    def _mentions_theme(
         self,
-        candidate: RetrievalCandidate,
-        domains: list[SqlDomain],
+        text: str,
         theme_anchor: str,
-    ) -> float:
-
-        domain_values = [d.value for d in domains]
-
-        if theme_anchor in domain_values:
-            return self.THEME_AFFINITY_BOOST
+    ) -> bool:
 
         readable_theme = theme_anchor.replace("_", " ")
-        lower_text = candidate.document.page_content.lower()
-
-        if theme_anchor in lower_text or readable_theme in lower_text:
-            return self.THEME_AFFINITY_BOOST * 0.5
+        lower_text = text.lower()
 
-        return 0.0
+        return theme_anchor in lower_text or readable_theme in lower_text
@@ -1,6 +1,7 @@
 # services/question_corpus/utils/domain_parser.py
 
 import logging
+from functools import lru_cache
 
 from domain.contracts.question.sql_domain import SqlDomain
 
@@ -8,6 +9,9 @@ _logger = logging.getLogger(__name__)
 
 _VALUE_MAP: dict[str, SqlDomain] = {d.value: d for d in SqlDomain}
 
+# One bit per SqlDomain member, in declaration order.
+SQL_DOMAIN_BITS: dict[SqlDomain, int] = {d: 1 << i for i, d in enumerate(SqlDomain)}
+
 
 def parse_sql_domains(value: "str | list | None") -> list[SqlDomain]:
     """Parse domains from any representation into a list of SqlDomain enums.
@@ -35,6 +39,18 @@ def parse_domains(value: "str | list | None") -> list[str]:
     return [d.value for d in parse_sql_domains(value)]
 
 
+def sql_domain_mask(value: "str | list | None") -> int:
+    """Parse domains into a bitmask of SQL_DOMAIN_BITS.
+
+    Same parsing rules as parse_sql_domains. CSV strings (the Chroma
+    metadata form) are memoized, so a document's domains are parsed once
+    per process rather than once per scoring stage.
+    """
+    if isinstance(value, str):
+        return _csv_domain_mask(value)
+    return _domain_mask(parse_sql_domains(value))
+
+
 def serialize_domains(value: "str | list | None") -> str:
     """Serialize domains to a CSV string for Chroma metadata storage.
 
@@ -77,3 +93,15 @@ def _to_raw_strings(value: "str | list | None") -> list[str]:
                 result.append(str(v).strip())
         return [t for t in result if t]
     return []
+
+
+@lru_cache(maxsize=4096)
+def _csv_domain_mask(value: str) -> int:
+    return _domain_mask(parse_sql_domains(value))
+
+
+def _domain_mask(domains: "list[SqlDomain]") -> int:
+    mask = 0
+    for domain in domains:
+        mask |= SQL_DOMAIN_BITS[domain]
+    return mask
@@ -1,47 +1,392 @@
 # services/question_corpus/vectorstores/chroma_corpus_builder.py
 
+import hashlib
+import json
+from dataclasses import dataclass
+
 from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 
-from infrastructure.config.settings import settings
+from infrastructure.embeddings.embedding_backends import embedding_model_name
+from infrastructure.embeddings.embedding_factory import get_embedding_model
+from infrastructure.vector_store.chroma_registry import (
+    EMBEDDING_MODEL_KEY,
+    EmbeddingModelMismatchError,
+)
 from services.question_corpus.constants.vector_store_constants import (
     CHROMA_COLLECTION_NAME,
+    CHROMA_CORPUS_VERSION_KEY,
     CHROMA_PERSIST_DIRECTORY,
 )
 
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+CONTENT_HASH_KEY = "content_hash"
+
+
+@dataclass(frozen=True)
+class ChromaSyncReport:
+
+    added: int
+
+    updated: int
+
+    unchanged: int
+
+    deleted: int
+
+    embedded_batches: int
+
+    corpus_version: str
+
 
 class ChromaCorpusBuilder:
 
+    # =====================================================
+    # CONSTANTS
+    # =====================================================
+
+    DEFAULT_BATCH_SIZE = 128
+
+    # =====================================================
+    # CONSTRUCTOR
+    # =====================================================
+
     def __init__(
         self,
+        embeddings: Embeddings | None = None,
+        collection_name: str = CHROMA_COLLECTION_NAME,
+        persist_directory: str = CHROMA_PERSIST_DIRECTORY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> None:
 
-        self._embeddings = OpenAIEmbeddings(model=settings.openai_embedding_model)
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self._embeddings = embeddings or get_embedding_model()
+
+        self._collection_name = collection_name
+
+        self._persist_directory = persist_directory
+
+        self._batch_size = batch_size
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
 
     def build(
         self,
         documents: list[Document],
+        incremental: bool = False,
     ) -> Chroma:
+        """
+        Full mode drops the collection and embeds every document.
+        Incremental mode embeds only new or changed documents and deletes
+        ids that are no longer in the corpus (see sync()); it falls back to
+        a full build when the collection was embedded with another model.
+        """
 
-        try:
+        if incremental:
+
+            recorded = self._foreign_embedding_model(
+                self._open(),
+            )
+
+            if recorded is not None:
+
+                logger.warning(
+                    "chroma_sync: collection embedded with '%s', configured model is '%s'; "
+                    "rebuilding in full",
+                    recorded,
+                    embedding_model_name(self._embeddings),
+                )
+
+                incremental = False
+
+        if not incremental:
+            self._delete_collection()
+
+        vectorstore = self._open()
+
+        self.sync(
+            vectorstore,
+            documents,
+        )
+
+        return vectorstore
+
+    def sync(
+        self,
+        vectorstore: Chroma,
+        documents: list[Document],
+    ) -> ChromaSyncReport:
+        """
+        Bring the collection in line with documents, keyed by the
+        document_id metadata field.
+
+        Each record stores a content hash of its text, its metadata and the
+        embedding model that produced its vector. Records whose hash matches
+        are left alone; the rest are embedded and
+        upserted in batches of batch_size. Hashes are written together with
+        their batch, so the collection itself is the checkpoint: an
+        interrupted sync resumes where it stopped on the next run.
+
+        Finally the collection metadata is stamped with the embedding model
+        and a corpus version (a digest of every id and content hash) that
+        retrieval caches use to invalidate themselves.
 
-            existing = Chroma(
-                collection_name=CHROMA_COLLECTION_NAME,
-                embedding_function=self._embeddings,
-                persist_directory=CHROMA_PERSIST_DIRECTORY,
+        Raises EmbeddingModelMismatchError when the non-empty collection was
+        embedded with another model: its vectors cannot be reused, so the
+        collection must be rebuilt in full (build(incremental=False)).
+        """
+
+        recorded = self._foreign_embedding_model(
+            vectorstore,
+        )
+
+        if recorded is not None:
+            raise EmbeddingModelMismatchError(
+                f"Collection '{self._collection_name}' was embedded with "
+                f"'{recorded}' but the configured model is "
+                f"'{embedding_model_name(self._embeddings)}'; run a full build."
             )
 
-            existing.delete_collection()
+        desired = self._stamp(
+            documents,
+        )
+
+        stored = self._stored_hashes(
+            vectorstore,
+        )
+
+        pending = [
+            document
+            for document_id, document in desired.items()
+            if stored.get(document_id) != document.metadata[CONTENT_HASH_KEY]
+        ]
+
+        removed = [
+            document_id
+            for document_id in stored
+            if document_id not in desired
+        ]
+
+        for start in range(0, len(removed), self._batch_size):
+
+            vectorstore.delete(
+                ids=removed[start:start + self._batch_size],
+            )
+
+        batches = 0
+
+        for start in range(0, len(pending), self._batch_size):
+
+            batch = pending[start:start + self._batch_size]
+
+            vectorstore.add_texts(
+                texts=[document.page_content for document in batch],
+                metadatas=[document.metadata for document in batch],
+                ids=[document.metadata["document_id"] for document in batch],
+            )
+
+            batches += 1
+
+        added = sum(
+            1
+            for document in pending
+            if document.metadata["document_id"] not in stored
+        )
+
+        corpus_version = self._stamp_metadata(
+            vectorstore,
+            desired,
+        )
+
+        report = ChromaSyncReport(
+            added=added,
+            updated=len(pending) - added,
+            unchanged=len(desired) - len(pending),
+            deleted=len(removed),
+            embedded_batches=batches,
+            corpus_version=corpus_version,
+        )
+
+        logger.info(
+            "chroma_sync: added=%d updated=%d unchanged=%d deleted=%d batches=%d",
+            report.added,
+            report.updated,
+            report.unchanged,
+            report.deleted,
+            report.embedded_batches,
+        )
+
+        return report
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _open(
+        self,
+    ) -> Chroma:
+
+        return Chroma(
+            collection_name=self._collection_name,
+            embedding_function=self._embeddings,
+            persist_directory=self._persist_directory,
+        )
+
+    def _delete_collection(
+        self,
+    ) -> None:
+
+        try:
+
+            self._open().delete_collection()
 
         except Exception:
             pass
 
-        vectorstore = Chroma.from_documents(
-            documents=documents,
-            embedding=self._embeddings,
-            collection_name=CHROMA_COLLECTION_NAME,
-            persist_directory=CHROMA_PERSIST_DIRECTORY,
+    def _foreign_embedding_model(
+        self,
+        vectorstore: Chroma,
+    ) -> str | None:
+        """The model recorded on a non-empty collection, when it is not ours."""
+
+        collection = vectorstore._collection
+
+        recorded = (collection.metadata or {}).get(EMBEDDING_MODEL_KEY)
+
+        if recorded is None or recorded == embedding_model_name(self._embeddings):
+            return None
+
+        if collection.count() == 0:
+            return None
+
+        return recorded
+
+    def _stamp(
+        self,
+        documents: list[Document],
+    ) -> dict[str, Document]:
+
+        stamped: dict[str, Document] = {}
+
+        model_name = embedding_model_name(self._embeddings)
+
+        for document in documents:
+
+            document_id = document.metadata.get("document_id")
+
+            if not document_id:
+                raise ValueError("every corpus document needs a document_id")
+
+            if document_id in stamped:
+                raise ValueError(f"duplicate document_id: {document_id}")
+
+            metadata = dict(
+                document.metadata,
+            )
+
+            metadata[CONTENT_HASH_KEY] = content_hash(
+                document,
+                model_name,
+            )
+
+            stamped[document_id] = Document(
+                page_content=document.page_content,
+                metadata=metadata,
+            )
+
+        return stamped
+
+    def _stamp_metadata(
+        self,
+        vectorstore: Chroma,
+        desired: dict[str, Document],
+    ) -> str:
+
+        digest = hashlib.sha256()
+
+        for document_id in sorted(desired):
+
+            digest.update(document_id.encode("utf-8"))
+
+            digest.update(desired[document_id].metadata[CONTENT_HASH_KEY].encode("utf-8"))
+
+        corpus_version = digest.hexdigest()
+
+        collection = vectorstore._collection
+
+        # hnsw:* keys are fixed at creation and may not be passed to modify().
+        metadata = {
+            key: value
+            for key, value in (collection.metadata or {}).items()
+            if not key.startswith("hnsw:")
+        }
+
+        stamp = {
+            CHROMA_CORPUS_VERSION_KEY: corpus_version,
+            EMBEDDING_MODEL_KEY: embedding_model_name(self._embeddings),
+        }
+
+        if any(metadata.get(key) != value for key, value in stamp.items()):
+
+            metadata.update(stamp)
+
+            collection.modify(
+                metadata=metadata,
+            )
+
+        return corpus_version
+
+    def _stored_hashes(
+        self,
+        vectorstore: Chroma,
+    ) -> dict[str, str | None]:
+
+        existing = vectorstore.get(
+            include=["metadatas"],
         )
 
-        return vectorstore
+        return {
+            record_id: (metadata or {}).get(CONTENT_HASH_KEY)
+            for record_id, metadata in zip(
+                existing["ids"],
+                existing["metadatas"],
+            )
+        }
+
+
+def content_hash(
+    document: Document,
+    embedding_model: str,
+) -> str:
+    """
+    Stable sha256 over the document text, its metadata and the embedding
+    model, so a stored hash identifies the vector next to it as well.
+    """
+
+    metadata = {
+        key: value
+        for key, value in document.metadata.items()
+        if key != CONTENT_HASH_KEY
+    }
+
+    payload = json.dumps(
+        {
+            "text": document.page_content,
+            "metadata": metadata,
+            "embedding_model": embedding_model,
+        },
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -2,12 +2,15 @@
 
 from typing import List
 
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
 from domain.contracts.question.question_bank_item import (
     QuestionBankItem,
 )
 
-from services.question_intelligence.semantic.embedding_similarity_engine import (
-    EmbeddingSimilarityEngine,
+from infrastructure.embeddings.embedding_factory import (
+    get_embedding_model,
 )
 
 from services.question_intelligence.clustering.semantic_cluster import (
@@ -18,15 +21,33 @@ from services.question_intelligence.clustering.semantic_cluster_report import (
     SemanticClusterReport,
 )
 
+from services.question_intelligence.semantic.embedding_matrix import (
+    EmbeddingMatrix,
+    normalize_rows,
+)
+
 
 class SemanticClusteringEngine:
 
     #DEFAULT_THRESHOLD = 0.72
     DEFAULT_THRESHOLD = 0.55
 
-    def __init__(self) -> None:
+    _INITIAL_CAPACITY = 16
+
+    def __init__(
+        self,
+        embedding_model: Embeddings | None = None,
+    ) -> None:
+
+        self._embedding_model = (
+            embedding_model
+            if embedding_model is not None
+            else get_embedding_model()
+        )
+
+        self._threshold = self.DEFAULT_THRESHOLD
 
-        self._similarity_engine = EmbeddingSimilarityEngine()
+        self._reset()
 
     # =====================================================
     # PUBLIC
@@ -38,61 +59,164 @@ class SemanticClusteringEngine:
         threshold: float = DEFAULT_THRESHOLD,
     ) -> SemanticClusterReport:
 
-        clusters: List[List[QuestionBankItem]] = []
+        self._threshold = threshold
 
-        for item in items:
+        self._reset()
 
-            assigned = False
+        return self.assign(items)
 
-            for cluster in clusters:
+    def assign(
+        self,
+        new_items: List[QuestionBankItem],
+    ) -> SemanticClusterReport:
+        """
+        Adds items to the clusters built by the last cluster()/assign() call.
 
-                centroid = cluster[0]
+        Each item joins the most similar centroid at or above the threshold,
+        otherwise it opens a new cluster. Existing clusters are not rebuilt.
+        """
 
-                similarity = self._similarity_engine.similarity(
-                    item.text,
-                    centroid.text,
-                )
+        vectors = EmbeddingMatrix.build(
+            [item.text for item in new_items],
+            self._embedding_model,
+        ).vectors
 
-                if similarity >= threshold:
+        for item, vector in zip(new_items, vectors):
 
-                    cluster.append(item)
+            self._add(item, vector)
 
-                    assigned = True
+        return self._build_report()
 
-                    break
+    # =====================================================
+    # INTERNALS
+    # =====================================================
 
-            if not assigned:
+    def _reset(self) -> None:
 
-                clusters.append([item])
+        self._centroid_sums = np.zeros((0, 0), dtype=np.float32)
 
-        semantic_clusters: List[SemanticCluster] = []
+        self._centroids = np.zeros((0, 0), dtype=np.float32)
 
-        for idx, cluster in enumerate(clusters):
+        self._counts: List[int] = []
 
-            similarities = []
+        self._members: List[List[QuestionBankItem]] = []
 
-            centroid = cluster[0]
+        self._member_vectors: List[List[np.ndarray]] = []
 
-            for member in cluster[1:]:
+        self._total_documents = 0
 
-                sim = self._similarity_engine.similarity(
-                    centroid.text,
-                    member.text,
-                )
+    def _add(
+        self,
+        item: QuestionBankItem,
+        vector: np.ndarray,
+    ) -> None:
 
-                similarities.append(sim)
+        self._total_documents += 1
 
-            avg_similarity = (
-                sum(similarities) / len(similarities) if similarities else 1.0
-            )
+        cluster_count = len(self._counts)
+
+        if cluster_count:
+
+            similarities = self._centroids[:cluster_count] @ vector
+
+            best = int(np.argmax(similarities))
+
+            if round(float(similarities[best]), 4) >= self._threshold:
+
+                self._join(best, item, vector)
+
+                return
+
+        self._open(item, vector)
+
+    def _join(
+        self,
+        cluster_idx: int,
+        item: QuestionBankItem,
+        vector: np.ndarray,
+    ) -> None:
+
+        self._centroid_sums[cluster_idx] += vector
+
+        self._counts[cluster_idx] += 1
+
+        self._centroids[cluster_idx] = normalize_rows(
+            self._centroid_sums[cluster_idx]
+        )[0]
+
+        self._members[cluster_idx].append(item)
+
+        self._member_vectors[cluster_idx].append(vector)
+
+    def _open(
+        self,
+        item: QuestionBankItem,
+        vector: np.ndarray,
+    ) -> None:
+
+        cluster_idx = len(self._counts)
+
+        self._ensure_capacity(cluster_idx + 1, vector.shape[0])
+
+        self._centroid_sums[cluster_idx] = vector
+
+        self._centroids[cluster_idx] = vector
+
+        self._counts.append(1)
+
+        self._members.append([item])
+
+        self._member_vectors.append([vector])
+
+    def _ensure_capacity(
+        self,
+        required: int,
+        dimension: int,
+    ) -> None:
+
+        capacity = self._centroid_sums.shape[0]
+
+        if capacity >= required:
+            return
+
+        new_capacity = max(
+            required,
+            capacity * 2,
+            self._INITIAL_CAPACITY,
+        )
+
+        sums = np.zeros((new_capacity, dimension), dtype=np.float32)
+
+        centroids = np.zeros((new_capacity, dimension), dtype=np.float32)
+
+        if capacity:
+
+            sums[:capacity] = self._centroid_sums
+
+            centroids[:capacity] = self._centroids
+
+        self._centroid_sums = sums
+
+        self._centroids = centroids
+
+    def _build_report(self) -> SemanticClusterReport:
+
+        semantic_clusters: List[SemanticCluster] = []
+
+        for idx, members in enumerate(self._members):
+
+            similarities = np.stack(self._member_vectors[idx]) @ self._centroids[idx]
+
+            # The member nearest the mean vector represents the cluster.
+            representative = members[int(np.argmax(similarities))]
 
             semantic_clusters.append(
                 SemanticCluster(
                     cluster_id=idx + 1,
-                    centroid_text=centroid.text,
-                    members=[item.text for item in cluster],
+                    centroid_text=representative.text,
+                    members=[item.text for item in members],
                     average_similarity=round(
-                        avg_similarity,
+                        float(similarities.mean()),
                         2,
                     ),
                 )
@@ -101,11 +225,11 @@ class SemanticClusteringEngine:
         cluster_sizes = [len(c.members) for c in semantic_clusters]
 
         return SemanticClusterReport(
-            total_documents=len(items),
+            total_documents=self._total_documents,
             total_clusters=len(semantic_clusters),
-            largest_cluster_size=max(cluster_sizes),
+            largest_cluster_size=max(cluster_sizes, default=0),
             average_cluster_size=round(
-                sum(cluster_sizes) / len(cluster_sizes),
+                sum(cluster_sizes) / len(cluster_sizes) if cluster_sizes else 0.0,
                 2,
             ),
             clusters=semantic_clusters,
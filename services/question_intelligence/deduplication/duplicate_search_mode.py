@@ -0,0 +1,14 @@
+# services/question_intelligence/deduplication/duplicate_search_mode.py
+
+from enum import Enum
+
+
+class DuplicateSearchMode(str, Enum):
+
+    # Every i<j pair scored from one batch embedding pass, in memory-bounded
+    # blocks of the normalized matrix.
+    EXACT = "exact"
+
+    # Random-projection LSH proposes candidate pairs; only those are scored.
+    # May miss some duplicates; intended for very large corpora.
+    ANN = "ann"
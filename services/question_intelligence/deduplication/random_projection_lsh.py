@@ -0,0 +1,100 @@
+# services/question_intelligence/deduplication/random_projection_lsh.py
+
+# RandomProjectionLSH
+#
+# Responsibility:
+# Proposes candidate near-duplicate pairs for cosine similarity by hashing
+# normalized vectors with random hyperplanes (SimHash). Vectors that share
+# a bucket in any of the hash tables become candidate pairs.
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+
+class RandomProjectionLSH:
+
+    DEFAULT_NUM_TABLES = 8
+
+    DEFAULT_NUM_BITS = 12
+
+    DEFAULT_SEED = 7
+
+    def __init__(
+        self,
+        num_tables: int = DEFAULT_NUM_TABLES,
+        num_bits: int = DEFAULT_NUM_BITS,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+
+        if num_tables < 1 or num_bits < 1:
+            raise ValueError("num_tables and num_bits must be >= 1")
+
+        self._num_tables = num_tables
+
+        self._num_bits = num_bits
+
+        self._seed = seed
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    def candidate_pairs(
+        self,
+        vectors: np.ndarray,
+    ) -> Set[Tuple[int, int]]:
+
+        count = vectors.shape[0]
+
+        if count < 2:
+            return set()
+
+        codes = self._hash_codes(vectors)
+
+        pairs: Set[Tuple[int, int]] = set()
+
+        for table in range(self._num_tables):
+
+            buckets: Dict[int, List[int]] = defaultdict(list)
+
+            for idx, code in enumerate(codes[:, table].tolist()):
+                buckets[code].append(idx)
+
+            for members in buckets.values():
+
+                for a in range(len(members)):
+
+                    for b in range(a + 1, len(members)):
+
+                        pairs.add((members[a], members[b]))
+
+        return pairs
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _hash_codes(
+        self,
+        vectors: np.ndarray,
+    ) -> np.ndarray:
+
+        rng = np.random.default_rng(self._seed)
+
+        planes = rng.standard_normal(
+            (vectors.shape[1], self._num_tables * self._num_bits),
+        ).astype(np.float32)
+
+        signs = (vectors @ planes) > 0
+
+        signs = signs.reshape(
+            vectors.shape[0],
+            self._num_tables,
+            self._num_bits,
+        )
+
+        weights = 1 << np.arange(self._num_bits, dtype=np.int64)
+
+        return (signs * weights).sum(axis=2)
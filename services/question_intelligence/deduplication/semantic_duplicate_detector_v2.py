@@ -1,13 +1,24 @@
 # services/question_intelligence/deduplication/semantic_duplicate_detector_v2.py
 
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
 
 from domain.contracts.question.question_bank_item import (
     QuestionBankItem,
 )
 
-from services.question_intelligence.semantic.embedding_similarity_engine import (
-    EmbeddingSimilarityEngine,
+from infrastructure.embeddings.embedding_factory import (
+    get_embedding_model,
+)
+
+from services.question_intelligence.deduplication.duplicate_search_mode import (
+    DuplicateSearchMode,
+)
+
+from services.question_intelligence.deduplication.random_projection_lsh import (
+    RandomProjectionLSH,
 )
 
 from services.question_intelligence.deduplication.semantic_duplicate_report import (
@@ -15,14 +26,37 @@ from services.question_intelligence.deduplication.semantic_duplicate_report impo
     SemanticDuplicateReport,
 )
 
+from services.question_intelligence.semantic.embedding_matrix import (
+    EmbeddingMatrix,
+)
+
 
 class SemanticDuplicateDetectorV2:
 
     DEFAULT_THRESHOLD = 0.82
 
-    def __init__(self) -> None:
+    # Rows per similarity tile; a tile holds BLOCK_SIZE² float32 values.
+    DEFAULT_BLOCK_SIZE = 1024
+
+    def __init__(
+        self,
+        embedding_model: Embeddings | None = None,
+        mode: DuplicateSearchMode = DuplicateSearchMode.EXACT,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        lsh: RandomProjectionLSH | None = None,
+    ) -> None:
+
+        self._embedding_model = (
+            embedding_model
+            if embedding_model is not None
+            else get_embedding_model()
+        )
 
-        self._similarity_engine = EmbeddingSimilarityEngine()
+        self._mode = mode
+
+        self._block_size = max(block_size, 1)
+
+        self._lsh = lsh if lsh is not None else RandomProjectionLSH()
 
     # =====================================================
     # PUBLIC
@@ -34,33 +68,33 @@ class SemanticDuplicateDetectorV2:
         threshold: float = DEFAULT_THRESHOLD,
     ) -> SemanticDuplicateReport:
 
-        duplicates: List[DuplicatePair] = []
+        matrix = EmbeddingMatrix.build(
+            [item.text for item in items],
+            self._embedding_model,
+        )
 
-        max_similarity = 0.0
+        if self._mode == DuplicateSearchMode.ANN:
 
-        for i in range(len(items)):
+            matches, max_similarity = self._ann_matches(
+                matrix.vectors,
+                threshold,
+            )
 
-            for j in range(i + 1, len(items)):
+        else:
 
-                similarity = self._similarity_engine.similarity(
-                    items[i].text,
-                    items[j].text,
-                )
-
-                max_similarity = max(
-                    max_similarity,
-                    similarity,
-                )
+            matches, max_similarity = self._blocked_matches(
+                matrix.vectors,
+                threshold,
+            )
 
-                if similarity >= threshold:
-
-                    duplicates.append(
-                        DuplicatePair(
-                            left=items[i].text,
-                            right=items[j].text,
-                            similarity=similarity,
-                        )
-                    )
+        duplicates: List[DuplicatePair] = [
+            DuplicatePair(
+                left=items[i].text,
+                right=items[j].text,
+                similarity=similarity,
+            )
+            for i, j, similarity in sorted(matches)
+        ]
 
         total_pairs = max(
             (len(items) * (len(items) - 1)) / 2,
@@ -75,3 +109,120 @@ class SemanticDuplicateDetectorV2:
             duplicate_ratio=round(duplicate_ratio, 2),
             max_similarity=round(max_similarity, 2),
         )
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _blocked_matches(
+        self,
+        vectors: np.ndarray,
+        threshold: float,
+    ) -> Tuple[List[Tuple[int, int, float]], float]:
+
+        count = vectors.shape[0]
+
+        matches: List[Tuple[int, int, float]] = []
+
+        max_similarity = 0.0
+
+        for row_start in range(0, count, self._block_size):
+
+            row_end = min(row_start + self._block_size, count)
+
+            for col_start in range(row_start, count, self._block_size):
+
+                col_end = min(col_start + self._block_size, count)
+
+                tile = self._round(
+                    vectors[row_start:row_end] @ vectors[col_start:col_end].T
+                )
+
+                # Keep only i<j pairs: mask the diagonal and lower triangle
+                # of tiles that straddle the diagonal.
+                rows = np.arange(row_start, row_end)[:, None]
+
+                cols = np.arange(col_start, col_end)[None, :]
+
+                upper = cols > rows
+
+                if not upper.any():
+                    continue
+
+                max_similarity = max(
+                    max_similarity,
+                    float(tile[upper].max()),
+                )
+
+                hits_i, hits_j = np.nonzero(upper & (tile >= threshold))
+
+                for i, j in zip(hits_i.tolist(), hits_j.tolist()):
+
+                    matches.append(
+                        (
+                            row_start + i,
+                            col_start + j,
+                            float(tile[i, j]),
+                        )
+                    )
+
+        return matches, max_similarity
+
+    def _ann_matches(
+        self,
+        vectors: np.ndarray,
+        threshold: float,
+    ) -> Tuple[List[Tuple[int, int, float]], float]:
+
+        candidates = sorted(self._lsh.candidate_pairs(vectors))
+
+        if not candidates:
+            return [], 0.0
+
+        left = np.fromiter((i for i, _ in candidates), dtype=np.int64)
+
+        right = np.fromiter((j for _, j in candidates), dtype=np.int64)
+
+        matches: List[Tuple[int, int, float]] = []
+
+        max_similarity = 0.0
+
+        for start in range(0, len(candidates), self._block_size):
+
+            end = start + self._block_size
+
+            similarities = self._round(
+                np.einsum(
+                    "ij,ij->i",
+                    vectors[left[start:end]],
+                    vectors[right[start:end]],
+                )
+            )
+
+            max_similarity = max(
+                max_similarity,
+                float(similarities.max()),
+            )
+
+            for offset in np.nonzero(similarities >= threshold)[0].tolist():
+
+                matches.append(
+                    (
+                        int(left[start + offset]),
+                        int(right[start + offset]),
+                        float(similarities[offset]),
+                    )
+                )
+
+        return matches, max_similarity
+
+    def _round(
+        self,
+        similarities: np.ndarray,
+    ) -> np.ndarray:
+
+        # Same 4-decimal precision as EmbeddingSimilarityEngine.similarity.
+        return np.round(
+            similarities.astype(np.float64),
+            4,
+        )
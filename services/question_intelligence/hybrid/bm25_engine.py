@@ -24,7 +24,8 @@ class BM25Engine:
 
         corpus = [item.text.lower().split() for item in items]
 
-        self._bm25 = BM25Okapi(corpus)
+        # BM25Okapi divides by the corpus size, so an empty corpus has no model.
+        self._bm25 = BM25Okapi(corpus) if corpus else None
 
     # =====================================================
     # PUBLIC
@@ -36,6 +37,9 @@ class BM25Engine:
         top_k: int,
     ) -> List[KeywordSearchResult]:
 
+        if self._bm25 is None:
+            return []
+
         tokens = query.lower().split()
 
         scores = self._bm25.get_scores(tokens)
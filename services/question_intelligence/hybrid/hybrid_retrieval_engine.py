@@ -1,11 +1,19 @@
 # services/question_intelligence/hybrid/hybrid_retrieval_engine.py
 
+from pathlib import Path
 from typing import List
 
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
 from domain.contracts.question.question_bank_item import (
     QuestionBankItem,
 )
 
+from infrastructure.embeddings.embedding_factory import (
+    get_embedding_model,
+)
+
 from services.question_intelligence.hybrid.bm25_engine import (
     BM25Engine,
 )
@@ -14,16 +22,22 @@ from services.question_intelligence.hybrid.hybrid_retrieval_result import (
     HybridRetrievalResult,
 )
 
-from services.question_intelligence.semantic.embedding_similarity_engine import (
-    EmbeddingSimilarityEngine,
+from services.question_intelligence.semantic.embedding_matrix import (
+    EmbeddingMatrix,
 )
 
 
 class HybridRetrievalEngine:
 
+    SEMANTIC_WEIGHT = 0.7
+
+    KEYWORD_WEIGHT = 0.3
+
     def __init__(
         self,
         items: List[QuestionBankItem],
+        embedding_model: Embeddings | None = None,
+        embedding_cache_path: str | Path | None = None,
     ) -> None:
 
         self._items = items
@@ -32,7 +46,18 @@ class HybridRetrievalEngine:
             items,
         )
 
-        self._similarity_engine = EmbeddingSimilarityEngine()
+        self._embedding_model = (
+            embedding_model
+            if embedding_model is not None
+            else get_embedding_model()
+        )
+
+        # Corpus is embedded once; every search reuses the normalized matrix.
+        self._corpus_matrix = EmbeddingMatrix.build(
+            [item.text for item in items],
+            self._embedding_model,
+            cache_path=embedding_cache_path,
+        )
 
     # =====================================================
     # PUBLIC
@@ -44,60 +69,94 @@ class HybridRetrievalEngine:
         top_k: int,
     ) -> List[HybridRetrievalResult]:
 
-        keyword_results = self._bm25.search(
-            query=query,
-            top_k=len(self._items),
-        )
-
-        max_keyword_score = max(
-            r.score
-            for r in keyword_results
-        )
+        if not self._items:
+            return []
 
-        keyword_scores = {
-            r.text: (
-                r.score / max_keyword_score
-            )
-            for r in keyword_results
-        }
+        semantic_scores = self._semantic_scores(query)
 
-        results = []
+        keyword_scores = self._keyword_scores(query)
 
-        for item in self._items:
+        final_scores = np.round(
+            semantic_scores * self.SEMANTIC_WEIGHT
+            + keyword_scores * self.KEYWORD_WEIGHT,
+            2,
+        )
 
-            semantic_score = self._similarity_engine.similarity(
-                query,
-                item.text,
-            )
+        ranking = np.argsort(
+            -final_scores,
+            kind="stable",
+        )
 
-            keyword_score = keyword_scores.get(
-                item.text,
-                0.0,
-            )
+        results = []
 
-            final_score = semantic_score * 0.7 + keyword_score * 0.3
+        for idx in ranking[:top_k]:
 
             results.append(
                 HybridRetrievalResult(
-                    text=item.text,
+                    text=self._items[idx].text,
                     semantic_score=round(
-                        semantic_score,
+                        float(semantic_scores[idx]),
                         2,
                     ),
                     keyword_score=round(
-                        keyword_score,
-                        2,
-                    ),
-                    final_score=round(
-                        final_score,
+                        float(keyword_scores[idx]),
                         2,
                     ),
+                    final_score=float(final_scores[idx]),
                 )
             )
 
-        results.sort(
-            key=lambda r: r.final_score,
-            reverse=True,
+        return results
+
+    # =====================================================
+    # INTERNALS
+    # =====================================================
+
+    def _semantic_scores(
+        self,
+        query: str,
+    ) -> np.ndarray:
+
+        query_vector = self._embedding_model.embed_query(query)
+
+        similarities = self._corpus_matrix.similarities(query_vector)
+
+        return np.round(
+            similarities.astype(np.float64),
+            4,
+        )
+
+    def _keyword_scores(
+        self,
+        query: str,
+    ) -> np.ndarray:
+
+        keyword_results = self._bm25.search(
+            query=query,
+            top_k=len(self._items),
         )
 
-        return results[:top_k]
+        max_keyword_score = max(
+            r.score
+            for r in keyword_results
+        )
+
+        if max_keyword_score <= 0:
+            return np.zeros(len(self._items))
+
+        keyword_scores = {
+            r.text: (
+                r.score / max_keyword_score
+            )
+            for r in keyword_results
+        }
+
+        return np.array(
+            [
+                keyword_scores.get(
+                    item.text,
+                    0.0,
+                )
+                for item in self._items
+            ]
+        )
@@ -1,5 +1,7 @@
 # services/question_intelligence/lazy_adaptive_interview_service.py
 
+from typing import Callable
+
 from domain.contracts.interview.interview_area import InterviewArea
 from domain.contracts.interview.interview_type import InterviewType
 from domain.contracts.interview.business_context import BusinessContext
@@ -18,6 +20,8 @@ from services.question_intelligence.interview_theme_memory import (
     with_interview_theme_anchor,
 )
 from services.question_intelligence.interview_theme_selector import InterviewThemeSelector
+from services.question_intelligence.next_question_prefetcher import NextQuestionPrefetcher
+from infrastructure.config.settings import settings
 
 from app.settings.constants import (
     QUESTIONS_PER_AREA,
@@ -32,12 +36,22 @@ class LazyAdaptiveInterviewService:
         self,
         area_builder: AreaQuestionBuilder,
         theme_selector: InterviewThemeSelector | None = None,
+        prefetcher: NextQuestionPrefetcher | None = None,
     ) -> None:
 
         self._area_builder = area_builder
         self._theme_selector = (
             theme_selector if theme_selector is not None else InterviewThemeSelector()
         )
+        self._prefetcher = (
+            prefetcher
+            if prefetcher is not None
+            else NextQuestionPrefetcher(
+                max_workers=settings.adaptive_prefetch_workers,
+                domain_tolerance=settings.adaptive_prefetch_domain_tolerance,
+                ttl_seconds=settings.adaptive_prefetch_ttl_s,
+            )
+        )
 
     def resolve_planned_areas(
         self,
@@ -92,11 +106,124 @@ class LazyAdaptiveInterviewService:
         job_description: str | None = None,
         company_description: str | None = None,
         business_context: BusinessContext | None = None,
+        session_id: str | None = None,
+        question_enricher: Callable[[Question], Question] | None = None,
     ) -> tuple[Question, InterviewRetrievalMemory]:
+        """
+        With session_id, a matching prefetch_next_question result is used
+        when the memory's adaptive signals still match its snapshot;
+        otherwise the question is built now. question_enricher is applied
+        to the built question (prefetched ones were enriched in the
+        background).
+        """
 
         if generated_count >= len(planned_areas):
             raise ValueError("All planned areas already have questions")
 
+        if session_id is not None:
+
+            prefetched = self._prefetcher.take(
+                session_id=session_id,
+                generated_count=generated_count,
+                memory=memory,
+            )
+
+            if prefetched is not None:
+                return prefetched
+
+        question, memory = self._build_next_question(
+            role=role,
+            level=level,
+            interview_type=interview_type,
+            planned_areas=planned_areas,
+            generated_count=generated_count,
+            memory=memory,
+            job_description=job_description,
+            company_description=company_description,
+            business_context=business_context,
+        )
+
+        if question_enricher is not None:
+            question = question_enricher(question)
+
+        return question, memory
+
+    def prefetch_next_question(
+        self,
+        session_id: str,
+        role: RoleType,
+        level: SeniorityLevel,
+        interview_type: InterviewType,
+        planned_areas: list[str],
+        generated_count: int,
+        memory: InterviewRetrievalMemory,
+        job_description: str | None = None,
+        company_description: str | None = None,
+        business_context: BusinessContext | None = None,
+        question_enricher: Callable[[Question], Question] | None = None,
+    ) -> bool:
+        """
+        Start building (and enriching) the question for planned slot
+        generated_count in the background from a snapshot of memory,
+        replacing the session's previous prefetch. Returns False when
+        prefetching is disabled or every planned area already has a
+        question.
+        """
+
+        if not settings.adaptive_prefetch_enabled:
+            return False
+
+        if generated_count >= len(planned_areas):
+            return False
+
+        def build(snapshot: InterviewRetrievalMemory) -> tuple[Question, InterviewRetrievalMemory]:
+
+            question, built_memory = self._build_next_question(
+                role=role,
+                level=level,
+                interview_type=interview_type,
+                planned_areas=planned_areas,
+                generated_count=generated_count,
+                memory=snapshot,
+                job_description=job_description,
+                company_description=company_description,
+                business_context=business_context,
+            )
+
+            if question_enricher is not None:
+                question = question_enricher(question)
+
+            return question, built_memory
+
+        self._prefetcher.start(
+            session_id=session_id,
+            generated_count=generated_count,
+            snapshot=memory,
+            build=build,
+        )
+
+        return True
+
+    def cancel_prefetch(
+        self,
+        session_id: str,
+    ) -> None:
+
+        self._prefetcher.cancel(session_id)
+
+    def _build_next_question(
+        self,
+        role: RoleType,
+        level: SeniorityLevel,
+        interview_type: InterviewType,
+        planned_areas: list[str],
+        generated_count: int,
+        memory: InterviewRetrievalMemory,
+        job_description: str | None,
+        company_description: str | None,
+        business_context: BusinessContext | None,
+    ) -> tuple[Question, InterviewRetrievalMemory]:
+
         next_area = InterviewArea(planned_areas[generated_count])
 
         questions, memory = self._area_builder.build(
@@ -0,0 +1,331 @@
+# services/question_intelligence/next_question_prefetcher.py
+
+# NextQuestionPrefetcher
+#
+# Responsibility:
+# Runs speculative next-question builds on a background executor with one
+# cancellable handle per interview session, and hands a result back unless
+# the session's adaptive signals changed enough, since the memory snapshot
+# the build started from, to steer selection elsewhere.
+# Handles are dropped when taken or cancelled, or after ttl_seconds without
+# a new prefetch for the session (abandoned interviews never take theirs).
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from domain.contracts.question.question import Question
+from domain.contracts.question.sql_domain import SqlDomain
+from services.question_corpus.contracts.interview_retrieval_memory import (
+    InterviewRetrievalMemory,
+)
+from services.question_corpus.retrieval.adaptive_context_builder import (
+    AdaptiveContextBuilder,
+)
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PrefetchResult = tuple[Question, InterviewRetrievalMemory]
+
+
+@dataclass(frozen=True)
+class AdaptiveSignals:
+    """The parts of InterviewRetrievalMemory that steer next-question selection."""
+
+    covered_domains: frozenset[SqlDomain]
+    weak_domains: frozenset[SqlDomain]
+    strong_domains: frozenset[SqlDomain]
+    last_difficulty: int | None
+    target_difficulty: int
+
+    @classmethod
+    def from_memory(
+        cls,
+        memory: InterviewRetrievalMemory,
+    ) -> "AdaptiveSignals":
+
+        return cls(
+            covered_domains=frozenset(memory.covered_domains),
+            weak_domains=frozenset(memory.weak_domains),
+            strong_domains=frozenset(memory.strong_domains),
+            last_difficulty=memory.difficulty_history[-1] if memory.difficulty_history else None,
+            target_difficulty=AdaptiveContextBuilder().compute_target_difficulty(memory),
+        )
+
+    def changed_enough(
+        self,
+        other: "AdaptiveSignals",
+        domain_tolerance: int,
+    ) -> bool:
+        """
+        True when selecting from other could land on a different question:
+        the last asked difficulty moved, the target difficulty moved by more
+        than one band, or more than domain_tolerance covered/weak/strong
+        domains differ. A single answer usually shifts the target by one
+        band and one domain into weak or strong; the next prefetch starts
+        from the updated memory and picks those up.
+        """
+
+        if self.last_difficulty != other.last_difficulty:
+            return True
+
+        if abs(self.target_difficulty - other.target_difficulty) > 1:
+            return True
+
+        drift = (
+            len(self.covered_domains ^ other.covered_domains)
+            + len(self.weak_domains ^ other.weak_domains)
+            + len(self.strong_domains ^ other.strong_domains)
+        )
+
+        return drift > domain_tolerance
+
+
+class PrefetchHandle:
+    """One in-flight prefetch: the planned slot, its memory snapshot and its future."""
+
+    def __init__(
+        self,
+        generated_count: int,
+        snapshot: InterviewRetrievalMemory,
+        future: "Future[PrefetchResult]",
+        started_at: float = 0.0,
+    ) -> None:
+
+        self.generated_count = generated_count
+        self.started_at = started_at
+        self.snapshot = snapshot
+        self.signals = AdaptiveSignals.from_memory(snapshot)
+        self.future = future
+
+    def cancel(self) -> bool:
+        """Cancel the build if it has not started; a running build is left to finish and discarded."""
+
+        return self.future.cancel()
+
+
+class NextQuestionPrefetcher:
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        domain_tolerance: int = 1,
+        ttl_seconds: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+
+        self._max_workers = max_workers
+        self._domain_tolerance = domain_tolerance
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._executor: ThreadPoolExecutor | None = None
+        self._handles: dict[str, PrefetchHandle] = {}
+        self._lock = threading.Lock()
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    def start(
+        self,
+        session_id: str,
+        generated_count: int,
+        snapshot: InterviewRetrievalMemory,
+        build: Callable[[InterviewRetrievalMemory], PrefetchResult],
+    ) -> PrefetchHandle:
+        """Submit build(snapshot), replacing (and cancelling) the session's previous prefetch."""
+
+        now = self._clock()
+
+        with self._lock:
+
+            expired = self._pop_expired(now)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="question-prefetch",
+                )
+
+            previous = self._handles.pop(session_id, None)
+
+            # The build runs in the caller's context so LLM metrics and
+            # operation attribution land in the session that asked for it.
+            handle = PrefetchHandle(
+                generated_count=generated_count,
+                snapshot=snapshot,
+                future=self._executor.submit(
+                    contextvars.copy_context().run,
+                    build,
+                    snapshot,
+                ),
+                started_at=now,
+            )
+
+            self._handles[session_id] = handle
+
+        if previous is not None:
+            previous.cancel()
+
+        for stale in expired:
+            stale.cancel()
+
+        return handle
+
+    def take(
+        self,
+        session_id: str,
+        generated_count: int,
+        memory: InterviewRetrievalMemory,
+    ) -> PrefetchResult | None:
+        """
+        The session's prefetched question for slot generated_count, waiting
+        for it if still running, with its memory rebased onto memory. None
+        when there is no prefetch, it targets another slot, the adaptive
+        signals changed enough since the snapshot, the question has been
+        asked meanwhile, or the build failed.
+        """
+
+        with self._lock:
+            expired = self._pop_expired(self._clock())
+            handle = self._handles.pop(session_id, None)
+
+        for stale in expired:
+            stale.cancel()
+
+        if handle is None:
+            return None
+
+        if handle.generated_count != generated_count:
+            handle.cancel()
+            return None
+
+        if handle.signals.changed_enough(
+            AdaptiveSignals.from_memory(memory),
+            self._domain_tolerance,
+        ):
+            logger.info(
+                "Discarding prefetched question for session %s: adaptive signals changed",
+                session_id,
+            )
+            handle.cancel()
+            return None
+
+        try:
+            question, built_memory = handle.future.result()
+        except Exception as exc:
+            logger.warning(
+                "Prefetched question build failed for session %s: %s",
+                session_id,
+                exc,
+            )
+            return None
+
+        if question.id in memory.asked_question_ids:
+            logger.info(
+                "Discarding prefetched question for session %s: already asked",
+                session_id,
+            )
+            return None
+
+        return question, rebase_memory(
+            built=built_memory,
+            snapshot=handle.snapshot,
+            memory=memory,
+        )
+
+    def cancel(
+        self,
+        session_id: str,
+    ) -> None:
+
+        with self._lock:
+            handle = self._handles.pop(session_id, None)
+
+        if handle is not None:
+            handle.cancel()
+
+    def shutdown(self) -> None:
+
+        with self._lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+            executor, self._executor = self._executor, None
+
+        for handle in handles:
+            handle.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __contains__(self, session_id: object) -> bool:
+
+        with self._lock:
+            return session_id in self._handles
+
+    # =====================================================
+    # INTERNAL
+    # =====================================================
+
+    def _pop_expired(
+        self,
+        now: float,
+    ) -> list[PrefetchHandle]:
+        """Remove handles older than the TTL; the caller cancels them outside the lock."""
+
+        expired = [
+            session_id
+            for session_id, handle in self._handles.items()
+            if now - handle.started_at > self._ttl_seconds
+        ]
+
+        return [self._handles.pop(session_id) for session_id in expired]
+
+
+def rebase_memory(
+    built: InterviewRetrievalMemory,
+    snapshot: InterviewRetrievalMemory,
+    memory: InterviewRetrievalMemory,
+) -> InterviewRetrievalMemory:
+    """
+    Replay onto memory what a build added to snapshot: list items it
+    appended are appended to memory's lists, other fields it changed take
+    the built value, and untouched fields keep memory's value.
+    """
+
+    update: dict = {}
+
+    for name in InterviewRetrievalMemory.model_fields:
+
+        built_value = getattr(built, name)
+        snapshot_value = getattr(snapshot, name)
+
+        if built_value == snapshot_value:
+            continue
+
+        if isinstance(built_value, list):
+
+            current = getattr(memory, name)
+
+            # Appended tails (difficulty_history may repeat values) are
+            # replayed as is; set-like lists only contribute new items.
+            if built_value[:len(snapshot_value)] == snapshot_value:
+                added = built_value[len(snapshot_value):]
+            else:
+                added = [
+                    item
+                    for item in built_value
+                    if item not in snapshot_value and item not in current
+                ]
+
+            update[name] = [*current, *added]
+            continue
+
+        update[name] = built_value
+
+    return memory.model_copy(update=update) if update else memory
@@ -1,7 +1,9 @@
 # services/question_intelligence/pipelines/base_llm_question_pipeline.py
 
 from abc import ABC, abstractmethod
-from typing import List
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, List
 
 from domain.contracts.question.question import Question
 from domain.contracts.question.question_bank_item import QuestionBankItem
@@ -27,6 +29,7 @@ from services.question_intelligence.interview_theme_guidance import build_theme_
 from services.question_intelligence.interview_theme_memory import (
     get_interview_theme_anchor,
 )
+from infrastructure.llm.llm_concurrency import submit_llm_call
 
 from app.core.logger import get_logger
 
@@ -75,13 +78,17 @@ class BaseLLMQuestionPipeline(ABC):
         corpus_quota caps how many questions are drawn from the retrieval
         corpus. Remaining slots are filled by LLM generation. When None the
         pipeline fills as many corpus questions as available (legacy behaviour).
+
+        Enrichment and generation calls run concurrently on the process-wide
+        LLM executor: one enrichment per open corpus slot is in flight at a
+        time and successes are kept in retrieval order. Generation for the
+        slots known to be open up front (reserved slots plus any gap the
+        candidates cannot cover) starts alongside enrichment; one top-up call
+        covers whatever failed enrichments leave once they have settled.
         """
 
         session_memory = memory if memory is not None else InterviewRetrievalMemory()
 
-        questions: List[Question] = []
-        enriched_pairs: list[tuple[QuestionBankItem, Question]] = []
-
         theme_anchor = get_interview_theme_anchor(session_memory)
         theme_guidance = build_theme_guidance(theme_anchor=theme_anchor, area=area)
 
@@ -118,48 +125,54 @@ class BaseLLMQuestionPipeline(ABC):
 
         label = self._pipeline_label()
 
-        for item in retrieved:
-
-            if len(questions) >= questions_per_area:
-                break
+        def generate(n: int) -> List[Question]:
+            return self._generate_with_retry(
+                role=role,
+                level=level,
+                n=n,
+                theme_guidance=theme_guidance,
+                job_description=job_description,
+                company_description=company_description,
+                business_context=business_context,
+            )
 
-            if corpus_quota is not None and len(questions) >= corpus_quota:
-                break
+        upfront_slots = (questions_per_area - effective_corpus_target) + max(
+            0,
+            effective_corpus_target - len(retrieved),
+        )
 
-            provenance = self._build_enrichment_provenance(item)
+        upfront_generation: Future[List[Question]] | None = (
+            submit_llm_call(generate, upfront_slots) if upfront_slots > 0 else None
+        )
 
-            enriched = self._enrich_item(
+        enriched_pairs = self._enrich_in_retrieval_order(
+            retrieved=retrieved,
+            target=effective_corpus_target,
+            enrich=lambda item: self._enrich_item(
                 item=item,
                 role=role,
                 level=level,
                 area=area,
-                provenance=provenance,
+                provenance=self._build_enrichment_provenance(item),
                 theme_guidance=theme_guidance,
                 job_description=job_description,
                 company_description=company_description,
                 business_context=business_context,
-            )
+            ),
+        )
 
-            if enriched is None:
-                logger.debug("[%s] Enrichment failed for item: %s", label, item.id)
-                continue
+        questions: List[Question] = [enriched for _, enriched in enriched_pairs]
 
-            enriched_pairs.append((item, enriched))
-            questions.append(enriched)
+        if upfront_generation is not None:
+            questions.extend(upfront_generation.result())
 
-        remaining_slots = questions_per_area - len(questions)
+        topup_slots = (
+            min(effective_corpus_target, len(retrieved)) - len(enriched_pairs)
+        )
 
-        if remaining_slots > 0:
+        if topup_slots > 0:
             questions.extend(
-                self._generate_with_retry(
-                    role=role,
-                    level=level,
-                    n=remaining_slots,
-                    theme_guidance=theme_guidance,
-                    job_description=job_description,
-                    company_description=company_description,
-                    business_context=business_context,
-                )
+                self._drop_repeated_prompts(generate(topup_slots), questions)
             )
 
         if not questions:
@@ -213,6 +226,76 @@ class BaseLLMQuestionPipeline(ABC):
     # SHARED UTILITY
     # ------------------------------------------------------------------
 
+    def _enrich_in_retrieval_order(
+        self,
+        retrieved: list[QuestionBankItem],
+        target: int,
+        enrich: Callable[[QuestionBankItem], Question | None],
+    ) -> list[tuple[QuestionBankItem, Question]]:
+        """
+        Enrich retrieved items concurrently until target succeed, keeping
+        the first successes in retrieval order.
+
+        Only as many enrichments as there are open slots are in flight, so
+        a failure is replaced by the next candidate. Enrichments still
+        pending when target is reached (or on error) are cancelled.
+        """
+
+        label = self._pipeline_label()
+
+        accepted: list[tuple[QuestionBankItem, Question]] = []
+        pending: deque[tuple[QuestionBankItem, Future[Question | None]]] = deque()
+        candidates = iter(retrieved)
+        unsubmitted = len(retrieved)
+
+        try:
+
+            while True:
+
+                while unsubmitted and len(pending) < target - len(accepted):
+                    item = next(candidates)
+                    unsubmitted -= 1
+                    pending.append((item, submit_llm_call(enrich, item)))
+
+                if len(accepted) >= target or not pending:
+                    break
+
+                item, future = pending.popleft()
+                enriched = future.result()
+
+                if enriched is None:
+                    logger.debug("[%s] Enrichment failed for item: %s", label, item.id)
+                    continue
+
+                accepted.append((item, enriched))
+
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+        return accepted
+
+    @staticmethod
+    def _drop_repeated_prompts(
+        generated: List[Question],
+        existing: List[Question],
+    ) -> List[Question]:
+        """
+        Drop generated questions whose prompt is already in existing.
+        The top-up generation call does not see the up-front call's output.
+        """
+
+        seen = {q.prompt for q in existing}
+        unique: List[Question] = []
+
+        for question in generated:
+            if question.prompt in seen:
+                continue
+            seen.add(question.prompt)
+            unique.append(question)
+
+        return unique
+
     def _build_enrichment_provenance(
         self,
         item: QuestionBankItem,
@@ -7,6 +7,7 @@ from services.question_corpus.mappers.retrieval_candidate_mapper import (
 from services.question_corpus.retrieval.adaptive_retrieval_policy import (
     AdaptiveRetrievalPolicy,
 )
+from services.question_corpus.retrieval.candidate_batch import CandidateBatch
 from services.question_corpus.retrieval.chroma_retrieval_service import (
     ChromaRetrievalService,
 )
@@ -149,23 +150,22 @@ class SqlPipelineRetrievalHelper:
         if not merged_pool:
             return []
 
-        adjusted = self._coverage_engine.apply(
-            candidates=merged_pool,
-            context=context,
+        batch = CandidateBatch(
+            merged_pool,
         )
 
-        adjusted = self._weak_domain_engine.apply(
-            candidates=adjusted,
+        self._coverage_engine.apply_batch(
+            batch=batch,
             context=context,
         )
 
-        adjusted.sort(
-            key=lambda candidate: candidate.adaptive_score or candidate.final_score,
-            reverse=True,
+        self._weak_domain_engine.apply_batch(
+            batch=batch,
+            context=context,
         )
 
         prioritized = self._performance_selector.prioritize(
-            pool=adjusted,
+            pool=batch.ranked(fallback_to_final=True),
             context=context,
         )
         top_candidates = prioritized[: context.target_question_count]
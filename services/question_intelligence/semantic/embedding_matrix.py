@@ -0,0 +1,237 @@
+# services/question_intelligence/semantic/embedding_matrix.py
+
+# EmbeddingMatrix
+#
+# Responsibility:
+# Holds a batch of text embeddings as a row-normalized float32 matrix so that
+# cosine similarity against the whole batch is a single matrix product.
+# Optionally persists the matrix to disk, keyed by a fingerprint of the texts
+# and embedding model, so a corpus is embedded only once across runs.
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class EmbeddingMatrix:
+
+    # =====================================================
+    # CONSTRUCTOR
+    # =====================================================
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        fingerprint: str = "",
+    ) -> None:
+
+        self._vectors = normalize_rows(vectors)
+
+        self._fingerprint = fingerprint
+
+    # =====================================================
+    # FACTORIES
+    # =====================================================
+
+    @classmethod
+    def build(
+        cls,
+        texts: Sequence[str],
+        embedding_model: Embeddings,
+        cache_path: str | Path | None = None,
+    ) -> "EmbeddingMatrix":
+
+        fingerprint = compute_fingerprint(
+            texts,
+            _model_name(embedding_model),
+        )
+
+        if cache_path is not None:
+
+            cached = cls.load(
+                cache_path,
+                expected_fingerprint=fingerprint,
+            )
+
+            if cached is not None:
+                return cached
+
+        vectors = embed_texts(
+            texts,
+            embedding_model,
+        )
+
+        matrix = cls(
+            vectors,
+            fingerprint=fingerprint,
+        )
+
+        if cache_path is not None:
+            matrix.save(cache_path)
+
+        return matrix
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        expected_fingerprint: str | None = None,
+    ) -> "EmbeddingMatrix | None":
+
+        path = Path(path)
+
+        if not path.exists():
+            return None
+
+        try:
+
+            with np.load(path, allow_pickle=False) as data:
+
+                fingerprint = str(data["fingerprint"])
+
+                vectors = data["vectors"]
+
+        except (OSError, KeyError, ValueError):
+            return None
+
+        if expected_fingerprint is not None and fingerprint != expected_fingerprint:
+            return None
+
+        return cls(
+            vectors,
+            fingerprint=fingerprint,
+        )
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    @property
+    def vectors(self) -> np.ndarray:
+
+        return self._vectors
+
+    @property
+    def fingerprint(self) -> str:
+
+        return self._fingerprint
+
+    def __len__(self) -> int:
+
+        return int(self._vectors.shape[0])
+
+    def similarities(
+        self,
+        query_vector: Sequence[float] | np.ndarray,
+    ) -> np.ndarray:
+
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        query = normalize_rows(
+            np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        )[0]
+
+        return self._vectors @ query
+
+    def save(
+        self,
+        path: str | Path,
+    ) -> None:
+
+        path = Path(path)
+
+        path.parent.mkdir(
+            parents=True,
+            exist_ok=True,
+        )
+
+        # np.savez appends ".npz" to bare file names; write through a handle
+        # so the cache lands exactly at the configured path.
+        with path.open("wb") as handle:
+
+            np.savez(
+                handle,
+                vectors=self._vectors,
+                fingerprint=np.array(self._fingerprint),
+            )
+
+
+# =========================================================
+# HELPERS
+# =========================================================
+
+
+def normalize_rows(
+    vectors: np.ndarray,
+) -> np.ndarray:
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+
+    # An empty corpus has no width to reshape to; keep its (0, 0) shape.
+    if matrix.size == 0:
+        return matrix
+
+    norms = np.linalg.norm(
+        matrix,
+        axis=1,
+        keepdims=True,
+    )
+
+    # Zero vectors stay zero so they score 0.0 against everything,
+    # matching the scalar cosine helpers.
+    norms[norms == 0] = 1.0
+
+    return matrix / norms
+
+
+def embed_texts(
+    texts: Sequence[str],
+    embedding_model: Embeddings,
+) -> np.ndarray:
+
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    embeddings: List[List[float]] = embedding_model.embed_documents(
+        list(texts),
+    )
+
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def compute_fingerprint(
+    texts: Sequence[str],
+    model_name: str,
+) -> str:
+
+    digest = hashlib.sha256(model_name.encode())
+
+    for text in texts:
+
+        digest.update(b"\x00")
+
+        digest.update(text.encode())
+
+    return digest.hexdigest()
+
+
+def _model_name(
+    embedding_model: Embeddings,
+) -> str:
+
+    return str(
+        getattr(
+            embedding_model,
+            "model",
+            type(embedding_model).__name__,
+        )
+    )
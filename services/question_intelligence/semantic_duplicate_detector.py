@@ -20,7 +20,7 @@ class SemanticDuplicateDetector:
 
         self._threshold = similarity_threshold
 
-        self._model = EmbeddingModelProvider.get_model()
+        self._embedder = EmbeddingModelProvider.get_embedder()
 
     # =====================================================
     # PUBLIC
@@ -34,9 +34,8 @@ class SemanticDuplicateDetector:
         if len(questions) < 2:
             return []
 
-        embeddings = self._model.encode(
+        embeddings = self._embedder.embed_many(
             questions,
-            convert_to_numpy=True,
         )
 
         duplicates = []
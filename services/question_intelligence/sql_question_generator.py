@@ -23,6 +23,7 @@ from infrastructure.llm.metrics.llm_operation_context import LLMOperationContext
 from infrastructure.llm.metrics.llm_operation_names import QUESTION_GENERATION
 
 from services.sql_engine.sql_database import SQLDatabase
+from services.sql_engine.sql_executor import SQLExecutor
 from services.question_intelligence.mappers.difficulty_mapper import map_corpus_difficulty
 
 from app.core.logger import get_logger
@@ -60,9 +61,15 @@ class SQLQuestionGenerator:
     LLM invocation and domain-mapping responsibilities.
     """
 
-    def __init__(self, llm: LLMPort, schema_definition: SchemaDefinition | None = None) -> None:
+    def __init__(
+        self,
+        llm: LLMPort,
+        schema_definition: SchemaDefinition | None = None,
+        warm_reference_results: bool = True,
+    ) -> None:
         self._llm = llm
         self._db = SQLDatabase(schema_definition)
+        self._sql_executor = SQLExecutor() if warm_reference_results else None
 
         # Lazy import to avoid circular dependency at module level
         from services.question_intelligence.sql_prompt_builder import SQLPromptBuilder
@@ -177,7 +184,7 @@ class SQLQuestionGenerator:
         source_difficulty: int | None = None,
     ) -> Question:
 
-        return Question(
+        question = Question(
             id=str(uuid.uuid4()),
             area=InterviewArea.TECH_DATABASE,
             type=QuestionType.DATABASE,
@@ -197,3 +204,18 @@ class SQLQuestionGenerator:
                 for i, tc in enumerate(item.test_cases)
             ],
         )
+
+        self._warm_reference_results(question)
+
+        return question
+
+    def _warm_reference_results(self, question: Question) -> None:
+        """Cache reference query results so the first submission is cheaper."""
+
+        if self._sql_executor is None:
+            return
+
+        try:
+            self._sql_executor.warm(question)
+        except Exception as e:
+            logger.warning("[SQL warm-up] Reference result warm-up failed: %s", e)
@@ -0,0 +1,128 @@
+# services/sql_engine/reference_result_cache.py
+
+# ReferenceResultCache
+#
+# Responsibility:
+# Memoizes the normalized result of a SQL test case's reference query.
+# The reference result depends only on (schema, seed, reference query), so it
+# is keyed by a content hash of those three and shared across submissions.
+# Entries hold both the normalized rows and their pre-sorted form so that
+# unordered comparisons only sort the candidate side.
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+NormalizedRow = Tuple[Optional[str], ...]
+
+
+@dataclass(frozen=True)
+class ReferenceResult:
+    rows: list[NormalizedRow]
+    sorted_rows: list[NormalizedRow]
+
+    @classmethod
+    def from_rows(cls, rows: list[NormalizedRow]) -> "ReferenceResult":
+        return cls(rows=list(rows), sorted_rows=sort_rows(rows))
+
+
+class ReferenceResultCache:
+    """Thread-safe LRU cache of reference query results."""
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, ReferenceResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    @staticmethod
+    def build_key(dataset_key: str, reference_query: str) -> str:
+        """
+        ``dataset_key`` identifies the (schema, seed) pair, e.g.
+        ``SQLSandboxPool.template_key``.
+        """
+        payload = f"{dataset_key}\x00{reference_query.strip()}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> ReferenceResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: str, rows: list[NormalizedRow]) -> ReferenceResult:
+        entry = ReferenceResult.from_rows(rows)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], list[NormalizedRow]],
+    ) -> ReferenceResult:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, compute())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+
+def sort_rows(rows: list[NormalizedRow]) -> list[NormalizedRow]:
+    """Canonical order for unordered comparison; NULLs sort before values."""
+
+    return sorted(
+        rows,
+        key=lambda row: tuple((value is not None, value or "") for value in row),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_default_reference_cache() -> ReferenceResultCache:
+    """Process-wide cache shared by every SQLEvaluator."""
+
+    return ReferenceResultCache()
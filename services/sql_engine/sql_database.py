@@ -3,10 +3,18 @@
 import sqlite3
 
 from services.sql_engine.schema_definition import SchemaDefinition
+from services.sql_engine.sql_sandbox_pool import (
+    SQLSandboxPool,
+    get_default_sandbox_pool,
+)
 
 
 class SQLDatabase:
-    def __init__(self, schema_definition: SchemaDefinition | None = None) -> None:
+    def __init__(
+        self,
+        schema_definition: SchemaDefinition | None = None,
+        sandbox_pool: SQLSandboxPool | None = None,
+    ) -> None:
         if schema_definition is None:
             from services.sql_engine.schema_registry import SchemaRegistry
             from domain.contracts.interview.business_context import BusinessContext
@@ -15,8 +23,11 @@ class SQLDatabase:
         self._schema_sql = schema_definition.schema_sql
         self._seed_sql = schema_definition.seed_sql
 
-        self._connection = sqlite3.connect(":memory:")
-        self._initialize()
+        self._sandbox_pool = (
+            sandbox_pool if sandbox_pool is not None else get_default_sandbox_pool()
+        )
+
+        self._connection = self.get_fresh_connection()
 
     # =====================================================
     # PUBLIC API
@@ -33,20 +44,6 @@ class SQLDatabase:
         return self._seed_sql
 
     def get_fresh_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(":memory:")
-        cursor = conn.cursor()
-
-        cursor.executescript(self._schema_sql)
-        cursor.executescript(self._seed_sql)
-
-        return conn
-
-    # =====================================================
-    # INTERNAL
-    # =====================================================
-
-    def _initialize(self) -> None:
-        cursor = self._connection.cursor()
-        cursor.executescript(self._schema_sql)
-        cursor.executescript(self._seed_sql)
-        self._connection.commit()
+        # Cloned from the pool's cached template; schema and seed scripts
+        # run once per (schema, seed) pair per process.
+        return self._sandbox_pool.clone(self._schema_sql, self._seed_sql)
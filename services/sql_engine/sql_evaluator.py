@@ -2,50 +2,85 @@
 
 from app.core.logger import get_logger
 
+from services.sql_engine.reference_result_cache import (
+    ReferenceResult,
+    ReferenceResultCache,
+    get_default_reference_cache,
+    sort_rows,
+)
+
 logger = get_logger(__name__)
 
 
 class SQLEvaluator:
 
+    def __init__(self, reference_cache: ReferenceResultCache | None = None):
+        self._reference_cache = (
+            reference_cache
+            if reference_cache is not None
+            else get_default_reference_cache()
+        )
+
     def evaluate(
         self,
         cursor,
         candidate_query: str,
         reference_query: str,
         ordered: bool = True,
+        dataset_key: str | None = None,
     ):
+        """
+        ``dataset_key`` identifies the (schema, seed) pair the cursor was
+        built from. When given, the reference result is served from the
+        shared cache and the reference query runs at most once per dataset.
+        """
 
         # ---------------------------------------------------------
-        # Candidate query
+        # Reference query (before the candidate, on pristine data)
         # ---------------------------------------------------------
 
-        cursor.execute(candidate_query)
-        candidate_rows = cursor.fetchall()
+        reference = self.reference_result(
+            cursor,
+            reference_query,
+            dataset_key=dataset_key,
+        )
 
         # ---------------------------------------------------------
-        # Reference query
-        # ---------------------------------------------------------
-
-        cursor.execute(reference_query)
-        reference_rows = cursor.fetchall()
-
-        # ---------------------------------------------------------
-        # Normalize results
+        # Candidate query
         # ---------------------------------------------------------
 
-        candidate_rows = self._normalize(candidate_rows)
-        reference_rows = self._normalize(reference_rows)
+        cursor.execute(candidate_query)
+        candidate_rows = self._normalize(cursor.fetchall())
 
         # ---------------------------------------------------------
         # Compare
         # ---------------------------------------------------------
 
         if ordered:
-            success = candidate_rows == reference_rows
+            success = candidate_rows == reference.rows
         else:
-            success = sorted(candidate_rows) == sorted(reference_rows)
+            success = sort_rows(candidate_rows) == reference.sorted_rows
+
+        return success, candidate_rows, list(reference.rows)
+
+    def reference_result(
+        self,
+        cursor,
+        reference_query: str,
+        dataset_key: str | None = None,
+    ) -> ReferenceResult:
+
+        def compute():
+            cursor.execute(reference_query)
+            return self._normalize(cursor.fetchall())
+
+        if dataset_key is None:
+            return ReferenceResult.from_rows(compute())
 
-        return success, candidate_rows, reference_rows
+        return self._reference_cache.get_or_compute(
+            ReferenceResultCache.build_key(dataset_key, reference_query),
+            compute,
+        )
 
     # ---------------------------------------------------------
 
@@ -1,6 +1,5 @@
 # services/sql_engine/sql_executor.py
 
-import sqlite3
 import time
 import traceback
 
@@ -17,6 +16,11 @@ from domain.contracts.execution.execution_test_result import (
 )
 
 from services.sql_engine.sql_evaluator import SQLEvaluator
+from services.sql_engine.sql_sandbox_pool import (
+    SQLSandbox,
+    SQLSandboxPool,
+    get_default_sandbox_pool,
+)
 
 from app.core.logger import get_logger
 
@@ -25,8 +29,15 @@ logger = get_logger(__name__)
 
 class SQLExecutor:
 
-    def __init__(self):
-        self._evaluator = SQLEvaluator()
+    def __init__(
+        self,
+        sandbox_pool: SQLSandboxPool | None = None,
+        evaluator: SQLEvaluator | None = None,
+    ):
+        self._evaluator = evaluator if evaluator is not None else SQLEvaluator()
+        self._sandbox_pool = (
+            sandbox_pool if sandbox_pool is not None else get_default_sandbox_pool()
+        )
 
     # ---------------------------------------------------------
 
@@ -36,69 +47,16 @@ class SQLExecutor:
 
         try:
 
-            conn = sqlite3.connect(":memory:")
-            cursor = conn.cursor()
-
-            # -----------------------------------------------------
-            # SCHEMA + DATA
-            # -----------------------------------------------------
-
-            if question.db_schema:
-                cursor.executescript(question.db_schema)
-
-            if question.db_seed_data:
-                cursor.executescript(question.db_seed_data)
-
             # -----------------------------------------------------
-            # MULTI TEST EXECUTION (NEW)
+            # SCHEMA + DATA (cloned from the cached template)
             # -----------------------------------------------------
 
-            test_results = []
-
-            sql_tests = getattr(question, "sql_test_cases", []) or []
-
-            for idx, test in enumerate(sql_tests):
-
-                try:
-
-                    effective_ordered = (
-                        test.ordered
-                        if test.ordered is not None
-                        else question.expected_ordered
-                    )
-
-                    success, candidate_rows, expected_rows = self._evaluator.evaluate(
-                        cursor,
-                        candidate_query=query,
-                        reference_query=test.expected_query,
-                        ordered=effective_ordered,
-                    )
+            with self._sandbox_pool.lease(
+                question.db_schema or "",
+                question.db_seed_data or "",
+            ) as sandbox:
 
-                    status = TestStatus.PASSED if success else TestStatus.FAILED
-
-                    test_results.append(
-                        TestExecutionResult(
-                            id=idx,
-                            type=TestType.VISIBLE,
-                            status=status,
-                            expected=expected_rows,
-                            actual=candidate_rows,
-                            error=None,
-                        )
-                    )
-
-                except Exception as e:
-
-                    test_results.append(
-                        TestExecutionResult(
-                            id=idx,
-                            type=TestType.VISIBLE,
-                            status=TestStatus.ERROR,
-                            expected=None,
-                            actual=None,
-                            error=str(e),
-                        )
-                    )
+                test_results = self._run_tests(sandbox, question, query)
 
             # -----------------------------------------------------
             # AGGREGATION
@@ -110,7 +68,6 @@ class SQLExecutor:
             success = passed_tests == total_tests and total_tests > 0
 
             duration = int((time.time() - start) * 1000)
-            conn.close()
 
             status = (
                 ExecutionStatus.SUCCESS if success else ExecutionStatus.FAILED_TESTS
@@ -146,3 +103,92 @@ class SQLExecutor:
                 total_tests=0,
                 test_results=[],
             )
+
+    # ---------------------------------------------------------
+
+    def warm(self, question: Question) -> None:
+        """
+        Pre-build the question's sandbox template and cache the result of
+        every reference query, so the first submission runs only the
+        candidate query.
+        """
+
+        with self._sandbox_pool.lease(
+            question.db_schema or "",
+            question.db_seed_data or "",
+        ) as sandbox:
+
+            for test in getattr(question, "sql_test_cases", []) or []:
+
+                with sandbox.isolated_case() as cursor:
+                    self._evaluator.reference_result(
+                        cursor,
+                        test.expected_query,
+                        dataset_key=sandbox.template_key,
+                    )
+
+    # ---------------------------------------------------------
+
+    def _run_tests(
+        self,
+        sandbox: SQLSandbox,
+        question: Question,
+        query: str,
+    ) -> list[TestExecutionResult]:
+
+        # -----------------------------------------------------
+        # MULTI TEST EXECUTION (NEW)
+        # -----------------------------------------------------
+
+        test_results = []
+
+        sql_tests = getattr(question, "sql_test_cases", []) or []
+
+        for idx, test in enumerate(sql_tests):
+
+            try:
+
+                effective_ordered = (
+                    test.ordered
+                    if test.ordered is not None
+                    else question.expected_ordered
+                )
+
+                # Each case runs in a rolled-back savepoint so it sees
+                # pristine seed data even if a previous case mutated it.
+                with sandbox.isolated_case() as cursor:
+                    success, candidate_rows, expected_rows = self._evaluator.evaluate(
+                        cursor,
+                        candidate_query=query,
+                        reference_query=test.expected_query,
+                        ordered=effective_ordered,
+                        dataset_key=sandbox.template_key,
+                    )
+
+                status = TestStatus.PASSED if success else TestStatus.FAILED
+
+                test_results.append(
+                    TestExecutionResult(
+                        id=idx,
+                        type=TestType.VISIBLE,
+                        status=status,
+                        expected=expected_rows,
+                        actual=candidate_rows,
+                        error=None,
+                    )
+                )
+
+            except Exception as e:
+
+                test_results.append(
+                    TestExecutionResult(
+                        id=idx,
+                        type=TestType.VISIBLE,
+                        status=TestStatus.ERROR,
+                        expected=None,
+                        actual=None,
+                        error=str(e),
+                    )
+                )
+
+        return test_results
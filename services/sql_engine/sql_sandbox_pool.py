@@ -0,0 +1,414 @@
+# services/sql_engine/sql_sandbox_pool.py
+
+# SQLSandboxPool
+#
+# Responsibility:
+# Provides pristine in-memory SQLite sandboxes for a (schema, seed) pair
+# without re-running the DDL/DML scripts on every submission.
+#
+# - One template database per schema+seed content hash, built once (LRU-bounded).
+# - Sandboxes are cloned from the template with sqlite3.Connection.backup.
+# - Each template has its own lock for building, cloning and closing it; the
+#   pool-wide lock only guards the dictionaries, so a slow template build
+#   never delays sandboxes for other schemas.
+# - A bounded number of cloned connections per template is kept for reuse.
+# - Each test case runs inside a SAVEPOINT that is rolled back, so the next
+#   case (and the next lease) sees the seed data unchanged.
+# - A sandbox whose savepoint could not be rolled back (e.g. the submission
+#   issued COMMIT) is tainted and discarded instead of being pooled.
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+
+_CASE_SAVEPOINT = "sandbox_case"
+
+
+class SQLSandbox:
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        template_key: str,
+    ) -> None:
+
+        self._connection = connection
+
+        self._template_key = template_key
+
+        self._tainted = False
+
+    # =====================================================
+    # PUBLIC
+    # =====================================================
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    @property
+    def template_key(self) -> str:
+        return self._template_key
+
+    @property
+    def tainted(self) -> bool:
+        return self._tainted
+
+    def cursor(self) -> sqlite3.Cursor:
+        return self._connection.cursor()
+
+    @contextmanager
+    def isolated_case(self) -> Iterator[sqlite3.Cursor]:
+        """Run one test case inside a savepoint that is always rolled back."""
+
+        self._connection.execute(f"SAVEPOINT {_CASE_SAVEPOINT}")
+
+        cursor = self._connection.cursor()
+
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._rollback_case()
+
+    # =====================================================
+    # INTERNAL
+    # =====================================================
+
+    def _rollback_case(self) -> None:
+
+        try:
+            self._connection.execute(f"ROLLBACK TO {_CASE_SAVEPOINT}")
+            self._connection.execute(f"RELEASE {_CASE_SAVEPOINT}")
+        except sqlite3.Error:
+            # The savepoint is gone (COMMIT/RELEASE issued by the query):
+            # the data may have changed, so never reuse this connection.
+            self._tainted = True
+
+        if self._connection.in_transaction:
+            self._tainted = True
+
+
+class _Template:
+    """A template database slot; built lazily by the first caller for its key."""
+
+    def __init__(self) -> None:
+
+        self.lock = threading.Lock()
+
+        self.connection: sqlite3.Connection | None = None
+
+        self.closed = False
+
+    def close(self) -> None:
+
+        with self.lock:
+
+            self.closed = True
+
+            if self.connection is not None:
+                self.connection.close()
+
+
+class SQLSandboxPool:
+    """Thread-safe cache of template databases plus pooled clones."""
+
+    DEFAULT_MAX_TEMPLATES = 32
+
+    DEFAULT_MAX_IDLE_PER_TEMPLATE = 4
+
+    def __init__(
+        self,
+        max_templates: int = DEFAULT_MAX_TEMPLATES,
+        max_idle_per_template: int = DEFAULT_MAX_IDLE_PER_TEMPLATE,
+    ) -> None:
+
+        if max_templates < 1:
+            raise ValueError("max_templates must be >= 1")
+
+        if max_idle_per_template < 0:
+            raise ValueError("max_idle_per_template must be >= 0")
+
+        self._max_templates = max_templates
+
+        self._max_idle = max_idle_per_template
+
+        self._templates: OrderedDict[str, _Template] = OrderedDict()
+
+        self._idle: dict[str, list[sqlite3.Connection]] = {}
+
+        self._lock = threading.Lock()
+
+    # =====================================================
+    # PUBLIC API
+    # =====================================================
+
+    @staticmethod
+    def template_key(
+        schema_sql: str,
+        seed_sql: str,
+    ) -> str:
+
+        payload = f"{schema_sql}\x00{seed_sql}"
+
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @contextmanager
+    def lease(
+        self,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> Iterator[SQLSandbox]:
+        """Borrow a pristine sandbox; it returns to the pool on exit."""
+
+        key = self.template_key(schema_sql, seed_sql)
+
+        sandbox = SQLSandbox(
+            self._acquire(key, schema_sql, seed_sql),
+            key,
+        )
+
+        try:
+            yield sandbox
+        finally:
+            self._release(sandbox)
+
+    def clone(
+        self,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> sqlite3.Connection:
+        """Return a standalone pristine connection owned by the caller."""
+
+        key = self.template_key(schema_sql, seed_sql)
+
+        target = sqlite3.connect(":memory:")
+
+        self._copy_template(key, schema_sql, seed_sql, target)
+
+        return target
+
+    def warm(
+        self,
+        schema_sql: str,
+        seed_sql: str,
+        count: int | None = None,
+    ) -> None:
+        """Build the template and pre-clone up to ``count`` idle sandboxes."""
+
+        key = self.template_key(schema_sql, seed_sql)
+
+        wanted = self._max_idle if count is None else min(count, self._max_idle)
+
+        while True:
+
+            with self._lock:
+                if len(self._idle.get(key, [])) >= wanted:
+                    break
+
+            connection = self._new_sandbox_connection(key, schema_sql, seed_sql)
+
+            with self._lock:
+                if key in self._templates:
+                    self._idle.setdefault(key, []).append(connection)
+                    continue
+
+            connection.close()
+            break
+
+    def idle_count(
+        self,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> int:
+
+        key = self.template_key(schema_sql, seed_sql)
+
+        with self._lock:
+            return len(self._idle.get(key, []))
+
+    def template_count(self) -> int:
+
+        with self._lock:
+            return len(self._templates)
+
+    # =====================================================
+    # INTERNAL
+    # =====================================================
+
+    def _acquire(
+        self,
+        key: str,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> sqlite3.Connection:
+
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+
+        return self._new_sandbox_connection(key, schema_sql, seed_sql)
+
+    def _release(
+        self,
+        sandbox: SQLSandbox,
+    ) -> None:
+
+        connection = sandbox.connection
+
+        if not sandbox.tainted:
+
+            with self._lock:
+
+                idle = self._idle.get(sandbox.template_key)
+
+                # Only pool clones whose template is still cached; an evicted
+                # template's clones would otherwise outlive it.
+                if (
+                    sandbox.template_key in self._templates
+                    and idle is not None
+                    and len(idle) < self._max_idle
+                ):
+                    idle.append(connection)
+                    return
+
+        connection.close()
+
+    def _new_sandbox_connection(
+        self,
+        key: str,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> sqlite3.Connection:
+
+        # Autocommit mode so SAVEPOINT/ROLLBACK TO are not mixed with the
+        # sqlite3 module's implicit transactions.
+        connection = sqlite3.connect(
+            ":memory:",
+            isolation_level=None,
+            check_same_thread=False,
+        )
+
+        self._copy_template(key, schema_sql, seed_sql, connection)
+
+        return connection
+
+    def _copy_template(
+        self,
+        key: str,
+        schema_sql: str,
+        seed_sql: str,
+        target: sqlite3.Connection,
+    ) -> None:
+
+        while True:
+
+            evicted: list[_Template] = []
+
+            with self._lock:
+
+                template = self._templates.get(key)
+
+                if template is None:
+                    template = _Template()
+                    evicted = self._store_template(key, template)
+                else:
+                    self._templates.move_to_end(key)
+
+            for stale in evicted:
+                stale.close()
+
+            with template.lock:
+
+                if template.closed:
+                    # Evicted between lookup and lock: look it up again.
+                    continue
+
+                if template.connection is None:
+                    try:
+                        template.connection = self._build_template(schema_sql, seed_sql)
+                    except Exception:
+                        template.closed = True
+                        self._forget_template(key, template)
+                        raise
+
+                template.connection.backup(target)
+
+                return
+
+    def _build_template(
+        self,
+        schema_sql: str,
+        seed_sql: str,
+    ) -> sqlite3.Connection:
+
+        template = sqlite3.connect(":memory:", check_same_thread=False)
+
+        try:
+            cursor = template.cursor()
+
+            if schema_sql:
+                cursor.executescript(schema_sql)
+
+            if seed_sql:
+                cursor.executescript(seed_sql)
+
+            template.commit()
+
+        except Exception:
+            template.close()
+            raise
+
+        return template
+
+    def _store_template(
+        self,
+        key: str,
+        template: _Template,
+    ) -> list[_Template]:
+        """Insert template (caller holds the pool lock); returns evicted ones to close."""
+
+        self._templates[key] = template
+
+        self._idle.setdefault(key, [])
+
+        evicted: list[_Template] = []
+
+        while len(self._templates) > self._max_templates:
+
+            evicted_key, evicted_template = self._templates.popitem(last=False)
+
+            evicted.append(evicted_template)
+
+            # Idle clones are only reachable through the pool, so they can
+            # be closed right away.
+            for connection in self._idle.pop(evicted_key, []):
+                connection.close()
+
+        return evicted
+
+    def _forget_template(
+        self,
+        key: str,
+        template: _Template,
+    ) -> None:
+
+        with self._lock:
+
+            if self._templates.get(key) is template:
+                del self._templates[key]
+                self._idle.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def get_default_sandbox_pool() -> SQLSandboxPool:
+    """Process-wide pool shared by SQLExecutor and SQLDatabase."""
+
+    return SQLSandboxPool()
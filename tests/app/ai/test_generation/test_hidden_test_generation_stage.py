@@ -0,0 +1,126 @@
+# tests/app/ai/test_generation/test_hidden_test_generation_stage.py
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.contracts.execution.coding_test_case import CodingTestCase
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.question.question import Question, QuestionDifficulty, QuestionType
+from app.ai.test_generation.hidden_test_generation_stage import HiddenTestGenerationStage
+
+_TIMEOUT = 5
+
+
+def _question(question_id: str, question_type: QuestionType = QuestionType.CODING) -> Question:
+
+    return Question(
+        id=question_id,
+        area=InterviewArea.TECH_CASE_STUDY,
+        type=question_type,
+        prompt=f"Prompt {question_id}",
+        difficulty=QuestionDifficulty.MEDIUM,
+    )
+
+
+def _test_generator(generate_tests) -> MagicMock:
+
+    test_generator = MagicMock()
+    test_generator.cache_key.side_effect = lambda question, num_tests: f"{question.id}:{num_tests}"
+    test_generator.generate_tests.side_effect = generate_tests
+
+    return test_generator
+
+
+def _tests_for(question: Question) -> list[CodingTestCase]:
+
+    return [CodingTestCase(args=[question.id], expected=question.id)]
+
+
+def test_coding_questions_are_generated_concurrently():
+
+    # Each generation only returns once the other one has started.
+    barrier = threading.Barrier(2, timeout=_TIMEOUT)
+
+    def generate_tests(question, num_tests, domain_profile):
+        barrier.wait()
+        return _tests_for(question)
+
+    stage = HiddenTestGenerationStage(_test_generator(generate_tests))
+
+    futures = stage.submit_all([_question("a"), _question("b")])
+
+    assert [f.result(_TIMEOUT).hidden_tests[0].expected for f in futures] == ["a", "b"]
+
+
+def test_identical_cache_keys_share_in_flight_work():
+
+    release = threading.Event()
+
+    def generate_tests(question, num_tests, domain_profile):
+        assert release.wait(_TIMEOUT)
+        return _tests_for(question)
+
+    test_generator = _test_generator(generate_tests)
+    stage = HiddenTestGenerationStage(test_generator, num_tests=2, domain_profile="fintech")
+
+    first = stage.submit(_question("a"))
+    second = stage.submit(_question("a"))
+    release.set()
+
+    assert first.result(_TIMEOUT).hidden_tests == second.result(_TIMEOUT).hidden_tests
+    test_generator.generate_tests.assert_called_once_with(
+        _question("a"), num_tests=2, domain_profile="fintech"
+    )
+
+    # Finished work is not reused; repeats go through generate_tests (and its cache).
+    stage.enrich(_question("a"))
+    assert test_generator.generate_tests.call_count == 2
+
+
+def test_non_coding_questions_pass_through():
+
+    test_generator = _test_generator(_tests_for)
+    stage = HiddenTestGenerationStage(test_generator)
+    question = _question("w", QuestionType.WRITTEN)
+
+    assert stage.enrich(question) is question
+    test_generator.generate_tests.assert_not_called()
+
+
+def test_generation_errors_reach_the_caller():
+
+    def generate_tests(question, num_tests, domain_profile):
+        raise ValueError("CodingSpec required for test generation")
+
+    stage = HiddenTestGenerationStage(_test_generator(generate_tests))
+
+    with pytest.raises(ValueError, match="CodingSpec"):
+        stage.enrich(_question("a"))
+
+
+def test_separate_stages_share_in_flight_work_per_domain_profile():
+
+    release = threading.Event()
+
+    def generate_tests(question, num_tests, domain_profile):
+        assert release.wait(_TIMEOUT)
+        return _tests_for(question)
+
+    test_generator = _test_generator(generate_tests)
+    first_interview = HiddenTestGenerationStage(test_generator, domain_profile="fintech")
+    second_interview = HiddenTestGenerationStage(test_generator, domain_profile="fintech")
+    other_domain = HiddenTestGenerationStage(test_generator, domain_profile="retail")
+
+    futures = [
+        first_interview.submit(_question("shared")),
+        second_interview.submit(_question("shared")),
+        other_domain.submit(_question("shared")),
+    ]
+    release.set()
+
+    for future in futures:
+        future.result(_TIMEOUT)
+
+    assert test_generator.generate_tests.call_count == 2
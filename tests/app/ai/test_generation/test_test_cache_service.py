@@ -0,0 +1,126 @@
+# tests/app/ai/test_generation/test_test_cache_service.py
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+import app.ai.test_generation.test_cache_service as test_cache_module
+from app.ai.test_generation.test_cache_service import TestCacheService
+from domain.contracts.execution.coding_test_case import CodingTestCase
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.question.question import Question, QuestionType
+
+
+def _question(question_id: str) -> Question:
+
+    return Question(
+        id=question_id,
+        area=InterviewArea.TECH_CODING,
+        type=QuestionType.CODING,
+        prompt=f"Prompt {question_id}",
+        reference_solution="def f(x): return x",
+    )
+
+
+def _tests(value) -> list[CodingTestCase]:
+
+    return [CodingTestCase(args=[value], expected=value)]
+
+
+@pytest.fixture()
+def paths(tmp_path):
+
+    return {
+        "db_path": tmp_path / "ai_test_cache.db",
+        "legacy_json_path": tmp_path / "ai_test_cache.json",
+    }
+
+
+def _row_count(db_path) -> int:
+
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM test_cache").fetchone()[0]
+
+
+def test_entries_are_shared_between_instances(paths):
+
+    TestCacheService(**paths).store_tests(_question("a"), 3, _tests(1))
+
+    assert TestCacheService(**paths).get_tests(_question("a"), 3) == _tests(1)
+    assert TestCacheService(**paths).get_tests(_question("a"), 2) is None
+
+
+def test_store_replaces_the_entry_for_its_key(paths):
+
+    cache = TestCacheService(**paths)
+
+    cache.store_tests(_question("a"), 3, _tests(1))
+    cache.store_tests(_question("a"), 3, _tests(2))
+
+    assert cache.get_tests(_question("a"), 3) == _tests(2)
+    assert _row_count(paths["db_path"]) == 1
+
+
+def test_legacy_json_is_migrated_once(paths):
+
+    key = TestCacheService(**paths).cache_key(_question("a"), 3)
+    paths["legacy_json_path"].write_text(json.dumps({key: [{"args": [7], "expected": 7}]}))
+
+    assert TestCacheService(**paths).get_tests(_question("a"), 3) == _tests(7)
+
+    other = TestCacheService(**paths).cache_key(_question("b"), 3)
+    paths["legacy_json_path"].write_text(json.dumps({other: [{"args": [8], "expected": 8}]}))
+
+    assert TestCacheService(**paths).get_tests(_question("b"), 3) is None
+
+
+def test_version_bump_drops_entries_of_other_versions(paths, monkeypatch):
+
+    TestCacheService(**paths).store_tests(_question("a"), 3, _tests(1))
+
+    class NextVersionCache(TestCacheService):
+        CACHE_VERSION = TestCacheService.CACHE_VERSION + 1
+
+    # A new process opening the database with the bumped version.
+    monkeypatch.setattr(test_cache_module, "_PREPARED_DATABASES", set())
+    NextVersionCache(**paths).get_tests(_question("a"), 3)
+
+    assert _row_count(paths["db_path"]) == 0
+
+
+def test_least_recently_used_entries_are_evicted(paths):
+
+    class EagerEvictionCache(TestCacheService):
+        _EVICT_EVERY = 1
+
+    cache = EagerEvictionCache(max_entries=2, **paths)
+
+    cache.store_tests(_question("a"), 3, _tests(1))
+    cache.store_tests(_question("b"), 3, _tests(2))
+    cache.get_tests(_question("a"), 3)
+    cache.store_tests(_question("c"), 3, _tests(3))
+
+    assert cache.get_tests(_question("a"), 3) == _tests(1)
+    assert cache.get_tests(_question("b"), 3) is None
+    assert cache.get_tests(_question("c"), 3) == _tests(3)
+
+
+def test_concurrent_stores_keep_every_entry(paths):
+
+    def store(worker: int) -> None:
+        cache = TestCacheService(**paths)
+        for i in range(10):
+            cache.store_tests(_question(f"{worker}-{i}"), 3, _tests(i))
+
+    threads = [threading.Thread(target=store, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cache = TestCacheService(**paths)
+
+    assert _row_count(paths["db_path"]) == 80
+    assert cache.get_tests(_question("7-9"), 3) == _tests(9)
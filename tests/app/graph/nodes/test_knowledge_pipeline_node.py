@@ -198,7 +198,7 @@ class TestRunKnowledgePipeline:
         store = _make_populated_store()
         state = _state_with_store(store=store)
         with patch(
-            "app.graph.nodes.reasoner_node.build_default_knowledge_pipeline",
+            "app.graph.nodes.reasoner_node.get_knowledge_pipeline_registry",
             side_effect=RuntimeError("pipeline failure"),
         ):
             result = _run_knowledge_pipeline(state=state, updated_observation_store=store)
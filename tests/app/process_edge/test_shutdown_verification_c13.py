@@ -61,6 +61,7 @@ def _settings(**overrides: object) -> Settings:
         "health_llm_probe_enabled": False,
         "health_db_probe_enabled": False,
         "health_sandbox_probe_enabled": True,
+        "health_retrieval_probe_enabled": False,
     }
     base.update(overrides)
     return Settings(**base)
@@ -57,6 +57,7 @@ class TestMainUsesSettings:
             lambda demo, settings=None: mock_asgi,
         )
         monkeypatch.setattr("app.main.run_process_app", mock_run)
+        monkeypatch.setattr("app.main.warm_corpus_backend", MagicMock())
 
         from app.main import main
 
@@ -81,6 +82,7 @@ class TestMainUsesSettings:
             lambda demo, settings=None: MagicMock(),
         )
         monkeypatch.setattr("app.main.run_process_app", MagicMock())
+        monkeypatch.setattr("app.main.warm_corpus_backend", MagicMock())
 
         from app.main import main
 
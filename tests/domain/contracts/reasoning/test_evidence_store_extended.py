@@ -8,7 +8,7 @@ from domain.contracts.reasoning.evidence_signal import EvidenceSignal
 from domain.contracts.reasoning.evidence_polarity import EvidencePolarity
 from domain.contracts.reasoning.evidence_source import EvidenceSource
 from domain.contracts.reasoning.evidence_type import EvidenceType
-from domain.contracts.reasoning.evidence_store import EvidenceStore, EvidenceStoreStatistics, _MAX_SIGNALS
+from domain.contracts.reasoning.evidence_store import EvidenceStore, EvidenceStoreStatistics
 from domain.contracts.reasoning.profile_dimension import ProfileDimension
 
 
@@ -52,11 +52,11 @@ def test_append_preserves_existing():
     assert new_store.signals[1] == s2
 
 
-def test_append_at_capacity_raises():
-    signals = [_sig(i) for i in range(_MAX_SIGNALS)]
-    store = EvidenceStore(signals=signals)
-    with pytest.raises(ValueError, match="capacity"):
-        store.append(_sig(_MAX_SIGNALS))
+def test_append_beyond_former_capacity():
+    store = EvidenceStore(signals=[_sig(i) for i in range(200)])
+    new_store = store.append(_sig(200))
+    assert len(new_store.signals) == 201
+    assert new_store.signals[-1] == _sig(200)
 
 
 def test_append_original_immutable():
@@ -187,3 +187,89 @@ def test_statistics_is_frozen():
     assert isinstance(stats, EvidenceStoreStatistics)
     with pytest.raises((ValidationError, TypeError)):
         stats.total = 99
+
+
+# --- extend / shared index ---
+
+def test_extend_appends_in_order():
+    s0, s1, s2 = _sig(0), _sig(1), _sig(2)
+    store = EvidenceStore(signals=[s0]).extend([s1, s2])
+    assert store.signals == [s0, s1, s2]
+
+
+def test_extend_empty_returns_same_store():
+    store = EvidenceStore(signals=[_sig(0)])
+    assert store.extend([]) is store
+
+
+def test_extend_validates_new_signals():
+    with pytest.raises(ValidationError):
+        EvidenceStore().extend([{"id": "x"}])
+
+
+def test_lookups_on_parent_ignore_signals_appended_later():
+    parent = EvidenceStore(signals=[_sig(0)])
+    assert parent.by_question(1) == []
+    child = parent.append(_sig(1))
+    assert child.by_question(1) == [_sig(1)]
+    assert parent.by_question(1) == []
+    assert not parent.contains_identity(_sig(1))
+    assert child.contains_identity(_sig(1))
+
+
+def test_diverging_appends_keep_separate_indexes():
+    parent = EvidenceStore(signals=[_sig(0)])
+    a = parent.append(_sig(1))
+    b = parent.append(_sig(2))
+    assert a.by_question(2) == []
+    assert b.by_question(1) == []
+    assert b.by_question(2) == [_sig(2)]
+    assert [s.question_index for s in a.recent(5)] == [1, 0]
+    assert [s.question_index for s in b.recent(5)] == [2, 0]
+
+
+def test_model_copy_with_new_signals_is_reindexed():
+    store = EvidenceStore(signals=[_sig(0)])
+    assert store.by_question(0) == [_sig(0)]
+    copy = store.model_copy(update={"signals": [_sig(1)]})
+    assert copy.by_question(0) == []
+    assert copy.by_question(1) == [_sig(1)]
+    assert store.by_question(0) == [_sig(0)]
+
+
+def test_index_does_not_affect_equality_or_copies():
+    import copy
+    import pickle
+
+    built = EvidenceStore().append(_sig(0)).append(_sig(1))
+    built.by_question(0)
+    assert built == EvidenceStore(signals=[_sig(0), _sig(1)])
+    for clone in (copy.deepcopy(built), pickle.loads(pickle.dumps(built))):
+        assert clone == built
+        assert clone.by_question(1) == [_sig(1)]
+
+
+def test_recent_ties_keep_insertion_order():
+    a = _sig(0, ts=3)
+    b = _sig(1, ts=5)
+    c = _sig(2, ts=3)
+    store = EvidenceStore(signals=[a, b, c])
+    assert store.recent(3) == [b, a, c]
+    assert store.recent(2) == [b, a]
+
+
+def test_lookups_match_linear_scan_across_many_appends():
+    dims = [ProfileDimension.TECHNICAL_DEPTH, ProfileDimension.COMMUNICATION]
+    types = [EvidenceType.SHALLOW_ANSWER, EvidenceType.KNOWLEDGE_GAP]
+    store = EvidenceStore()
+    for i in range(300):
+        store = store.append(_sig(i % 7, dimension=dims[i % 2], signal_type=types[i % 3 % 2], ts=i % 11))
+        store.by_question(0)
+    for q in range(7):
+        assert store.by_question(q) == [s for s in store.signals if s.question_index == q]
+    for d in dims:
+        assert store.by_dimension(d) == [s for s in store.signals if s.dimension == d]
+    for t in types:
+        assert store.by_type(t) == [s for s in store.signals if s.signal_type == t]
+    expected = sorted(store.signals, key=lambda s: s.timestamp_question_index, reverse=True)
+    assert store.recent(40) == expected[:40]
@@ -0,0 +1,173 @@
+# tests/domain/observation/runtime/test_in_memory_observation_store.py
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from domain.contracts.observation.observation_filter import ObservationFilter
+from domain.contracts.observation.observation_origin import ObservationOrigin
+from domain.contracts.observation.observation_query import (
+    ObservationQuery,
+    ObservationSortField,
+    ObservationSortOrder,
+)
+from domain.contracts.observation.observation_status import ObservationStatus
+from domain.contracts.observation.observation_type import ObservationType
+from domain.observation.runtime.in_memory_observation_store import InMemoryObservationStore
+from domain.observation.runtime.observation_collection import matches_filter
+from domain.observation.runtime.observation_store_query_engine import ObservationStoreQueryEngine
+from tests.domain.observation.runtime.conftest import SESSION, make_obs
+
+ACTIVE = frozenset({ObservationStatus.ACTIVE})
+TYPES = [
+    ObservationType.TECHNICAL_CORRECTNESS,
+    ObservationType.KNOWLEDGE_GAP,
+    ObservationType.REASONING_IMPROVING,
+]
+ORIGINS = [ObservationOrigin.EVALUATION, ObservationOrigin.PATTERN_DETECTOR]
+
+
+@pytest.fixture()
+def store() -> InMemoryObservationStore:
+    return InMemoryObservationStore(SESSION)
+
+
+def _populate(store: InMemoryObservationStore, n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    appended = []
+    for _ in range(n):
+        obs = make_obs(
+            question_index=rng.randrange(10),
+            observation_type=rng.choice(TYPES),
+            origin=rng.choice(ORIGINS),
+            confidence=round(rng.random(), 2),
+        )
+        store.append(obs)
+        appended.append(obs)
+    return appended
+
+
+def _scan(store: InMemoryObservationStore, q: ObservationQuery) -> list:
+    """Reference implementation: full scan in append order, stable sort, slice."""
+    key_fn = {
+        ObservationSortField.QUESTION_INDEX: lambda o: o.metadata.question_index,
+        ObservationSortField.OBSERVED_AT: lambda o: o.metadata.observed_at,
+        ObservationSortField.CONFIDENCE: lambda o: o.confidence,
+        ObservationSortField.WEIGHT: lambda o: o.weight,
+    }[q.sort_by]
+    results = [o for o in store._store.values() if matches_filter(o, q.filter)]
+    results.sort(key=key_fn, reverse=q.sort_order == ObservationSortOrder.DESC)
+    return results[q.offset:q.offset + q.limit]
+
+
+class TestAppendDeduplication:
+    def test_duplicate_key_supersedes_previous_active(self, store):
+        first = make_obs(1)
+        second = make_obs(1)
+        store.append(first)
+        store.append(second)
+
+        assert store.get(first.id).status == ObservationStatus.SUPERSEDED
+        assert store.get(second.id).status == ObservationStatus.ACTIVE
+        assert store.count() == 2
+
+    def test_only_the_active_entry_is_superseded(self, store):
+        chain = [make_obs(1) for _ in range(4)]
+        for obs in chain:
+            store.append(obs)
+
+        statuses = [store.get(o.id).status for o in chain]
+        assert statuses == [ObservationStatus.SUPERSEDED] * 3 + [ObservationStatus.ACTIVE]
+
+    def test_different_origin_does_not_supersede(self, store):
+        store.append(make_obs(1, origin=ObservationOrigin.EVALUATION))
+        store.append(make_obs(1, origin=ObservationOrigin.PATTERN_DETECTOR))
+
+        assert ObservationStoreQueryEngine(store).count_active() == 2
+
+    def test_reappending_same_id_keeps_indexes_consistent(self, store):
+        obs = make_obs(1)
+        store.append(obs)
+        store.append(obs)
+
+        active = store.query(ObservationQuery(filter=ObservationFilter(statuses=ACTIVE)))
+        assert [o.id for o in active] == [obs.id]
+        assert store.count() == 1
+
+
+class TestQuery:
+    def test_limit_and_offset_are_applied(self, store):
+        for i in range(10):
+            store.append(make_obs(i))
+
+        page = store.query(ObservationQuery(limit=3, offset=4))
+
+        assert [o.metadata.question_index for o in page] == [4, 5, 6]
+
+    def test_sort_descending(self, store):
+        for c in (0.2, 0.9, 0.5):
+            store.append(make_obs(int(c * 10), confidence=c))
+
+        results = store.query(
+            ObservationQuery(
+                sort_by=ObservationSortField.CONFIDENCE,
+                sort_order=ObservationSortOrder.DESC,
+            )
+        )
+
+        assert [o.confidence for o in results] == [0.9, 0.5, 0.2]
+
+    @pytest.mark.parametrize(
+        "observation_filter",
+        [
+            ObservationFilter(),
+            ObservationFilter(statuses=ACTIVE),
+            ObservationFilter(statuses=frozenset({ObservationStatus.SUPERSEDED})),
+            ObservationFilter(observation_types=frozenset({ObservationType.KNOWLEDGE_GAP})),
+            ObservationFilter(
+                observation_types=frozenset(TYPES[:2]),
+                statuses=ACTIVE,
+            ),
+            ObservationFilter(question_index_min=3, question_index_max=3),
+            ObservationFilter(question_index_min=6),
+            ObservationFilter(question_index_max=2, confidence_min=0.5),
+            ObservationFilter(origins=frozenset({ObservationOrigin.PATTERN_DETECTOR})),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "sort_by", [ObservationSortField.QUESTION_INDEX, ObservationSortField.CONFIDENCE]
+    )
+    def test_indexed_query_matches_full_scan(self, store, observation_filter, sort_by):
+        _populate(store, 300)
+
+        for order in ObservationSortOrder:
+            q = ObservationQuery(
+                filter=observation_filter,
+                sort_by=sort_by,
+                sort_order=order,
+                limit=50,
+                offset=5,
+            )
+            assert store.query(q) == _scan(store, q)
+
+    def test_count_matching_ignores_pagination(self, store):
+        _populate(store, 300)
+        f = ObservationFilter(statuses=ACTIVE)
+
+        expected = sum(1 for o in store._store.values() if o.status == ObservationStatus.ACTIVE)
+        assert store.count_matching(f) == expected
+        assert ObservationStoreQueryEngine(store).count_active() == expected
+
+
+def test_snapshot_reflects_superseded_status(store):
+    store.append(make_obs(0))
+    store.append(make_obs(0))
+    store.append(make_obs(1))
+
+    snapshot = store.snapshot()
+
+    assert snapshot.total_count == 3
+    assert snapshot.active_count == 2
+    assert snapshot.superseded_count == 1
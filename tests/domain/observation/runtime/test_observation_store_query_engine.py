@@ -14,6 +14,7 @@ from domain.contracts.observation.observation_snapshot import ObservationSnapsho
 from domain.contracts.observation.observation_status import ObservationStatus
 from domain.contracts.observation.observation_store import ObservationStore
 from domain.contracts.observation.observation_type import ObservationType
+from domain.observation.runtime.in_memory_observation_store import InMemoryObservationStore
 from domain.observation.runtime.observation_store_query_engine import ObservationStoreQueryEngine
 from tests.domain.observation.runtime.conftest import make_obs, SESSION
 
@@ -147,6 +148,33 @@ class TestQueryEngineStatistics:
         assert stats.total == 1
 
 
+class TestQueryEngineLargeSessions:
+    """Accessors page past ObservationQuery's 1000-row cap."""
+
+    _TOTAL = 1_250
+
+    @pytest.fixture()
+    def large_engine(self) -> ObservationStoreQueryEngine:
+        large_store = InMemoryObservationStore(SESSION)
+        for i in range(self._TOTAL):
+            large_store.append(make_obs(i))
+        return ObservationStoreQueryEngine(large_store)
+
+    def test_all_returns_every_observation(self, large_engine: ObservationStoreQueryEngine):
+        indices = [o.metadata.question_index for o in large_engine.all().all]
+        assert indices == list(range(self._TOTAL))
+
+    def test_accessors_return_every_match(self, large_engine: ObservationStoreQueryEngine):
+        assert large_engine.active_only().size == self._TOTAL
+        assert large_engine.by_type(ObservationType.TECHNICAL_CORRECTNESS).size == self._TOTAL
+
+    def test_statistics_cover_every_observation(self, large_engine: ObservationStoreQueryEngine):
+        assert large_engine.statistics().total == self._TOTAL
+
+    def test_explicit_limit_is_still_applied(self, large_engine: ObservationStoreQueryEngine):
+        assert large_engine.all(limit=10).size == 10
+
+
 class TestQueryEngineCounts:
     def test_count(self, store: _Store, engine: ObservationStoreQueryEngine):
         store.append(make_obs(0))
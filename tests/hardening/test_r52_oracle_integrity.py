@@ -216,6 +216,71 @@ class TestOracleValidatorOverlapCheck:
         assert result == []
 
 
+# ===========================================================
+# OracleValidator — batched reference run
+# ===========================================================
+
+FLAKY_REFERENCE = """
+def pick(x):
+    if x == 1:
+        raise ValueError("bad input")
+    if x == 2:
+        while True:
+            pass
+    return x * 2
+"""
+
+
+class TestOracleValidatorBatchedRun:
+
+    def test_all_cases_share_one_sandbox_execution(self):
+        from services.coding_engine.execution_sandbox import ExecutionSandbox
+
+        with patch.object(
+            ExecutionSandbox, "execute", autospec=True, side_effect=ExecutionSandbox.execute,
+        ) as execute:
+            result = OracleValidator().validate(
+                reference_solution=CORRECT_TWO_SUM,
+                entrypoint="two_sum",
+                visible_tests=_VISIBLE_TESTS,
+                hidden_tests=[
+                    _tc([[3, 2, 4], 6], [1, 2]),
+                    _tc([[1, 5, 3, 2], 4], [0, 3]),
+                    _tc([[3, 3], 6], [0, 1]),
+                ],
+            )
+
+        assert execute.call_count == 1
+        assert [t.args for t in result] == [[[3, 2, 4], 6], [[3, 3], 6]]
+
+    def test_failing_cases_are_isolated(self, monkeypatch):
+        import app.ai.test_generation.oracle_validator as oracle_validator
+
+        monkeypatch.setattr(oracle_validator, "_SANDBOX_TIMEOUT", 1)
+
+        results = oracle_validator._run_reference_batch(
+            FLAKY_REFERENCE,
+            "pick",
+            [_tc([0], 0), _tc([1], 0), _tc([2], 0), _tc([3], 0)],
+        )
+
+        assert [r.success for r in results] == [True, False, False, True]
+        assert [results[0].output, results[3].output] == [0, 6]
+        assert results[1].error == "ValueError: bad input"
+        assert results[2].error == "timeout"
+
+    def test_reference_that_does_not_load_fails_every_case(self):
+        import app.ai.test_generation.oracle_validator as oracle_validator
+
+        results = oracle_validator._run_reference_batch(
+            "def two_sum(:",
+            "two_sum",
+            [_tc([[1, 2], 3], [0, 1]), _tc([[1, 3], 4], [0, 1])],
+        )
+
+        assert [r.success for r in results] == [False, False]
+
+
 # ===========================================================
 # AITestGenerator — all hidden discarded → no crash
 # ===========================================================
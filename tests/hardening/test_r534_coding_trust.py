@@ -253,10 +253,15 @@ class TestFailureBlockHiddenException:
 
 class TestCacheKeyRefSolution:
 
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path):
+        self._tmp_path = tmp_path
+
     def _make_svc(self):
-        svc = TestCacheService.__new__(TestCacheService)
-        svc._cache = {}
-        return svc
+        return TestCacheService(
+            db_path=self._tmp_path / "ai_test_cache.db",
+            legacy_json_path=self._tmp_path / "ai_test_cache.json",
+        )
 
     def test_different_ref_solutions_produce_different_keys(self):
         svc = self._make_svc()
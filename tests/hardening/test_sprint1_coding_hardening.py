@@ -186,20 +186,19 @@ class TestCacheNullGuard:
         cache_data = {}
         question = _make_question()
         num_tests = 3
-        version = TestCacheService.CACHE_VERSION
-        payload = f"v{version}:{question.id}:{question.prompt}:{num_tests}"
-        key = hashlib.sha256(payload.encode()).hexdigest()
+        cache_file = tmp_path / "ai_test_cache.json"
+
+        svc = TestCacheService(
+            db_path=tmp_path / "ai_test_cache.db",
+            legacy_json_path=cache_file,
+        )
+        key = svc.cache_key(question, num_tests)
         cache_data[key] = [
             {"args": [1], "expected": None},
             {"args": [2], "expected": None},
         ]
-        cache_file = tmp_path / "ai_test_cache.json"
         cache_file.write_text(json.dumps(cache_data))
 
-        svc = TestCacheService()
-        svc.CACHE_FILE = cache_file
-        svc._cache = cache_data
-
         result = svc.get_tests(question, num_tests)
         assert result is None
 
@@ -211,9 +210,13 @@ class TestCacheNullGuard:
         old_payload = f"{question.id}:{question.prompt}:{num_tests}"
         old_key = hashlib.sha256(old_payload.encode()).hexdigest()
         cache_data = {old_key: [{"args": [1], "expected": 1}]}
+        cache_file = tmp_path / "ai_test_cache.json"
+        cache_file.write_text(json.dumps(cache_data))
 
-        svc = TestCacheService()
-        svc._cache = cache_data
+        svc = TestCacheService(
+            db_path=tmp_path / "ai_test_cache.db",
+            legacy_json_path=cache_file,
+        )
 
         result = svc.get_tests(question, num_tests)
         assert result is None
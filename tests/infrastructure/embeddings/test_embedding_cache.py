@@ -0,0 +1,163 @@
+# tests/infrastructure/embeddings/test_embedding_cache.py
+
+import numpy as np
+import pytest
+
+from infrastructure.embeddings.embedding_backends import (
+    EmbeddingBackend,
+    LangChainEmbeddingBackend,
+)
+from infrastructure.embeddings.embedding_cache import (
+    CachedEmbeddings,
+    EmbeddingCache,
+    MmapEmbeddingStore,
+    text_hash,
+)
+
+
+class _CountingBackend(EmbeddingBackend):
+
+    def __init__(self, model_name: str = "fake-model") -> None:
+        self._model_name = model_name
+        self.batches: list[list[str]] = []
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return np.array(
+            [[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts],
+            dtype=np.float32,
+        )
+
+    @property
+    def embedded(self) -> list[str]:
+        return [t for batch in self.batches for t in batch]
+
+
+def _embedder(tmp_path=None, backend=None, **cache_kwargs) -> CachedEmbeddings:
+    cache = EmbeddingCache(
+        directory=tmp_path / "cache" if tmp_path is not None else None,
+        **cache_kwargs,
+    )
+    return CachedEmbeddings(backend or _CountingBackend(), cache, batch_size=2)
+
+
+class TestCachedEmbeddings:
+
+    def test_repeated_texts_hit_memory(self):
+        backend = _CountingBackend()
+        embedder = _embedder(backend=backend)
+
+        first = embedder.embed_many(["a", "bb", "a"])
+        second = embedder.embed_many(["bb", "a"])
+
+        assert backend.embedded == ["a", "bb"]
+        np.testing.assert_array_equal(second, first[[1, 0]])
+
+        metrics = embedder.cache.metrics
+        assert (metrics.memory_hits, metrics.misses) == (2, 2)
+        assert metrics.hit_rate == 0.5
+        assert metrics.bytes_saved == 2 * 3 * 4
+
+    def test_misses_are_batched(self):
+        backend = _CountingBackend()
+        embedder = _embedder(backend=backend)
+
+        embedder.embed_many([f"t{i}" for i in range(5)])
+
+        assert [len(b) for b in backend.batches] == [2, 2, 1]
+
+    def test_models_do_not_share_vectors(self):
+        cache = EmbeddingCache()
+        small = _CountingBackend("small")
+        large = _CountingBackend("large")
+
+        CachedEmbeddings(small, cache).embed_many(["same text"])
+        CachedEmbeddings(large, cache).embed_many(["same text"])
+
+        assert large.embedded == ["same text"]
+
+    def test_langchain_interface(self):
+        embedder = _embedder()
+
+        documents = embedder.embed_documents(["x", "yy"])
+        query = embedder.embed_query("yy")
+
+        assert query == documents[1]
+        assert isinstance(query[0], float)
+
+    def test_memory_tier_is_bounded(self):
+        embedder = _embedder(max_memory_entries=2)
+
+        embedder.embed_many(["a", "b", "c"])
+
+        assert embedder.cache.memory_size == 2
+
+    def test_wraps_langchain_embeddings(self):
+        class _Fake:
+            model = "text-embedding-fake"
+
+            def embed_documents(self, texts):
+                return [[1.0, 0.0] for _ in texts]
+
+        backend = LangChainEmbeddingBackend(_Fake())
+
+        assert backend.model_name == "text-embedding-fake"
+        assert backend.embed_batch(["q"]).dtype == np.float32
+
+
+class TestDiskTier:
+
+    def test_vectors_survive_a_new_process_cache(self, tmp_path):
+        first = _CountingBackend()
+        original = _embedder(tmp_path, first).embed_many(["alpha", "beta"])
+
+        second = _CountingBackend()
+        reloaded = _embedder(tmp_path, second)
+        vectors = reloaded.embed_many(["beta", "alpha", "gamma"])
+
+        assert second.embedded == ["gamma"]
+        np.testing.assert_array_equal(vectors[:2], original[[1, 0]])
+        assert reloaded.cache.metrics.disk_hits == 2
+
+    def test_store_sees_rows_appended_by_another_writer(self, tmp_path):
+        reader = MmapEmbeddingStore(tmp_path)
+        writer = MmapEmbeddingStore(tmp_path)
+
+        assert reader.get("k") is None
+
+        writer.put_many([("k", np.array([1.0, 2.0], dtype=np.float32))])
+
+        np.testing.assert_array_equal(reader.get("k"), [1.0, 2.0])
+
+    def test_torn_index_line_is_ignored_and_repaired(self, tmp_path):
+        store = MmapEmbeddingStore(tmp_path)
+        store.put_many([("a", np.ones(3, dtype=np.float32))])
+
+        with (tmp_path / MmapEmbeddingStore.INDEX_FILE).open("ab") as index:
+            index.write(b"deadbeef\t3\t")
+
+        reopened = MmapEmbeddingStore(tmp_path)
+        reopened.put_many([("b", np.full(3, 2.0, dtype=np.float32))])
+
+        fresh = MmapEmbeddingStore(tmp_path)
+        assert len(fresh) == 2
+        assert fresh.get("deadbeef") is None
+        np.testing.assert_array_equal(fresh.get("b"), [2.0, 2.0, 2.0])
+
+    def test_duplicate_puts_are_written_once(self, tmp_path):
+        store = MmapEmbeddingStore(tmp_path)
+        vector = np.arange(4, dtype=np.float32)
+
+        store.put_many([(text_hash("x"), vector)])
+        store.put_many([(text_hash("x"), vector)])
+
+        assert (tmp_path / MmapEmbeddingStore.DATA_FILE).stat().st_size == vector.nbytes
+
+
+def test_invalid_batch_size_rejected():
+    with pytest.raises(ValueError):
+        CachedEmbeddings(_CountingBackend(), EmbeddingCache(), batch_size=0)
@@ -0,0 +1,129 @@
+# tests/infrastructure/embeddings/test_embedding_factory.py
+
+import numpy as np
+import pytest
+from langchain_openai import OpenAIEmbeddings
+
+from infrastructure.config.settings import settings
+from infrastructure.embeddings import embedding_factory
+from infrastructure.embeddings.embedding_backends import (
+    BackendEmbeddings,
+    SentenceTransformerBackend,
+    embedding_model_name,
+)
+from infrastructure.embeddings.local_embedding_model import (
+    load_local_sentence_transformer,
+)
+from services.embedding.embedding_model_provider import EmbeddingModelProvider
+
+
+class _FakeSentenceTransformer:
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append({"texts": list(texts), **kwargs})
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture()
+def local_backend(monkeypatch) -> _FakeSentenceTransformer:
+
+    model = _FakeSentenceTransformer()
+
+    monkeypatch.setattr(settings, "embedding_backend", "local")
+    monkeypatch.setattr(settings, "local_embedding_model", "fake-local")
+    monkeypatch.setattr(settings, "local_embedding_batch_size", 16)
+    monkeypatch.setattr(settings, "local_embedding_runtime", "torch")
+    monkeypatch.setattr(settings, "local_embedding_int8", False)
+    monkeypatch.setattr(embedding_factory, "get_local_sentence_transformer", lambda: model)
+
+    return model
+
+
+def test_local_backend_embeds_in_batches_without_the_api(local_backend, monkeypatch):
+
+    monkeypatch.setattr(settings, "embedding_cache_enabled", False)
+
+    embeddings = embedding_factory.get_embedding_model()
+
+    assert isinstance(embeddings, BackendEmbeddings)
+    assert embedding_model_name(embeddings) == "fake-local"
+    assert embeddings.embed_query("abc") == [3.0, 1.0]
+    assert embeddings.embed_documents(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert local_backend.calls[-1]["batch_size"] == 16
+
+
+def test_cached_local_backend_keeps_the_model_name(local_backend, monkeypatch):
+
+    monkeypatch.setattr(settings, "embedding_cache_enabled", True)
+
+    embeddings = embedding_factory.get_embedding_model()
+
+    assert embedding_model_name(embeddings) == "fake-local"
+
+
+@pytest.mark.parametrize(
+    ("runtime", "int8", "expected"),
+    [
+        ("torch", False, "fake-local"),
+        ("torch", True, "fake-local@torch-int8"),
+        ("onnx", False, "fake-local@onnx-fp32"),
+        ("onnx", True, "fake-local@onnx-int8"),
+    ],
+)
+def test_local_model_name_includes_runtime_and_precision(local_backend, monkeypatch, runtime, int8, expected):
+
+    monkeypatch.setattr(settings, "embedding_cache_enabled", True)
+    monkeypatch.setattr(settings, "local_embedding_runtime", runtime)
+    monkeypatch.setattr(settings, "local_embedding_int8", int8)
+
+    assert embedding_model_name(embedding_factory.get_embedding_model()) == expected
+    assert embedding_factory.get_embedding_backend().model_name == expected
+
+
+@pytest.mark.parametrize("cache_enabled", [True, False])
+def test_provider_embedder_follows_the_cache_setting(local_backend, monkeypatch, cache_enabled):
+
+    monkeypatch.setattr(settings, "embedding_cache_enabled", cache_enabled)
+    monkeypatch.setattr(EmbeddingModelProvider, "_model", local_backend)
+
+    embedder = EmbeddingModelProvider.get_embedder()
+
+    assert type(embedder) is type(embedding_factory.get_embedding_model())
+    assert isinstance(embedder, BackendEmbeddings) is not cache_enabled
+    assert embedder.embed_many(["a", "bb"]).tolist() == [[1.0, 1.0], [2.0, 1.0]]
+
+
+def test_openai_backend_is_the_default(monkeypatch):
+
+    monkeypatch.setattr(settings, "embedding_backend", "openai")
+    monkeypatch.setattr(settings, "embedding_cache_enabled", False)
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+
+    assert isinstance(embedding_factory.get_embedding_model(), OpenAIEmbeddings)
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+
+    monkeypatch.setattr(settings, "embedding_backend", "cohere")
+
+    with pytest.raises(ValueError, match="Unknown embedding backend"):
+        embedding_factory.get_embedding_backend()
+
+
+def test_unknown_local_runtime_is_rejected():
+
+    with pytest.raises(ValueError, match="Unknown local embedding runtime"):
+        load_local_sentence_transformer("fake-local", runtime="tensorrt")
+
+
+def test_sentence_transformer_backend_forwards_batch_size():
+
+    model = _FakeSentenceTransformer()
+
+    vectors = SentenceTransformerBackend(model, "fake-local", batch_size=8).embed_batch(["a"])
+
+    assert vectors.shape == (1, 2)
+    assert model.calls[0]["batch_size"] == 8
@@ -0,0 +1,148 @@
+# tests/infrastructure/execution/test_python_language_executor.py
+
+import pytest
+
+from infrastructure.execution import (
+    ExecutionDispatcher,
+    LanguageExecutorRegistry,
+    PythonLanguageExecutor,
+)
+from infrastructure.execution.contracts.execution_artifact import ArtifactKind
+from infrastructure.execution.contracts.execution_limits import ExecutionLimits
+from infrastructure.execution.contracts.execution_request import ExecutionRequest
+from infrastructure.execution.contracts.execution_status import ExecutionStatus
+
+executor = PythonLanguageExecutor()
+
+pytestmark = pytest.mark.skipif(
+    not executor.is_available(), reason="POSIX rlimits/wait4 not available"
+)
+
+
+def _request(python_env, code, limits=None, hidden="", visible=""):
+    return ExecutionRequest(
+        execution_id="exec-py",
+        question_id="q-py",
+        language_id="python",
+        candidate_code=code,
+        hidden_test_suite=hidden,
+        visible_test_suite=visible,
+        environment=python_env,
+        limits=limits or ExecutionLimits(),
+    )
+
+
+def _artifact(result, kind):
+    return next(a for a in result.artifacts if a.kind == kind)
+
+
+def test_success_reports_measured_metrics(python_env):
+    result = executor.execute(
+        _request(python_env, "print(sum(i * i for i in range(200_000)))")
+    )
+
+    assert result.status == ExecutionStatus.SUCCESS
+    assert result.stdout.strip() == str(sum(i * i for i in range(200_000)))
+    assert result.metrics.peak_memory_kb > 0
+    assert result.metrics.cpu_time_ms >= 0
+    assert result.metrics.stdout_bytes == len(result.stdout)
+    assert not _artifact(result, ArtifactKind.STDOUT).truncated
+
+
+def test_failing_assertion_in_test_suite_is_failed_tests(python_env):
+    result = executor.execute(
+        _request(
+            python_env,
+            "def add(a, b):\n    return a - b",
+            hidden="assert add(2, 2) == 4, 'add(2, 2)'",
+        )
+    )
+
+    assert result.status == ExecutionStatus.FAILED_TESTS
+    assert result.runtime_errors == ["add(2, 2)"]
+
+
+def test_syntax_error_is_located(python_env):
+    result = executor.execute(_request(python_env, "x = 1\ndef broken(:\n    pass"))
+
+    assert result.status == ExecutionStatus.SYNTAX_ERROR
+    assert result.diagnostics.first_error.line == 2
+
+
+def test_runtime_error_diagnostic(python_env):
+    result = executor.execute(_request(python_env, "x = 1\nraise ValueError('boom')"))
+
+    assert result.status == ExecutionStatus.RUNTIME_ERROR
+    diagnostic = result.diagnostics.first_error
+    assert (diagnostic.error_type, diagnostic.message, diagnostic.line) == (
+        "ValueError",
+        "boom",
+        2,
+    )
+
+
+def test_timeout_kills_process(python_env):
+    result = executor.execute(
+        _request(python_env, "while True:\n    pass", ExecutionLimits(timeout_ms=300))
+    )
+
+    assert result.status == ExecutionStatus.TIMEOUT
+    assert result.timed_out is True
+    assert result.metrics.duration_ms < 3_000
+
+
+def test_memory_limit_is_enforced(python_env):
+    result = executor.execute(
+        _request(
+            python_env,
+            "blob = bytearray(256 * 1024 * 1024)",
+            ExecutionLimits(memory_limit_mb=64),
+        )
+    )
+
+    assert result.status == ExecutionStatus.MEMORY_EXCEEDED
+
+
+def test_output_is_cut_off_at_limit(python_env):
+    limits = ExecutionLimits(max_output_bytes=2_048)
+
+    result = executor.execute(
+        _request(python_env, "while True:\n    print('x' * 100)", limits)
+    )
+
+    stdout = _artifact(result, ArtifactKind.STDOUT)
+    assert result.status == ExecutionStatus.SANDBOX_VIOLATION
+    assert stdout.truncated is True
+    assert stdout.size_bytes + result.metrics.stderr_bytes <= 2_048
+
+
+def test_file_descriptor_limit_is_enforced(python_env):
+    code = "handles = [open(__file__) for _ in range(64)]"
+
+    result = executor.execute(
+        _request(python_env, code, ExecutionLimits(max_file_descriptors=16))
+    )
+
+    assert result.status == ExecutionStatus.RUNTIME_ERROR
+    assert result.diagnostics.first_error.error_type == "OSError"
+
+
+def test_filesystem_writes_are_blocked(python_env):
+    result = executor.execute(
+        _request(
+            python_env,
+            "with open('out.txt', 'w') as handle:\n    handle.write('data')",
+        )
+    )
+
+    assert result.status == ExecutionStatus.SANDBOX_VIOLATION
+
+
+def test_dispatcher_routes_to_registered_executor(python_env):
+    registry = LanguageExecutorRegistry()
+    registry.register(PythonLanguageExecutor())
+
+    result = ExecutionDispatcher(registry).dispatch(_request(python_env, "print('ok')"))
+
+    assert result.status == ExecutionStatus.SUCCESS
+    assert result.stdout == "ok\n"
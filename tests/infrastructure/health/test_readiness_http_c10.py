@@ -20,6 +20,7 @@ from infrastructure.health.http import (
 )
 from infrastructure.health.readiness import evaluate_readiness
 from infrastructure.health.types import ProbeResult, ReadinessReport
+from infrastructure.vector_store.chroma_registry import ChromaWarmState
 
 
 def _settings(**overrides: object) -> Settings:
@@ -29,6 +30,7 @@ def _settings(**overrides: object) -> Settings:
         "health_llm_probe_enabled": True,
         "health_db_probe_enabled": True,
         "health_sandbox_probe_enabled": True,
+        "health_retrieval_probe_enabled": True,
         "sqlite_db_path": "data/questions.db",
     }
     base.update(overrides)
@@ -39,12 +41,14 @@ def _client(
     *,
     settings: Settings,
     llm_connectivity_check=None,
+    retrieval_warm_state=lambda: ChromaWarmState(status="warm"),
 ) -> TestClient:
     api = FastAPI()
     register_readiness_route(
         api,
         settings=settings,
         llm_connectivity_check=llm_connectivity_check,
+        retrieval_warm_state=retrieval_warm_state,
     )
     return TestClient(api)
 
@@ -92,6 +96,7 @@ class TestHealthReadyEndpoint:
             "llm",
             "database",
             "sandbox",
+            "retrieval",
         }
         assert all(p["status"] == "success" for p in payload["probes"])
 
@@ -12,8 +12,14 @@ from unittest.mock import MagicMock
 import pytest
 
 from infrastructure.config.settings import Settings
-from infrastructure.health.probes import probe_database, probe_llm, probe_sandbox
+from infrastructure.health.probes import (
+    probe_database,
+    probe_llm,
+    probe_retrieval,
+    probe_sandbox,
+)
 from infrastructure.health.readiness import evaluate_readiness
+from infrastructure.vector_store.chroma_registry import ChromaWarmState
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 HEALTH_ROOT = REPO_ROOT / "infrastructure" / "health"
@@ -26,12 +32,18 @@ def _settings(**overrides: object) -> Settings:
         "health_llm_probe_enabled": True,
         "health_db_probe_enabled": True,
         "health_sandbox_probe_enabled": True,
+        "health_retrieval_probe_enabled": True,
+        "retrieval_warmup_enabled": True,
         "sqlite_db_path": "data/questions.db",
     }
     base.update(overrides)
     return Settings(**base)
 
 
+def _warm() -> ChromaWarmState:
+    return ChromaWarmState(status="warm", detail="interview_questions: 3 records")
+
+
 class TestProbeDatabase:
     def test_success_read_only(self, tmp_path: Path) -> None:
         db_path = tmp_path / "ready.db"
@@ -143,6 +155,43 @@ class TestProbeSandbox:
         assert result.status == "skipped"
 
 
+class TestProbeRetrieval:
+    def test_success_when_warm(self) -> None:
+        result = probe_retrieval(_settings(), warm_state=_warm)
+        assert result.status == "success"
+        assert result.detail == "interview_questions: 3 records"
+
+    @pytest.mark.parametrize("status", ["cold", "warming"])
+    def test_failure_until_warm(self, status: str) -> None:
+        result = probe_retrieval(
+            _settings(),
+            warm_state=lambda: ChromaWarmState(status=status),
+        )
+        assert result.status == "failure"
+        assert result.detail == f"retrieval index {status}"
+
+    def test_failure_carries_warm_up_error(self) -> None:
+        failed = ChromaWarmState(
+            status="failed",
+            detail="collection missing",
+            error_type="NotFoundError",
+        )
+        result = probe_retrieval(_settings(), warm_state=lambda: failed)
+        assert result.status == "failure"
+        assert result.error_type == "NotFoundError"
+
+    def test_skipped_when_cold_and_warm_up_disabled(self) -> None:
+        result = probe_retrieval(
+            _settings(retrieval_warmup_enabled=False),
+            warm_state=lambda: ChromaWarmState(status="cold"),
+        )
+        assert result.status == "skipped"
+
+    def test_skipped_when_disabled(self) -> None:
+        result = probe_retrieval(_settings(health_retrieval_probe_enabled=False))
+        assert result.status == "skipped"
+
+
 class TestEvaluateReadiness:
     def test_ready_when_all_enabled_probes_succeed(self, tmp_path: Path) -> None:
         db_path = tmp_path / "ok.db"
@@ -150,9 +199,15 @@ class TestEvaluateReadiness:
         report = evaluate_readiness(
             _settings(sqlite_db_path=str(db_path)),
             llm_connectivity_check=lambda _s: None,
+            retrieval_warm_state=_warm,
         )
         assert report.ready is True
-        assert {p.name for p in report.probes} == {"llm", "database", "sandbox"}
+        assert {p.name for p in report.probes} == {
+            "llm",
+            "database",
+            "sandbox",
+            "retrieval",
+        }
         assert all(p.status == "success" for p in report.probes)
 
     def test_not_ready_when_any_enabled_probe_fails(self, tmp_path: Path) -> None:
@@ -171,6 +226,7 @@ class TestEvaluateReadiness:
                 health_llm_probe_enabled=False,
                 health_db_probe_enabled=False,
                 health_sandbox_probe_enabled=False,
+                health_retrieval_probe_enabled=False,
             )
         )
         assert report.ready is True
@@ -9,41 +9,36 @@ from infrastructure.vector_store.chroma_question_store import (
 )
 
 
+def _registry(store_instance=None) -> MagicMock:
+    registry = MagicMock()
+    registry.vectorstore.return_value = store_instance or MagicMock()
+    return registry
+
+
 def test_store_initializes_with_correct_parameters():
-    mock_embedding = MagicMock()
-
-    with (
-        patch(
-            "infrastructure.vector_store.chroma_question_store.get_embedding_model",
-            return_value=mock_embedding,
-        ),
-        patch(
-            "infrastructure.vector_store.chroma_question_store.Chroma"
-        ) as mock_chroma,
+    registry = _registry()
+
+    with patch(
+        "infrastructure.vector_store.chroma_question_store.get_chroma_registry",
+        return_value=registry,
     ):
 
-        store = ChromaQuestionStore()
+        ChromaQuestionStore()
 
-        mock_chroma.assert_called_once()
+        registry.vectorstore.assert_called_once()
 
-        _, kwargs = mock_chroma.call_args
+        _, kwargs = registry.vectorstore.call_args
 
         assert kwargs["collection_name"] == "question_bank"
-        assert kwargs["embedding_function"] == mock_embedding
+        assert kwargs["persist_directory"] == str(ChromaQuestionStore.PERSIST_DIR)
 
 
 def test_add_documents_delegates_to_chroma():
     mock_store_instance = MagicMock()
 
-    with (
-        patch(
-            "infrastructure.vector_store.chroma_question_store.get_embedding_model",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "infrastructure.vector_store.chroma_question_store.Chroma",
-            return_value=mock_store_instance,
-        ),
+    with patch(
+        "infrastructure.vector_store.chroma_question_store.get_chroma_registry",
+        return_value=_registry(mock_store_instance),
     ):
         store = ChromaQuestionStore()
 
@@ -52,19 +47,27 @@ def test_add_documents_delegates_to_chroma():
         mock_store_instance.add_documents.assert_called_once()
 
 
+def test_reset_collection_recreates_shared_store_in_place():
+    mock_store_instance = MagicMock()
+
+    with patch(
+        "infrastructure.vector_store.chroma_question_store.get_chroma_registry",
+        return_value=_registry(mock_store_instance),
+    ):
+        store = ChromaQuestionStore()
+
+        store.reset_collection()
+
+        mock_store_instance.reset_collection.assert_called_once()
+
+
 def test_similarity_search_delegates():
     mock_store_instance = MagicMock()
     mock_store_instance.similarity_search.return_value = []
 
-    with (
-        patch(
-            "infrastructure.vector_store.chroma_question_store.get_embedding_model",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "infrastructure.vector_store.chroma_question_store.Chroma",
-            return_value=mock_store_instance,
-        ),
+    with patch(
+        "infrastructure.vector_store.chroma_question_store.get_chroma_registry",
+        return_value=_registry(mock_store_instance),
     ):
         store = ChromaQuestionStore()
 
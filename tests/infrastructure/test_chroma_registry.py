@@ -0,0 +1,114 @@
+# tests/infrastructure/test_chroma_registry.py
+
+# Tests for ChromaRegistry
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from infrastructure.vector_store.chroma_registry import (
+    EMBEDDING_MODEL_KEY,
+    ChromaRegistry,
+    EmbeddingModelMismatchError,
+)
+
+
+class _FakeEmbeddings(Embeddings):
+
+    def embed_documents(self, texts):
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 1.0, 0.0]
+
+
+def _registry() -> ChromaRegistry:
+    return ChromaRegistry(embeddings_factory=_FakeEmbeddings)
+
+
+def test_clients_and_vectorstores_are_shared(tmp_path):
+    registry = _registry()
+    directory = str(tmp_path / "chroma")
+
+    first = registry.vectorstore("questions", directory)
+    second = registry.vectorstore("questions", directory)
+    other = registry.vectorstore("question_bank", directory)
+
+    assert first is second
+    assert other is not first
+    assert registry.client(directory) is registry.client(str(tmp_path / "." / "chroma"))
+    assert first.embeddings is other.embeddings
+
+
+def test_warm_up_loads_collection_and_probes(tmp_path):
+    registry = _registry()
+    directory = str(tmp_path / "chroma")
+    registry.vectorstore("questions", directory).add_texts(["a", "bb", "ccc"])
+
+    assert registry.warm_state().status == "cold"
+
+    state = registry.warm_up("questions", directory)
+
+    assert state.is_warm
+    assert state.record_count == 3
+    assert registry.warm_state() == state
+
+
+def test_warm_up_failure_is_recorded(tmp_path):
+
+    def _broken() -> Embeddings:
+        raise RuntimeError("no embedding provider")
+
+    registry = ChromaRegistry(embeddings_factory=_broken)
+
+    state = registry.warm_up("questions", str(tmp_path / "chroma"))
+
+    assert state.status == "failed"
+    assert state.error_type == "RuntimeError"
+    assert registry.warm_state() == state
+
+
+def test_background_warm_up(tmp_path):
+    registry = _registry()
+    directory = str(tmp_path / "chroma")
+
+    thread = registry.warm_up_in_background("questions", directory)
+    thread.join(timeout=10)
+
+    assert registry.warm_state().is_warm
+    assert registry.warm_state().record_count == 0
+
+
+def test_reset_drops_clients_and_warm_state(tmp_path):
+    registry = _registry()
+    directory = str(tmp_path / "chroma")
+
+    vectorstore = registry.vectorstore("questions", directory)
+    registry.warm_up("questions", directory)
+
+    registry.reset()
+
+    assert registry.warm_state().status == "cold"
+    assert registry.vectorstore("questions", directory) is not vectorstore
+
+
+class _OtherEmbeddings(_FakeEmbeddings):
+
+    model = "other-model"
+
+
+def test_new_collection_records_its_embedding_model(tmp_path):
+    directory = str(tmp_path / "chroma")
+
+    vectorstore = _registry().vectorstore("questions", directory)
+
+    assert vectorstore._collection.metadata[EMBEDDING_MODEL_KEY] == "_FakeEmbeddings"
+
+
+def test_collection_built_with_another_model_is_refused(tmp_path):
+    directory = str(tmp_path / "chroma")
+    _registry().vectorstore("questions", directory).add_texts(["a", "bb"])
+
+    registry = ChromaRegistry(embeddings_factory=_OtherEmbeddings)
+
+    with pytest.raises(EmbeddingModelMismatchError, match="_FakeEmbeddings"):
+        registry.vectorstore("questions", directory)
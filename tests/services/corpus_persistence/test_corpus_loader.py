@@ -13,6 +13,7 @@ from services.corpus_persistence.corpus_loader import (
     ensure_corpus,
     restore_corpus_from_hf,
     validate_corpus,
+    warm_corpus_backend,
 )
 
 
@@ -211,3 +212,20 @@ def test_ensure_corpus_exits_on_restore_failure(tmp_path):
     ):
         with pytest.raises(SystemExit):
             ensure_corpus()
+
+
+# ---------------------------------------------------------
+# warm_corpus_backend
+# ---------------------------------------------------------
+
+
+def test_warm_corpus_backend_warms_retrieval_collection(tmp_path):
+    registry = MagicMock()
+
+    with (
+        patch.object(loader_module, "CHROMA_PERSIST_DIRECTORY", str(tmp_path)),
+        patch.object(loader_module, "get_chroma_registry", return_value=registry),
+    ):
+        warm_corpus_backend(background=False)
+
+    registry.warm_up.assert_called_once_with("interview_questions", str(tmp_path))
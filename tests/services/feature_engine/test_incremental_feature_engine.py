@@ -204,3 +204,197 @@ class TestIncrementalDeterminism:
         result_full = full_engine.run(ctx)
 
         assert result_inc.features[0].value == result_full.features[0].value
+
+
+class TestIncrementalDeltaDispatch:
+    """Incremental cycles skip unaffected updaters and fold only new observations."""
+
+    def _two_updater_engine(self) -> tuple[IncrementalFeatureEngine, StubUpdater, StubUpdater]:
+        reasoning_updater = StubUpdater(
+            updater_id="reasoning_upd",
+            invocation_order=1,
+            candidates_to_produce=[make_candidate(FeatureType.REASONING, "HIGH")],
+            observation_type_set=frozenset({"reasoning_depth_high"}),
+            feature_identity_set=frozenset({"reasoning_feature"}),
+        )
+        trend_updater = StubUpdater(
+            updater_id="trend_upd",
+            invocation_order=2,
+            candidates_to_produce=[make_candidate(FeatureType.TREND, "IMPROVING")],
+            observation_type_set=frozenset({"performance_improving"}),
+            feature_identity_set=frozenset({"trend_feature"}),
+        )
+        engine = IncrementalFeatureEngine(
+            [reasoning_updater, trend_updater], PassthroughComposer()
+        )
+        return engine, reasoning_updater, trend_updater
+
+    def test_unaffected_updater_is_not_invoked(self) -> None:
+        engine, reasoning_updater, trend_updater = self._two_updater_engine()
+        first = [
+            make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=0),
+            make_observation(ObservationType.PERFORMANCE_IMPROVING, question_index=0),
+        ]
+        engine.run(make_context(snapshot=make_snapshot(first), question_index=0))
+
+        second = first + [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=1)]
+        result = engine.run(make_context(snapshot=make_snapshot(second), question_index=1))
+
+        assert reasoning_updater.produce_call_count == 2
+        assert trend_updater.produce_call_count == 1
+        assert result.diagnostics.plan.is_incremental is True
+        assert result.diagnostics.plan.affected_feature_type_ids == frozenset({"reasoning_feature"})
+        assert set(result.feature_type_ids) == {"reasoning_feature", "trend_feature"}
+        retained = {
+            r.feature_type_id
+            for r in result.diagnostics.resolution_report.resolution_records
+            if r.strategy == ResolutionStrategy.RETAINED
+        }
+        assert retained == {"trend_feature"}
+
+    def test_non_folding_updater_receives_full_subset(self) -> None:
+        engine, reasoning_updater, _ = self._two_updater_engine()
+        first = [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=0)]
+        engine.run(make_context(snapshot=make_snapshot(first), question_index=0))
+
+        second = first + [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=1)]
+        engine.run(make_context(snapshot=make_snapshot(second), question_index=1))
+
+        assert len(reasoning_updater.last_observations_received) == 2
+
+    def test_folding_updater_receives_only_new_observations(self) -> None:
+        from domain.plugins.feature.updaters.reasoning_feature_updater import (
+            ReasoningFeatureUpdater,
+        )
+
+        engine = IncrementalFeatureEngine([ReasoningFeatureUpdater()], PassthroughComposer())
+        first = [
+            make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=0),
+            make_observation(ObservationType.REASONING_DEPTH_LOW, question_index=0),
+        ]
+        engine.run(make_context(snapshot=make_snapshot(first), question_index=0))
+
+        new_obs = make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=1)
+        result = engine.run(
+            make_context(snapshot=make_snapshot(first + [new_obs]), question_index=1)
+        )
+
+        (record,) = result.diagnostics.updater_invocation_records
+        assert record.observation_ids_received == (str(new_obs.id),)
+        assert len(result.features[0].provenance.source_observation_ids) == 3
+        assert engine.observation_watermark == 3
+
+    def test_rewritten_prefix_falls_back_to_full_recomputation(self) -> None:
+        engine, reasoning_updater, trend_updater = self._two_updater_engine()
+        first = [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=2)]
+        engine.run(make_context(snapshot=make_snapshot(first), question_index=2))
+
+        # An observation ordered before the watermark invalidates the prefix.
+        earlier = make_observation(ObservationType.PERFORMANCE_IMPROVING, question_index=1)
+        result = engine.run(
+            make_context(snapshot=make_snapshot(first + [earlier]), question_index=2)
+        )
+
+        assert result.diagnostics.plan.is_full_recomputation is True
+        assert trend_updater.produce_call_count == 2
+
+    def test_failed_cycle_resets_cache(self) -> None:
+        engine, reasoning_updater, _ = self._two_updater_engine()
+        engine.run(make_context(question_index=0))
+
+        def _boom(observations):
+            raise RuntimeError("updater failure")
+
+        reasoning_updater.produce = _boom
+        obs = [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=1)]
+        with pytest.raises(RuntimeError):
+            engine.run(make_context(snapshot=make_snapshot(obs), question_index=1))
+
+        assert engine.has_prior_cycle is False
+        assert engine.observation_watermark == 0
+
+
+class TestIncrementalDifferential:
+    """Differential mode: every incremental cycle must equal full recomputation."""
+
+    def _default_updaters(self):
+        from domain.plugins.feature.updaters.confidence_feature_updater import (
+            ConfidenceFeatureUpdater,
+        )
+        from domain.plugins.feature.updaters.coverage_feature_updater import (
+            CoverageFeatureUpdater,
+        )
+        from domain.plugins.feature.updaters.reasoning_feature_updater import (
+            ReasoningFeatureUpdater,
+        )
+        from domain.plugins.feature.updaters.technical_skill_feature_updater import (
+            TechnicalSkillFeatureUpdater,
+        )
+        from domain.plugins.feature.updaters.trend_feature_updater import (
+            TrendFeatureUpdater,
+        )
+
+        return [
+            TechnicalSkillFeatureUpdater(),
+            ReasoningFeatureUpdater(),
+            ConfidenceFeatureUpdater(),
+            CoverageFeatureUpdater(),
+            TrendFeatureUpdater(),
+        ]
+
+    def test_session_matches_full_recomputation_every_cycle(self) -> None:
+        import random
+
+        from domain.plugins.feature.default_feature_composer import DefaultFeatureComposer
+        from services.feature_engine.feature_engine import FeatureEngine
+
+        rng = random.Random(20)
+        obs_types = list(ObservationType)
+        incremental = IncrementalFeatureEngine(
+            self._default_updaters(),
+            DefaultFeatureComposer(),
+            verify_against_full=True,
+        )
+        full = FeatureEngine(self._default_updaters(), DefaultFeatureComposer())
+
+        observations = []
+        for question_index in range(12):
+            for _ in range(rng.randint(0, 4)):
+                observations.append(
+                    make_observation(
+                        rng.choice(obs_types),
+                        question_index=question_index,
+                        confidence=round(rng.uniform(0.1, 1.0), 3),
+                    )
+                )
+            ctx = make_context(snapshot=make_snapshot(observations), question_index=question_index)
+
+            incremental_result = incremental.run(ctx)
+            full_result = full.run(ctx)
+
+            assert incremental_result.features == full_result.features
+            if question_index:
+                assert incremental_result.diagnostics.plan.is_incremental is True
+
+    def test_divergence_is_reported(self) -> None:
+        updater = StubUpdater(
+            candidates_to_produce=[make_candidate(FeatureType.REASONING, "HIGH")],
+            observation_type_set=frozenset({"reasoning_depth_high"}),
+            feature_identity_set=frozenset({"reasoning_feature"}),
+        )
+        engine = IncrementalFeatureEngine(
+            [updater], PassthroughComposer(), verify_against_full=True
+        )
+        obs = [make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=0)]
+        engine.run(make_context(snapshot=make_snapshot(obs), question_index=0))
+
+        # A stateful updater violates the contract: its output changes between
+        # the incremental dispatch and the verification run.
+        values = iter(["LOW", "HIGH"])
+        updater.produce = lambda observations: [
+            make_candidate(FeatureType.REASONING, next(values))
+        ]
+        obs.append(make_observation(ObservationType.REASONING_DEPTH_HIGH, question_index=1))
+
+        with pytest.raises(FeatureEngineError, match="diverged"):
+            engine.run(make_context(snapshot=make_snapshot(obs), question_index=1))
@@ -255,18 +255,17 @@ def test_original_memory_is_not_mutated():
     assert len(memory.evidence_store.signals) == 1
 
 
-def test_evidence_store_capacity_not_exceeded():
-    from domain.contracts.reasoning.evidence_store import _MAX_SIGNALS
-    signals = [_make_signal(i) for i in range(_MAX_SIGNALS)]
+def test_evidence_store_grows_beyond_200_signals():
+    signals = [_make_signal(i) for i in range(200)]
     store = EvidenceStore(signals=signals)
     memory = InterviewMemory(evidence_store=store)
 
-    extra = [_make_signal(_MAX_SIGNALS)]
+    extra = [_make_signal(200)]
     d = _make_detector("D", priority=10, signals=extra)
     svc = ReasonerService(_registry(d))
-    decision, _, _ = svc.reason(_base_input(memory=memory))
-    # Service should not crash; decision is produced
+    decision, _, updated_memory = svc.reason(_base_input(memory=memory))
     assert decision.skip is False
+    assert len(updated_memory.evidence_store.signals) == 201
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,126 @@
+# tests/services/knowledge_pipeline/test_knowledge_pipeline_registry.py
+# KnowledgePipelineRegistry — session-scoped pipeline reuse
+#
+# Verifies:
+# 1. Consecutive cycles of a session share one IncrementalFeatureEngine.
+# 2. Reused cycles produce the same features as a fresh pipeline.
+# 3. A new ObservationStore instance rebinds the pipeline but keeps the engine.
+# 4. Sessions are evicted explicitly and after the TTL.
+
+from __future__ import annotations
+
+import uuid
+
+from domain.contracts.observation.observation import Observation
+from domain.contracts.observation.observation_id import ObservationId
+from domain.contracts.observation.observation_metadata import ObservationMetadata
+from domain.contracts.observation.observation_origin import ObservationOrigin
+from domain.contracts.observation.observation_status import ObservationStatus
+from domain.contracts.observation.observation_type import ObservationType
+from domain.observation.runtime.in_memory_observation_store import InMemoryObservationStore
+from services.knowledge_pipeline.default_knowledge_pipeline_factory import (
+    build_default_knowledge_pipeline,
+)
+from services.knowledge_pipeline.knowledge_pipeline_context import KnowledgePipelineContext
+from services.knowledge_pipeline.knowledge_pipeline_registry import KnowledgePipelineRegistry
+
+
+def _observation(q_idx: int, observation_type: ObservationType) -> Observation:
+    return Observation(
+        id=ObservationId(value=str(uuid.uuid4())),
+        observation_type=observation_type,
+        status=ObservationStatus.ACTIVE,
+        description="Test observation",
+        confidence=0.85,
+        metadata=ObservationMetadata(
+            session_id="s1",
+            question_index=q_idx,
+            origin=ObservationOrigin.REPLAY,
+        ),
+    )
+
+
+def _context(q_idx: int) -> KnowledgePipelineContext:
+    return KnowledgePipelineContext(
+        session_id="s1",
+        candidate_identity_id="cand-1",
+        question_index=q_idx,
+    )
+
+
+def _features(result) -> list:
+    return [
+        (f.feature_identity.feature_type_id, f.value)
+        for f in result.profile.features
+    ] if result.profile is not None else []
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKnowledgePipelineRegistry:
+    def test_cycles_of_a_session_reuse_the_feature_engine(self) -> None:
+        registry = KnowledgePipelineRegistry()
+        store = InMemoryObservationStore(session_id="s1")
+
+        store.append(_observation(0, ObservationType.TECHNICAL_STRENGTH))
+        registry.run("s1", store, _context(0))
+        engine = registry._sessions["s1"].feature_engine
+
+        store.append(_observation(1, ObservationType.TECHNICAL_GAP))
+        result = registry.run("s1", store, _context(1))
+
+        assert registry._sessions["s1"].feature_engine is engine
+        assert engine.observation_watermark == store.count()
+        assert _features(result)
+        assert _features(result) == _features(
+            build_default_knowledge_pipeline(store).run(_context(1))
+        )
+
+    def test_new_store_rebinds_pipeline_and_keeps_engine(self) -> None:
+        registry = KnowledgePipelineRegistry()
+        first = InMemoryObservationStore(session_id="s1")
+        first.append(_observation(0, ObservationType.TECHNICAL_STRENGTH))
+        registry.run("s1", first, _context(0))
+        session = registry._sessions["s1"]
+        engine, pipeline = session.feature_engine, session.pipeline
+
+        second = InMemoryObservationStore(session_id="s1")
+        second.append(_observation(0, ObservationType.TECHNICAL_STRENGTH))
+        result = registry.run("s1", second, _context(0))
+
+        assert session.feature_engine is engine
+        assert session.pipeline is not pipeline
+        assert _features(result) == _features(
+            build_default_knowledge_pipeline(second).run(_context(0))
+        )
+
+    def test_evict_drops_the_session(self) -> None:
+        registry = KnowledgePipelineRegistry()
+        store = InMemoryObservationStore(session_id="s1")
+        store.append(_observation(0, ObservationType.TECHNICAL_STRENGTH))
+        registry.run("s1", store, _context(0))
+
+        registry.evict("s1")
+
+        assert "s1" not in registry
+
+    def test_idle_sessions_expire_after_ttl(self) -> None:
+        clock = _Clock()
+        registry = KnowledgePipelineRegistry(ttl_seconds=10.0, clock=clock)
+        store = InMemoryObservationStore(session_id="s1")
+        store.append(_observation(0, ObservationType.TECHNICAL_STRENGTH))
+
+        registry.run("s1", store, _context(0))
+        clock.now = 5.0
+        registry.run("s2", store, _context(0))
+        clock.now = 12.0
+        registry.run("s2", store, _context(0))
+
+        assert "s1" not in registry
+        assert "s2" in registry
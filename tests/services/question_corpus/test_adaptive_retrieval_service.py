@@ -72,8 +72,22 @@ def _build_candidate(
     )
 
 
+class _StagedRetrieval:
+    """Yields canned per-stage results and records which stages were consumed."""
+
+    def __init__(self) -> None:
+        self.stage_results: list[list[RetrievalCandidate]] = []
+        self.searched_stages: list[RetrievalFilters] = []
+        self.search = MagicMock()
+
+    def search_staged(self, query, filter_stages, k):
+        for stage_filters, results in zip(filter_stages, self.stage_results):
+            self.searched_stages.append(stage_filters)
+            yield results
+
+
 def _build_service(
-    mock_retrieval: MagicMock,
+    mock_retrieval: _StagedRetrieval,
 ) -> AdaptiveRetrievalService:
 
     coverage_engine = CoveragePenaltyEngine()
@@ -102,8 +116,8 @@ def test_strict_retrieval_success_stage_1() -> None:
     stages = _stage_filters(context)
     candidate = _build_candidate("bg-1", context.target_area)
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [candidate],
         [],
         [],
@@ -119,8 +133,8 @@ def test_strict_retrieval_success_stage_1() -> None:
 
     assert len(results) == 1
     assert results[0].document.metadata["area"] == context.target_area
-    assert mock_retrieval.search_with_filters.call_count == 1
-    assert mock_retrieval.search_with_filters.call_args_list[0].kwargs["filters"] == stages[0]
+    assert len(mock_retrieval.searched_stages) == 1
+    assert mock_retrieval.searched_stages[0] == stages[0]
     mock_retrieval.search.assert_not_called()
 
 
@@ -130,8 +144,8 @@ def test_stage_2_retrieval_success() -> None:
     stages = _stage_filters(context)
     candidate = _build_candidate("bg-2", context.target_area)
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [],
         [candidate],
     ]
@@ -145,8 +159,8 @@ def test_stage_2_retrieval_success() -> None:
 
     assert len(results) == 1
     assert results[0].document.metadata["area"] == context.target_area
-    assert mock_retrieval.search_with_filters.call_count == 2
-    assert mock_retrieval.search_with_filters.call_args_list[1].kwargs["filters"] == stages[1]
+    assert len(mock_retrieval.searched_stages) == 2
+    assert mock_retrieval.searched_stages[1] == stages[1]
     mock_retrieval.search.assert_not_called()
 
 
@@ -156,8 +170,8 @@ def test_stage_3_retrieval_success() -> None:
     stages = _stage_filters(context)
     candidate = _build_candidate("bg-3", context.target_area)
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [],
         [],
         [candidate],
@@ -171,8 +185,8 @@ def test_stage_3_retrieval_success() -> None:
     )
 
     assert len(results) == 1
-    assert mock_retrieval.search_with_filters.call_count == 3
-    assert mock_retrieval.search_with_filters.call_args_list[2].kwargs["filters"] == stages[2]
+    assert len(mock_retrieval.searched_stages) == 3
+    assert mock_retrieval.searched_stages[2] == stages[2]
     mock_retrieval.search.assert_not_called()
 
 
@@ -182,8 +196,8 @@ def test_stage_4_retrieval_success() -> None:
     stages = _stage_filters(context)
     candidate = _build_candidate("bg-4", context.target_area)
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [],
         [],
         [],
@@ -198,8 +212,8 @@ def test_stage_4_retrieval_success() -> None:
     )
 
     assert len(results) == 1
-    assert mock_retrieval.search_with_filters.call_count == 4
-    assert mock_retrieval.search_with_filters.call_args_list[3].kwargs["filters"] == stages[3]
+    assert len(mock_retrieval.searched_stages) == 4
+    assert mock_retrieval.searched_stages[3] == stages[3]
     assert stages[3].area == context.target_area
     assert stages[3].role is None
     assert stages[3].seniority == context.seniority
@@ -212,8 +226,8 @@ def test_all_stages_empty_returns_empty_list() -> None:
 
     context = _build_context()
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [],
         [],
         [],
@@ -228,7 +242,7 @@ def test_all_stages_empty_returns_empty_list() -> None:
     )
 
     assert results == []
-    assert mock_retrieval.search_with_filters.call_count == 4
+    assert len(mock_retrieval.searched_stages) == 4
     mock_retrieval.search.assert_not_called()
 
 
@@ -240,8 +254,8 @@ def test_background_fresh_start_micro_pool_advances_stage() -> None:
         for index in range(6)
     ]
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [_build_candidate("bg-micro", context.target_area)],
         candidates_big,
     ]
@@ -254,7 +268,7 @@ def test_background_fresh_start_micro_pool_advances_stage() -> None:
     )
 
     assert len(results) >= 1
-    assert mock_retrieval.search_with_filters.call_count == 2
+    assert len(mock_retrieval.searched_stages) == 2
     returned_ids = {
         item.document.metadata["document_id"] for item in results
     }
@@ -265,8 +279,8 @@ def test_background_fresh_start_falls_back_to_largest_micro_pool() -> None:
 
     context = _build_context(asked_question_ids=[])
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [_build_candidate("bg-a", context.target_area)],
         [
             _build_candidate("bg-b", context.target_area),
@@ -284,7 +298,7 @@ def test_background_fresh_start_falls_back_to_largest_micro_pool() -> None:
     )
 
     assert len(results) == 1
-    assert mock_retrieval.search_with_filters.call_count == 4
+    assert len(mock_retrieval.searched_stages) == 4
     assert results[0].document.metadata["document_id"] in {"bg-b", "bg-c"}
 
 
@@ -295,8 +309,8 @@ def test_non_background_area_keeps_non_empty_stage_success() -> None:
         asked_question_ids=[],
     )
 
-    mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.side_effect = [
+    mock_retrieval = _StagedRetrieval()
+    mock_retrieval.stage_results = [
         [_build_candidate("cs-1", context.target_area)],
     ]
 
@@ -308,7 +322,7 @@ def test_non_background_area_keeps_non_empty_stage_success() -> None:
     )
 
     assert len(results) == 1
-    assert mock_retrieval.search_with_filters.call_count == 1
+    assert len(mock_retrieval.searched_stages) == 1
 
 
 def test_build_relaxation_stages_preserves_area_across_stages() -> None:
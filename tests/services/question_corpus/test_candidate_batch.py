@@ -0,0 +1,152 @@
+# tests/services/question_corpus/test_candidate_batch.py
+
+import random
+
+from langchain_core.documents import Document
+
+from domain.contracts.question.sql_domain import SqlDomain
+from services.question_corpus.contracts.adaptive_retrieval_context import (
+    AdaptiveRetrievalContext,
+)
+from services.question_corpus.contracts.interview_retrieval_memory import (
+    InterviewRetrievalMemory,
+)
+from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
+from services.question_corpus.retrieval.candidate_batch import CandidateBatch
+from services.question_corpus.retrieval.coverage_penalty_engine import CoveragePenaltyEngine
+from services.question_corpus.retrieval.weak_domain_boost_engine import WeakDomainBoostEngine
+from services.question_corpus.utils.domain_parser import (
+    SQL_DOMAIN_BITS,
+    parse_sql_domains,
+    sql_domain_mask,
+)
+
+_DOMAINS = [d.value for d in SqlDomain]
+
+
+def _candidate(
+    document_id: str,
+    domains: str,
+    adaptive_score: float,
+    text: str = "question",
+) -> RetrievalCandidate:
+
+    return RetrievalCandidate(
+        document=Document(
+            page_content=text,
+            metadata={"document_id": document_id, "domains": domains},
+        ),
+        semantic_score=adaptive_score,
+        quality_score=0.5,
+        final_score=adaptive_score,
+        adaptive_score=adaptive_score,
+    )
+
+
+def _context(theme_anchor: str | None = None) -> AdaptiveRetrievalContext:
+
+    return AdaptiveRetrievalContext(
+        current_role="backend_engineer",
+        seniority="mid",
+        target_area="technical_database",
+        target_question_count=3,
+        already_used_domains=[SqlDomain.JOIN, SqlDomain.INDEXING],
+        weak_domains=[SqlDomain.CTE, SqlDomain.JOIN],
+        memory=InterviewRetrievalMemory(theme_anchor=theme_anchor),
+    )
+
+
+def _reference(
+    candidates: list[RetrievalCandidate],
+    context: AdaptiveRetrievalContext,
+) -> list[tuple[str, float]]:
+    """Per-candidate coverage penalty and weak-domain boost, as one loop."""
+
+    used = set(context.already_used_domains)
+    weak = set(context.weak_domains)
+    anchor = context.memory.theme_anchor
+
+    scored = []
+
+    for c in candidates:
+        domains = parse_sql_domains(c.document.metadata["domains"])
+        score = round(max(0.0, c.adaptive_score - 0.15 * len(used.intersection(domains))), 3)
+        boost = 0.10 * len(weak.intersection(domains))
+        if anchor:
+            text = c.document.page_content.lower()
+            if anchor in [d.value for d in domains]:
+                boost += 0.08
+            elif anchor in text or anchor.replace("_", " ") in text:
+                boost += 0.04
+        scored.append((c.document.metadata["document_id"], round(score + boost, 3)))
+
+    return sorted(scored, key=lambda pair: pair[1], reverse=True)
+
+
+def test_domain_mask_matches_parsed_domains():
+
+    mask = sql_domain_mask("join, cte,unknown_thing")
+
+    assert mask == (
+        SQL_DOMAIN_BITS[SqlDomain.JOIN]
+        | SQL_DOMAIN_BITS[SqlDomain.CTE]
+        | SQL_DOMAIN_BITS[SqlDomain.TECHNICAL_DATABASE]
+    )
+    assert sql_domain_mask(["join", SqlDomain.CTE]) == sql_domain_mask("join,cte")
+    assert sql_domain_mask(None) == 0
+
+
+def test_batch_engines_match_per_candidate_scoring():
+
+    rng = random.Random(5)
+
+    candidates = [
+        _candidate(
+            f"d{i}",
+            ",".join(rng.sample(_DOMAINS, rng.randint(0, 3))),
+            round(rng.uniform(0.0, 0.9), 3),
+            text=rng.choice(["uses a window function", "plain question"]),
+        )
+        for i in range(40)
+    ]
+
+    context = _context(theme_anchor="window_function")
+
+    batch = CandidateBatch(candidates)
+    CoveragePenaltyEngine().apply_batch(batch=batch, context=context)
+    WeakDomainBoostEngine().apply_batch(batch=batch, context=context)
+
+    ranked = batch.ranked()
+
+    assert [
+        (c.document.metadata["document_id"], c.adaptive_score) for c in ranked
+    ] == _reference(candidates, context)
+
+
+def test_ranked_only_copies_changed_candidates():
+
+    untouched = _candidate("a", "having", 0.8)
+    boosted = _candidate("b", "cte", 0.6)
+
+    batch = CandidateBatch([untouched, boosted])
+    WeakDomainBoostEngine().apply_batch(batch=batch, context=_context())
+
+    ranked = batch.ranked()
+
+    assert ranked[0] is untouched
+    assert ranked[1] is not boosted
+    assert ranked[1].adaptive_score == 0.7
+
+
+def test_zero_adaptive_score_can_fall_back_to_final_score():
+
+    penalized = _candidate("a", "join,indexing", 0.3)
+    other = _candidate("b", "having", 0.2)
+
+    batch = CandidateBatch([other, penalized])
+    CoveragePenaltyEngine().apply_batch(batch=batch, context=_context())
+
+    assert [c.document.metadata["document_id"] for c in batch.ranked()] == ["b", "a"]
+    assert [
+        c.document.metadata["document_id"] for c in batch.ranked(fallback_to_final=True)
+    ] == ["a", "b"]
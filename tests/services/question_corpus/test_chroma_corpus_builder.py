@@ -0,0 +1,232 @@
+# tests/services/question_corpus/test_chroma_corpus_builder.py
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from infrastructure.vector_store.chroma_registry import (
+    EMBEDDING_MODEL_KEY,
+    EmbeddingModelMismatchError,
+)
+from services.question_corpus.constants.vector_store_constants import (
+    CHROMA_CORPUS_VERSION_KEY,
+)
+from services.question_corpus.vectorstores.chroma_corpus_builder import (
+    CONTENT_HASH_KEY,
+    ChromaCorpusBuilder,
+    content_hash,
+)
+
+
+class _CountingEmbeddings(Embeddings):
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        self.embedded.extend(texts)
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 1.0, 0.0]
+
+
+def _document(document_id: str, text: str, difficulty: int = 2) -> Document:
+
+    return Document(
+        page_content=text,
+        metadata={
+            "document_id": document_id,
+            "area": "technical_database",
+            "difficulty": difficulty,
+        },
+    )
+
+
+def _corpus(size: int = 5) -> list[Document]:
+
+    return [_document(f"q{i}", f"question number {i}") for i in range(size)]
+
+
+@pytest.fixture()
+def embeddings() -> _CountingEmbeddings:
+    return _CountingEmbeddings()
+
+
+@pytest.fixture()
+def builder(tmp_path, embeddings) -> ChromaCorpusBuilder:
+
+    return ChromaCorpusBuilder(
+        embeddings=embeddings,
+        collection_name="corpus_test",
+        persist_directory=str(tmp_path / "chroma"),
+        batch_size=2,
+    )
+
+
+def test_full_build_stores_document_ids_and_hashes(builder, embeddings):
+
+    vectorstore = builder.build(_corpus())
+
+    stored = vectorstore.get(include=["metadatas"])
+
+    assert sorted(stored["ids"]) == [f"q{i}" for i in range(5)]
+    assert all(m[CONTENT_HASH_KEY] for m in stored["metadatas"])
+    assert embeddings.calls == 3
+
+
+def test_unchanged_corpus_embeds_nothing(builder, embeddings):
+
+    builder.build(_corpus())
+    embeddings.embedded.clear()
+
+    vectorstore = builder.build(_corpus(), incremental=True)
+    report = builder.sync(vectorstore, _corpus())
+
+    assert embeddings.embedded == []
+    assert (report.added, report.updated, report.unchanged, report.deleted) == (0, 0, 5, 0)
+
+
+def test_single_edit_embeds_one_document(builder, embeddings):
+
+    builder.build(_corpus())
+    embeddings.embedded.clear()
+
+    corpus = _corpus()
+    corpus[3] = _document("q3", "question number 3, reworded")
+    corpus[1] = _document("q1", "question number 1", difficulty=4)
+
+    vectorstore = builder.build(corpus, incremental=True)
+
+    assert sorted(embeddings.embedded) == ["question number 1", "question number 3, reworded"]
+    assert vectorstore.get(ids=["q3"])["documents"] == ["question number 3, reworded"]
+    assert vectorstore.get(ids=["q1"])["metadatas"][0]["difficulty"] == 4
+
+
+def test_removed_ids_are_deleted_and_new_ids_added(builder, embeddings):
+
+    builder.build(_corpus())
+    embeddings.embedded.clear()
+
+    corpus = _corpus()[:3] + [_document("q9", "a brand new question")]
+
+    vectorstore = builder.build(corpus, incremental=True)
+
+    assert sorted(vectorstore.get()["ids"]) == ["q0", "q1", "q2", "q9"]
+    assert embeddings.embedded == ["a brand new question"]
+
+
+def test_interrupted_sync_resumes_from_written_batches(builder, embeddings, monkeypatch):
+
+    vectorstore = builder.build([], incremental=True)
+
+    original = vectorstore.add_texts
+    calls = {"n": 0}
+
+    def flaky_add_texts(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 2:
+            raise RuntimeError("embedding provider unavailable")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(vectorstore, "add_texts", flaky_add_texts)
+
+    with pytest.raises(RuntimeError):
+        builder.sync(vectorstore, _corpus())
+
+    monkeypatch.undo()
+    embeddings.embedded.clear()
+
+    report = builder.sync(vectorstore, _corpus())
+
+    assert report.unchanged == 2
+    assert report.added == 3
+    assert sorted(embeddings.embedded) == [f"question number {i}" for i in (2, 3, 4)]
+
+
+def test_sync_stamps_a_content_derived_corpus_version(builder):
+
+    vectorstore = builder.build(_corpus())
+    version = vectorstore._collection.metadata[CHROMA_CORPUS_VERSION_KEY]
+
+    assert builder.sync(vectorstore, _corpus()).corpus_version == version
+
+    corpus = _corpus()
+    corpus[0] = _document("q0", "question number 0, reworded")
+
+    report = builder.sync(vectorstore, corpus)
+
+    assert report.corpus_version != version
+    assert vectorstore._collection.metadata[CHROMA_CORPUS_VERSION_KEY] == report.corpus_version
+
+
+def test_sync_records_the_embedding_model(builder):
+
+    vectorstore = builder.build(_corpus())
+
+    assert vectorstore._collection.metadata[EMBEDDING_MODEL_KEY] == "_CountingEmbeddings"
+
+
+def test_duplicate_document_ids_are_rejected(builder):
+
+    with pytest.raises(ValueError, match="duplicate document_id"):
+        builder.build([_document("q1", "a"), _document("q1", "b")], incremental=True)
+
+
+class _OtherModelEmbeddings(_CountingEmbeddings):
+
+    model = "other-model"
+
+
+def test_sync_refuses_a_collection_embedded_with_another_model(builder, tmp_path):
+
+    vectorstore = builder.build(_corpus())
+
+    switched = ChromaCorpusBuilder(
+        embeddings=_OtherModelEmbeddings(),
+        collection_name="corpus_test",
+        persist_directory=str(tmp_path / "chroma"),
+        batch_size=2,
+    )
+
+    with pytest.raises(EmbeddingModelMismatchError):
+        switched.sync(vectorstore, _corpus())
+
+
+def test_incremental_build_after_a_model_switch_rebuilds_in_full(builder, tmp_path):
+
+    builder.build(_corpus())
+
+    other = _OtherModelEmbeddings()
+    switched = ChromaCorpusBuilder(
+        embeddings=other,
+        collection_name="corpus_test",
+        persist_directory=str(tmp_path / "chroma"),
+        batch_size=2,
+    )
+
+    vectorstore = switched.build(_corpus(), incremental=True)
+
+    assert sorted(other.embedded) == [f"question number {i}" for i in range(5)]
+    assert vectorstore._collection.metadata[EMBEDDING_MODEL_KEY] == "other-model"
+    assert vectorstore._collection.count() == 5
+
+
+def test_content_hash_identifies_the_embedding_model(builder, tmp_path):
+
+    vectorstore = builder.build(_corpus())
+    version = vectorstore._collection.metadata[CHROMA_CORPUS_VERSION_KEY]
+
+    switched = ChromaCorpusBuilder(
+        embeddings=_OtherModelEmbeddings(),
+        collection_name="corpus_test",
+        persist_directory=str(tmp_path / "chroma"),
+        batch_size=2,
+    )
+
+    rebuilt = switched.build(_corpus(), incremental=True)
+
+    assert content_hash(_corpus()[0], "a") != content_hash(_corpus()[0], "b")
+    assert rebuilt._collection.metadata[CHROMA_CORPUS_VERSION_KEY] != version
@@ -0,0 +1,203 @@
+# tests/services/question_corpus/test_chroma_retrieval_service.py
+
+import hashlib
+import uuid
+
+import chromadb
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+
+from services.question_corpus.contracts.retrieval_filters import RetrievalFilters
+from services.question_corpus.retrieval.chroma_filter_builder import ChromaFilterBuilder
+from services.question_corpus.retrieval.chroma_retrieval_service import (
+    ChromaRetrievalService,
+)
+
+
+class _HashEmbeddings(Embeddings):
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def embed_documents(self, texts):
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return self._vector(text)
+
+    @staticmethod
+    def _vector(text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:8]]
+
+
+_SENIORITIES = ["junior", "mid", "senior"]
+
+_AREAS = ["technical_database", "technical_background"]
+
+
+@pytest.fixture()
+def embeddings() -> _HashEmbeddings:
+    return _HashEmbeddings()
+
+
+@pytest.fixture()
+def service(embeddings) -> ChromaRetrievalService:
+
+    vectorstore = Chroma(
+        collection_name=f"test-{uuid.uuid4().hex}",
+        embedding_function=embeddings,
+        client=chromadb.EphemeralClient(),
+    )
+
+    texts = [f"question {i}" for i in range(60)]
+
+    vectorstore.add_texts(
+        texts=texts,
+        metadatas=[
+            {
+                "document_id": f"q{i}",
+                "role": "backend_engineer" if i % 4 else "data_engineer",
+                "seniority": _SENIORITIES[i % 3],
+                "area": _AREAS[i % 2],
+                "difficulty": 1 + i % 5,
+            }
+            for i in range(60)
+        ],
+    )
+
+    return ChromaRetrievalService(vectorstore=vectorstore)
+
+
+def _stages() -> list[RetrievalFilters]:
+
+    return [
+        RetrievalFilters(
+            role="backend_engineer",
+            seniority="mid",
+            area="technical_database",
+            min_difficulty=2,
+            max_difficulty=4,
+        ),
+        RetrievalFilters(
+            seniority="mid,senior",
+            area="technical_database",
+            min_difficulty=2,
+            max_difficulty=4,
+        ),
+        RetrievalFilters(
+            seniority="junior,mid,senior",
+            area="technical_database",
+        ),
+    ]
+
+
+def _ids(candidates) -> list[str]:
+    return [c.document.metadata["document_id"] for c in candidates]
+
+
+def _count_queries(service, monkeypatch) -> list[dict]:
+
+    collection = service._vectorstore._collection
+    original = collection.query
+    calls: list[dict] = []
+
+    def counting_query(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(collection, "query", counting_query)
+
+    return calls
+
+
+@pytest.mark.parametrize("k", [2, 5, 12])
+def test_staged_results_match_per_stage_search(service, k):
+
+    expected = [
+        _ids(service.search_with_filters("sql joins", stage, k=k))
+        for stage in _stages()
+    ]
+
+    staged = [_ids(stage) for stage in service.search_staged("sql joins", _stages(), k=k)]
+
+    assert staged == expected
+
+
+def test_staged_search_embeds_once_and_queries_twice(service, embeddings, monkeypatch):
+
+    calls = _count_queries(service, monkeypatch)
+
+    list(service.search_staged("sql joins", _stages(), k=2))
+
+    assert embeddings.queries == ["sql joins"]
+    assert len(calls) == 2
+    assert calls[1]["n_results"] == 2 * ChromaRetrievalService.STAGED_FETCH_MULTIPLIER
+
+
+def test_undersized_relaxed_stage_falls_back_to_its_own_query(service, monkeypatch):
+
+    calls = _count_queries(service, monkeypatch)
+
+    stages = _stages()[:2]
+
+    # Only 5 of the 60 records match this stage, so the truncated widened
+    # window holds fewer than k of them and the stage must query on its own.
+    narrow = RetrievalFilters(
+        role="data_engineer",
+        seniority="mid",
+        area="technical_database",
+    )
+
+    results = list(service.search_staged("sql joins", [stages[0], narrow, stages[1]], k=5))
+
+    assert _ids(results[1]) == _ids(service.search_with_filters("sql joins", narrow, k=5))
+    assert calls[2]["where"] == ChromaFilterBuilder().build(narrow)
+
+
+def test_stages_are_evaluated_lazily(service, monkeypatch):
+
+    calls = _count_queries(service, monkeypatch)
+
+    staged = service.search_staged("sql joins", _stages(), k=2)
+
+    next(staged)
+    staged.close()
+
+    assert len(calls) == 1
+
+
+class TestFilterBuilderLocalEvaluation:
+
+    def test_matches_mirrors_where_clause(self):
+
+        builder = ChromaFilterBuilder()
+        filters = _stages()[1]
+
+        assert builder.matches(
+            filters,
+            {"seniority": "senior", "area": "technical_database", "difficulty": 3},
+        )
+        assert not builder.matches(
+            filters,
+            {"seniority": "junior", "area": "technical_database", "difficulty": 3},
+        )
+        assert not builder.matches(
+            filters,
+            {"seniority": "mid", "area": "technical_database", "difficulty": 5},
+        )
+        assert not builder.matches(
+            filters,
+            {"seniority": "mid", "area": "technical_database", "difficulty": "3"},
+        )
+
+    def test_covering_keeps_only_constraints_shared_by_every_stage(self):
+
+        covering = ChromaFilterBuilder().covering(_stages())
+
+        assert covering == RetrievalFilters(
+            seniority="mid,senior,junior",
+            area="technical_database",
+        )
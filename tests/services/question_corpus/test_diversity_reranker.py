@@ -0,0 +1,170 @@
+# tests/services/question_corpus/test_diversity_reranker.py
+
+import math
+import random
+import uuid
+
+import chromadb
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
+from services.question_corpus.retrieval.chroma_retrieval_service import (
+    ChromaRetrievalService,
+)
+from services.question_corpus.retrieval.diversity_reranker import DiversityReranker
+
+
+def _candidate(
+    document_id: str,
+    final_score: float,
+    embedding: list[float] | None,
+) -> RetrievalCandidate:
+
+    return RetrievalCandidate(
+        document=Document(
+            page_content=f"question {document_id}",
+            metadata={"document_id": document_id},
+        ),
+        semantic_score=final_score,
+        quality_score=0.5,
+        final_score=final_score,
+        embedding=embedding,
+    )
+
+
+def _reference_rerank(
+    candidates: list[RetrievalCandidate],
+    top_k: int,
+) -> list[tuple[str, float]]:
+    """The original pairwise greedy loop, kept as an oracle."""
+
+    def cosine(a, b):
+        dot = sum(x * y for x, y in zip(a, b))
+        na = math.sqrt(sum(x * x for x in a))
+        nb = math.sqrt(sum(x * x for x in b))
+        return 0.0 if na == 0 or nb == 0 else dot / (na * nb)
+
+    selected = []
+    remaining = candidates.copy()
+
+    while remaining and len(selected) < top_k:
+        best, best_score = None, -999.0
+        for c in remaining:
+            sims = [
+                cosine(c.embedding, s.embedding)
+                for s, _ in selected
+                if c.embedding is not None and s.embedding is not None
+            ]
+            penalty = (
+                min(max(sims) * DiversityReranker.REDUNDANCY_WEIGHT, DiversityReranker.REDUNDANCY_CAP)
+                if sims
+                else 0.0
+            )
+            if c.final_score - penalty > best_score:
+                best, best_score = c, c.final_score - penalty
+        selected.append((best, round(best_score, 3)))
+        remaining.remove(best)
+
+    return [(c.document.metadata["document_id"], score) for c, score in selected]
+
+
+def test_near_duplicate_is_pushed_down():
+
+    candidates = [
+        _candidate("a", 0.90, [1.0, 0.0]),
+        _candidate("a-dup", 0.89, [0.99, 0.01]),
+        _candidate("b", 0.80, [0.0, 1.0]),
+    ]
+
+    reranked = DiversityReranker().rerank(candidates, top_k=3)
+
+    assert [c.document.metadata["document_id"] for c in reranked] == ["a", "b", "a-dup"]
+    assert reranked[2].diversity_score == round(0.89 - 0.25, 3)
+
+
+def test_matches_pairwise_reference():
+
+    rng = random.Random(3)
+
+    candidates = [
+        _candidate(
+            f"d{i}",
+            round(rng.uniform(0.3, 0.95), 3),
+            None if i % 7 == 0 else [rng.uniform(-1, 1) for _ in range(16)],
+        )
+        for i in range(50)
+    ]
+
+    reranked = DiversityReranker().rerank(candidates, top_k=20)
+
+    assert [
+        (c.document.metadata["document_id"], c.diversity_score) for c in reranked
+    ] == _reference_rerank(candidates, top_k=20)
+
+
+def test_precomputed_matrix_matches_candidate_embeddings():
+
+    rng = random.Random(11)
+
+    vectors = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(30)]
+
+    candidates = [
+        _candidate(f"d{i}", round(rng.uniform(0.3, 0.95), 3), vector)
+        for i, vector in enumerate(vectors)
+    ]
+
+    reranker = DiversityReranker()
+
+    assert reranker.rerank(candidates, top_k=10, embeddings=np.array(vectors)) == (
+        reranker.rerank(candidates, top_k=10)
+    )
+
+
+def test_candidates_without_embeddings_keep_their_scores():
+
+    candidates = [
+        _candidate("a", 0.7, None),
+        _candidate("b", 0.6, None),
+    ]
+
+    reranked = DiversityReranker().rerank(candidates, top_k=5)
+
+    assert [c.diversity_score for c in reranked] == [0.7, 0.6]
+
+
+class _AxisEmbeddings(Embeddings):
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        return [1.0, 0.0, 0.0] if "join" in text else [0.0, 1.0, 0.0]
+
+
+def test_chroma_search_reranks_with_stored_vectors():
+
+    vectorstore = Chroma(
+        collection_name=f"test-{uuid.uuid4().hex}",
+        embedding_function=_AxisEmbeddings(),
+        client=chromadb.EphemeralClient(),
+    )
+
+    vectorstore.add_texts(
+        texts=["sql join basics", "sql join types", "index tuning"],
+        metadatas=[
+            {"document_id": "j1", "quality_score": 0.9},
+            {"document_id": "j2", "quality_score": 0.9},
+            {"document_id": "i1", "quality_score": 0.9},
+        ],
+    )
+
+    service = ChromaRetrievalService(vectorstore=vectorstore)
+
+    results = service.search("join", k=3)
+
+    assert all(c.embedding is not None for c in results)
+    assert [c.document.metadata["document_id"] for c in results[:2]] == ["j1", "j2"]
+    assert results[1].diversity_score == round(results[1].final_score - 0.25, 3)
@@ -0,0 +1,165 @@
+# tests/services/question_corpus/test_retrieval_result_cache.py
+
+import uuid
+
+import chromadb
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from infrastructure.config.settings import settings
+from services.question_corpus.constants.vector_store_constants import (
+    CHROMA_CORPUS_VERSION_KEY,
+)
+from services.question_corpus.contracts.retrieval_candidate import RetrievalCandidate
+from services.question_corpus.contracts.retrieval_filters import RetrievalFilters
+from services.question_corpus.retrieval.chroma_retrieval_service import (
+    ChromaRetrievalService,
+)
+from services.question_corpus.retrieval.retrieval_result_cache import (
+    RetrievalResultCache,
+    retrieval_cache_key,
+)
+
+
+class _Clock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _candidate(document_id: str) -> RetrievalCandidate:
+
+    return RetrievalCandidate(
+        document=Document(page_content="q", metadata={"document_id": document_id}),
+        semantic_score=0.5,
+        quality_score=0.5,
+        final_score=0.5,
+    )
+
+
+def _key(query: str = "sql joins", version: str = "v1"):
+    return retrieval_cache_key(query, RetrievalFilters(area="technical_database"), 5, version)
+
+
+class TestRetrievalResultCache:
+
+    def test_key_normalizes_whitespace_and_separates_filters(self):
+
+        assert _key("sql  joins ") == _key("sql joins")
+        assert _key() != retrieval_cache_key("sql joins", RetrievalFilters(), 5, "v1")
+        assert _key() != retrieval_cache_key("sql joins", None, 5, "v1")
+
+    def test_entries_expire_after_ttl(self):
+
+        clock = _Clock()
+        cache = RetrievalResultCache(ttl_seconds=10, clock=clock)
+        cache.put(_key(), [_candidate("a")])
+
+        clock.now = 9
+        assert cache.get(_key()) is not None
+
+        clock.now = 11
+        assert cache.get(_key()) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+
+        cache = RetrievalResultCache(max_entries=2)
+        cache.put(_key("a"), [])
+        cache.put(_key("b"), [])
+        cache.get(_key("a"))
+        cache.put(_key("c"), [])
+
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) == []
+
+    def test_new_corpus_version_drops_entries(self):
+
+        cache = RetrievalResultCache()
+        cache.observe_version("v1")
+        cache.put(_key(), [_candidate("a")])
+
+        cache.observe_version("v1")
+        assert len(cache) == 1
+
+        cache.observe_version("v2")
+        assert len(cache) == 0
+
+    def test_returned_lists_do_not_alias_the_entry(self):
+
+        cache = RetrievalResultCache()
+        cache.put(_key(), [_candidate("a")])
+
+        cache.get(_key()).clear()
+
+        assert len(cache.get(_key())) == 1
+
+
+class _CountingEmbeddings(Embeddings):
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def embed_documents(self, texts):
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [float(len(text)), 1.0, 0.5]
+
+
+@pytest.fixture()
+def vectorstore():
+
+    store = Chroma(
+        collection_name=f"test-{uuid.uuid4().hex}",
+        embedding_function=_CountingEmbeddings(),
+        client=chromadb.EphemeralClient(),
+    )
+
+    store.add_texts(
+        texts=[f"question {i}" for i in range(10)],
+        metadatas=[
+            {"document_id": f"q{i}", "area": "technical_database", "difficulty": 1 + i % 5}
+            for i in range(10)
+        ],
+    )
+
+    return store
+
+
+def test_repeated_search_needs_no_embedding_or_query(vectorstore):
+
+    service = ChromaRetrievalService(
+        vectorstore=vectorstore,
+        result_cache=RetrievalResultCache(),
+    )
+    filters = RetrievalFilters(area="technical_database")
+
+    first = service.search_with_filters("sql joins", filters, k=3)
+    second = service.search_with_filters("sql  joins", filters, k=3)
+    staged = next(service.search_staged("sql joins", [filters], k=3))
+
+    assert vectorstore.embeddings.queries == ["sql joins"]
+    assert second == first == staged
+
+
+def test_corpus_version_change_invalidates_results(vectorstore, monkeypatch):
+
+    cache = RetrievalResultCache()
+    service = ChromaRetrievalService(vectorstore=vectorstore, result_cache=cache)
+    monkeypatch.setattr(settings, "retrieval_corpus_version_check_s", 0.0)
+
+    service.search("sql joins", k=3)
+
+    vectorstore._collection.modify(metadata={CHROMA_CORPUS_VERSION_KEY: "rebuilt"})
+
+    service.search("sql joins", k=3)
+
+    assert vectorstore.embeddings.queries == ["sql joins", "sql joins"]
+    assert (cache.hits, len(cache)) == (0, 1)
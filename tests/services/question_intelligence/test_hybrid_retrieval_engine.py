@@ -0,0 +1,150 @@
+# tests/services/question_intelligence/test_hybrid_retrieval_engine.py
+
+from datetime import datetime, timezone
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.interview.interview_type import InterviewType
+from domain.contracts.question.question_bank_item import QuestionBankItem
+from domain.contracts.user.role import Role, RoleType
+from domain.contracts.user.seniority_level import SeniorityLevel
+from services.question_ingestion.contracts.ingestion_metadata import IngestionMetadata
+from services.question_intelligence.hybrid.hybrid_retrieval_engine import (
+    HybridRetrievalEngine,
+)
+from services.question_intelligence.semantic.embedding_matrix import EmbeddingMatrix
+
+_VOCABULARY = ["index", "transaction", "cache", "queue"]
+
+
+class _KeywordEmbeddings:
+    """Deterministic bag-of-keywords embeddings that count backend calls."""
+
+    model = "fake-keyword-embeddings"
+
+    def __init__(self) -> None:
+        self.document_calls = 0
+        self.query_calls = 0
+
+    def _vector(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float(lowered.count(word)) for word in _VOCABULARY]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls += 1
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.query_calls += 1
+        return self._vector(text)
+
+
+def _item(item_id: str, text: str) -> QuestionBankItem:
+    return QuestionBankItem(
+        id=item_id,
+        text=text,
+        interview_type=InterviewType.TECHNICAL,
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        area=InterviewArea.TECH_DATABASE,
+        level=SeniorityLevel.MID,
+        difficulty=3,
+        ingestion_metadata=IngestionMetadata(
+            source_name="test_dataset",
+            source_type="manual",
+            dataset_version="v1",
+            ingestion_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+
+def _items() -> list[QuestionBankItem]:
+    return [
+        _item("q1", "How does a database index speed up lookups?"),
+        _item("q2", "Explain transaction isolation levels."),
+        _item("q3", "When would you put a cache in front of a service?"),
+        _item("q4", "Design a durable message queue."),
+    ]
+
+
+def test_corpus_is_embedded_once_and_query_once_per_search() -> None:
+    embeddings = _KeywordEmbeddings()
+    engine = HybridRetrievalEngine(_items(), embedding_model=embeddings)
+
+    engine.search("index design", top_k=2)
+    engine.search("cache invalidation", top_k=2)
+
+    assert embeddings.document_calls == 1
+    assert embeddings.query_calls == 2
+
+
+def test_search_ranks_semantic_and_keyword_matches_first() -> None:
+    engine = HybridRetrievalEngine(_items(), embedding_model=_KeywordEmbeddings())
+
+    results = engine.search("transaction isolation", top_k=2)
+
+    assert len(results) == 2
+    assert results[0].text == "Explain transaction isolation levels."
+    assert results[0].semantic_score == 1.0
+    assert results[0].final_score == 1.0
+    assert results[0].final_score >= results[1].final_score
+
+
+def test_embedding_matrix_is_reused_from_disk(tmp_path) -> None:
+    cache_path = tmp_path / "hybrid_embeddings.npz"
+
+    first = _KeywordEmbeddings()
+    HybridRetrievalEngine(_items(), embedding_model=first, embedding_cache_path=cache_path)
+
+    second = _KeywordEmbeddings()
+    engine = HybridRetrievalEngine(
+        _items(),
+        embedding_model=second,
+        embedding_cache_path=cache_path,
+    )
+
+    assert first.document_calls == 1
+    assert second.document_calls == 0
+    assert engine.search("queue", top_k=1)[0].text == "Design a durable message queue."
+
+
+def test_stale_disk_cache_is_ignored_when_corpus_changes(tmp_path) -> None:
+    cache_path = tmp_path / "hybrid_embeddings.npz"
+
+    HybridRetrievalEngine(
+        _items(),
+        embedding_model=_KeywordEmbeddings(),
+        embedding_cache_path=cache_path,
+    )
+
+    embeddings = _KeywordEmbeddings()
+    HybridRetrievalEngine(
+        _items()[:2],
+        embedding_model=embeddings,
+        embedding_cache_path=cache_path,
+    )
+
+    assert embeddings.document_calls == 1
+    assert len(EmbeddingMatrix.load(cache_path)) == 2
+
+
+def test_zero_vectors_score_zero() -> None:
+    matrix = EmbeddingMatrix([[0.0, 0.0], [3.0, 4.0]])
+
+    scores = matrix.similarities([3.0, 4.0])
+
+    assert scores[0] == 0.0
+    assert abs(float(scores[1]) - 1.0) < 1e-6
+
+
+def test_empty_corpus_builds_and_returns_no_results(tmp_path) -> None:
+    embeddings = _KeywordEmbeddings()
+    cache_path = tmp_path / "corpus.npz"
+
+    engine = HybridRetrievalEngine(
+        [],
+        embedding_model=embeddings,
+        embedding_cache_path=cache_path,
+    )
+
+    assert engine.search("index design", top_k=3) == []
+    assert len(EmbeddingMatrix.load(cache_path)) == 0
+    assert embeddings.document_calls == 0
@@ -0,0 +1,398 @@
+# tests/services/question_intelligence/test_next_question_prefetcher.py
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.interview.interview_type import InterviewType
+from domain.contracts.question.question import Question, QuestionDifficulty, QuestionType
+from domain.contracts.question.sql_domain import SqlDomain
+from domain.contracts.shared.action_type import ActionType
+from domain.contracts.user.role import RoleType
+from domain.contracts.user.seniority_level import SeniorityLevel
+from infrastructure.config.settings import settings
+from services.question_corpus.contracts.interview_retrieval_memory import (
+    InterviewRetrievalMemory,
+)
+from services.question_intelligence.lazy_adaptive_interview_service import (
+    LazyAdaptiveInterviewService,
+)
+from services.question_intelligence.next_question_prefetcher import (
+    NextQuestionPrefetcher,
+    rebase_memory,
+)
+from app.graph.nodes.adaptive_navigation_node import AdaptiveNavigationNode
+
+_PLANNED = [
+    InterviewArea.TECH_BACKGROUND.value,
+    InterviewArea.TECH_TECHNICAL_KNOWLEDGE.value,
+    InterviewArea.TECH_CASE_STUDY.value,
+]
+
+
+def _question(question_id: str, area: InterviewArea = InterviewArea.TECH_TECHNICAL_KNOWLEDGE) -> Question:
+
+    return Question(
+        id=question_id,
+        area=area,
+        type=QuestionType.WRITTEN,
+        prompt=f"Prompt {question_id}",
+        difficulty=QuestionDifficulty.MEDIUM,
+    )
+
+
+def _area_builder() -> MagicMock:
+
+    def build(**kwargs):
+        memory = kwargs["memory"]
+        question_id = f"built-{area_builder.build.call_count}"
+        return (
+            [_question(question_id, kwargs["area"])],
+            memory.model_copy(
+                update={
+                    "asked_question_ids": [*memory.asked_question_ids, question_id],
+                    "difficulty_history": [*memory.difficulty_history, 2],
+                }
+            ),
+        )
+
+    area_builder = MagicMock()
+    area_builder.build.side_effect = build
+
+    return area_builder
+
+
+def _kwargs(memory: InterviewRetrievalMemory) -> dict:
+
+    return {
+        "role": RoleType.BACKEND_ENGINEER,
+        "level": SeniorityLevel.MID,
+        "interview_type": InterviewType.TECHNICAL,
+        "planned_areas": _PLANNED,
+        "generated_count": 1,
+        "memory": memory,
+    }
+
+
+@pytest.fixture()
+def prefetcher():
+
+    prefetcher = NextQuestionPrefetcher()
+    yield prefetcher
+    prefetcher.shutdown()
+
+
+def test_matching_prefetch_is_served_with_memory_rebased(prefetcher):
+
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+    snapshot = InterviewRetrievalMemory(asked_question_ids=["q-1"], difficulty_history=[2])
+
+    assert service.prefetch_next_question(session_id="s", **_kwargs(snapshot))
+
+    answered = snapshot.model_copy(update={"average_score": 0.5, "question_count": 1})
+
+    question, memory = service.generate_next_question(session_id="s", **_kwargs(answered))
+
+    assert question.id == "built-1"
+    assert area_builder.build.call_count == 1
+    assert memory.asked_question_ids == ["q-1", "built-1"]
+    assert memory.difficulty_history == [2, 2]
+    assert (memory.average_score, memory.question_count) == (0.5, 1)
+
+
+def test_changed_adaptive_signals_discard_the_prefetch(prefetcher):
+
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+    snapshot = InterviewRetrievalMemory(asked_question_ids=["q-1"])
+
+    service.prefetch_next_question(session_id="s", **_kwargs(snapshot))
+
+    weak = snapshot.model_copy(update={"weak_domains": [SqlDomain.JOIN, SqlDomain.CTE]})
+
+    question, memory = service.generate_next_question(session_id="s", **_kwargs(weak))
+
+    assert area_builder.build.call_count == 2
+    assert question.id == "built-2"
+    assert memory.weak_domains == [SqlDomain.JOIN, SqlDomain.CTE]
+
+
+def test_small_signal_drift_keeps_the_prefetch(prefetcher):
+
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+    snapshot = InterviewRetrievalMemory(asked_question_ids=["q-1"], difficulty_history=[2])
+
+    service.prefetch_next_question(session_id="s", **_kwargs(snapshot))
+
+    answered = snapshot.model_copy(
+        update={"weak_domains": [SqlDomain.JOIN], "average_score": 0.7, "question_count": 1}
+    )
+
+    question, memory = service.generate_next_question(session_id="s", **_kwargs(answered))
+
+    assert area_builder.build.call_count == 1
+    assert question.id == "built-1"
+    assert memory.weak_domains == [SqlDomain.JOIN]
+
+
+def test_prefetched_question_asked_meanwhile_is_discarded(prefetcher):
+
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+    snapshot = InterviewRetrievalMemory()
+
+    service.prefetch_next_question(session_id="s", **_kwargs(snapshot))
+    prefetcher._handles["s"].future.result()
+
+    asked = snapshot.model_copy(update={"asked_question_ids": ["built-1"]})
+    question, _ = service.generate_next_question(session_id="s", **_kwargs(asked))
+
+    assert area_builder.build.call_count == 2
+    assert question.id == "built-2"
+
+
+def test_prefetch_is_only_used_for_its_session(prefetcher):
+
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+    memory = InterviewRetrievalMemory()
+
+    service.prefetch_next_question(session_id="s", **_kwargs(memory))
+
+    service.generate_next_question(session_id="other", **_kwargs(memory))
+    service.generate_next_question(**_kwargs(memory))
+
+    assert area_builder.build.call_count == 3
+
+
+def test_enricher_runs_once_on_either_path(prefetcher):
+
+    enricher = MagicMock(side_effect=lambda q: q.model_copy(update={"prompt": "enriched"}))
+    service = LazyAdaptiveInterviewService(area_builder=_area_builder(), prefetcher=prefetcher)
+    memory = InterviewRetrievalMemory()
+
+    service.prefetch_next_question(session_id="s", question_enricher=enricher, **_kwargs(memory))
+    prefetched, _ = service.generate_next_question(
+        session_id="s", question_enricher=enricher, **_kwargs(memory)
+    )
+    built, _ = service.generate_next_question(question_enricher=enricher, **_kwargs(memory))
+
+    assert prefetched.prompt == built.prompt == "enriched"
+    assert enricher.call_count == 2
+
+
+def test_failed_prefetch_falls_back_to_a_synchronous_build(prefetcher):
+
+    area_builder = MagicMock()
+    area_builder.build.side_effect = iter(
+        [RuntimeError("llm down"), ([_question("sync")], InterviewRetrievalMemory())]
+    )
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+
+    service.prefetch_next_question(session_id="s", **_kwargs(InterviewRetrievalMemory()))
+    question, _ = service.generate_next_question(
+        session_id="s", **_kwargs(InterviewRetrievalMemory())
+    )
+
+    assert question.id == "sync"
+
+
+def test_new_prefetch_cancels_the_pending_one():
+
+    release = threading.Event()
+    prefetcher = NextQuestionPrefetcher(max_workers=1)
+    memory = InterviewRetrievalMemory()
+
+    def blocking_build(m):
+        release.wait()
+        return _question("a"), m
+
+    blocker = prefetcher.start("a", 1, memory, blocking_build)
+    pending = prefetcher.start("b", 1, memory, lambda m: (_question("b1"), m))
+    prefetcher.start("b", 1, memory, lambda m: (_question("b2"), m))
+
+    release.set()
+
+    assert pending.future.cancelled()
+    assert prefetcher.take("b", 1, memory)[0].id == "b2"
+    assert blocker.future.result()[0].id == "a"
+
+    prefetcher.shutdown()
+
+
+def test_untaken_prefetches_are_evicted_after_the_ttl():
+
+    now = [0.0]
+    release = threading.Event()
+    prefetcher = NextQuestionPrefetcher(max_workers=1, ttl_seconds=60, clock=lambda: now[0])
+    memory = InterviewRetrievalMemory()
+
+    def blocking_build(m):
+        release.wait()
+        return _question("busy"), m
+
+    prefetcher.start("busy", 1, memory, blocking_build)
+    abandoned = prefetcher.start("abandoned", 1, memory, lambda m: (_question("a1"), m))
+
+    now[0] = 30.0
+    prefetcher.start("active", 1, memory, lambda m: (_question("b1"), m))
+
+    assert "abandoned" in prefetcher
+
+    now[0] = 61.0
+    prefetcher.start("late", 1, memory, lambda m: (_question("c1"), m))
+
+    assert "abandoned" not in prefetcher
+    assert "busy" not in prefetcher
+    assert abandoned.future.cancelled()
+    assert "active" in prefetcher
+
+    release.set()
+    assert prefetcher.take("active", 1, memory)[0].id == "b1"
+    assert prefetcher.take("abandoned", 1, memory) is None
+
+    prefetcher.shutdown()
+
+
+def test_build_runs_in_the_callers_context(prefetcher):
+
+    from infrastructure.llm.metrics.llm_operation_context import LLMOperationContext
+
+    memory = InterviewRetrievalMemory()
+
+    with LLMOperationContext.scope("question_generation"):
+        prefetcher.start("s", 1, memory, lambda m: (_question(LLMOperationContext.get_operation()), m))
+
+    assert prefetcher.take("s", 1, memory)[0].id == "question_generation"
+
+
+def test_disabled_prefetch_starts_nothing(prefetcher, monkeypatch):
+
+    monkeypatch.setattr(settings, "adaptive_prefetch_enabled", False)
+    area_builder = _area_builder()
+    service = LazyAdaptiveInterviewService(area_builder=area_builder, prefetcher=prefetcher)
+
+    assert not service.prefetch_next_question(session_id="s", **_kwargs(InterviewRetrievalMemory()))
+    assert area_builder.build.call_count == 0
+
+
+def test_rebase_replays_appended_items():
+
+    snapshot = InterviewRetrievalMemory(difficulty_history=[2], covered_domains=[SqlDomain.JOIN])
+    built = snapshot.model_copy(
+        update={
+            "difficulty_history": [2, 2],
+            "covered_domains": [SqlDomain.CTE, SqlDomain.JOIN],
+        }
+    )
+    memory = snapshot.model_copy(update={"average_score": 0.7})
+
+    rebased = rebase_memory(built=built, snapshot=snapshot, memory=memory)
+
+    assert rebased.difficulty_history == [2, 2]
+    assert rebased.covered_domains == [SqlDomain.JOIN, SqlDomain.CTE]
+    assert rebased.average_score == 0.7
+
+
+def test_navigation_prefetches_after_generating_a_question():
+
+    from domain.contracts.interview_state import InterviewState
+    from domain.contracts.user.role import Role
+
+    lazy_service = MagicMock()
+    lazy_service.generate_next_question.return_value = (
+        _question("q-2"),
+        InterviewRetrievalMemory(asked_question_ids=["q-1"]),
+    )
+
+    state = InterviewState(
+        interview_id="adaptive-test",
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        company="TestCorp",
+        interview_type=InterviewType.TECHNICAL,
+        language="en",
+        questions=[_question("q-1", InterviewArea.TECH_BACKGROUND)],
+        current_question_index=0,
+        planned_areas=_PLANNED,
+        adaptive_interview_enabled=True,
+        retrieval_memory=InterviewRetrievalMemory(),
+        intent=ActionType.NEXT,
+    )
+
+    AdaptiveNavigationNode(lazy_service=lazy_service)(state)
+
+    assert lazy_service.generate_next_question.call_args.kwargs["session_id"] == "adaptive-test"
+
+    prefetch = lazy_service.prefetch_next_question.call_args.kwargs
+    assert prefetch["generated_count"] == 2
+    assert prefetch["memory"].asked_question_ids == ["q-1", "q-2"]
+
+
+@pytest.mark.parametrize(
+    ("score", "average_score", "question_count"),
+    [(70.0, 0.0, 0), (30.0, 0.0, 0), (30.0, 0.75, 3), (95.0, 0.75, 3)],
+)
+def test_evaluated_answer_is_served_from_the_prefetch(
+    prefetcher,
+    score,
+    average_score,
+    question_count,
+):
+
+    from domain.contracts.interview_state import InterviewState
+    from domain.contracts.question.question_evaluation import QuestionEvaluation
+    from domain.contracts.question.question_result import QuestionResult
+    from domain.contracts.user.role import Role
+
+    service = LazyAdaptiveInterviewService(area_builder=_area_builder(), prefetcher=prefetcher)
+    node = AdaptiveNavigationNode(lazy_service=service, seniority_level=SeniorityLevel.MID)
+
+    # q-1 came from the bank, so it is already recorded in the retrieval memory.
+    state = InterviewState(
+        interview_id="adaptive-test",
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        company="TestCorp",
+        interview_type=InterviewType.TECHNICAL,
+        language="en",
+        questions=[_question("q-1", InterviewArea.TECH_BACKGROUND)],
+        current_question_index=0,
+        planned_areas=_PLANNED,
+        adaptive_interview_enabled=True,
+        retrieval_memory=InterviewRetrievalMemory(
+            asked_question_ids=["q-1"],
+            difficulty_history=[2],
+            average_score=average_score,
+            question_count=question_count,
+        ),
+    )
+
+    node.prefetch_next(state)
+
+    answered = state.model_copy(
+        update={
+            "results_by_question": {
+                "q-1": QuestionResult(
+                    question_id="q-1",
+                    evaluation=QuestionEvaluation(
+                        question_id="q-1",
+                        score=score,
+                        max_score=100.0,
+                        feedback="ok",
+                        passed=score >= 50,
+                    ),
+                )
+            },
+            "intent": ActionType.NEXT,
+        }
+    )
+
+    new_state = node(answered)
+
+    # A discarded prefetch would have been followed by a synchronous "built-2".
+    assert new_state.questions[-1].id == "built-1"
+    assert new_state.retrieval_memory.question_count == question_count + 1
+    assert new_state.retrieval_memory.asked_question_ids == ["q-1", "built-1"]
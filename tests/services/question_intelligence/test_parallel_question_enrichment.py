@@ -0,0 +1,208 @@
+# tests/services/question_intelligence/test_parallel_question_enrichment.py
+"""
+Unit tests for concurrent enrichment in BaseLLMQuestionPipeline.build.
+
+Validates that:
+  - enriched corpus questions keep retrieval order whatever order calls finish in
+  - a failed enrichment is replaced by the next candidate
+  - gap-filling generation starts while enrichment is still in flight
+  - failed enrichments are covered by one top-up generation call
+  - enrichment runs in the caller's context
+"""
+
+import threading
+from datetime import datetime, timezone
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.interview.interview_type import InterviewType
+from domain.contracts.question.question import Question, QuestionDifficulty, QuestionType
+from domain.contracts.question.question_bank_item import QuestionBankItem
+from domain.contracts.user.role import Role, RoleType
+from domain.contracts.user.seniority_level import SeniorityLevel
+from services.question_corpus.contracts.interview_retrieval_memory import (
+    InterviewRetrievalMemory,
+)
+from services.question_ingestion.contracts.ingestion_metadata import IngestionMetadata
+from services.question_intelligence.pipelines.base_llm_question_pipeline import (
+    BaseLLMQuestionPipeline,
+)
+
+_TIMEOUT = 5
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _bank_item(doc_id: str) -> QuestionBankItem:
+
+    return QuestionBankItem(
+        id=doc_id,
+        text=f"Corpus question {doc_id}",
+        interview_type=InterviewType.TECHNICAL,
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        area=InterviewArea.TECH_DATABASE,
+        level=SeniorityLevel.MID,
+        difficulty=3,
+        ingestion_metadata=IngestionMetadata(
+            source_name="test",
+            source_type="question_corpus",
+            dataset_version="v1",
+            ingestion_timestamp=datetime(1970, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+
+def _question(question_id: str) -> Question:
+
+    return Question(
+        id=question_id,
+        area=InterviewArea.TECH_DATABASE,
+        type=QuestionType.DATABASE,
+        prompt=f"Prompt {question_id}",
+        difficulty=QuestionDifficulty.MEDIUM,
+    )
+
+
+class _StubPipeline(BaseLLMQuestionPipeline):
+    """Pipeline whose enrichment and generation are plain callables."""
+
+    def __init__(self, items, enrich, generate=None) -> None:
+        super().__init__()
+        self._items = items
+        self._enrich = enrich
+        self._generate = generate or (lambda n: [_question(f"llm-{i}") for i in range(n)])
+        self.enriched_ids: list[str] = []
+
+    def _pipeline_label(self) -> str:
+        return "STUB"
+
+    def _candidate_scan_k(self) -> int:
+        return len(self._items)
+
+    def _retrieve_candidates(self, **kwargs) -> list[QuestionBankItem]:
+        return self._items
+
+    def _enrich_item(self, item, **kwargs) -> Question | None:
+        self.enriched_ids.append(item.id)
+        return self._enrich(item)
+
+    def _generate_with_retry(self, role, level, n, **kwargs) -> list[Question]:
+        return self._generate(n)
+
+    def _build_provenance_model_tag(self) -> str:
+        return "stub"
+
+
+def _build(pipeline: _StubPipeline, questions_per_area: int, corpus_quota: int | None = None):
+
+    return pipeline.build(
+        role=RoleType.BACKEND_ENGINEER,
+        level=SeniorityLevel.MID,
+        interview_type=InterviewType.TECHNICAL,
+        area=InterviewArea.TECH_DATABASE,
+        questions_per_area=questions_per_area,
+        corpus_quota=corpus_quota,
+        memory=InterviewRetrievalMemory(),
+    )
+
+
+# ─── tests ────────────────────────────────────────────────────────────────────
+
+def test_results_keep_retrieval_order_when_later_calls_finish_first() -> None:
+
+    last_done = threading.Event()
+
+    def enrich(item):
+        if item.id == "a":
+            # The first candidate only finishes once the last one has.
+            assert last_done.wait(_TIMEOUT)
+        if item.id == "c":
+            last_done.set()
+        return _question(f"enriched-{item.id}")
+
+    pipeline = _StubPipeline([_bank_item(i) for i in "abc"], enrich)
+
+    questions, memory = _build(pipeline, questions_per_area=3)
+
+    assert [q.id for q in questions] == ["enriched-a", "enriched-b", "enriched-c"]
+    assert memory.asked_question_ids == ["a", "b", "c"]
+
+
+def test_failed_enrichment_is_replaced_by_the_next_candidate() -> None:
+
+    pipeline = _StubPipeline(
+        [_bank_item(i) for i in "abcd"],
+        lambda item: None if item.id == "a" else _question(f"enriched-{item.id}"),
+    )
+
+    questions, _ = _build(pipeline, questions_per_area=2)
+
+    assert [q.id for q in questions] == ["enriched-b", "enriched-c"]
+    assert sorted(pipeline.enriched_ids) == ["a", "b", "c"]
+
+
+def test_generation_starts_before_enrichment_finishes() -> None:
+
+    generation_started = threading.Event()
+
+    def enrich(item):
+        assert generation_started.wait(_TIMEOUT)
+        return _question(f"enriched-{item.id}")
+
+    def generate(n):
+        generation_started.set()
+        return [_question(f"llm-{i}") for i in range(n)]
+
+    pipeline = _StubPipeline([_bank_item("a")], enrich, generate)
+
+    questions, _ = _build(pipeline, questions_per_area=3, corpus_quota=2)
+
+    assert [q.id for q in questions] == ["enriched-a", "llm-0", "llm-1"]
+
+
+def test_failed_enrichments_share_one_top_up_generation() -> None:
+
+    calls: list[int] = []
+    lock = threading.Lock()
+
+    def generate(n):
+        with lock:
+            start = sum(calls)
+            calls.append(n)
+        return [_question(f"llm-{start + i}") for i in range(n)]
+
+    pipeline = _StubPipeline(
+        [_bank_item(i) for i in "abc"],
+        lambda item: None if item.id in "ab" else _question(f"enriched-{item.id}"),
+        generate,
+    )
+
+    questions, _ = _build(pipeline, questions_per_area=4, corpus_quota=3)
+
+    assert sorted(calls) == [1, 2]
+    assert len(questions) == 4
+    assert len({q.prompt for q in questions}) == 4
+    assert questions[0].id == "enriched-c"
+
+
+def test_top_up_drops_prompts_the_up_front_call_already_produced() -> None:
+
+    pipeline = _StubPipeline([_bank_item("a")], lambda item: None)
+
+    questions, _ = _build(pipeline, questions_per_area=3, corpus_quota=1)
+
+    assert [q.id for q in questions] == ["llm-0", "llm-1"]
+
+
+def test_enrichment_runs_in_the_callers_context() -> None:
+
+    from infrastructure.llm.metrics.llm_operation_context import LLMOperationContext
+
+    pipeline = _StubPipeline(
+        [_bank_item("a")],
+        lambda item: _question(LLMOperationContext.get_operation()),
+    )
+
+    with LLMOperationContext.scope("question_generation"):
+        questions, _ = _build(pipeline, questions_per_area=1)
+
+    assert questions[0].id == "question_generation"
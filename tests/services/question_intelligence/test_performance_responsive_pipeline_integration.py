@@ -78,11 +78,15 @@ def test_adaptive_retrieval_service_prefers_target_difficulty() -> None:
     )
 
     mock_retrieval = MagicMock()
-    mock_retrieval.search_with_filters.return_value = [
-        _candidate("top", difficulty=2, area="technical_background", score=0.95),
-        _candidate("aligned", difficulty=4, area="technical_background", score=0.70),
-        _candidate("hard", difficulty=5, area="technical_background", score=0.80),
-    ]
+    mock_retrieval.search_staged.return_value = iter(
+        [
+            [
+                _candidate("top", difficulty=2, area="technical_background", score=0.95),
+                _candidate("aligned", difficulty=4, area="technical_background", score=0.70),
+                _candidate("hard", difficulty=5, area="technical_background", score=0.80),
+            ]
+        ]
+    )
 
     service = AdaptiveRetrievalService(
         retrieval=mock_retrieval,
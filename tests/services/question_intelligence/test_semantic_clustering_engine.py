@@ -0,0 +1,110 @@
+# tests/services/question_intelligence/test_semantic_clustering_engine.py
+
+from datetime import datetime, timezone
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.interview.interview_type import InterviewType
+from domain.contracts.question.question_bank_item import QuestionBankItem
+from domain.contracts.user.role import Role, RoleType
+from domain.contracts.user.seniority_level import SeniorityLevel
+from services.question_ingestion.contracts.ingestion_metadata import IngestionMetadata
+from services.question_intelligence.clustering.semantic_clustering_engine import (
+    SemanticClusteringEngine,
+)
+
+_VECTORS = {
+    "index scan": [1.0, 0.1, 0.0],
+    "index seek": [0.9, 0.2, 0.0],
+    "composite index": [1.0, 0.0, 0.1],
+    "cache eviction": [0.0, 1.0, 0.1],
+    "cache warmup": [0.1, 0.9, 0.0],
+    "queue backpressure": [0.0, 0.0, 1.0],
+}
+
+
+class _TableEmbeddings:
+
+    model = "fake-table-embeddings"
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.texts_embedded = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        return [_VECTORS[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return _VECTORS[text]
+
+
+def _item(text: str) -> QuestionBankItem:
+    return QuestionBankItem(
+        id=text.replace(" ", "_"),
+        text=text,
+        interview_type=InterviewType.TECHNICAL,
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        area=InterviewArea.TECH_DATABASE,
+        level=SeniorityLevel.MID,
+        difficulty=3,
+        ingestion_metadata=IngestionMetadata(
+            source_name="test_dataset",
+            source_type="manual",
+            dataset_version="v1",
+            ingestion_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+
+def test_cluster_groups_similar_items_with_one_embedding_call() -> None:
+    embeddings = _TableEmbeddings()
+    engine = SemanticClusteringEngine(embedding_model=embeddings)
+
+    report = engine.cluster(
+        [_item(text) for text in ["index scan", "cache eviction", "index seek", "cache warmup"]],
+        threshold=0.8,
+    )
+
+    assert embeddings.calls == 1
+    assert report.total_documents == 4
+    assert report.total_clusters == 2
+    assert report.clusters[0].members == ["index scan", "index seek"]
+    assert report.clusters[1].members == ["cache eviction", "cache warmup"]
+    assert report.largest_cluster_size == 2
+    assert 0.8 < report.clusters[0].average_similarity <= 1.0
+
+
+def test_assign_extends_existing_clusters_incrementally() -> None:
+    embeddings = _TableEmbeddings()
+    engine = SemanticClusteringEngine(embedding_model=embeddings)
+    engine.cluster([_item("index scan"), _item("cache eviction")], threshold=0.8)
+
+    report = engine.assign([_item("composite index"), _item("queue backpressure")])
+
+    assert embeddings.texts_embedded == 4
+    assert report.total_documents == 4
+    assert report.total_clusters == 3
+    assert report.clusters[0].members == ["index scan", "composite index"]
+    assert report.clusters[2].members == ["queue backpressure"]
+    assert report.clusters[2].average_similarity == 1.0
+
+
+def test_cluster_resets_previous_state() -> None:
+    engine = SemanticClusteringEngine(embedding_model=_TableEmbeddings())
+    engine.cluster([_item(text) for text in _VECTORS], threshold=0.8)
+
+    report = engine.cluster([_item("cache warmup")], threshold=0.8)
+
+    assert report.total_documents == 1
+    assert report.total_clusters == 1
+    assert report.clusters[0].centroid_text == "cache warmup"
+
+
+def test_empty_input_yields_empty_report() -> None:
+    engine = SemanticClusteringEngine(embedding_model=_TableEmbeddings())
+
+    report = engine.cluster([])
+
+    assert report.total_clusters == 0
+    assert report.largest_cluster_size == 0
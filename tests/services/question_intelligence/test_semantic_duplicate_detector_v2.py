@@ -0,0 +1,137 @@
+# tests/services/question_intelligence/test_semantic_duplicate_detector_v2.py
+
+import math
+import random
+from datetime import datetime, timezone
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.interview.interview_type import InterviewType
+from domain.contracts.question.question_bank_item import QuestionBankItem
+from domain.contracts.user.role import Role, RoleType
+from domain.contracts.user.seniority_level import SeniorityLevel
+from services.question_ingestion.contracts.ingestion_metadata import IngestionMetadata
+from services.question_intelligence.deduplication.duplicate_search_mode import (
+    DuplicateSearchMode,
+)
+from services.question_intelligence.deduplication.semantic_duplicate_detector_v2 import (
+    SemanticDuplicateDetectorV2,
+)
+
+
+class _TableEmbeddings:
+    """Returns fixed vectors per text and counts batch calls."""
+
+    model = "fake-table-embeddings"
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self._vectors = vectors
+        self.calls = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        return [self._vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._vectors[text]
+
+
+def _item(item_id: str, text: str) -> QuestionBankItem:
+    return QuestionBankItem(
+        id=item_id,
+        text=text,
+        interview_type=InterviewType.TECHNICAL,
+        role=Role(type=RoleType.BACKEND_ENGINEER),
+        area=InterviewArea.TECH_DATABASE,
+        level=SeniorityLevel.MID,
+        difficulty=3,
+        ingestion_metadata=IngestionMetadata(
+            source_name="test_dataset",
+            source_type="manual",
+            dataset_version="v1",
+            ingestion_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+
+def _corpus(size: int, dim: int = 16) -> tuple[list[QuestionBankItem], dict]:
+    rng = random.Random(11)
+    vectors: dict[str, list[float]] = {}
+    items = []
+    bases = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(size // 3 + 1)]
+    for idx in range(size):
+        base = bases[idx // 3]
+        text = f"question {idx}"
+        vectors[text] = [value + rng.gauss(0, 0.15) for value in base]
+        items.append(_item(f"q{idx}", text))
+    return items, vectors
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return round(dot / norm, 4)
+
+
+def _brute_force_pairs(items, vectors, threshold) -> list[tuple[str, str]]:
+    pairs = []
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            if _cosine(vectors[items[i].text], vectors[items[j].text]) >= threshold:
+                pairs.append((items[i].text, items[j].text))
+    return pairs
+
+
+def test_exact_mode_matches_pairwise_scan_with_one_embedding_call() -> None:
+    items, vectors = _corpus(30)
+    embeddings = _TableEmbeddings(vectors)
+    detector = SemanticDuplicateDetectorV2(embedding_model=embeddings, block_size=7)
+
+    report = detector.detect(items, threshold=0.9)
+
+    expected = _brute_force_pairs(items, vectors, 0.9)
+    assert [(p.left, p.right) for p in report.duplicate_pairs] == expected
+    assert expected
+    assert embeddings.calls == 1
+    assert report.total_documents == 30
+    assert report.duplicate_ratio == round(len(expected) / (30 * 29 / 2), 2)
+
+
+def test_block_size_does_not_change_report() -> None:
+    items, vectors = _corpus(25)
+
+    small = SemanticDuplicateDetectorV2(
+        embedding_model=_TableEmbeddings(vectors), block_size=4
+    ).detect(items, threshold=0.9)
+    large = SemanticDuplicateDetectorV2(
+        embedding_model=_TableEmbeddings(vectors), block_size=1000
+    ).detect(items, threshold=0.9)
+
+    assert small == large
+
+
+def test_ann_mode_reports_subset_of_exact_pairs() -> None:
+    items, vectors = _corpus(30)
+
+    exact = SemanticDuplicateDetectorV2(
+        embedding_model=_TableEmbeddings(vectors),
+    ).detect(items, threshold=0.9)
+    approximate = SemanticDuplicateDetectorV2(
+        embedding_model=_TableEmbeddings(vectors),
+        mode=DuplicateSearchMode.ANN,
+    ).detect(items, threshold=0.9)
+
+    exact_pairs = {(p.left, p.right) for p in exact.duplicate_pairs}
+    approximate_pairs = {(p.left, p.right) for p in approximate.duplicate_pairs}
+    assert approximate_pairs <= exact_pairs
+    assert approximate_pairs
+
+
+def test_single_item_yields_empty_report() -> None:
+    detector = SemanticDuplicateDetectorV2(
+        embedding_model=_TableEmbeddings({"only": [1.0, 0.0]}),
+    )
+
+    report = detector.detect([_item("q1", "only")])
+
+    assert report.duplicate_pairs == []
+    assert report.max_similarity == 0.0
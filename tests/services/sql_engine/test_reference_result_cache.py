@@ -0,0 +1,106 @@
+# tests/services/sql_engine/test_reference_result_cache.py
+
+import pytest
+
+from domain.contracts.interview.interview_area import InterviewArea
+from domain.contracts.question.question import (
+    Question,
+    QuestionDifficulty,
+    QuestionType,
+    SQLTestCase,
+)
+from services.sql_engine.reference_result_cache import ReferenceResultCache
+from services.sql_engine.sql_evaluator import SQLEvaluator
+from services.sql_engine.sql_executor import SQLExecutor
+from services.sql_engine.sql_sandbox_pool import SQLSandboxPool
+
+SCHEMA = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);"
+SEED = "INSERT INTO items (id, name) VALUES (1, 'b'), (2, NULL), (3, 'a');"
+
+
+def _question(*queries: str) -> Question:
+    return Question(
+        id="q_ref_cache",
+        area=InterviewArea.TECH_DATABASE,
+        type=QuestionType.DATABASE,
+        prompt="Select item names.",
+        difficulty=QuestionDifficulty.MEDIUM,
+        db_schema=SCHEMA,
+        db_seed_data=SEED,
+        expected_ordered=False,
+        sql_test_cases=[
+            SQLTestCase(id=f"t{i}", expected_query=query) for i, query in enumerate(queries)
+        ],
+    )
+
+
+def _executor(cache: ReferenceResultCache) -> SQLExecutor:
+    return SQLExecutor(
+        sandbox_pool=SQLSandboxPool(),
+        evaluator=SQLEvaluator(reference_cache=cache),
+    )
+
+
+class TestReferenceResultCache:
+    def test_key_depends_on_dataset_and_query(self):
+        key = ReferenceResultCache.build_key("dataset", "SELECT 1")
+
+        assert key == ReferenceResultCache.build_key("dataset", "  SELECT 1 ")
+        assert key != ReferenceResultCache.build_key("other", "SELECT 1")
+        assert key != ReferenceResultCache.build_key("dataset", "SELECT 2")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ReferenceResultCache(max_entries=2)
+        cache.put("a", [("1",)])
+        cache.put("b", [("2",)])
+        cache.get("a")
+        cache.put("c", [("3",)])
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == 2
+
+    def test_sorted_rows_handle_nulls(self):
+        entry = ReferenceResultCache().put("k", [("b",), (None,), ("a",)])
+
+        assert entry.sorted_rows == [(None,), ("a",), ("b",)]
+
+    def test_invalid_capacity_rejected(self):
+        with pytest.raises(ValueError):
+            ReferenceResultCache(max_entries=0)
+
+
+def test_repeated_submissions_reuse_reference_results():
+    cache = ReferenceResultCache()
+    executor = _executor(cache)
+    question = _question("SELECT name FROM items")
+
+    first = executor.execute(question, "SELECT name FROM items ORDER BY id DESC")
+    second = executor.execute(question, "SELECT name FROM items")
+
+    assert first.success and second.success
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+
+def test_warm_precomputes_every_reference_query():
+    cache = ReferenceResultCache()
+    executor = _executor(cache)
+    question = _question("SELECT name FROM items", "SELECT COUNT(*) FROM items")
+
+    executor.warm(question)
+    result = executor.execute(question, "SELECT COUNT(*) FROM items")
+
+    assert cache.size == 2
+    assert cache.hits == 2
+    assert result.passed_tests == 1
+
+
+def test_reference_is_evaluated_on_pristine_data():
+    cache = ReferenceResultCache()
+    executor = _executor(cache)
+    question = _question("SELECT COUNT(*) FROM items")
+
+    result = executor.execute(question, "DELETE FROM items RETURNING id")
+
+    assert result.test_results[0].expected == [("3",)]
@@ -0,0 +1,157 @@
+# tests/services/sql_engine/test_sql_sandbox_pool.py
+
+import pytest
+
+from domain.contracts.question.question import (
+    Question,
+    QuestionDifficulty,
+    QuestionType,
+    SQLTestCase,
+)
+from domain.contracts.interview.interview_area import InterviewArea
+from services.sql_engine.sql_executor import SQLExecutor
+from services.sql_engine.sql_sandbox_pool import SQLSandboxPool
+
+SCHEMA = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL);"
+SEED = "INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c');"
+
+
+def _count(cursor) -> int:
+    cursor.execute("SELECT COUNT(*) FROM items")
+    return cursor.fetchone()[0]
+
+
+class TestSQLSandboxPool:
+    def test_template_is_built_once_and_sandbox_is_pooled(self):
+        pool = SQLSandboxPool()
+
+        with pool.lease(SCHEMA, SEED) as first:
+            first_connection = first.connection
+        with pool.lease(SCHEMA, SEED) as second:
+            assert second.connection is first_connection
+
+        assert pool.template_count() == 1
+        assert pool.idle_count(SCHEMA, SEED) == 1
+
+    def test_isolated_case_rolls_back_mutations(self):
+        pool = SQLSandboxPool()
+
+        with pool.lease(SCHEMA, SEED) as sandbox:
+            with sandbox.isolated_case() as cursor:
+                cursor.execute("DELETE FROM items")
+                assert _count(cursor) == 0
+            with sandbox.isolated_case() as cursor:
+                assert _count(cursor) == 3
+
+        assert not sandbox.tainted
+
+    def test_committed_sandbox_is_tainted_and_not_pooled(self):
+        pool = SQLSandboxPool()
+
+        with pool.lease(SCHEMA, SEED) as sandbox:
+            with sandbox.isolated_case() as cursor:
+                cursor.execute("DELETE FROM items")
+                cursor.execute("COMMIT")
+
+        assert sandbox.tainted
+        assert pool.idle_count(SCHEMA, SEED) == 0
+
+        with pool.lease(SCHEMA, SEED) as fresh:
+            assert _count(fresh.cursor()) == 3
+
+    def test_idle_connections_are_bounded(self):
+        pool = SQLSandboxPool(max_idle_per_template=2)
+
+        pool.warm(SCHEMA, SEED, count=5)
+
+        assert pool.idle_count(SCHEMA, SEED) == 2
+
+    def test_least_recently_used_template_is_evicted(self):
+        pool = SQLSandboxPool(max_templates=1)
+
+        pool.clone(SCHEMA, SEED).close()
+        pool.clone(SCHEMA, "").close()
+
+        assert pool.template_count() == 1
+        assert pool.idle_count(SCHEMA, SEED) == 0
+
+    def test_clone_is_independent_of_template(self):
+        pool = SQLSandboxPool()
+
+        clone = pool.clone(SCHEMA, SEED)
+        clone.execute("DELETE FROM items")
+
+        assert _count(pool.clone(SCHEMA, SEED).cursor()) == 3
+
+    def test_broken_schema_is_not_cached(self):
+        pool = SQLSandboxPool()
+
+        with pytest.raises(Exception):
+            pool.clone("CREATE TABLE broken (", "")
+
+        assert pool.template_count() == 0
+
+
+def test_executor_cases_do_not_see_each_others_writes():
+    question = Question(
+        id="q_mutating",
+        area=InterviewArea.TECH_DATABASE,
+        type=QuestionType.DATABASE,
+        prompt="Remove all items.",
+        difficulty=QuestionDifficulty.MEDIUM,
+        db_schema=SCHEMA,
+        db_seed_data=SEED,
+        sql_test_cases=[
+            SQLTestCase(id="t1", expected_query="SELECT COUNT(*) FROM items"),
+            SQLTestCase(id="t2", expected_query="SELECT COUNT(*) FROM items"),
+        ],
+    )
+    executor = SQLExecutor(sandbox_pool=SQLSandboxPool())
+
+    result = executor.execute(question, "DELETE FROM items WHERE id = 1 RETURNING id")
+
+    # Without per-case rollback the second case would find nothing to delete.
+    assert [t.actual for t in result.test_results] == [[("1",)], [("1",)]]
+
+
+def test_slow_template_build_does_not_block_other_schemas():
+    import threading
+
+    pool = SQLSandboxPool()
+    other_schema = "CREATE TABLE other (id INTEGER);"
+    build_started = threading.Event()
+    release_build = threading.Event()
+    original_build = pool._build_template
+
+    def slow_build(schema_sql, seed_sql):
+        if schema_sql == SCHEMA:
+            build_started.set()
+            assert release_build.wait(5)
+        return original_build(schema_sql, seed_sql)
+
+    pool._build_template = slow_build
+
+    slow = threading.Thread(target=lambda: pool.clone(SCHEMA, SEED).close())
+    slow.start()
+
+    try:
+        assert build_started.wait(5)
+        with pool.lease(other_schema, "") as sandbox:
+            assert sandbox.cursor().execute("SELECT COUNT(*) FROM other").fetchone() == (0,)
+    finally:
+        release_build.set()
+        slow.join(5)
+
+    assert pool.template_count() == 2
+
+
+def test_failed_template_build_is_not_cached():
+    pool = SQLSandboxPool()
+
+    with pytest.raises(Exception):
+        pool.clone("CREATE TABLE broken (", "")
+
+    assert pool.template_count() == 0
+
+    with pytest.raises(Exception):
+        pool.clone("CREATE TABLE broken (", "")
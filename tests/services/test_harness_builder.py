@@ -0,0 +1,76 @@
+# tests/services/test_harness_builder.py
+
+from domain.contracts.execution.coding_spec import CodingSpec
+from domain.contracts.execution.coding_test_case import CodingTestCase
+from services.coding_engine.harness.harness_builder import HarnessBuilder
+from services.coding_engine.harness.harness_cache import HarnessCache
+from services.coding_engine.harness.template_renderer import TemplateRenderer
+
+SPEC = CodingSpec(type="function", entrypoint="double", parameters=["x"])
+VISIBLE = [CodingTestCase(args=[2], expected=4)]
+HIDDEN = [CodingTestCase(args=[5], expected=10)]
+
+
+def _build(builder, user_code, hidden=HIDDEN, question_id="q1"):
+    return builder.build(
+        user_code=user_code,
+        visible_tests=VISIBLE,
+        hidden_tests=hidden,
+        function_name="double",
+        coding_spec=SPEC,
+        question_id=question_id,
+    )
+
+
+def test_body_is_rendered_once_per_question():
+    cache = HarnessCache()
+    builder = HarnessBuilder(cache=cache)
+
+    first = _build(builder, "def double(x):\n    return x * 2")
+    second = _build(builder, "def double(x):\n    return x + x")
+
+    assert cache.size == 1
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first.startswith("def double(x):\n    return x * 2\n\n")
+    assert second.startswith("def double(x):\n    return x + x\n\n")
+    assert first.split("\n", 2)[2] == second.split("\n", 2)[2]
+
+
+def test_changed_tests_render_a_new_body():
+    cache = HarnessCache()
+    builder = HarnessBuilder(cache=cache)
+
+    _build(builder, "def double(x): return 2 * x")
+    harness = _build(
+        builder,
+        "def double(x): return 2 * x",
+        hidden=[CodingTestCase(args=[7], expected=14)],
+    )
+
+    assert cache.size == 2
+    assert "14" in harness
+
+
+def test_cached_harness_runs_user_code():
+    builder = HarnessBuilder(cache=HarnessCache())
+    _build(builder, "def double(x): return 0")
+
+    namespace = {}
+    harness = _build(builder, "def double(x): return 2 * x")
+    exec(compile(harness, "<harness>", "exec"), namespace)
+
+    assert namespace["double"](3) == 6
+
+
+def test_cache_evicts_least_recently_used():
+    cache = HarnessCache(max_entries=1)
+    builder = HarnessBuilder(cache=cache)
+
+    _build(builder, "def double(x): return 2 * x", question_id="q1")
+    _build(builder, "def double(x): return 2 * x", question_id="q2")
+
+    assert cache.size == 1
+
+
+def test_renderers_share_one_jinja_environment():
+    assert TemplateRenderer().env is TemplateRenderer().env
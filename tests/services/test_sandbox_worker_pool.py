@@ -0,0 +1,182 @@
+# Tests for SandboxWorkerPool and ExecutionSandbox pool delegation
+
+import time
+
+import pytest
+
+from services.coding_engine.execution_sandbox import ExecutionSandbox
+from infrastructure.config.settings import settings
+from services.coding_engine.sandbox_worker_pool import (
+    SandboxWorkerError,
+    SandboxWorkerPool,
+    get_default_worker_pool,
+    warm_default_worker_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    worker_pool = SandboxWorkerPool(size=1, max_runs_per_worker=3)
+    yield worker_pool
+    worker_pool.close()
+
+
+def test_successful_execution(pool):
+    sandbox = ExecutionSandbox(timeout_seconds=2, worker_pool=pool)
+
+    result = sandbox.execute('print("hello")')
+
+    assert result.returncode == 0
+    assert result.stdout == "hello\n"
+    assert result.timeout is False
+
+
+def test_runtime_error_reports_traceback(pool):
+    sandbox = ExecutionSandbox(timeout_seconds=2, worker_pool=pool)
+
+    result = sandbox.execute('raise ValueError("boom")')
+
+    assert result.returncode == 1
+    assert "ValueError: boom" in result.stderr
+
+
+def test_sys_exit_code_is_propagated(pool):
+    result = pool.run("import sys\nsys.exit(3)", timeout_seconds=2)
+
+    assert result.returncode == 3
+
+
+def test_timeout_kills_worker_and_pool_recovers(pool):
+    timed_out = pool.run("while True:\n    pass", timeout_seconds=1)
+    after = pool.run('print("next")', timeout_seconds=2)
+
+    assert timed_out.timeout is True
+    assert "timed out" in timed_out.stderr.lower()
+    assert after.stdout == "next\n"
+
+
+def test_timeout_keeps_output_printed_before_it(pool):
+    result = pool.run('print("partial", flush=True)\nwhile True:\n    pass', timeout_seconds=1)
+
+    assert result.timeout is True
+    assert result.stdout == "partial\n"
+
+
+def test_memory_limit_applies_to_runs():
+    worker_pool = SandboxWorkerPool(size=1, memory_limit_mb=256)
+
+    try:
+        result = worker_pool.run("blob = bytearray(1024 * 1024 * 1024)", timeout_seconds=5)
+    finally:
+        worker_pool.close()
+
+    assert result.returncode == 1
+    assert "MemoryError" in result.stderr
+
+
+def test_default_pool_is_warmed_with_the_configured_limits(monkeypatch):
+    monkeypatch.setattr(settings, "coding_sandbox_worker_pool_size", 2)
+    monkeypatch.setattr(settings, "coding_sandbox_worker_memory_limit_mb", 256)
+    get_default_worker_pool.cache_clear()
+
+    try:
+        default_pool = warm_default_worker_pool()
+
+        assert default_pool.idle_count() == 2
+
+        result = default_pool.run("blob = bytearray(1024 * 1024 * 1024)", timeout_seconds=5)
+
+        assert "MemoryError" in result.stderr
+    finally:
+        get_default_worker_pool().close()
+        get_default_worker_pool.cache_clear()
+
+
+def test_runs_do_not_share_state(pool):
+    pool.run("import json\njson.dumps = None", timeout_seconds=2)
+
+    result = pool.run('import json\nprint(json.dumps([1]))', timeout_seconds=2)
+
+    assert result.stdout == "[1]\n"
+
+
+def test_worker_recycled_after_max_runs(pool):
+    for _ in range(3):
+        pool.run("pass", timeout_seconds=2)
+
+    assert pool.idle_count() == 0
+
+    pool.run("pass", timeout_seconds=2)
+
+    assert pool.idle_count() == 1
+
+
+def test_sandbox_falls_back_to_subprocess_when_pool_fails():
+    class _BrokenPool:
+        def run(self, code, timeout_seconds):
+            raise SandboxWorkerError("worker exited unexpectedly")
+
+    sandbox = ExecutionSandbox(timeout_seconds=2, worker_pool=_BrokenPool())
+
+    result = sandbox.execute('print("fallback")')
+
+    assert result.returncode == 0
+    assert "fallback" in result.stdout
+
+
+def test_run_cannot_write_to_the_worker_pipes(pool):
+    forged = (
+        "import os\n"
+        "written = []\n"
+        "for fd in range(3, 64):\n"
+        "    try:\n"
+        "        os.write(fd, b'\\x00\\x00\\x00\\x02{}')\n"
+        "        written.append(fd)\n"
+        "    except OSError:\n"
+        "        pass\n"
+        "print(written)\n"
+    )
+
+    result = pool.run(forged, timeout_seconds=2)
+    after = pool.run('print("next")', timeout_seconds=2)
+
+    assert result.returncode == 0
+    assert result.stdout == "[]\n"
+    assert after.stdout == "next\n"
+
+
+def test_processes_spawned_by_a_run_do_not_survive_it(pool, tmp_path):
+    marker = tmp_path / "survived"
+    daemon = (
+        "import os, time\n"
+        "if os.fork() == 0:\n"
+        "    time.sleep(0.5)\n"
+        f"    open({str(marker)!r}, 'w').close()\n"
+        "    os._exit(0)\n"
+        'print("parent done")\n'
+    )
+
+    result = pool.run(daemon, timeout_seconds=2)
+    time.sleep(1)
+
+    assert result.stdout == "parent done\n"
+    assert not marker.exists()
+
+
+def test_timeout_kills_processes_spawned_by_the_run(pool, tmp_path):
+    marker = tmp_path / "survived"
+    daemon = (
+        "import os, time\n"
+        "if os.fork() == 0:\n"
+        "    time.sleep(1.5)\n"
+        f"    open({str(marker)!r}, 'w').close()\n"
+        "    os._exit(0)\n"
+        "while True:\n"
+        "    pass\n"
+    )
+
+    result = pool.run(daemon, timeout_seconds=1)
+    time.sleep(1)
+
+    assert result.timeout is True
+    assert not marker.exists()